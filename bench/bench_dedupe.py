@@ -0,0 +1,58 @@
+"""
+Duplicate ingest benchmark.
+
+Inserts N fresh raw frames into a truth database, then re-inserts the same
+frames (replay / mirrored scope) and reports per-event cost of each phase,
+with the dedupe filter enabled and disabled.
+
+Usage:
+    python bench/bench_dedupe.py [--events N]
+
+Property of Uncompromising Sensors LLC.
+"""
+
+# Imports
+import argparse, os, shutil, sys, tempfile, time
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nova.core.database import Database
+from nova.core.events import RawFrame
+
+
+def makeFrames(count):
+    """Deterministic raw frames, 10 ms apart"""
+    return [RawFrame.create('bench', f"2026-02-01T00:{i // 6000 % 60:02d}:{i // 100 % 60:02d}.{i % 100:02d}0000+00:00",
+                            'hardwareService', 'node1', 'gps1', i.to_bytes(8, 'big') * 8)
+            for i in range(count)]
+
+
+def runPhase(db, frames, canonicalTruthTime):
+    """Returns microseconds per insert"""
+    start = time.perf_counter()
+    for frame in frames:
+        db.insertEvent(frame, canonicalTruthTime)
+    return (time.perf_counter() - start) / len(frames) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Duplicate ingest benchmark')
+    parser.add_argument('--events', type=int, default=20000)
+    args = parser.parse_args()
+
+    frames = makeFrames(args.events)
+    for label, capacity in (('filter', 1000000), ('no filter', 0)):
+        dirPath = Path(tempfile.mkdtemp())
+        try:
+            db = Database(str(dirPath / 'bench.db'), dedupeFilterCapacity=capacity)
+            freshUs = runPhase(db, frames, '2026-02-01T01:00:00+00:00')
+            duplicateUs = runPhase(db, frames, '2026-02-01T01:00:01+00:00')
+            db.close()
+        finally:
+            shutil.rmtree(dirPath, ignore_errors=True)
+        print(f'{label:10s} fresh {freshUs:7.1f} us/event   duplicate {duplicateUs:7.1f} us/event')
+
+
+if __name__ == '__main__':
+    main()
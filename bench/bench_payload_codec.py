@@ -0,0 +1,109 @@
+"""
+Payload codec benchmark.
+
+Writes the same synthetic recording (ubx.nav_pvt + ubx.nav_sat parsed messages
+and telemetry.gnss UI updates per receiver and epoch) into a truth database
+once per payload codec, then reports on-disk size, Parsed/UI column bytes,
+insert cost and full-window query cost.
+
+Usage:
+    python bench/bench_payload_codec.py [--seconds S] [--rate HZ] [--receivers N] [--codecs none,zlib,zstd]
+
+Property of Uncompromising Sensors LLC.
+"""
+
+# Imports
+import argparse, os, random, shutil, sys, tempfile, time
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from bench import synthetic
+from nova.core.database import Database
+from nova.core.events import ParsedMessage, Timebase
+
+
+def recording(seconds, rate, receivers):
+    """synthetic.truthEvents without raw frames, plus one nav_sat (satellite table) per receiver and epoch"""
+    rng = random.Random(6)
+    events = [e for e in synthetic.truthEvents(seconds, rate, receivers) if e.lane.value != 'raw']
+    for when in synthetic.epochTimes(seconds, rate):
+        for receiver in range(receivers):
+            svs = [{'gnssId': gnssId, 'svId': svId, 'cno': cno, 'elev': elev, 'azim': azim,
+                    'prRes': round(rng.uniform(-5, 5), 1), 'qualityInd': 7, 'svUsed': cno > 30}
+                   for gnssId, svId, cno, elev, azim in synthetic._satellites(rng, 24)]
+            events.append(ParsedMessage.create('bench', when.isoformat(), 'hardwareService', 'node1', f"gps{receiver + 1}",
+                                               'ubx.nav_sat', 'v1', {'iTOW': int(when.timestamp() * 1000) % 604800000,
+                                                                     'numSvs': len(svs), 'svs': svs}))
+    for event in events:
+        event.canonicalTruthTime = event.sourceTruthTime
+    return events
+
+
+def fileBytes(dirPath):
+    return sum(path.stat().st_size for path in dirPath.rglob('*.db'))
+
+
+def columnBytes(database):
+    total = 0
+    connections = [database.conn] + [database._getSegmentWriteConnection(s) for s in database.listSegments()]
+    for conn in connections:
+        total += conn.execute("SELECT COALESCE(SUM(length(payload)), 0) FROM parsedEvents").fetchone()[0]
+        total += conn.execute("SELECT COALESCE(SUM(length(data)), 0) FROM uiEvents").fetchone()[0]
+    return total
+
+
+def runCodec(codec, events, trainSamples):
+    dirPath = Path(tempfile.mkdtemp())
+    try:
+        config = None if codec == 'none' else {'codec': codec, 'trainSamples': trainSamples}
+        database = Database(str(dirPath / 'bench.db'), payloadCodec=config)
+        start = time.perf_counter()
+        for offset in range(0, len(events), 1000):
+            batch = events[offset:offset + 1000]
+            database.insertEventsBatch(batch, batch[0].sourceTruthTime)
+        insertSeconds = time.perf_counter() - start
+        database.checkpoint('TRUNCATE')
+
+        start = time.perf_counter()
+        rows = database.queryEvents(events[0].sourceTruthTime, events[-1].sourceTruthTime, Timebase.SOURCE)
+        querySeconds = time.perf_counter() - start
+        result = {
+            'codec': codec,
+            'fileMb': fileBytes(dirPath) / 1e6,
+            'columnMb': columnBytes(database) / 1e6,
+            'insertUs': insertSeconds / len(events) * 1e6,
+            'queryUs': querySeconds / max(len(rows), 1) * 1e6,
+        }
+        database.close()
+        return result
+    finally:
+        shutil.rmtree(dirPath, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Payload codec benchmark')
+    parser.add_argument('--seconds', type=int, default=120)
+    parser.add_argument('--rate', type=int, default=10)
+    parser.add_argument('--receivers', type=int, default=2)
+    parser.add_argument('--codecs', default='none,zlib,zstd')
+    parser.add_argument('--train-samples', type=int, default=500)
+    args = parser.parse_args()
+
+    events = recording(args.seconds, args.rate, args.receivers)
+    print(f'{len(events)} events')
+    baseline = None
+    for codec in args.codecs.split(','):
+        try:
+            result = runCodec(codec, events, args.train_samples)
+        except Exception as e:
+            print(f'{codec:5s} skipped: {e}')
+            continue
+        baseline = baseline or result
+        print(f"{codec:5s} file {result['fileMb']:7.2f} MB ({baseline['fileMb'] / result['fileMb']:4.1f}x)   "
+              f"payload {result['columnMb']:7.2f} MB ({baseline['columnMb'] / result['columnMb']:4.1f}x)   "
+              f"insert {result['insertUs']:6.1f} us/event   query {result['queryUs']:6.1f} us/row")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""
+Publish serialization benchmark.
+
+Compares the previous NovaAdapter publish path (jsonNormalize round trip,
+canonicalJson, full envelope json.dumps) against the single-pass
+canonicalizeJson + cached envelope template path, on GNSS-shaped payloads.
+
+Usage:
+    python bench/bench_publish_serialization.py [--iterations N]
+
+Property of Uncompromising Sensors LLC.
+"""
+
+# Imports
+import argparse, hashlib, json, os, sys, time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from nova.core.canonical_json import canonicalJson, canonicalizeJson
+from nova.core.events import buildEntityIdentityKey
+
+
+SCOPE_ID, SYSTEM_ID, CONTAINER_ID, UNIQUE_ID = 'bench-scope', 'hardwareService', 'node1', 'gps1'
+
+
+def navSatPayload():
+    """nav_sat-style payload: nested dicts keyed by int svId"""
+    svInfo = {}
+    for constellation, count in (('GPS', 12), ('GAL', 8), ('GLO', 6), ('BDS', 6)):
+        svInfo[constellation] = {svId: {'cno': 30 + svId % 15, 'elev': 10.5 + svId, 'azim': 3 * svId, 'used': svId % 3 != 0}
+                                 for svId in range(1, count + 1)}
+    return {'iTOW': 345600000, 'numSvs': 32, 'svInfo': svInfo}
+
+
+def gnssUiData():
+    """telemetry.gnss-style UI update"""
+    return {'lat': 37.774929, 'lon': -122.419416, 'alt': 12.53, 'fixType': '3D', 'numSv': 18,
+            'avgCn0': 41.2, 'cn04th': 44, 'hAcc': 0.82, 'vAcc': 1.3, 'gnssTime': '2025-01-01T00:00:00Z'}
+
+
+def legacyPublish(payload, sourceTruthTime):
+    """Previous path: normalize by JSON round trip, canonicalize, hash, dump full envelope"""
+    normalized = json.loads(json.dumps(payload))
+    canonical = canonicalJson(normalized)
+    hasher = hashlib.sha256()
+    hasher.update(b"eidV1")
+    hasher.update(SCOPE_ID.encode('utf-8'))
+    hasher.update(b"parsed")
+    hasher.update(buildEntityIdentityKey(SYSTEM_ID, CONTAINER_ID, UNIQUE_ID).encode('utf-8'))
+    hasher.update(sourceTruthTime.encode('utf-8'))
+    hasher.update(canonical.encode('utf-8'))
+    envelope = {
+        "schemaVersion": 1, "eventId": hasher.hexdigest(), "scopeId": SCOPE_ID, "lane": "parsed",
+        "sourceTruthTime": sourceTruthTime, "systemId": SYSTEM_ID, "containerId": CONTAINER_ID,
+        "uniqueId": UNIQUE_ID, "messageType": "ubx.nav_sat", "payload": normalized
+    }
+    return json.dumps(envelope).encode('utf-8')
+
+
+class TemplatePublisher:
+    """Current path: cached hash prefix and static envelope fields, single-pass canonical payload"""
+
+    def __init__(self):
+        self.hashPrefix = hashlib.sha256()
+        for part in (b"eidV1", SCOPE_ID.encode('utf-8'), b"parsed",
+                     buildEntityIdentityKey(SYSTEM_ID, CONTAINER_ID, UNIQUE_ID).encode('utf-8')):
+            self.hashPrefix.update(part)
+        self.staticJson = json.dumps({"schemaVersion": 1, "scopeId": SCOPE_ID, "lane": "parsed", "systemId": SYSTEM_ID,
+                                      "containerId": CONTAINER_ID, "uniqueId": UNIQUE_ID,
+                                      "messageType": "ubx.nav_sat"})[1:-1].encode('utf-8')
+
+    def publish(self, payload, sourceTruthTime):
+        _, canonical = canonicalizeJson(payload)
+        hasher = self.hashPrefix.copy()
+        hasher.update(sourceTruthTime.encode('utf-8'))
+        hasher.update(canonical)
+        return b''.join((b'{"eventId":"', hasher.hexdigest().encode('ascii'), b'","sourceTruthTime":"',
+                         sourceTruthTime.encode('ascii'), b'",', self.staticJson, b',"payload":', canonical, b'}'))
+
+
+def timeIt(fn, payload, iterations):
+    """Returns (mean us, p99 us) per call"""
+    sourceTruthTime = datetime.now(timezone.utc).isoformat()
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn(payload, sourceTruthTime)
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    return sum(samples) / len(samples), samples[int(len(samples) * 0.99)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='NovaAdapter publish serialization benchmark')
+    parser.add_argument('--iterations', type=int, default=5000)
+    args = parser.parse_args()
+
+    template = TemplatePublisher()
+    for name, payload in (('ubx.nav_sat', navSatPayload()), ('telemetry.gnss', gnssUiData())):
+        legacyMean, legacyP99 = timeIt(legacyPublish, payload, args.iterations)
+        fastMean, fastP99 = timeIt(template.publish, payload, args.iterations)
+        print(f'{name:16s} legacy {legacyMean:8.1f} us (p99 {legacyP99:8.1f})   '
+              f'template {fastMean:8.1f} us (p99 {fastP99:8.1f})   speedup {legacyMean / fastMean:4.2f}x')
+
+
+if __name__ == '__main__':
+    main()
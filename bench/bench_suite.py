@@ -0,0 +1,349 @@
+"""
+NOVA benchmark suite.
+
+Drives deterministic synthetic receiver data (bench/synthetic.py) through the
+parsers, Ingest, Database queries, StreamCursor replay and Export, and records
+throughput, latency percentiles and peak RSS per stage to a JSON results file.
+
+Each stage runs in its own child process so peak RSS is per stage and stages
+cannot warm each other's caches. Stages that read data first build their
+database with insertEventsBatch (not timed).
+
+Results: {"meta": {...}, "stages": {name: {"throughput", "unit", "count",
+"seconds", "p50Ms", "p95Ms", "p99Ms", "peakRssMb"}}}
+
+Comparison: --baseline FILE prints per-stage deltas and exits 1 if any stage's
+throughput dropped by more than --max-regression percent. --save-baseline
+writes this run as the new baseline.
+
+Usage:
+    python bench/bench_suite.py [--seconds 60] [--rate 10] [--receivers 2]
+                                [--stages ingest,query] [--output FILE]
+                                [--baseline bench/baseline.json] [--save-baseline]
+
+Property of Uncompromising Sensors LLC.
+"""
+
+# Imports
+import argparse, asyncio, json, multiprocessing, os, platform, random, resource, shutil, subprocess, sys, tempfile, time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+import synthetic
+
+
+BENCH_DIR = Path(__file__).parent
+DEFAULT_BASELINE = BENCH_DIR / 'baseline.json'
+READ_CHUNK_BYTES = 4096  # Serial/TCP read size fed to the parsers
+
+
+# ============================================================================
+# Measurement helpers
+# ============================================================================
+
+def percentile(sortedValues, fraction):
+    """Nearest-rank percentile of an ascending list"""
+    if not sortedValues:
+        return None
+    return sortedValues[min(len(sortedValues) - 1, max(0, round(fraction * len(sortedValues)) - 1))]
+
+
+def peakRssMb():
+    """Peak resident set size of this process (ru_maxrss is KiB on Linux, bytes on macOS)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def summarize(count, seconds, latencies, unit):
+    """Stage result from operation count, wall time and per-operation latencies (seconds)"""
+    latencies = sorted(latencies)
+    toMs = lambda value: None if value is None else round(value * 1000, 4)
+    return {
+        'throughput': round(count / seconds, 1) if seconds > 0 else None,
+        'unit': unit,
+        'count': count,
+        'seconds': round(seconds, 4),
+        'p50Ms': toMs(percentile(latencies, 0.50)),
+        'p95Ms': toMs(percentile(latencies, 0.95)),
+        'p99Ms': toMs(percentile(latencies, 0.99)),
+    }
+
+
+def buildDatabase(dirPath, config):
+    """Truth database holding the synthetic event set (setup, not timed)"""
+    from nova.core.database import Database
+    database = Database(str(dirPath / 'bench.db'))
+    events = synthetic.truthEvents(config['seconds'], config['rate'], config['receivers'])
+    for offset in range(0, len(events), 5000):
+        batch = events[offset:offset + 5000]
+        for event in batch:
+            event.canonicalTruthTime = event.sourceTruthTime  # Deterministic canonical times
+        database.insertEventsBatch(batch, batch[0].sourceTruthTime)
+    return database, len(events)
+
+
+# ============================================================================
+# Stages
+# ============================================================================
+
+def _parseStage(parser, data, expected):
+    """Feed fixed-size reads through parser.parseAll with carry-over, like a read loop"""
+    latencies = []
+    buffer = b''
+    parsed = 0
+    start = time.perf_counter()
+    for offset in range(0, len(data), READ_CHUNK_BYTES):
+        chunkStart = time.perf_counter()
+        buffer, messages = parser.parseAll(buffer + data[offset:offset + READ_CHUNK_BYTES])
+        latencies.append(time.perf_counter() - chunkStart)
+        parsed += len(messages)
+    seconds = time.perf_counter() - start
+    if parsed != expected:
+        raise RuntimeError(f"Parsed {parsed} messages, expected {expected}")
+    result = summarize(parsed, seconds, latencies, 'messages/s')
+    result['mbPerSecond'] = round(len(data) / seconds / 1e6, 3)
+    return result
+
+
+def stageParseUbx(config, dirPath):
+    from sdk.parsers.ubx import Ubx
+    data, count = synthetic.ubxStream(config['seconds'], config['rate'] * config['receivers'])
+    return _parseStage(Ubx(), data, count)
+
+
+def stageParseSbf(config, dirPath):
+    from sdk.parsers.sbf import Sbf
+    data, count = synthetic.sbfStream(config['seconds'], config['rate'] * config['receivers'])
+    return _parseStage(Sbf(), data, count)
+
+
+def stageParseNmea(config, dirPath):
+    from sdk.parsers.nmea import Nmea
+    data, count = synthetic.nmeaStream(config['seconds'], config['rate'] * config['receivers'])
+    return _parseStage(Nmea(), data, count)
+
+
+def stageIngest(config, dirPath):
+    """Ingest.ingest per event (validate, eventId, dedupe, insert)"""
+    from nova.core.database import Database
+    from nova.core.ingest import Ingest
+    events = synthetic.truthEvents(config['seconds'], config['rate'], config['receivers'])
+    database = Database(str(dirPath / 'bench.db'))
+    ingest = Ingest(database, verifyEventId=False)
+    latencies = []
+    start = time.perf_counter()
+    for event in events:
+        eventStart = time.perf_counter()
+        ingest.ingest(event)
+        latencies.append(time.perf_counter() - eventStart)
+    seconds = time.perf_counter() - start
+    database.close()
+    return summarize(len(events), seconds, latencies, 'events/s')
+
+
+def stageQuery(config, dirPath):
+    """Random 1 s and 10 s source-time windows across all lanes"""
+    from nova.core.events import Timebase
+    database, _ = buildDatabase(dirPath, config)
+    rng = random.Random(5)
+    latencies, rows = [], 0
+    start = time.perf_counter()
+    for i in range(config['queries']):
+        windowSeconds = 1 if i % 2 == 0 else 10
+        windowStart = synthetic.BASE_TIME + timedelta(seconds=rng.uniform(0, max(0, config['seconds'] - windowSeconds)))
+        queryStart = time.perf_counter()
+        rows += len(database.queryEvents(windowStart.isoformat(), (windowStart + timedelta(seconds=windowSeconds)).isoformat(),
+                                         Timebase.SOURCE))
+        latencies.append(time.perf_counter() - queryStart)
+    seconds = time.perf_counter() - start
+    database.close()
+    result = summarize(config['queries'], seconds, latencies, 'queries/s')
+    result['rowsPerSecond'] = round(rows / seconds, 1)
+    return result
+
+
+def stageStream(config, dirPath):
+    """Bounded StreamCursor replay of the whole dataset, unthrottled rate"""
+    from nova.core.contracts import StreamRequest, StreamComplete, TimelineMode
+    from nova.core.streaming import StreamCursor
+    database, total = buildDatabase(dirPath, config)
+    startUs = int(synthetic.BASE_TIME.timestamp() * 1_000_000)
+    request = StreamRequest(requestId='bench', clientConnId='bench', playbackRequestId='bench',
+                            startTime=startUs, stopTime=startUs + int(config['seconds'] * 1_000_000),
+                            rate=1e9, timelineMode=TimelineMode.REPLAY, timebase='source')
+
+    async def run():
+        queue = asyncio.Queue()
+        cursor = StreamCursor(request, database)
+        task = asyncio.create_task(cursor.streamChunks(queue))
+        latencies, events, eventIds = [], 0, set()
+        start = last = time.perf_counter()
+        while True:
+            item = await queue.get()
+            now = time.perf_counter()
+            if isinstance(item, StreamComplete):
+                break
+            latencies.append(now - last)
+            last = now
+            events += len(item.events)
+            eventIds.update(event['eventId'] for event in item.events)
+        seconds = time.perf_counter() - start
+        await task
+        return events, len(eventIds), seconds, latencies
+
+    events, uniqueEvents, seconds, latencies = asyncio.run(run())
+    database.close()
+    if uniqueEvents != total:
+        raise RuntimeError(f"Streamed {uniqueEvents} distinct events, expected {total}")
+    # Windows are inclusive at both ends, so events on a window boundary are delivered twice
+    result = summarize(events, seconds, latencies, 'events/s')
+    result['chunks'] = len(latencies)
+    result['uniqueEvents'] = uniqueEvents
+    return result
+
+
+def stageExport(config, dirPath):
+    """Export of the whole dataset through file drivers"""
+    from nova.core.export import Export
+    from nova.core.events import Timebase
+    database, total = buildDatabase(dirPath, config)
+    exporter = Export(database, dirPath / 'exports')
+    stopTime = synthetic.BASE_TIME + timedelta(seconds=config['seconds'])
+    start = time.perf_counter()
+    result = asyncio.run(exporter.export(synthetic.BASE_TIME.isoformat(), stopTime.isoformat(), Timebase.SOURCE))
+    seconds = time.perf_counter() - start
+    database.close()
+    summary = summarize(result['eventCount'], seconds, [seconds], 'events/s')
+    summary['filesWritten'] = result['filesWritten']
+    return summary
+
+
+STAGES = {
+    'parseUbx': stageParseUbx,
+    'parseSbf': stageParseSbf,
+    'parseNmea': stageParseNmea,
+    'ingest': stageIngest,
+    'query': stageQuery,
+    'stream': stageStream,
+    'export': stageExport,
+}
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+def _stageWorker(name, config, resultQueue):
+    """Child process: run one stage in a scratch directory"""
+    import logging
+    logging.disable(logging.INFO)  # Keep per-query/stream info logs out of the measurement
+    dirPath = Path(tempfile.mkdtemp(prefix=f'nova-bench-{name}-'))
+    try:
+        result = STAGES[name](config, dirPath)
+        result['peakRssMb'] = peakRssMb()
+        resultQueue.put((name, result, None))
+    except Exception as e:
+        resultQueue.put((name, None, f"{type(e).__name__}: {e}"))
+    finally:
+        shutil.rmtree(dirPath, ignore_errors=True)
+
+
+def runStage(name, config):
+    resultQueue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_stageWorker, args=(name, config, resultQueue))
+    process.start()
+    _, result, error = resultQueue.get()
+    process.join()
+    if error:
+        raise RuntimeError(f"Stage {name} failed: {error}")
+    return result
+
+
+def gitCommit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCH_DIR, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def compare(results, baseline, maxRegression):
+    """Print per-stage deltas against baseline. Returns names of stages whose throughput regressed."""
+    regressed = []
+    if baseline.get('meta', {}).get('config') != results['meta']['config']:
+        print(f"note: baseline config {baseline.get('meta', {}).get('config')} differs from this run")
+    print(f"\n{'stage':12s} {'throughput':>14s} {'baseline':>14s} {'change':>8s} {'p95 ms':>10s} {'base p95':>10s}")
+    for name, stage in results['stages'].items():
+        base = baseline.get('stages', {}).get(name)
+        if not base or not base.get('throughput'):
+            print(f"{name:12s} {stage['throughput']:>14} {'-':>14s}")
+            continue
+        change = (stage['throughput'] - base['throughput']) / base['throughput'] * 100
+        flag = ''
+        if change < -maxRegression:
+            regressed.append(name)
+            flag = '  REGRESSED'
+        print(f"{name:12s} {stage['throughput']:>14} {base['throughput']:>14} {change:>+7.1f}% "
+              f"{stage['p95Ms']!s:>10} {base.get('p95Ms')!s:>10}{flag}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='NOVA benchmark suite')
+    parser.add_argument('--seconds', type=float, default=60, help='Synthetic data duration')
+    parser.add_argument('--rate', type=float, default=10, help='Epochs per second per receiver')
+    parser.add_argument('--receivers', type=int, default=2)
+    parser.add_argument('--queries', type=int, default=200, help='Window queries in the query stage')
+    parser.add_argument('--stages', default=','.join(STAGES), help=f'Comma-separated subset of {",".join(STAGES)}')
+    parser.add_argument('--output', help='Results file (default bench/results/bench-<timestamp>.json)')
+    parser.add_argument('--baseline', default=str(DEFAULT_BASELINE), help='Baseline results to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='Write this run to --baseline')
+    parser.add_argument('--max-regression', type=float, default=10.0, help='Allowed throughput drop in percent')
+    args = parser.parse_args()
+
+    stages = [name.strip() for name in args.stages.split(',') if name.strip()]
+    unknown = [name for name in stages if name not in STAGES]
+    if unknown:
+        parser.error(f"Unknown stages: {unknown}")
+
+    config = {'seconds': args.seconds, 'rate': args.rate, 'receivers': args.receivers, 'queries': args.queries}
+    results = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'gitCommit': gitCommit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'machine': platform.machine(),
+            'cpuCount': os.cpu_count(),
+            'config': config,
+        },
+        'stages': {},
+    }
+
+    for name in stages:
+        result = runStage(name, config)
+        results['stages'][name] = result
+        print(f"{name:12s} {result['throughput']:>12} {result['unit']:12s} p50 {result['p50Ms']} ms  "
+              f"p95 {result['p95Ms']} ms  p99 {result['p99Ms']} ms  peak RSS {result['peakRssMb']} MB")
+
+    output = Path(args.output) if args.output else BENCH_DIR / 'results' / f"bench-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2) + '\n')
+    print(f"\nResults: {output}")
+
+    baselinePath = Path(args.baseline)
+    if args.save_baseline:
+        baselinePath.write_text(json.dumps(results, indent=2) + '\n')
+        print(f"Baseline saved: {baselinePath}")
+    elif baselinePath.exists():
+        regressed = compare(results, json.loads(baselinePath.read_text()), args.max_regression)
+        if regressed:
+            print(f"\nThroughput regressed more than {args.max_regression}%: {', '.join(regressed)}")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
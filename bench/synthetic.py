@@ -0,0 +1,194 @@
+"""
+Deterministic synthetic receiver data for benchmarks.
+
+Byte streams a real receiver would emit (framing, checksums and field layout
+accepted by sdk.parsers) and the NOVA events a hardware service would publish
+for them. Every generator is seeded, so the same arguments always produce the
+same bytes and the same eventIds.
+
+- ubxStream:  UBX NAV-PVT + NAV-SAT per epoch (u-blox)
+- sbfStream:  SBF PVTGeodetic per epoch (Septentrio)
+- nmeaStream: GGA + RMC + GSV sentences per epoch
+- truthEvents: raw + parsed + UI events for several receivers at a fixed rate
+
+Property of Uncompromising Sensors LLC.
+"""
+
+# Imports
+import binascii, math, random, struct
+from datetime import datetime, timedelta, timezone
+from functools import reduce
+
+from nova.core.events import RawFrame, ParsedMessage, UiUpdate
+
+
+BASE_TIME = datetime(2026, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+GNSS_IDS = {'GPS': 0, 'GAL': 2, 'BDS': 3, 'GLO': 6}
+
+
+def epochTimes(seconds, rateHz):
+    """Epoch datetimes from BASE_TIME at rateHz"""
+    step = timedelta(microseconds=round(1_000_000 / rateHz))
+    return [BASE_TIME + step * i for i in range(int(seconds * rateHz))]
+
+
+def _track(rng, epoch):
+    """Slowly moving receiver position for an epoch index"""
+    return (37.7749 + 1e-6 * epoch + rng.uniform(-1e-7, 1e-7),
+            -122.4194 + 1e-6 * epoch + rng.uniform(-1e-7, 1e-7),
+            12.5 + rng.uniform(-0.2, 0.2))
+
+
+def _satellites(rng, count):
+    """(gnssId, svId, cno, elev, azim) tuples"""
+    constellations = list(GNSS_IDS.values())
+    return [(constellations[i % len(constellations)], 1 + i // len(constellations), rng.randint(25, 50),
+             rng.randint(5, 89), rng.randint(0, 359)) for i in range(count)]
+
+
+# ============================================================================
+# UBX
+# ============================================================================
+
+def ubxFrame(classId, messageId, payload):
+    """UBX frame: sync, class, id, length, payload, Fletcher-8 checksum"""
+    body = bytes([classId, messageId]) + struct.pack('<H', len(payload)) + payload
+    ca = cb = 0
+    for byte in body:
+        ca = (ca + byte) & 0xff
+        cb = (cb + ca) & 0xff
+    return b'\xb5\x62' + body + bytes([ca, cb])
+
+
+def ubxNavPvt(when, lat, lon, height, numSv):
+    iTow = int((when - BASE_TIME).total_seconds() * 1000) % 604_800_000
+    payload = struct.pack('<IHBBBBBBIiBBBBiiiiIIiiiiiIIHHIihH',
+                          iTow, when.year, when.month, when.day, when.hour, when.minute, when.second, 0x37,
+                          25, 0, 3, 0x01, 0xe0, numSv,
+                          round(lon * 1e7), round(lat * 1e7), round(height * 1000), round((height - 30) * 1000),
+                          800, 1200, 10, -5, 2, 11, 4_500_000, 150, 200_000, 120, 0, 0, 0, 0, 0)
+    return ubxFrame(0x01, 0x07, payload)
+
+
+def ubxNavSat(when, satellites):
+    iTow = int((when - BASE_TIME).total_seconds() * 1000) % 604_800_000
+    payload = struct.pack('<IBBH', iTow, 1, len(satellites), 0)
+    for gnssId, svId, cno, elev, azim in satellites:
+        payload += struct.pack('<BBBbhhI', gnssId, svId, cno, elev, azim, 0, 0x0000_1f0f)
+    return ubxFrame(0x01, 0x35, payload)
+
+
+def ubxStream(seconds=10, rateHz=10, numSv=24, seed=1):
+    """Returns (bytes, frame count): NAV-PVT + NAV-SAT per epoch"""
+    rng = random.Random(seed)
+    frames = []
+    for epoch, when in enumerate(epochTimes(seconds, rateHz)):
+        lat, lon, height = _track(rng, epoch)
+        frames.append(ubxNavPvt(when, lat, lon, height, numSv))
+        frames.append(ubxNavSat(when, _satellites(rng, numSv)))
+    return b''.join(frames), len(frames)
+
+
+# ============================================================================
+# SBF
+# ============================================================================
+
+def sbfBlock(blockNumber, when, body, revision=2):
+    """SBF block: sync, CRC-16/CCITT, ID, length (padded to 4), TOW, WNc, body"""
+    gpsSeconds = (when - datetime(1980, 1, 6, tzinfo=timezone.utc)).total_seconds()
+    tow, wnc = int(gpsSeconds % 604800 * 1000), int(gpsSeconds // 604800)
+    content = struct.pack('<IH', tow, wnc) + body
+    length = 8 + len(content)
+    content += b'\x00' * (-length % 4)
+    header = struct.pack('<HH', blockNumber | (revision << 13), 8 + len(content))
+    crc = binascii.crc_hqx(header + content, 0)
+    return b'$@' + struct.pack('<H', crc) + header + content
+
+
+def sbfPvtGeodetic(when, lat, lon, height, numSv):
+    body = struct.pack('<BBdddfffffdfBBBBHHIBBHHHHB',
+                       4, 0, math.radians(lat), math.radians(lon), height, -32.1, 0.01, -0.02, 0.0, 45.0,
+                       0.12, 0.3, 0, 0, numSv, 0, 0, 0, 0, 0, 1, 0, 25, 80, 120, 0)
+    return sbfBlock(4007, when, body)
+
+
+def sbfStream(seconds=10, rateHz=10, numSv=24, seed=2):
+    """Returns (bytes, block count): PVTGeodetic per epoch"""
+    rng = random.Random(seed)
+    blocks = []
+    for epoch, when in enumerate(epochTimes(seconds, rateHz)):
+        lat, lon, height = _track(rng, epoch)
+        blocks.append(sbfPvtGeodetic(when, lat, lon, height, numSv))
+    return b''.join(blocks), len(blocks)
+
+
+# ============================================================================
+# NMEA
+# ============================================================================
+
+def nmeaSentence(body):
+    """$<body>*<checksum>\\r\\n"""
+    checksum = reduce(lambda a, c: a ^ ord(c), body, 0)
+    return f"${body}*{checksum:02X}\r\n".encode('ascii')
+
+
+def _nmeaAngle(value, degreeDigits):
+    degrees = int(abs(value))
+    minutes = (abs(value) - degrees) * 60
+    return f"{degrees:0{degreeDigits}d}{minutes:07.4f}"
+
+
+def nmeaEpoch(when, lat, lon, height, satellites):
+    hhmmss = when.strftime('%H%M%S') + f".{when.microsecond // 10000:02d}"
+    latText, lonText = _nmeaAngle(lat, 2), _nmeaAngle(lon, 3)
+    ns, ew = ('N' if lat >= 0 else 'S'), ('E' if lon >= 0 else 'W')
+    sentences = [
+        nmeaSentence(f"GPGGA,{hhmmss},{latText},{ns},{lonText},{ew},1,{len(satellites):02d},0.9,{height:.1f},M,-32.1,M,,"),
+        nmeaSentence(f"GPRMC,{hhmmss},A,{latText},{ns},{lonText},{ew},0.02,45.0,{when.strftime('%d%m%y')},,,A"),
+    ]
+    gps = [s for s in satellites if s[0] == GNSS_IDS['GPS']]
+    pages = max(1, math.ceil(len(gps) / 4))
+    for page in range(pages):
+        fields = ''.join(f",{svId:02d},{elev:02d},{azim:03d},{cno:02d}" for _, svId, cno, elev, azim in gps[page * 4:page * 4 + 4])
+        sentences.append(nmeaSentence(f"GPGSV,{pages},{page + 1},{len(gps):02d}{fields}"))
+    return sentences
+
+
+def nmeaStream(seconds=10, rateHz=10, numSv=24, seed=3):
+    """Returns (bytes, sentence count): GGA + RMC + GSV pages per epoch"""
+    rng = random.Random(seed)
+    sentences = []
+    for epoch, when in enumerate(epochTimes(seconds, rateHz)):
+        lat, lon, height = _track(rng, epoch)
+        sentences.extend(nmeaEpoch(when, lat, lon, height, _satellites(rng, numSv)))
+    return b''.join(sentences), len(sentences)
+
+
+# ============================================================================
+# Truth events
+# ============================================================================
+
+def truthEvents(seconds=10, rateHz=10, receivers=2, scopeId='bench', seed=4):
+    """
+    Events a hardware service would publish: per receiver and epoch one raw
+    frame (NAV-PVT bytes), one parsed ubx.nav_pvt and one telemetry.gnss UI update.
+    Returned in source-time order.
+    """
+    rng = random.Random(seed)
+    events = []
+    for epoch, when in enumerate(epochTimes(seconds, rateHz)):
+        sourceTruthTime = when.isoformat()
+        for receiver in range(receivers):
+            uniqueId = f"gps{receiver + 1}"
+            lat, lon, height = _track(rng, epoch)
+            numSv = rng.randint(12, 30)
+            events.append(RawFrame.create(scopeId, sourceTruthTime, 'hardwareService', 'node1', uniqueId,
+                                          ubxNavPvt(when, lat, lon, height, numSv)))
+            events.append(ParsedMessage.create(scopeId, sourceTruthTime, 'hardwareService', 'node1', uniqueId,
+                                               'ubx.nav_pvt', 'v1',
+                                               {'lat': round(lat, 9), 'lon': round(lon, 9), 'height': round(height, 3),
+                                                'numSv': numSv, 'fixType': '3D Fix', 'hAcc': 0.8, 'vAcc': 1.2}))
+            events.append(UiUpdate.create(scopeId, sourceTruthTime, 'hardwareService', 'node1', uniqueId,
+                                          'telemetry.gnss', 'telemetry.gnss', '1.0.0',
+                                          {'lat': round(lat, 9), 'lon': round(lon, 9), 'alt': round(height, 3), 'numSv': numSv}))
+    return events
@@ -13,11 +13,25 @@ Architecture Contract:
 - EventId MUST be stable across languages (Python, C++, JavaScript, etc.)
 - Same content → same eventId (idempotency for dedupe)
 - Different content → different eventId (uniqueness)
+
+Fast path (normalizeJson / canonicalizeJson):
+Producers historically normalized payloads with json.loads(json.dumps(obj)) before
+canonicalizing. normalizeJson produces the same object in a single pass (dict keys
+to strings exactly as json.dumps would, tuples to lists, numpy scalars/arrays to
+Python numbers/lists), so canonical output is byte-for-byte identical.
 """
 
+import sys
+
 import canonicaljson
 
 
+def _numpy():
+    """numpy if some module already imported it, else None (no numpy object can exist yet).
+    Keeps numpy's import cost out of Core startup; numpy is optional for Core."""
+    return sys.modules.get('numpy')
+
+
 def canonicalJson(obj: any) -> str:
     """
     Canonical JSON serialization for EventId stability (RFC 8785 JCS).
@@ -72,3 +86,101 @@ def canonicalJsonBytes(obj: any) -> bytes:
         Canonical JSON as UTF-8 bytes
     """
     return canonicaljson.encode_canonical_json(obj)
+
+
+# Non-string dict keys converted the way json.dumps does (cached: svIds, channel numbers repeat every message).
+# Keyed by (type, key) because 1, 1.0 and True are equal dict keys but serialize differently.
+_keyCache = {(bool, True): 'true', (bool, False): 'false', (type(None), None): 'null'}
+
+
+def _normalizeKey(key) -> str:
+    """Convert a dict key to the string json.dumps would emit for it."""
+    cacheKey = (type(key), key)
+    try:
+        cached = _keyCache.get(cacheKey)
+    except TypeError:
+        cached = None
+    if cached is not None:
+        return cached
+    if isinstance(key, str):
+        return str(key)
+    _np = _numpy()
+    if isinstance(key, bool) or (_np is not None and isinstance(key, _np.bool_)):
+        result = 'true' if key else 'false'
+    elif isinstance(key, int) or (_np is not None and isinstance(key, _np.integer)):
+        result = int.__repr__(int(key))
+    elif isinstance(key, float) or (_np is not None and isinstance(key, _np.floating)):
+        value = float(key)
+        if value != value:
+            result = 'NaN'
+        elif value in (float('inf'), float('-inf')):
+            result = 'Infinity' if value > 0 else '-Infinity'
+        else:
+            result = float.__repr__(value)
+        return result                                   # Not cached: 0.0 == -0.0 and NaN never matches
+    else:
+        raise TypeError(f'keys must be str, int, float, bool or None, not {key.__class__.__name__}')
+    if len(_keyCache) < 4096:
+        _keyCache[cacheKey] = result
+    return result
+
+
+def _normalizeOther(obj):
+    """Slow path of normalizeJson for subclasses and numpy types."""
+    if isinstance(obj, bool):
+        return bool(obj)
+    if isinstance(obj, int):
+        return int(obj)
+    if isinstance(obj, float):
+        return float(obj)
+    if isinstance(obj, str):
+        return str(obj)
+    if isinstance(obj, dict):
+        return {key if type(key) is str else _normalizeKey(key): normalizeJson(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [normalizeJson(value) for value in obj]
+    _np = _numpy()
+    if _np is not None and isinstance(obj, _np.generic):
+        return normalizeJson(obj.item())
+    if _np is not None and isinstance(obj, _np.ndarray):
+        return normalizeJson(obj.tolist())
+    raise TypeError(f'Object of type {obj.__class__.__name__} is not JSON serializable')
+
+
+def normalizeJson(obj: any) -> any:
+    """
+    Normalize a Python object to plain JSON types in a single pass.
+    
+    Equivalent to json.loads(json.dumps(obj)) for everything json.dumps accepts
+    (dict keys become strings, tuples become lists), and additionally converts
+    numpy scalars and arrays to Python numbers and lists.
+    
+    Args:
+        obj: Python object (dict, list, tuple, primitives, numpy scalars/arrays)
+        
+    Returns:
+        Normalized object containing only dict/list/str/int/float/bool/None
+        
+    Raises:
+        TypeError: If obj contains non-serializable types
+    """
+    objType = type(obj)
+    if objType is str or objType is int or objType is float or objType is bool or obj is None:
+        return obj
+    if objType is dict:
+        return {key if type(key) is str else _normalizeKey(key): normalizeJson(value) for key, value in obj.items()}
+    if objType is list or objType is tuple:
+        return [normalizeJson(value) for value in obj]
+    return _normalizeOther(obj)
+
+
+def canonicalizeJson(obj: any) -> tuple:
+    """
+    Normalize and canonicalize in one call.
+    
+    Returns:
+        (normalizedObject, canonicalBytes) where canonicalBytes is byte-for-byte
+        identical to canonicalJsonBytes(json.loads(json.dumps(obj)))
+    """
+    normalized = normalizeJson(obj)
+    return normalized, canonicaljson.encode_canonical_json(normalized)
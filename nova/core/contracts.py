@@ -36,6 +36,14 @@ class RequestType(str, Enum):
     CANCEL_STREAM_RAW = "cancelStreamRaw"
     # Phase 9: Metadata ingest from Server (chat messages)
     INGEST_METADATA = "ingestMetadata"
+    # Core metrics snapshot for the Server's /metrics route
+    GET_METRICS = "getMetrics"
+    # Admin-triggered profiling session in Core
+    PROFILE = "profile"
+    # Event loop stall ring from Core's watchdog
+    GET_STALLS = "getStalls"
+    # Multi-resolution bucket summaries for timeline scrubbing
+    QUERY_OVERVIEW = "queryOverview"
 
 
 class ResponseType(str, Enum):
@@ -78,6 +86,7 @@ class StreamRequest:
     timelineMode: TimelineMode
     timebase: str = "canonical"  # "canonical" or "source"
     filters: Optional[Dict[str, Any]] = None
+    unpaced: bool = False  # Bounded replay as fast as the consumer drains (rate sign sets direction only)
 
     def toDict(self) -> Dict[str, Any]:
         d = asdict(self)
@@ -20,13 +20,56 @@ Schema:
 - eventIndex: Global dedupe table (eventId PK)
 - rawEvents, parsedEvents, uiEvents, commandEvents, metadataEvents: Per-lane tables
 - All lane tables reference eventIndex via FK
+- segmentCatalog: Time-partitioned segment files (see below)
+- retentionState: Per-rule retention watermarks (nova/core/retention.py)
+- replicationState: Per-peer replication cursors (nova/core/replication.py)
+- sequenceState: Reserved ingest sequence block (lane rows' ingestSeq, replication order)
+- payloadDictionaries: Payload codec dictionaries (nova/core/payloadCodec.py)
+- overviewBuckets: Overview pyramid aggregates (nova/core/overview.py)
+
+Time-Partitioned Segments:
+  High-volume lanes (raw, parsed, ui) are stored in segment files, one per
+  period (day by default) of canonicalTruthTime, under <dbStem>_segments/.
+  The main file keeps eventIndex (global dedupe), commandEvents,
+  metadataEvents and the segmentCatalog, which records each segment's file
+  and the range of sourceTruthTime periods it contains.
+  - Inserts go to the segment of the event's canonicalTruthTime period
+  - queryEvents only opens segments overlapping the requested window
+  - Lane tables in the main file remain queryable (pre-segment data and
+    events whose canonicalTruthTime cannot be partitioned)
+  - Segment row commits before its eventIndex row; on open, the newest
+    segment's trailing rows are re-indexed so a crash between the two
+    commits cannot leave an event outside dedupe
+  - archiveSegment() moves a closed segment out of the live set
+  - queryEvents(ingestOrder=True) merges each lane's sources by ingestSeq
+    (database-wide), so export order is ingest order whichever file a row landed in
+
+Duplicate Fast Path:
+  A Bloom filter over recent eventIds (rebuilt from eventIndex at open) lets
+  insertEvent confirm likely duplicates with an indexed read instead of a
+  failed insert; definitely-new events go straight to the insert.
+
+Payload Compression (optional, see payloadCodec.py):
+  Parsed payload / UI data columns may hold dictionary-compressed blobs next to
+  plain JSON text. Dictionaries (payloadDictionaries, main file) are trained per
+  Parsed messageType / UI manifestId from the first rows written, or from stored rows by
+  trainPayloadDictionaries(); queryEvents and readRowsSince return plain JSON
+  either way. migratePayloads() re-encodes stored rows to the configured codec.
+
+Query Cache (optional, see queryCache.py):
+  Decoded queryEvents results for windows ending before the live margin are
+  kept in an LRU with a byte budget. Inserts into a cached window, retention
+  deletes and segment archival invalidate the affected entries.
 """
 
 import sqlite3
 import json
+import re
+import shutil
 import threading
 import time
-from datetime import datetime
+from collections import OrderedDict
+from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any, Tuple
 from pathlib import Path
 
@@ -35,8 +78,12 @@ from sdk.logging import getLogger
 # Import architectural invariants from single source of truth
 from .contract import (
     Lane, Timebase,
-    LANE_TABLE_NAMES
+    LANE_TABLE_NAMES, LANE_PRIORITY
 )
+from .dedupeFilter import DedupeFilter
+from .metrics import getRegistry
+from .payloadCodec import PayloadCodec, PayloadCodecError
+from .queryCache import QueryCache
 from .events import (
     Event,
     RawFrame, ParsedMessage, UiUpdate, 
@@ -50,6 +97,55 @@ class DatabaseError(Exception):
     pass
 
 
+_metrics = getRegistry()
+INSERT_SECONDS = _metrics.histogram('nova_db_insert_seconds', 'Database.insertEvent latency including dedupe and commit', ('lane',))
+INSERTS_TOTAL = _metrics.counter('nova_db_inserts_total', 'Database.insertEvent calls by outcome', ('lane', 'result'))
+QUERY_SECONDS = _metrics.histogram('nova_db_query_seconds', 'Database.queryEvents latency')
+QUERY_ROWS_TOTAL = _metrics.counter('nova_db_query_rows_total', 'Events returned by Database.queryEvents')
+
+
+# Lanes stored in time-partitioned segment files (Command/Metadata stay in the main file)
+SEGMENTED_LANES = (Lane.RAW, Lane.PARSED, Lane.UI)
+
+# Lanes whose JSON column may be compressed by the payload codec -> (column, dictionary key column)
+# UI rows are all messageType UiUpdate; their shape follows the manifest
+CODEC_COLUMNS = {Lane.PARSED: ('payload', 'messageType'), Lane.UI: ('data', 'manifestId')}
+
+# Overview bucket merge: counts add, min/max widen, last follows the newest canonicalTruthTime
+OVERVIEW_MERGE = """
+    INSERT INTO overviewBuckets (tier, bucketStart, scopeId, lane, systemId, containerId, uniqueId, messageType,
+                                 field, count, minValue, maxValue, lastValue, lastTime)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (tier, bucketStart, scopeId, lane, systemId, containerId, uniqueId, messageType, field) DO UPDATE SET
+        count = count + excluded.count,
+        minValue = min(minValue, excluded.minValue),
+        maxValue = max(maxValue, excluded.maxValue),
+        lastValue = CASE WHEN excluded.lastTime >= lastTime THEN excluded.lastValue ELSE lastValue END,
+        lastTime = max(lastTime, excluded.lastTime)
+"""
+
+# Ingest sequence numbers reserved per sequenceState write (unused numbers are skipped after a restart)
+INGEST_SEQ_BLOCK = 4096
+
+# Segment period -> (timestamp prefix length, valid partition key pattern)
+SEGMENT_PERIODS = {
+    'month': (7, re.compile(r'^\d{4}-\d{2}$')),
+    'day': (10, re.compile(r'^\d{4}-\d{2}-\d{2}$')),
+    'hour': (13, re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}$')),
+}
+
+
+
+def _storedUtcTime(value: str) -> str:
+    """ISO8601 time (Z, any offset, or naive = UTC) in the stored canonicalTruthTime form (UTC isoformat)"""
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        raise DatabaseError(f"Invalid time: {value!r}")
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc).isoformat()
+    return parsed.astimezone(timezone.utc).isoformat()
+
 class Database:
     """
     SQLite truth database with abstract interface.
@@ -57,48 +153,106 @@ class Database:
     Design: Keep DB-specific details isolated to enable future swapping.
     """
     
-    def __init__(self, dbPath: str):
+    def __init__(self, dbPath: str, segmentPeriod: Optional[str] = 'day',
+                 maxOpenSegmentReaders: int = 16, maxOpenSegmentWriters: int = 4,
+                 dedupeFilterCapacity: int = 1000000, payloadCodec: Optional[Dict[str, Any]] = None,
+                 queryCache: Optional[Dict[str, Any]] = None):
         """
         Initialize database connection.
         
         Args:
-            dbPath: Path to SQLite database file
+            dbPath: Path to SQLite database file (main file: dedupe index, catalog, command/metadata lanes)
+            segmentPeriod: 'month', 'day' or 'hour' partitioning of raw/parsed/ui lanes,
+                           or None to keep every lane in the main file
+            maxOpenSegmentReaders: Segment read connections kept open (LRU)
+            maxOpenSegmentWriters: Segment write connections kept open (LRU)
+            dedupeFilterCapacity: Recent eventIds per Bloom filter generation (0 disables the filter)
+            payloadCodec: PayloadCodec settings ({codec, level, dictionarySize, trainSamples}) for
+                          Parsed/UI JSON columns; None or codec None stores plain JSON
+            queryCache: QueryCache settings ({maxBytes, maxEntryBytes, liveMarginSeconds}) for
+                        decoded historical query results; None or maxBytes 0 disables caching
         """
+        if segmentPeriod is not None and segmentPeriod not in SEGMENT_PERIODS:
+            raise DatabaseError(f"Invalid segmentPeriod '{segmentPeriod}', expected one of {list(SEGMENT_PERIODS)} or None")
         self.log = getLogger()
         self.dbPath = Path(dbPath)
         self.dbPath.parent.mkdir(parents=True, exist_ok=True)
+        self.segmentPeriod = segmentPeriod
+        self.segmentDir = self.dbPath.parent / f"{self.dbPath.stem}_segments"
+        self._keyLength, self._keyPattern = SEGMENT_PERIODS.get(segmentPeriod, (0, None))
+        self.maxOpenSegmentReaders = maxOpenSegmentReaders
+        self.maxOpenSegmentWriters = maxOpenSegmentWriters
         self.conn: Optional[sqlite3.Connection] = None
         self._readConn: Optional[sqlite3.Connection] = None  # Dedicated read connection
         self._writeLock = threading.Lock()  # Serialize writes only
         self._readLock = threading.Lock()  # Serialize read connection access
+        self._segments: Dict[str, Dict[str, Any]] = {}  # segmentId -> catalog entry
+        self._segmentWriters: OrderedDict = OrderedDict()  # segmentId -> write connection (LRU)
+        self._segmentReaders: OrderedDict = OrderedDict()  # segmentId -> read connection (LRU)
+        self._compacting: set = set()  # segmentIds being VACUUMed (late inserts go to the main file)
+        self._ingestSeq = 0  # Last assigned ingest sequence number (replication order, stable across VACUUM)
+        self._ingestSeqCeiling = 0  # Highest number reserved in sequenceState
+        self._dedupeFilter: Optional[DedupeFilter] = DedupeFilter(dedupeFilterCapacity) if dedupeFilterCapacity > 0 else None
+        self.dedupeStats = {'probes': 0, 'duplicates': 0, 'falsePositives': 0, 'missed': 0}
+        try:
+            self._payloadCodec = PayloadCodec(**(payloadCodec or {}))
+        except (PayloadCodecError, TypeError) as e:
+            raise DatabaseError(f"Invalid payloadCodec: {e}")
+        self._payloadCodec.loadDictionary = self._loadPayloadDictionary
+        self._queryCache: Optional[QueryCache] = QueryCache.fromConfig(queryCache)
         self._connect()
         self._initSchema()
+        self._loadSegments()
+        self._loadIngestSeq()
+        self._loadDedupeFilter()
+        self._loadPayloadDictionaries()
     
-    def _connect(self):
-        """Establish database connection with settings for high-throughput writes"""
-        self.conn = sqlite3.connect(
-            str(self.dbPath),
+    @staticmethod
+    def _openWriteConnection(path: Path) -> sqlite3.Connection:
+        """Open a connection with settings for high-throughput writes"""
+        conn = sqlite3.connect(
+            str(path),
             check_same_thread=False,  # Allow multi-thread access (with caution)
             isolation_level='DEFERRED',  # Let Python manage transactions
             timeout=30.0  # Wait up to 30s for locks instead of failing immediately
         )
-        self.conn.row_factory = sqlite3.Row  # Access columns by name
+        conn.row_factory = sqlite3.Row  # Access columns by name
         
         # Configure for high-throughput writes (gigabytes of data)
         # WAL mode for better write concurrency
-        self.conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA journal_mode=WAL")
         # NORMAL sync is safe in WAL mode, balances durability/performance
-        self.conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
         # Large cache for high throughput (negative = KB, -64000 = ~64MB cache)
-        self.conn.execute("PRAGMA cache_size=-64000")
+        conn.execute("PRAGMA cache_size=-64000")
         # Disable auto-checkpoint - we checkpoint manually or on close
         # This prevents checkpoint stalls during heavy writes
-        self.conn.execute("PRAGMA wal_autocheckpoint=0")
+        conn.execute("PRAGMA wal_autocheckpoint=0")
         # Memory-map up to 256MB of database for faster access
-        self.conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA mmap_size=268435456")
         # Temp tables in memory (faster)
-        self.conn.execute("PRAGMA temp_store=MEMORY")
-        self.conn.commit()
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.commit()
+        return conn
+    
+    @staticmethod
+    def _openReadConnection(path: Path) -> sqlite3.Connection:
+        """Open a read-only tuned connection"""
+        conn = sqlite3.connect(
+            str(path),
+            check_same_thread=False,
+            timeout=30.0
+        )
+        conn.row_factory = sqlite3.Row
+        # Read-only optimizations
+        conn.execute("PRAGMA query_only=ON")
+        conn.execute("PRAGMA cache_size=-32000")  # 32MB cache for reads
+        conn.execute("PRAGMA mmap_size=268435456")  # Memory-map
+        return conn
+    
+    def _connect(self):
+        """Establish database connection with settings for high-throughput writes"""
+        self.conn = self._openWriteConnection(self.dbPath)
     
     def _getReadConnection(self) -> sqlite3.Connection:
         """
@@ -108,16 +262,7 @@ class Database:
         Uses a single persistent read connection (with lock for cursor isolation).
         """
         if self._readConn is None:
-            self._readConn = sqlite3.connect(
-                str(self.dbPath),
-                check_same_thread=False,
-                timeout=30.0
-            )
-            self._readConn.row_factory = sqlite3.Row
-            # Read-only optimizations
-            self._readConn.execute("PRAGMA query_only=ON")
-            self._readConn.execute("PRAGMA cache_size=-32000")  # 32MB cache for reads
-            self._readConn.execute("PRAGMA mmap_size=268435456")  # Memory-map
+            self._readConn = self._openReadConnection(self.dbPath)
         return self._readConn
     
     def _initSchema(self):
@@ -151,6 +296,7 @@ class Database:
                     bytes BLOB NOT NULL,
                     connectionId TEXT,
                     sequence INTEGER,
+                    ingestSeq INTEGER,
                     FOREIGN KEY (eventId) REFERENCES eventIndex(eventId)
                 )
             """)
@@ -191,6 +337,7 @@ class Database:
                     messageType TEXT NOT NULL,
                     schemaVersion TEXT NOT NULL,
                     payload TEXT NOT NULL,
+                    ingestSeq INTEGER,
                     FOREIGN KEY (eventId) REFERENCES eventIndex(eventId)
                 )
             """)
@@ -233,6 +380,7 @@ class Database:
                     manifestId TEXT NOT NULL,
                     manifestVersion TEXT NOT NULL,
                     data TEXT NOT NULL,
+                    ingestSeq INTEGER,
                     FOREIGN KEY (eventId) REFERENCES eventIndex(eventId)
                 )
             """)
@@ -267,6 +415,7 @@ class Database:
                     targetId TEXT NOT NULL,
                     commandType TEXT NOT NULL,
                     payload TEXT NOT NULL,
+                    ingestSeq INTEGER,
                     FOREIGN KEY (eventId) REFERENCES eventIndex(eventId)
                 )
             """)
@@ -303,6 +452,7 @@ class Database:
                     effectiveTime TEXT NOT NULL,
                     manifestId TEXT,
                     payload TEXT NOT NULL,
+                    ingestSeq INTEGER,
                     FOREIGN KEY (eventId) REFERENCES eventIndex(eventId)
                 )
             """)
@@ -328,6 +478,83 @@ class Database:
                 ON {metadataTable}(effectiveTime)
             """)
             
+            # Segment catalog: one row per time-partitioned segment file
+            # minSourceKey/maxSourceKey: range of sourceTruthTime periods stored in the segment
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS segmentCatalog (
+                    segmentId TEXT PRIMARY KEY NOT NULL,
+                    path TEXT NOT NULL,
+                    minSourceKey TEXT,
+                    maxSourceKey TEXT,
+                    state TEXT NOT NULL DEFAULT 'active',
+                    createdAt TEXT NOT NULL
+                )
+            """)
+            
+            # Retention watermarks: canonicalTruthTime through which each rule has been applied
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS retentionState (
+                    ruleId TEXT PRIMARY KEY NOT NULL,
+                    processedThrough TEXT NOT NULL
+                )
+            """)
+            
+            # Lane rows carry ingestSeq, a stable ingest sequence (rowids can change on VACUUM)
+            for table in LANE_TABLE_NAMES.values():
+                self._migrateIngestSeq(self.conn, table)
+            
+            # Ingest sequence: highest number reserved (see _reserveIngestSeq)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS sequenceState (
+                    name TEXT PRIMARY KEY NOT NULL,
+                    value INTEGER NOT NULL
+                )
+            """)
+            
+            # Replication high-water marks: per-peer cursor (JSON {source: ingestSeq}) into the peer's tables
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS replicationState (
+                    peerId TEXT PRIMARY KEY NOT NULL,
+                    cursor TEXT NOT NULL,
+                    eventsApplied INTEGER NOT NULL DEFAULT 0,
+                    updatedAt TEXT NOT NULL
+                )
+            """)
+            
+            # Payload codec dictionaries (payloadCodec.py): referenced by dictId from compressed rows
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS payloadDictionaries (
+                    dictId INTEGER PRIMARY KEY AUTOINCREMENT,
+                    codec TEXT NOT NULL,
+                    lane TEXT NOT NULL,
+                    messageType TEXT NOT NULL,
+                    dictionary BLOB NOT NULL,
+                    sampleCount INTEGER NOT NULL,
+                    createdAt TEXT NOT NULL
+                )
+            """)
+            
+            # Overview pyramid (overview.py): per-tier bucket aggregates, one row per field ('' = event count)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS overviewBuckets (
+                    tier INTEGER NOT NULL,
+                    bucketStart INTEGER NOT NULL,
+                    scopeId TEXT NOT NULL,
+                    lane TEXT NOT NULL,
+                    systemId TEXT NOT NULL,
+                    containerId TEXT NOT NULL,
+                    uniqueId TEXT NOT NULL,
+                    messageType TEXT NOT NULL,
+                    field TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    minValue REAL,
+                    maxValue REAL,
+                    lastValue REAL,
+                    lastTime TEXT NOT NULL,
+                    PRIMARY KEY (tier, bucketStart, scopeId, lane, systemId, containerId, uniqueId, messageType, field)
+                ) WITHOUT ROWID
+            """)
+            
             self.conn.commit()
             
         except sqlite3.Error as e:
@@ -335,7 +562,1058 @@ class Database:
         finally:
             cursor.close()
     
+    @staticmethod
+    def _migrateIngestSeq(conn: sqlite3.Connection, table: str):
+        """
+        Index a lane table's ingestSeq, adding the column (backfilled from rowid, the
+        previous replication cursor) to tables created before it existed.
+        """
+        columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+        if 'ingestSeq' not in columns:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN ingestSeq INTEGER")
+            conn.execute(f"UPDATE {table} SET ingestSeq = rowid")
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_ingestSeq ON {table}(ingestSeq)")
+    
+    def _loadIngestSeq(self):
+        """
+        Resume the ingest sequence after the reserved block.
+        
+        A database without a reservation yet (new, or created before ingestSeq) has
+        its live segments migrated and resumes after the highest stored number.
+        """
+        row = self.conn.execute("SELECT value FROM sequenceState WHERE name = 'ingestSeq'").fetchone()
+        if row is not None:
+            self._ingestSeq = self._ingestSeqCeiling = row[0]
+            return
+        
+        highest = 0
+        for segment in [s for s in self._segments.values() if s['state'] == 'active']:
+            conn = self._getSegmentWriteConnection(segment)
+            try:
+                for lane in SEGMENTED_LANES:
+                    table = LANE_TABLE_NAMES[lane]
+                    self._migrateIngestSeq(conn, table)
+                    highest = max(highest, conn.execute(f"SELECT MAX(ingestSeq) FROM {table}").fetchone()[0] or 0)
+                conn.commit()
+            except sqlite3.Error as e:
+                conn.rollback()
+                raise DatabaseError(f"Segment migration failed ({segment['segmentId']}): {e}")
+        for table in LANE_TABLE_NAMES.values():
+            highest = max(highest, self.conn.execute(f"SELECT MAX(ingestSeq) FROM {table}").fetchone()[0] or 0)
+        with self._writeLock:
+            self._ingestSeq = highest
+            self._reserveIngestSeq()
+    
+    def _reserveIngestSeq(self):
+        """
+        Persist the next block of ingest sequence numbers before handing them out, so
+        numbers are never reused - not even after the newest rows are removed.
+        Caller holds _writeLock with no open transaction on the main connection.
+        """
+        try:
+            self.conn.execute("INSERT OR REPLACE INTO sequenceState (name, value) VALUES ('ingestSeq', ?)",
+                              (self._ingestSeq + INGEST_SEQ_BLOCK,))
+            self.conn.commit()
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            raise DatabaseError(f"Ingest sequence reservation failed: {e}")
+        self._ingestSeqCeiling = self._ingestSeq + INGEST_SEQ_BLOCK
+    
+    def _nextIngestSeq(self) -> int:
+        """Next ingest sequence number (caller holds _writeLock with no open main-file transaction)"""
+        if self._ingestSeq >= self._ingestSeqCeiling:
+            self._reserveIngestSeq()
+        self._ingestSeq += 1
+        return self._ingestSeq
+    
+    # ========================================================================
+    # Time-Partitioned Segments
+    # ========================================================================
+    
+    def _loadSegments(self):
+        """Load segment catalog and reconcile the newest segment with eventIndex"""
+        rows = self.conn.execute(
+            "SELECT segmentId, path, minSourceKey, maxSourceKey, state FROM segmentCatalog ORDER BY segmentId"
+        ).fetchall()
+        self._segments = {row['segmentId']: dict(row) for row in rows}
+        for segment in self._segments.values():
+            if segment['state'] == 'active' and not self._segmentPath(segment).exists():
+                # Not persisted: the file may be restored later
+                self.log.warning(f"[Database] Segment file missing, excluded from queries: {segment['segmentId']}",
+                                 path=str(self._segmentPath(segment)))
+                segment['state'] = 'missing'
+        
+        liveSegments = [s for s in self._segments.values() if s['state'] == 'active']
+        if liveSegments:
+            self._reconcileSegment(liveSegments[-1])
+    
+    def _loadDedupeFilter(self):
+        """Seed the dedupe filter with the most recent eventIds (eventIndex rowid = ingest order)"""
+        if self._dedupeFilter is None:
+            return
+        limit = self._dedupeFilter.capacity * 2
+        rows = self.conn.execute(
+            "SELECT eventId FROM (SELECT rowid, eventId FROM eventIndex ORDER BY rowid DESC LIMIT ?) ORDER BY rowid",
+            (limit,)
+        ).fetchall()
+        self._dedupeFilter.update(row[0] for row in rows)
+    
+    def _segmentPath(self, segment: Dict[str, Any]) -> Path:
+        """Resolve catalog path (relative to segmentDir unless archived elsewhere)"""
+        path = Path(segment['path'])
+        return path if path.is_absolute() else self.segmentDir / path
+    
+    def _reconcileSegment(self, segment: Dict[str, Any], tailRows: int = 10000):
+        """
+        Repair the crash window between segment commit and eventIndex commit.
+        
+        Re-indexes the segment's most recent rows and recomputes its source-time
+        bounds from the (indexed) min/max sourceTruthTime.
+        """
+        conn = self._getSegmentWriteConnection(segment)
+        minKeys, maxKeys = [], []
+        with self._writeLock:
+            try:
+                for lane in SEGMENTED_LANES:
+                    table = LANE_TABLE_NAMES[lane]
+                    eventIds = conn.execute(
+                        f"SELECT eventId FROM {table} ORDER BY rowid DESC LIMIT ?", (tailRows,)
+                    ).fetchall()
+                    self.conn.executemany(
+                        "INSERT OR IGNORE INTO eventIndex (eventId) VALUES (?)",
+                        [(row[0],) for row in eventIds]
+                    )
+                    low, high = conn.execute(
+                        f"SELECT MIN(sourceTruthTime), MAX(sourceTruthTime) FROM {table}"
+                    ).fetchone()
+                    if low is not None:
+                        minKeys.append(low[:self._keyLength])
+                        maxKeys.append(high[:self._keyLength])
+                if minKeys:
+                    segment['minSourceKey'] = min(minKeys)
+                    segment['maxSourceKey'] = max(maxKeys)
+                    self.conn.execute(
+                        "UPDATE segmentCatalog SET minSourceKey = ?, maxSourceKey = ? WHERE segmentId = ?",
+                        (segment['minSourceKey'], segment['maxSourceKey'], segment['segmentId'])
+                    )
+                self.conn.commit()
+            except sqlite3.Error as e:
+                self.conn.rollback()
+                raise DatabaseError(f"Segment reconcile failed ({segment['segmentId']}): {e}")
+    
+    def _segmentKey(self, canonicalTruthTime: str) -> Optional[str]:
+        """Partition key (period prefix of canonicalTruthTime), or None if unpartitionable"""
+        if self._keyPattern is None or not canonicalTruthTime:
+            return None
+        key = canonicalTruthTime[:self._keyLength]
+        return key if self._keyPattern.match(key) else None
+    
+    def _routeSegment(self, lane: Lane, canonicalTruthTime: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the segment for an insert, creating it on first use.
+        None means the main file (unsegmented lane, partitioning disabled or unparseable time).
+        Caller holds _writeLock with no open transaction on the main connection.
+        """
+        if lane not in SEGMENTED_LANES:
+            return None
+        segmentId = self._segmentKey(canonicalTruthTime)
+        if segmentId is None:
+            return None
+        segment = self._segments.get(segmentId)
+        if segment is not None:
+            if segment['state'] != 'active' or segmentId in self._compacting:
+                return None  # Archived or compacting period: late events stay queryable in the main file
+            return segment
+        
+        # New period: create segment file with the main file's lane schema, then catalog it
+        self.segmentDir.mkdir(parents=True, exist_ok=True)
+        segment = {
+            'segmentId': segmentId,
+            'path': f"{self.dbPath.stem}_{segmentId}{self.dbPath.suffix or '.db'}",
+            'minSourceKey': None,
+            'maxSourceKey': None,
+            'state': 'active'
+        }
+        tables = [LANE_TABLE_NAMES[l] for l in SEGMENTED_LANES]
+        schema = self.conn.execute(
+            f"SELECT sql FROM sqlite_master WHERE tbl_name IN ({','.join('?' * len(tables))}) "
+            f"AND sql IS NOT NULL ORDER BY type DESC",  # tables before indexes
+            tables
+        ).fetchall()
+        conn = self._getSegmentWriteConnection(segment)
+        try:
+            for row in schema:
+                conn.execute(row[0].replace('CREATE TABLE ', 'CREATE TABLE IF NOT EXISTS ', 1)
+                                   .replace('CREATE INDEX ', 'CREATE INDEX IF NOT EXISTS ', 1))
+            conn.commit()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO segmentCatalog (segmentId, path, state, createdAt) VALUES (?, ?, 'active', ?)",
+                (segmentId, segment['path'], datetime.now(timezone.utc).isoformat())
+            )
+            self.conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            self.conn.rollback()
+            raise DatabaseError(f"Segment creation failed ({segmentId}): {e}")
+        self._segments[segmentId] = segment
+        self.log.info(f"[Database] Created segment {segmentId}", path=str(self._segmentPath(segment)))
+        return segment
+    
+    def _getSegmentWriteConnection(self, segment: Dict[str, Any]) -> sqlite3.Connection:
+        """Segment write connection from the LRU (evicted connections are checkpointed and closed)"""
+        segmentId = segment['segmentId']
+        conn = self._segmentWriters.get(segmentId)
+        if conn is not None:
+            self._segmentWriters.move_to_end(segmentId)
+            return conn
+        conn = self._openWriteConnection(self._segmentPath(segment))
+        self._segmentWriters[segmentId] = conn
+        while len(self._segmentWriters) > self.maxOpenSegmentWriters:
+            _, evicted = self._segmentWriters.popitem(last=False)
+            self._closeConnection(evicted, checkpoint=True)
+        return conn
+    
+    def _getSegmentReadConnection(self, segment: Dict[str, Any]) -> sqlite3.Connection:
+        """Segment read connection from the LRU. Caller holds _readLock."""
+        segmentId = segment['segmentId']
+        conn = self._segmentReaders.get(segmentId)
+        if conn is not None:
+            self._segmentReaders.move_to_end(segmentId)
+            return conn
+        conn = self._openReadConnection(self._segmentPath(segment))
+        self._segmentReaders[segmentId] = conn
+        while len(self._segmentReaders) > self.maxOpenSegmentReaders:
+            _, evicted = self._segmentReaders.popitem(last=False)
+            self._closeConnection(evicted)
+        return conn
+    
+    @staticmethod
+    def _closeConnection(conn: sqlite3.Connection, checkpoint: bool = False):
+        """Close a connection, optionally truncating its WAL first (best effort)"""
+        try:
+            if checkpoint:
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            conn.close()
+        except sqlite3.Error:
+            pass
+    
+    def _segmentsForWindow(self, startTime: str, stopTime: str, timebase: Timebase) -> List[Dict[str, Any]]:
+        """
+        Live segments that can contain rows with startTime <= time <= stopTime.
+        
+        Timestamps compare as strings (as in the lane queries), so a row inside the window
+        has a period prefix between the window's prefixes.
+        """
+        n = self._keyLength
+        startKey, stopKey = startTime[:n], stopTime[:n]
+        selected = []
+        for segmentId in sorted(list(self._segments)):
+            segment = self._segments[segmentId]
+            if segment['state'] != 'active':
+                continue
+            if timebase == Timebase.CANONICAL:
+                if startKey <= segmentId <= stopKey:
+                    selected.append(segment)
+            elif segment['minSourceKey'] is not None:
+                if segment['minSourceKey'] <= stopKey and startKey <= segment['maxSourceKey']:
+                    selected.append(segment)
+        return selected
+    
+    def listSegments(self) -> List[Dict[str, Any]]:
+        """Segment catalog entries (segmentId, path, minSourceKey, maxSourceKey, state), oldest first"""
+        return [dict(self._segments[segmentId], path=str(self._segmentPath(self._segments[segmentId])))
+                for segmentId in sorted(list(self._segments))]
+    
+    def archiveSegment(self, segmentId: str, archiveDir: str) -> str:
+        """
+        Move a segment file out of the live set.
+        
+        The segment is checkpointed, closed and moved to archiveDir; its events are no
+        longer returned by queries but remain in eventIndex, so re-ingest is still deduped.
+        The newest segment (current insert target) cannot be archived.
+        
+        Returns:
+            Path of the archived segment file
+        """
+        with self._writeLock:
+            segment = self._segments.get(segmentId)
+            if segment is None or segment['state'] != 'active':
+                raise DatabaseError(f"No active segment '{segmentId}'")
+            if segmentId == max(s for s, seg in self._segments.items() if seg['state'] == 'active'):
+                raise DatabaseError(f"Segment '{segmentId}' is the newest segment and cannot be archived")
+            
+            writer = self._segmentWriters.pop(segmentId, None)
+            if writer is not None:
+                self._closeConnection(writer, checkpoint=True)
+            with self._readLock:
+                reader = self._segmentReaders.pop(segmentId, None)
+                if reader is not None:
+                    self._closeConnection(reader)
+                
+                source = self._segmentPath(segment)
+                if writer is None:
+                    # Fold any leftover WAL into the file before moving it
+                    self._closeConnection(self._openWriteConnection(source), checkpoint=True)
+                destination = Path(archiveDir) / source.name
+                destination.parent.mkdir(parents=True, exist_ok=True)
+                shutil.move(str(source), str(destination))
+                for suffix in ('-wal', '-shm'):
+                    Path(str(source) + suffix).unlink(missing_ok=True)
+                
+                try:
+                    self.conn.execute(
+                        "UPDATE segmentCatalog SET state = 'archived', path = ? WHERE segmentId = ?",
+                        (str(destination.resolve()), segmentId)
+                    )
+                    self.conn.commit()
+                except sqlite3.Error as e:
+                    self.conn.rollback()
+                    raise DatabaseError(f"Archive catalog update failed ({segmentId}): {e}")
+                segment['state'] = 'archived'
+                segment['path'] = str(destination.resolve())
+        
+        if self._queryCache is not None:
+            self._queryCache.invalidateAll()
+        self.log.info(f"[Database] Archived segment {segmentId}", path=str(destination))
+        return str(destination)
+    
+    # ========================================================================
+    # Retention
+    # ========================================================================
+    
+    def getRetentionWatermark(self, ruleId: str) -> Optional[str]:
+        """canonicalTruthTime through which a retention rule has been applied (None if never run)"""
+        with self._writeLock:
+            row = self.conn.execute(
+                "SELECT processedThrough FROM retentionState WHERE ruleId = ?", (ruleId,)
+            ).fetchone()
+        return row[0] if row else None
+    
+    def setRetentionWatermark(self, ruleId: str, processedThrough: str):
+        """Record that a retention rule has been applied through processedThrough"""
+        with self._writeLock:
+            try:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO retentionState (ruleId, processedThrough) VALUES (?, ?)",
+                    (ruleId, processedThrough)
+                )
+                self.conn.commit()
+            except sqlite3.Error as e:
+                self.conn.rollback()
+                raise DatabaseError(f"Retention watermark update failed: {e}")
+    
+    def _laneSources(self, lane: Lane, segments: List[Dict[str, Any]]) -> List[Tuple[Optional[Dict[str, Any]], sqlite3.Connection]]:
+        """(segment or None for main file, read connection) for a lane. Caller holds _readLock."""
+        sources = [(None, self._getReadConnection())]
+        if lane in SEGMENTED_LANES:
+            sources.extend((segment, self._getSegmentReadConnection(segment)) for segment in segments)
+        return sources
+    
+    def earliestCanonicalTime(self, lane: Lane, messageType: Optional[str] = None) -> Optional[str]:
+        """Earliest canonicalTruthTime stored for a lane (optionally one messageType), across live segments"""
+        table = LANE_TABLE_NAMES[lane]
+        query = f"SELECT MIN(canonicalTruthTime) FROM {table}"
+        params = []
+        if messageType and lane != Lane.RAW:
+            query += " WHERE messageType = ?"
+            params.append(messageType)
+        
+        segments = [s for _, s in sorted(self._segments.items()) if s['state'] == 'active']
+        earliest = None
+        with self._readLock:
+            try:
+                for _, conn in self._laneSources(lane, segments):
+                    value = conn.execute(query, params).fetchone()[0]
+                    if value is not None and (earliest is None or value < earliest):
+                        earliest = value
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Query failed: {e}")
+        return earliest
+    
+    def latestMetadataPayloads(self, messageType: str, scopeId: str) -> Dict[str, Dict[str, Any]]:
+        """Latest payload per manifestId for a metadata messageType (by canonicalTruthTime)"""
+        with self._readLock:
+            try:
+                rows = self._getReadConnection().execute(
+                    "SELECT manifestId, payload FROM metadataEvents "
+                    "WHERE messageType = ? AND scopeId = ? AND manifestId IS NOT NULL "
+                    "ORDER BY canonicalTruthTime, eventId",
+                    (messageType, scopeId)
+                ).fetchall()
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Query failed: {e}")
+        return {manifestId: json.loads(payload) for manifestId, payload in rows}
+    
+    def thinEvents(
+        self,
+        lane: Lane,
+        startTime: str,
+        stopTime: str,
+        messageType: Optional[str] = None,
+        keepEveryN: Optional[int] = None,
+        keepPerSeconds: Optional[int] = None,
+        batchSize: int = 2000
+    ) -> Dict[str, Any]:
+        """
+        Remove events of one lane with startTime <= canonicalTruthTime < stopTime.
+        
+        startTime/stopTime may carry any UTC offset; they are converted to the stored
+        UTC form before comparing. Without keep arguments every matching event is removed.
+        keepEveryN keeps the 1st, (N+1)th, ... event per entity (and messageType);
+        keepPerSeconds keeps the first event per entity (and messageType) in each
+        keepPerSeconds bucket of sourceTruthTime (epoch seconds, offset applied).
+        eventIndex rows are kept, so removed events stay deduped.
+        
+        Deletes run in ingestSeq batches, each its own write transaction, so ingest is never
+        blocked for long (ingestSeq, unlike rowid, survives a concurrent compactSegment).
+        
+        Returns:
+            Dict with examined, removed and segmentIds (segments that had rows removed)
+        """
+        table = LANE_TABLE_NAMES[lane]
+        startTime, stopTime = _storedUtcTime(startTime), _storedUtcTime(stopTime)
+        where = "canonicalTruthTime >= ? AND canonicalTruthTime < ?"
+        params: List[Any] = [startTime, stopTime]
+        if messageType and lane != Lane.RAW:
+            where += " AND messageType = ?"
+            params.append(messageType)
+        
+        partition = "systemId, containerId, uniqueId" + ("" if lane == Lane.RAW else ", messageType")
+        if keepEveryN:
+            candidates = f"""
+                SELECT rid FROM (
+                    SELECT ingestSeq AS rid, ROW_NUMBER() OVER (
+                        PARTITION BY {partition} ORDER BY sourceTruthTime, eventId) AS rn
+                    FROM {table} WHERE {where}
+                ) WHERE (rn - 1) % ? != 0
+            """
+            candidateParams = params + [int(keepEveryN)]
+        elif keepPerSeconds:
+            candidates = f"""
+                SELECT rid FROM (
+                    SELECT ingestSeq AS rid, ROW_NUMBER() OVER (
+                        PARTITION BY {partition},
+                            CAST(strftime('%s', sourceTruthTime) AS INTEGER) / ?
+                        ORDER BY sourceTruthTime, eventId) AS rn
+                    FROM {table} WHERE {where}
+                ) WHERE rn > 1
+            """
+            candidateParams = [int(keepPerSeconds)] + params
+        else:
+            candidates = f"SELECT ingestSeq FROM {table} WHERE {where}"
+            candidateParams = params
+        
+        segments = self._segmentsForWindow(startTime, stopTime, Timebase.CANONICAL) if self._segments else []
+        examined = removed = 0
+        touched = []
+        
+        with self._readLock:
+            try:
+                plans = []
+                for segment, conn in self._laneSources(lane, segments):
+                    examined += conn.execute(f"SELECT COUNT(*) FROM {table} WHERE {where}", params).fetchone()[0]
+                    seqs = [row[0] for row in conn.execute(candidates, candidateParams)]
+                    if seqs:
+                        plans.append((segment, seqs))
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Retention query failed: {e}")
+        
+        for segment, seqs in plans:
+            for offset in range(0, len(seqs), batchSize):
+                batch = seqs[offset:offset + batchSize]
+                with self._writeLock:
+                    conn = self.conn if segment is None else self._getSegmentWriteConnection(segment)
+                    try:
+                        cursor = conn.execute(
+                            f"DELETE FROM {table} WHERE ingestSeq IN ({','.join('?' * len(batch))})", batch
+                        )
+                        removed += cursor.rowcount
+                        conn.commit()
+                    except sqlite3.Error as e:
+                        conn.rollback()
+                        raise DatabaseError(f"Retention delete failed: {e}")
+                if self._queryCache is not None:
+                    self._queryCache.invalidateAll()
+            if segment is not None:
+                touched.append(segment['segmentId'])
+        
+        return {'examined': examined, 'removed': removed, 'segmentIds': touched}
+    
+    def compactSegment(self, segmentId: str) -> bool:
+        """
+        VACUUM a segment file to return space freed by retention.
+        Only older segments are compacted (the newest segment is the insert target).
+        
+        The VACUUM runs on its own connection without the global write lock, so ingest
+        into the main file and other segments continues; while it runs, late events for
+        this segment's period are stored in the main file (still queried and deduped).
+        
+        Returns:
+            True if the segment was compacted
+        """
+        with self._writeLock:
+            segment = self._segments.get(segmentId)
+            liveIds = [s for s, seg in self._segments.items() if seg['state'] == 'active']
+            if (segment is None or segment['state'] != 'active' or segmentId == max(liveIds)
+                    or segmentId in self._compacting):
+                return False
+            self._compacting.add(segmentId)
+        try:
+            conn = self._openWriteConnection(self._segmentPath(segment))
+            try:
+                conn.execute("VACUUM")
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                return True
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            self.log.warning(f"[Database] Segment compaction failed ({segmentId}): {e}")
+            return False
+        finally:
+            with self._writeLock:
+                self._compacting.discard(segmentId)
+    
+    # ========================================================================
+    # Payload Compression
+    # ========================================================================
+    
+    def _loadPayloadDictionaries(self):
+        """Register stored dictionaries with the payload codec"""
+        rows = self.conn.execute(
+            "SELECT dictId, codec, lane, messageType, dictionary FROM payloadDictionaries ORDER BY dictId"
+        ).fetchall()
+        for row in rows:
+            self._payloadCodec.addDictionary(row['dictId'], row['codec'], row['lane'], row['messageType'], bytes(row['dictionary']))
+    
+    def _loadPayloadDictionary(self, dictId: int) -> Optional[Tuple[str, bytes]]:
+        """(codec, dictionary) stored after this instance opened (written by another Database instance)"""
+        conn = self._openReadConnection(self.dbPath)
+        try:
+            row = conn.execute("SELECT codec, dictionary FROM payloadDictionaries WHERE dictId = ?", (dictId,)).fetchone()
+        finally:
+            conn.close()
+        return (row['codec'], bytes(row['dictionary'])) if row else None
+    
+    def _storePayloadDictionary(self, lane: str, messageType: str, samples: List[bytes]) -> bool:
+        """Train, persist and activate a dictionary. Caller holds _writeLock."""
+        dictionary = self._payloadCodec.train(samples)
+        if not dictionary:
+            self.log.warning(f"[Database] Payload dictionary training failed for {lane}/{messageType} ({len(samples)} samples)")
+            return False
+        try:
+            cursor = self.conn.execute(
+                "INSERT INTO payloadDictionaries (codec, lane, messageType, dictionary, sampleCount, createdAt) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (self._payloadCodec.codec, lane, messageType, dictionary, len(samples), datetime.now(timezone.utc).isoformat())
+            )
+            self.conn.commit()
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            raise DatabaseError(f"Payload dictionary insert failed: {e}")
+        self._payloadCodec.addDictionary(cursor.lastrowid, self._payloadCodec.codec, lane, messageType, dictionary)
+        self.log.info(f"[Database] Trained {self._payloadCodec.codec} payload dictionary {cursor.lastrowid} "
+                      f"for {lane}/{messageType}: {len(dictionary)} bytes from {len(samples)} samples")
+        return True
+    
+    def _trainDuePayloadDictionaries(self):
+        """Train dictionaries for messageTypes that collected enough plain-row samples"""
+        for lane, messageType in self._payloadCodec.dueForTraining():
+            samples = self._payloadCodec.takeSamples(lane, messageType)
+            with self._writeLock:
+                self._storePayloadDictionary(lane, messageType, samples)
+    
+    def trainPayloadDictionaries(self, retrain: bool = False) -> List[Tuple[str, str]]:
+        """
+        Train dictionaries from stored rows for every Parsed messageType and UI manifestId.
+        
+        Samples are the newest trainSamples rows per key across the main file
+        and live segments.
+        
+        Args:
+            retrain: Also replace existing dictionaries (older ones stay readable)
+        
+        Returns:
+            [(lane, messageType or manifestId)] that got a new dictionary
+        """
+        if not self._payloadCodec.enabled:
+            raise DatabaseError("trainPayloadDictionaries requires a payload codec")
+        segments = [s for _, s in sorted(self._segments.items()) if s['state'] == 'active']
+        trained = []
+        for lane, (column, keyColumn) in CODEC_COLUMNS.items():
+            table = LANE_TABLE_NAMES[lane]
+            samplesByType: Dict[str, List[bytes]] = {}
+            with self._readLock:
+                try:
+                    sources = self._laneSources(lane, segments)
+                    messageTypes = set()
+                    for _, conn in sources:
+                        messageTypes.update(row[0] for row in conn.execute(f"SELECT DISTINCT {keyColumn} FROM {table}"))
+                    for messageType in sorted(messageTypes):
+                        if not retrain and self._payloadCodec.hasDictionary(lane.value, messageType):
+                            continue
+                        samples = []
+                        for _, conn in reversed(sources):  # Newest segment first
+                            remaining = self._payloadCodec.trainSamples - len(samples)
+                            if remaining <= 0:
+                                break
+                            samples.extend(
+                                self._payloadCodec.decode(row[0]).encode('utf-8') for row in conn.execute(
+                                    f"SELECT {column} FROM {table} WHERE {keyColumn} = ? ORDER BY rowid DESC LIMIT ?",
+                                    (messageType, remaining))
+                            )
+                        samplesByType[messageType] = samples
+                except sqlite3.Error as e:
+                    raise DatabaseError(f"Payload sample query failed: {e}")
+            for messageType, samples in samplesByType.items():
+                with self._writeLock:
+                    if self._storePayloadDictionary(lane.value, messageType, samples):
+                        trained.append((lane.value, messageType))
+        return trained
+    
+    def migratePayloads(self, batchSize: int = 2000, vacuum: bool = False) -> Dict[str, int]:
+        """
+        Re-encode stored Parsed/UI JSON columns with the configured codec.
+        
+        With a codec, plain rows of messageTypes that have a dictionary are
+        compressed; without one, compressed rows are rewritten as plain JSON.
+        Each batch is its own write transaction. vacuum=True runs VACUUM on the
+        main file and every live segment afterwards (freed pages are otherwise
+        only reused, not returned to the filesystem).
+        
+        Returns:
+            Dict with examined, rewritten, bytesBefore and bytesAfter (rewritten rows' column size)
+        """
+        codec = self._payloadCodec
+        targetType = 'text' if codec.enabled else 'blob'
+        segments = [s for _, s in sorted(self._segments.items()) if s['state'] == 'active']
+        stats = {'examined': 0, 'rewritten': 0, 'bytesBefore': 0, 'bytesAfter': 0}
+        
+        for lane, (column, keyColumn) in CODEC_COLUMNS.items():
+            table = LANE_TABLE_NAMES[lane]
+            for segment in [None] + (segments if lane in SEGMENTED_LANES else []):
+                lastRowid = 0
+                while True:
+                    with self._writeLock:
+                        conn = self.conn if segment is None else self._getSegmentWriteConnection(segment)
+                        try:
+                            rows = conn.execute(
+                                f"SELECT rowid, {keyColumn}, {column} FROM {table} "
+                                f"WHERE rowid > ? AND typeof({column}) = ? ORDER BY rowid LIMIT ?",
+                                (lastRowid, targetType, batchSize)
+                            ).fetchall()
+                            if not rows:
+                                break
+                            updates = []
+                            for rowid, messageType, value in rows:
+                                text = codec.decode(value)
+                                encoded = codec.encode(lane.value, messageType, text) if codec.enabled else text
+                                if encoded is not value:
+                                    updates.append((encoded, rowid))
+                                    stats['bytesBefore'] += len(value if isinstance(value, bytes) else value.encode('utf-8'))
+                                    stats['bytesAfter'] += len(encoded if isinstance(encoded, bytes) else encoded.encode('utf-8'))
+                            conn.executemany(f"UPDATE {table} SET {column} = ? WHERE rowid = ?", updates)
+                            conn.commit()
+                        except sqlite3.Error as e:
+                            conn.rollback()
+                            raise DatabaseError(f"Payload migration failed: {e}")
+                    stats['examined'] += len(rows)
+                    stats['rewritten'] += len(updates)
+                    lastRowid = rows[-1][0]
+        
+        if codec.enabled:
+            self._trainDuePayloadDictionaries()  # Rows without a dictionary were sampled by encode()
+        if vacuum:
+            with self._writeLock:
+                try:
+                    for conn in [self.conn] + [self._getSegmentWriteConnection(s) for s in segments]:
+                        conn.execute("VACUUM")
+                        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                except sqlite3.Error as e:
+                    raise DatabaseError(f"VACUUM failed: {e}")
+        return stats
+    
+    # ========================================================================
+    # Overview Pyramid
+    # ========================================================================
+    
+    def mergeOverviewBuckets(self, rows: List[tuple]):
+        """
+        Merge partial bucket aggregates into overviewBuckets in one transaction.
+        
+        Args:
+            rows: (tier, bucketStart, scopeId, lane, systemId, containerId, uniqueId, messageType,
+                   field, count, minValue, maxValue, lastValue, lastTime)
+        """
+        if not rows:
+            return
+        with self._writeLock:
+            try:
+                self.conn.executemany(OVERVIEW_MERGE, rows)
+                self.conn.commit()
+            except sqlite3.Error as e:
+                self.conn.rollback()
+                raise DatabaseError(f"Overview merge failed: {e}")
+    
+    def deleteOverviewBuckets(self, startSeconds: int, stopSeconds: int) -> int:
+        """Remove buckets of every tier with startSeconds <= bucketStart < stopSeconds"""
+        with self._writeLock:
+            try:
+                cursor = self.conn.execute(
+                    "DELETE FROM overviewBuckets WHERE bucketStart >= ? AND bucketStart < ?", (startSeconds, stopSeconds)
+                )
+                self.conn.commit()
+            except sqlite3.Error as e:
+                self.conn.rollback()
+                raise DatabaseError(f"Overview delete failed: {e}")
+        return cursor.rowcount
+    
+    def queryOverviewBuckets(
+        self,
+        tier: int,
+        startSeconds: int,
+        stopSeconds: int,
+        scopeIds: Optional[List[str]] = None,
+        lanes: Optional[List[str]] = None,
+        systemId: Optional[str] = None,
+        containerId: Optional[str] = None,
+        uniqueId: Optional[str] = None,
+        messageType: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Buckets of one tier with startSeconds <= bucketStart <= stopSeconds, ordered by series then time"""
+        query = "SELECT * FROM overviewBuckets WHERE tier = ? AND bucketStart >= ? AND bucketStart <= ?"
+        params: List[Any] = [tier, startSeconds, stopSeconds]
+        for column, values in (('scopeId', scopeIds), ('lane', lanes)):
+            if values:
+                query += f" AND {column} IN ({','.join('?' * len(values))})"
+                params.extend(values)
+        for column, value in (('systemId', systemId), ('containerId', containerId),
+                              ('uniqueId', uniqueId), ('messageType', messageType)):
+            if value:
+                query += f" AND {column} = ?"
+                params.append(value)
+        query += " ORDER BY scopeId, lane, systemId, containerId, uniqueId, messageType, field, bucketStart"
+        with self._readLock:
+            try:
+                return [dict(row) for row in self._getReadConnection().execute(query, params)]
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Overview query failed: {e}")
+    
+    # ========================================================================
+    # Replication
+    # ========================================================================
+    
+    def readRowsSince(
+        self,
+        cursor: Dict[str, int],
+        maxRows: int = 5000,
+        scopeIds: Optional[List[str]] = None
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+        """
+        Read stored events in ingestSeq order after a replication cursor.
+        
+        Sources are visited in a fixed order - main-file lane tables (lane priority
+        order), then live segments oldest first - and each contributes a contiguous
+        ingestSeq range. The cursor maps 'main/<table>' or '<segmentId>/<table>' to the
+        last ingestSeq read; rows filtered out by scopeIds still advance it. ingestSeq
+        is a stored column, so VACUUM (compactSegment, migratePayloads) cannot shift it.
+        
+        Returns:
+            (rows as lane-table dicts with 'lane' and plain JSON payloads, cursor after these rows)
+        """
+        cursor = dict(cursor)
+        rows: List[Dict[str, Any]] = []
+        lanes = sorted(Lane, key=lambda lane: LANE_PRIORITY[lane])
+        segments = [s for _, s in sorted(self._segments.items()) if s['state'] == 'active']
+        scopeSet = set(scopeIds) if scopeIds else None
+        
+        with self._readLock:
+            try:
+                sources = [('main', None, lane) for lane in lanes]
+                sources += [(segment['segmentId'], segment, lane) for segment in segments for lane in SEGMENTED_LANES]
+                for sourceId, segment, lane in sources:
+                    remaining = maxRows - len(rows)
+                    if remaining <= 0:
+                        break
+                    table = LANE_TABLE_NAMES[lane]
+                    key = f"{sourceId}/{table}"
+                    conn = self._getReadConnection() if segment is None else self._getSegmentReadConnection(segment)
+                    fetched = conn.execute(
+                        f"SELECT * FROM {table} WHERE ingestSeq > ? ORDER BY ingestSeq LIMIT ?",
+                        (cursor.get(key, 0), remaining)
+                    ).fetchall()
+                    if not fetched:
+                        continue
+                    cursor[key] = fetched[-1]['ingestSeq']
+                    codecColumn = CODEC_COLUMNS[lane][0] if lane in CODEC_COLUMNS else None
+                    for row in fetched:
+                        if scopeSet is None or row['scopeId'] in scopeSet:
+                            result = dict(row)
+                            del result['ingestSeq']
+                            result['lane'] = lane.value
+                            if codecColumn:
+                                result[codecColumn] = self._payloadCodec.decode(result[codecColumn])
+                            rows.append(result)
+            except sqlite3.Error as e:
+                raise DatabaseError(f"Replication read failed: {e}")
+        
+        return rows, cursor
+    
+    def insertEventsBatch(self, events: List[Event], canonicalTruthTime: str) -> int:
+        """
+        Insert many events with batch dedupe against eventIndex (see insertNewEvents).
+        
+        Storage only - Ingest.ingestBatch also fans new events out to LIVE streams,
+        the overview pyramid and the ingest metrics.
+        
+        Returns:
+            Number of events inserted
+        """
+        return len(self.insertNewEvents(events, canonicalTruthTime))
+    
+    def insertNewEvents(self, events: List[Event], canonicalTruthTime: str) -> List[Tuple[Event, str]]:
+        """
+        Insert many events with batch dedupe against eventIndex.
+        
+        Known eventIds are removed with indexed IN lookups, the rest is written with
+        one executemany per table: segment files commit first, then eventIndex,
+        main-file lanes and catalog bounds in one main-file transaction. Command
+        events go through insertEvent (requestId idempotency).
+        
+        Returns:
+            (event, stored canonicalTruthTime) for each event inserted, duplicates excluded
+        """
+        commands = [e for e in events if e.lane == Lane.COMMAND]
+        batch: Dict[str, Event] = {}
+        for event in events:
+            if event.lane != Lane.COMMAND:
+                batch.setdefault(event.eventId, event)
+        
+        with self._writeLock:
+            try:
+                # Batch dedupe against eventIndex
+                eventIds = list(batch)
+                for offset in range(0, len(eventIds), 500):
+                    chunk = eventIds[offset:offset + 500]
+                    for row in self.conn.execute(
+                        f"SELECT eventId FROM eventIndex WHERE eventId IN ({','.join('?' * len(chunk))})", chunk
+                    ):
+                        del batch[row[0]]
+                
+                # Group lane inserts by destination (None = main file) and statement
+                groups: Dict[Optional[str], Dict[str, List[tuple]]] = {}
+                bounds: Dict[str, Tuple[str, str]] = {}
+                for event in batch.values():
+                    eventCanonical = event.canonicalTruthTime or canonicalTruthTime
+                    segment = self._routeSegment(event.lane, eventCanonical)
+                    sql, params = self._buildLaneInsert(event, eventCanonical)
+                    params += (self._nextIngestSeq(),)
+                    segmentId = segment['segmentId'] if segment else None
+                    groups.setdefault(segmentId, {}).setdefault(sql, []).append(params)
+                    if segment is not None:
+                        sourceKey = event.sourceTruthTime[:self._keyLength]
+                        low, high = bounds.get(segmentId, (segment['minSourceKey'], segment['maxSourceKey']))
+                        bounds[segmentId] = (sourceKey if low is None or sourceKey < low else low,
+                                             sourceKey if high is None or sourceKey > high else high)
+                
+                for segmentId, statements in groups.items():
+                    if segmentId is None:
+                        continue
+                    segmentConn = self._getSegmentWriteConnection(self._segments[segmentId])
+                    try:
+                        for sql, paramsList in statements.items():
+                            segmentConn.executemany(sql, paramsList)
+                        segmentConn.commit()
+                    except sqlite3.Error:
+                        segmentConn.rollback()
+                        raise
+                
+                self.conn.executemany("INSERT INTO eventIndex (eventId) VALUES (?)", [(eventId,) for eventId in batch])
+                for sql, paramsList in groups.get(None, {}).items():
+                    self.conn.executemany(sql, paramsList)
+                for segmentId, (low, high) in bounds.items():
+                    self.conn.execute(
+                        "UPDATE segmentCatalog SET minSourceKey = ?, maxSourceKey = ? WHERE segmentId = ?",
+                        (low, high, segmentId)
+                    )
+                self.conn.commit()
+            except sqlite3.Error as e:
+                self.conn.rollback()
+                raise DatabaseError(f"Batch insert failed: {e}")
+            
+            for segmentId, (low, high) in bounds.items():
+                self._segments[segmentId]['minSourceKey'], self._segments[segmentId]['maxSourceKey'] = low, high
+            if self._dedupeFilter is not None:
+                self._dedupeFilter.update(list(batch))
+        
+        inserted = [(event, event.canonicalTruthTime or canonicalTruthTime) for event in batch.values()]
+        if inserted and self._queryCache is not None:
+            self._queryCache.invalidateTimes([(event.sourceTruthTime, eventCanonical) for event, eventCanonical in inserted])
+        
+        for command in commands:
+            commandCanonical = command.canonicalTruthTime or canonicalTruthTime
+            if self.insertEvent(command, commandCanonical):
+                inserted.append((command, commandCanonical))
+        if self._payloadCodec.enabled:
+            self._trainDuePayloadDictionaries()
+        return inserted
+    
+    def getReplicationCursor(self, peerId: str) -> Dict[str, int]:
+        """Persisted cursor into a peer's tables (empty if never replicated)"""
+        with self._writeLock:
+            row = self.conn.execute("SELECT cursor FROM replicationState WHERE peerId = ?", (peerId,)).fetchone()
+        return json.loads(row[0]) if row else {}
+    
+    def setReplicationCursor(self, peerId: str, cursor: Dict[str, int], eventsApplied: int = 0):
+        """Persist a peer's replication cursor (high-water mark)"""
+        with self._writeLock:
+            try:
+                self.conn.execute("""
+                    INSERT INTO replicationState (peerId, cursor, eventsApplied, updatedAt) VALUES (?, ?, ?, ?)
+                    ON CONFLICT(peerId) DO UPDATE SET
+                        cursor = excluded.cursor,
+                        eventsApplied = eventsApplied + excluded.eventsApplied,
+                        updatedAt = excluded.updatedAt
+                """, (peerId, json.dumps(cursor, sort_keys=True), eventsApplied, datetime.now(timezone.utc).isoformat()))
+                self.conn.commit()
+            except sqlite3.Error as e:
+                self.conn.rollback()
+                raise DatabaseError(f"Replication cursor update failed: {e}")
+    
+    # ========================================================================
+    # Insert / Query
+    # ========================================================================
+    
+    def _buildLaneInsert(self, event: Event, canonicalTruthTime: str) -> Tuple[str, tuple]:
+        """Return (sql, params) inserting event into its lane table; params omit the trailing ingestSeq"""
+        if event.lane == Lane.RAW:
+            return """
+                INSERT INTO rawEvents (
+                    eventId, scopeId, sourceTruthTime, canonicalTruthTime,
+                    systemId, containerId, uniqueId, bytes,
+                    connectionId, sequence, ingestSeq
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                event.eventId,
+                event.scopeId,
+                event.sourceTruthTime,
+                canonicalTruthTime,
+                event.systemId,
+                event.containerId,
+                event.uniqueId,
+                event.bytesData,
+                event.connectionId,
+                event.sequence
+            )
+        
+        if event.lane == Lane.PARSED:
+            return """
+                INSERT INTO parsedEvents (
+                    eventId, scopeId, sourceTruthTime, canonicalTruthTime,
+                    systemId, containerId, uniqueId, messageType,
+                    schemaVersion, payload, ingestSeq
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                event.eventId,
+                event.scopeId,
+                event.sourceTruthTime,
+                canonicalTruthTime,
+                event.systemId,
+                event.containerId,
+                event.uniqueId,
+                event.messageType,
+                event.schemaVersion,
+                self._payloadCodec.encode('parsed', event.messageType,
+                                          json.dumps(event.payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False))
+            )
+        
+        if event.lane == Lane.UI:
+            return """
+                INSERT INTO uiEvents (
+                    eventId, scopeId, sourceTruthTime, canonicalTruthTime,
+                    systemId, containerId, uniqueId, messageType,
+                    viewId, manifestId, manifestVersion, data, ingestSeq
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                event.eventId,
+                event.scopeId,
+                event.sourceTruthTime,
+                canonicalTruthTime,
+                event.systemId,
+                event.containerId,
+                event.uniqueId,
+                event.messageType,
+                event.viewId,
+                event.manifestId,
+                event.manifestVersion,
+                self._payloadCodec.encode('ui', event.manifestId,
+                                          json.dumps(event.data, sort_keys=True, separators=(',', ':'), ensure_ascii=False))
+            )
+        
+        if event.lane == Lane.COMMAND:
+            return """
+                INSERT INTO commandEvents (
+                    eventId, scopeId, sourceTruthTime, canonicalTruthTime,
+                    systemId, containerId, uniqueId, messageType,
+                    commandId, requestId, targetId, commandType, payload, ingestSeq
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                event.eventId,
+                event.scopeId,
+                event.sourceTruthTime,
+                canonicalTruthTime,
+                event.systemId,
+                event.containerId,
+                event.uniqueId,
+                event.messageType,
+                event.commandId,
+                getattr(event, 'requestId', None),
+                event.targetId,
+                event.commandType,
+                json.dumps(event.payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+            )
+        
+        if event.lane == Lane.METADATA:
+            return """
+                INSERT INTO metadataEvents (
+                    eventId, scopeId, sourceTruthTime, canonicalTruthTime,
+                    systemId, containerId, uniqueId, messageType,
+                    effectiveTime, manifestId, payload, ingestSeq
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                event.eventId,
+                event.scopeId,
+                event.sourceTruthTime,
+                canonicalTruthTime,
+                event.systemId,
+                event.containerId,
+                event.uniqueId,
+                event.messageType,
+                event.effectiveTime,
+                event.manifestId,
+                json.dumps(event.payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+            )
+        
+        raise DatabaseError(f"Unknown lane: {event.lane}")
+    
     def insertEvent(self, event: Event, canonicalTruthTime: str) -> bool:
+        """
+        Insert event with atomic dedupe (see _insertEvent).
+        
+        Returns:
+            True if inserted, False if duplicate (deduped)
+        """
+        insertStart = time.perf_counter()
+        inserted = self._insertEvent(event, canonicalTruthTime)
+        if inserted and self._queryCache is not None:
+            self._queryCache.invalidateTimes([(event.sourceTruthTime, canonicalTruthTime)])
+        lane = event.lane.value
+        INSERT_SECONDS.observe(time.perf_counter() - insertStart, lane=lane)
+        INSERTS_TOTAL.inc(lane=lane, result='inserted' if inserted else 'duplicate')
+        if self._payloadCodec.enabled and lane in ('parsed', 'ui'):
+            self._trainDuePayloadDictionaries()
+        return inserted
+    
+    def _insertEvent(self, event: Event, canonicalTruthTime: str) -> bool:
         """
         Insert event with atomic dedupe.
         
@@ -343,6 +1621,9 @@ class Database:
         On duplicate eventId: transaction fails, returns False (dedupe).
         On success: both tables updated, returns True.
         
+        Segmented lanes: the lane row commits to its segment file first, then
+        eventIndex (and any widened catalog bounds) commit in the main file.
+        
         Args:
             event: Event to insert
             canonicalTruthTime: Wall-clock receive time at this NOVA instance
@@ -353,7 +1634,21 @@ class Database:
         Raises:
             DatabaseError: On database errors (not dedupe)
         """
+        insertSql, insertParams = self._buildLaneInsert(event, canonicalTruthTime)
+        dedupeFilter = self._dedupeFilter
+        
         with self._writeLock:
+            # Likely duplicate: confirm with an indexed read instead of a failed insert
+            if dedupeFilter is not None and dedupeFilter.mightContain(event.eventId):
+                self.dedupeStats['probes'] += 1
+                if self.conn.execute("SELECT 1 FROM eventIndex WHERE eventId = ?", (event.eventId,)).fetchone():
+                    self.dedupeStats['duplicates'] += 1
+                    return False
+                self.dedupeStats['falsePositives'] += 1
+            
+            insertParams += (self._nextIngestSeq(),)
+            segment = self._routeSegment(event.lane, canonicalTruthTime)
+            segmentConn = None
             cursor = self.conn.cursor()
             
             try:
@@ -363,130 +1658,54 @@ class Database:
                     (event.eventId,)
                 )
                 
-                # Insert into lane-specific table
-                if event.lane == Lane.RAW:
-                    cursor.execute("""
-                        INSERT INTO rawEvents (
-                            eventId, scopeId, sourceTruthTime, canonicalTruthTime,
-                            systemId, containerId, uniqueId, bytes,
-                            connectionId, sequence
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        event.eventId,
-                        event.scopeId,
-                        event.sourceTruthTime,
-                        canonicalTruthTime,
-                        event.systemId,
-                        event.containerId,
-                        event.uniqueId,
-                        event.bytesData,
-                        event.connectionId,
-                        event.sequence
-                    ))
-                
-                elif event.lane == Lane.PARSED:
-                    cursor.execute("""
-                        INSERT INTO parsedEvents (
-                            eventId, scopeId, sourceTruthTime, canonicalTruthTime,
-                            systemId, containerId, uniqueId, messageType,
-                            schemaVersion, payload
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        event.eventId,
-                        event.scopeId,
-                        event.sourceTruthTime,
-                        canonicalTruthTime,
-                        event.systemId,
-                        event.containerId,
-                        event.uniqueId,
-                        event.messageType,
-                        event.schemaVersion,
-                        json.dumps(event.payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
-                    ))
-                
-                elif event.lane == Lane.UI:
-                    cursor.execute("""
-                        INSERT INTO uiEvents (
-                            eventId, scopeId, sourceTruthTime, canonicalTruthTime,
-                            systemId, containerId, uniqueId, messageType,
-                            viewId, manifestId, manifestVersion, data
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        event.eventId,
-                        event.scopeId,
-                        event.sourceTruthTime,
-                        canonicalTruthTime,
-                        event.systemId,
-                        event.containerId,
-                        event.uniqueId,
-                        event.messageType,
-                        event.viewId,
-                        event.manifestId,
-                        event.manifestVersion,
-                        json.dumps(event.data, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
-                    ))
-                
-                elif event.lane == Lane.COMMAND:
-                    cursor.execute("""
-                        INSERT INTO commandEvents (
-                            eventId, scopeId, sourceTruthTime, canonicalTruthTime,
-                            systemId, containerId, uniqueId, messageType,
-                            commandId, requestId, targetId, commandType, payload
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        event.eventId,
-                        event.scopeId,
-                        event.sourceTruthTime,
-                        canonicalTruthTime,
-                        event.systemId,
-                        event.containerId,
-                        event.uniqueId,
-                        event.messageType,
-                        event.commandId,
-                        getattr(event, 'requestId', None),
-                        event.targetId,
-                        event.commandType,
-                        json.dumps(event.payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
-                    ))
+                if segment is None:
+                    # Insert into lane-specific table (main file)
+                    cursor.execute(insertSql, insertParams)
+                    self.conn.commit()
+                    if dedupeFilter is not None:
+                        dedupeFilter.add(event.eventId)
+                    return True
                 
-                elif event.lane == Lane.METADATA:
-                    cursor.execute("""
-                        INSERT INTO metadataEvents (
-                            eventId, scopeId, sourceTruthTime, canonicalTruthTime,
-                            systemId, containerId, uniqueId, messageType,
-                            effectiveTime, manifestId, payload
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        event.eventId,
-                        event.scopeId,
-                        event.sourceTruthTime,
-                        canonicalTruthTime,
-                        event.systemId,
-                        event.containerId,
-                        event.uniqueId,
-                        event.messageType,
-                        event.effectiveTime,
-                        event.manifestId,
-                        json.dumps(event.payload, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
-                    ))
-                
-                else:
-                    self.conn.rollback()
-                    raise DatabaseError(f"Unknown lane: {event.lane}")
+                # Widen catalog source bounds in the same main-file transaction
+                sourceKey = event.sourceTruthTime[:self._keyLength]
+                minKey = segment['minSourceKey'] if segment['minSourceKey'] is not None and segment['minSourceKey'] <= sourceKey else sourceKey
+                maxKey = segment['maxSourceKey'] if segment['maxSourceKey'] is not None and segment['maxSourceKey'] >= sourceKey else sourceKey
+                widened = (minKey, maxKey) != (segment['minSourceKey'], segment['maxSourceKey'])
+                if widened:
+                    cursor.execute(
+                        "UPDATE segmentCatalog SET minSourceKey = ?, maxSourceKey = ? WHERE segmentId = ?",
+                        (minKey, maxKey, segment['segmentId'])
+                    )
                 
+                segmentConn = self._getSegmentWriteConnection(segment)
+                segmentConn.execute(insertSql, insertParams)
+                segmentConn.commit()
+                segmentConn = None
                 self.conn.commit()
+                if widened:
+                    segment['minSourceKey'], segment['maxSourceKey'] = minKey, maxKey
+                if dedupeFilter is not None:
+                    dedupeFilter.add(event.eventId)
                 return True
                 
             except sqlite3.IntegrityError as e:
                 # Dedupe: eventId or requestId already exists
+                if segmentConn is not None:
+                    segmentConn.rollback()
                 self.conn.rollback()
                 errStr = str(e)
                 # Handle duplicate eventId (eventIndex) or duplicate requestId (CommandRequest)
                 if "eventIndex" in errStr or "eventId" in errStr or "requestId" in errStr or "UNIQUE constraint" in errStr:
+                    if "eventIndex" in errStr and dedupeFilter is not None:
+                        # Older than the filter window: remember it so further replays take the fast path
+                        self.dedupeStats['missed'] += 1
+                        dedupeFilter.add(event.eventId)
                     return False  # Duplicate, this is expected (idempotent insert)
                 raise DatabaseError(f"Integrity error: {e}")
             
             except sqlite3.Error as e:
+                if segmentConn is not None:
+                    segmentConn.rollback()
                 self.conn.rollback()
                 errStr = str(e)
                 # Handle duplicate eventId or requestId as dedupe
@@ -542,7 +1761,8 @@ class Database:
             commandType: Filter Command by commandType
             requestId: Filter Command by requestId
             limit: Max results (applied per-lane before merging)
-            ingestOrder: If True, order by rowid (ingest order) for export parity.
+            ingestOrder: If True, order each lane by ingestSeq (ingest order) across the main
+                         file and segments, for export parity with the real-time FileWriter.
                          If False, use timebase ordering per ordering.py contract.
             
         Returns:
@@ -551,225 +1771,274 @@ class Database:
         # Performance tracking
         queryStart = time.perf_counter()
         
+        timeField = "sourceTruthTime" if timebase == Timebase.SOURCE else "canonicalTruthTime"
+        
+        # Default to all lanes if not specified
+        if lanes is None:
+            lanes = list(Lane)
+        
+        # Historical windows: serve from / fill the query cache
+        cache = self._queryCache
+        cacheKey = cacheToken = None
+        if cache is not None:
+            if cache.cacheable(stopTime):
+                timebaseName = Timebase(timebase).value
+                cacheKey = (timebaseName, startTime, stopTime, tuple(scopeIds) if scopeIds else None,
+                            tuple(Lane(lane).value for lane in lanes), systemId, containerId, uniqueId, viewId,
+                            messageType, manifestId, commandId, commandType, requestId, limit, ingestOrder)
+                cached, cacheToken = cache.get(cacheKey, timebaseName, stopTime)
+                if cached is not None:
+                    QUERY_SECONDS.observe(time.perf_counter() - queryStart)
+                    QUERY_ROWS_TOTAL.inc(len(cached))
+                    return cached
+            else:
+                cache.bypass()
+        
+        # Build scope filter
+        scopeFilter = ""
+        scopeParams = []
+        if scopeIds:
+            placeholders = ','.join('?' * len(scopeIds))
+            scopeFilter = f" AND scopeId IN ({placeholders})"
+            scopeParams = scopeIds
+        
+        # Build entity filter
+        def buildEntityFilter(params):
+            filter_parts = []
+            if systemId:
+                filter_parts.append(" AND systemId = ?")
+                params.append(systemId)
+            if containerId:
+                filter_parts.append(" AND containerId = ?")
+                params.append(containerId)
+            if uniqueId:
+                filter_parts.append(" AND uniqueId = ?")
+                params.append(uniqueId)
+            return ''.join(filter_parts)
+        
+        # Query each lane with ORDER BY per ordering contract
+        from . import ordering
+        
+        # Helper: get ORDER BY clause
+        # TWO SEPARATE ORDERING CONTRACTS:
+        #   1. Global Truth Ordering (default): timebase + lane priority + eventId
+        #      Used for: queries, streaming, UI display
+        #   2. File Parity Ordering (ingestOrder=True): ingestSeq (insertion order)
+        #      Used for: export file generation to match real-time FileWriter output.
+        #      ingestSeq is global to the database, so rows from the main file and the
+        #      segments merge back into ingest order regardless of canonical day
+        # These are NOT interchangeable - see phase6Summary.md for details.
+        def getOrderByClause(lane: Lane) -> str:
+            if ingestOrder:
+                # File Parity Sub-Contract: match real-time FileWriter order
+                return "ORDER BY ingestSeq ASC"
+            # Global Truth Contract: deterministic timebase ordering
+            return ordering.buildOrderByClause(timebase, lane)
+        
+        # Per-lane (lane, sql, params, JSON column) - executed against the main file and overlapping segments
+        laneQueries = []
+        seqColumn = ", ingestSeq" if ingestOrder else ""
+        
+        if Lane.RAW in lanes:
+            orderByClause = getOrderByClause(Lane.RAW)
+            query = f"""
+                SELECT 
+                    'raw' as lane,
+                    eventId, scopeId, sourceTruthTime, canonicalTruthTime,
+                    systemId, containerId, uniqueId, bytes,
+                    connectionId, sequence{seqColumn}
+                FROM rawEvents
+                WHERE {timeField} >= ? AND {timeField} <= ?
+                {scopeFilter}
+            """
+            params = [startTime, stopTime] + scopeParams
+            query += buildEntityFilter(params)
+            query += f" {orderByClause}"
+            
+            if limit:
+                query += f" LIMIT ?"
+                params.append(limit)
+            
+            laneQueries.append((Lane.RAW, query, params, None))
+        
+        if Lane.PARSED in lanes:
+            orderByClause = getOrderByClause(Lane.PARSED)
+            query = f"""
+                SELECT
+                    'parsed' as lane,
+                    eventId, scopeId, sourceTruthTime, canonicalTruthTime,
+                    systemId, containerId, uniqueId, messageType,
+                    schemaVersion, payload{seqColumn}
+                FROM parsedEvents
+                WHERE {timeField} >= ? AND {timeField} <= ?
+                {scopeFilter}
+            """
+            params = [startTime, stopTime] + scopeParams
+            query += buildEntityFilter(params)
+            
+            if messageType:
+                query += " AND messageType = ?"
+                params.append(messageType)
+            
+            query += f" {orderByClause}"
+            
+            if limit:
+                query += f" LIMIT ?"
+                params.append(limit)
+            
+            laneQueries.append((Lane.PARSED, query, params, 'payload'))
+        
+        if Lane.UI in lanes:
+            orderByClause = getOrderByClause(Lane.UI)
+            query = f"""
+                SELECT
+                    'ui' as lane,
+                    eventId, scopeId, sourceTruthTime, canonicalTruthTime,
+                    systemId, containerId, uniqueId, messageType,
+                    viewId, manifestId, manifestVersion, data{seqColumn}
+                FROM uiEvents
+                WHERE {timeField} >= ? AND {timeField} <= ?
+                {scopeFilter}
+            """
+            params = [startTime, stopTime] + scopeParams
+            query += buildEntityFilter(params)
+            
+            if viewId:
+                query += " AND viewId = ?"
+                params.append(viewId)
+            
+            if manifestId:
+                query += " AND manifestId = ?"
+                params.append(manifestId)
+            
+            query += f" {orderByClause}"
+            
+            if limit:
+                query += f" LIMIT ?"
+                params.append(limit)
+            
+            laneQueries.append((Lane.UI, query, params, 'data'))
+        
+        if Lane.COMMAND in lanes:
+            orderByClause = getOrderByClause(Lane.COMMAND)
+            query = f"""
+                SELECT
+                    'command' as lane,
+                    eventId, scopeId, sourceTruthTime, canonicalTruthTime,
+                    systemId, containerId, uniqueId, messageType,
+                    commandId, requestId, targetId, commandType, payload{seqColumn}
+                FROM commandEvents
+                WHERE {timeField} >= ? AND {timeField} <= ?
+                {scopeFilter}
+            """
+            params = [startTime, stopTime] + scopeParams
+            query += buildEntityFilter(params)
+            
+            if commandId:
+                query += " AND commandId = ?"
+                params.append(commandId)
+            
+            if commandType:
+                query += " AND commandType = ?"
+                params.append(commandType)
+            
+            if requestId:
+                query += " AND requestId = ?"
+                params.append(requestId)
+        
+            query += f" {orderByClause}"
+            
+            if limit:
+                query += f" LIMIT ?"
+                params.append(limit)
+            
+            laneQueries.append((Lane.COMMAND, query, params, 'payload'))
+        
+        if Lane.METADATA in lanes:
+            orderByClause = getOrderByClause(Lane.METADATA)
+            query = f"""
+                SELECT
+                    'metadata' as lane,
+                    eventId, scopeId, sourceTruthTime, canonicalTruthTime,
+                    systemId, containerId, uniqueId, messageType,
+                    effectiveTime, manifestId, payload{seqColumn}
+                FROM metadataEvents
+                WHERE {timeField} >= ? AND {timeField} <= ?
+                {scopeFilter}
+            """
+            params = [startTime, stopTime] + scopeParams
+            query += buildEntityFilter(params)
+            
+            if manifestId:
+                query += " AND manifestId = ?"
+                params.append(manifestId)
+            
+            if messageType:
+                query += " AND messageType = ?"
+                params.append(messageType)
+            
+            query += f" {orderByClause}"
+            
+            if limit:
+                query += f" LIMIT ?"
+                params.append(limit)
+            
+            laneQueries.append((Lane.METADATA, query, params, 'payload'))
+        
+        # Segments overlapping the window (segmented lanes only)
+        segments = []
+        if self._segments and any(lane in SEGMENTED_LANES for lane, _, _, _ in laneQueries):
+            segments = self._segmentsForWindow(startTime, stopTime, timebase)
+        
         # Use dedicated read connection with lock for cursor isolation
         # SQLite WAL mode supports concurrent reads with writes
         with self._readLock:
-            readConn = self._getReadConnection()
-            timeField = "sourceTruthTime" if timebase == Timebase.SOURCE else "canonicalTruthTime"
             results = []
-            
-            # Default to all lanes if not specified
-            if lanes is None:
-                lanes = list(Lane)
-            
-            # Build scope filter
-            scopeFilter = ""
-            scopeParams = []
-            if scopeIds:
-                placeholders = ','.join('?' * len(scopeIds))
-                scopeFilter = f" AND scopeId IN ({placeholders})"
-                scopeParams = scopeIds
-            
-            # Build entity filter
-            def buildEntityFilter(params):
-                filter_parts = []
-                if systemId:
-                    filter_parts.append(" AND systemId = ?")
-                    params.append(systemId)
-                if containerId:
-                    filter_parts.append(" AND containerId = ?")
-                    params.append(containerId)
-                if uniqueId:
-                    filter_parts.append(" AND uniqueId = ?")
-                    params.append(uniqueId)
-                return ''.join(filter_parts)
-            
-            cursor = readConn.cursor()
+            resultBytes = 0  # Stored JSON/bytes length, for the query cache size estimate
             
             try:
-                # Query each lane with ORDER BY per ordering contract
-                from . import ordering
-                
-                # Helper: get ORDER BY clause
-                # TWO SEPARATE ORDERING CONTRACTS:
-                #   1. Global Truth Ordering (default): timebase + lane priority + eventId
-                #      Used for: queries, streaming, UI display
-                #   2. File Parity Ordering (ingestOrder=True): rowid (insertion order)
-                #      Used for: export file generation to match real-time FileWriter output
-                # These are NOT interchangeable - see phase6Summary.md for details.
-                def getOrderByClause(lane: Lane) -> str:
-                    if ingestOrder:
-                        # File Parity Sub-Contract: match real-time FileWriter order
-                        return "ORDER BY rowid ASC"
-                    # Global Truth Contract: deterministic timebase ordering
-                    return ordering.buildOrderByClause(timebase, lane)
-                
-                if Lane.RAW in lanes:
-                    orderByClause = getOrderByClause(Lane.RAW)
-                    query = f"""
-                        SELECT 
-                            'raw' as lane,
-                            eventId, scopeId, sourceTruthTime, canonicalTruthTime,
-                            systemId, containerId, uniqueId, bytes,
-                            connectionId, sequence
-                        FROM rawEvents
-                        WHERE {timeField} >= ? AND {timeField} <= ?
-                        {scopeFilter}
-                    """
-                    params = [startTime, stopTime] + scopeParams
-                    query += buildEntityFilter(params)
-                    query += f" {orderByClause}"
-                    
-                    if limit:
-                        query += f" LIMIT ?"
-                        params.append(limit)
-                    
-                    cursor.execute(query, params)
-                    for row in cursor.fetchall():
-                        results.append(dict(row))
-                
-                if Lane.PARSED in lanes:
-                    orderByClause = getOrderByClause(Lane.PARSED)
-                    query = f"""
-                        SELECT
-                            'parsed' as lane,
-                            eventId, scopeId, sourceTruthTime, canonicalTruthTime,
-                            systemId, containerId, uniqueId, messageType,
-                            schemaVersion, payload
-                        FROM parsedEvents
-                        WHERE {timeField} >= ? AND {timeField} <= ?
-                        {scopeFilter}
-                    """
-                    params = [startTime, stopTime] + scopeParams
-                    query += buildEntityFilter(params)
-                    
-                    if messageType:
-                        query += " AND messageType = ?"
-                        params.append(messageType)
-                    
-                    query += f" {orderByClause}"
-                    
-                    if limit:
-                        query += f" LIMIT ?"
-                        params.append(limit)
-                    
-                    cursor.execute(query, params)
-                    for row in cursor.fetchall():
-                        result = dict(row)
-                        result['payload'] = json.loads(result['payload'])
-                        results.append(result)
-                
-                if Lane.UI in lanes:
-                    orderByClause = getOrderByClause(Lane.UI)
-                    query = f"""
-                        SELECT
-                            'ui' as lane,
-                            eventId, scopeId, sourceTruthTime, canonicalTruthTime,
-                            systemId, containerId, uniqueId, messageType,
-                            viewId, manifestId, manifestVersion, data
-                        FROM uiEvents
-                        WHERE {timeField} >= ? AND {timeField} <= ?
-                        {scopeFilter}
-                    """
-                    params = [startTime, stopTime] + scopeParams
-                    query += buildEntityFilter(params)
+                for lane, query, params, jsonField in laneQueries:
+                    # Main file first (pre-segment data), then segments oldest first
+                    sources = [self._getReadConnection()]
+                    if lane in SEGMENTED_LANES:
+                        sources.extend(self._getSegmentReadConnection(segment) for segment in segments)
                     
-                    if viewId:
-                        query += " AND viewId = ?"
-                        params.append(viewId)
+                    laneRows = []
+                    contributing = 0
+                    for conn in sources:
+                        cursor = conn.execute(query, params)
+                        try:
+                            rows = cursor.fetchall()
+                        finally:
+                            cursor.close()
+                        if rows:
+                            contributing += 1
+                            laneRows.extend(dict(row) for row in rows)
                     
-                    if manifestId:
-                        query += " AND manifestId = ?"
-                        params.append(manifestId)
-                    
-                    query += f" {orderByClause}"
-                    
-                    if limit:
-                        query += f" LIMIT ?"
-                        params.append(limit)
-                    
-                    cursor.execute(query, params)
-                    for row in cursor.fetchall():
-                        result = dict(row)
-                        result['data'] = json.loads(result['data'])
-                        results.append(result)
-                
-                if Lane.COMMAND in lanes:
-                    orderByClause = getOrderByClause(Lane.COMMAND)
-                    query = f"""
-                        SELECT
-                            'command' as lane,
-                            eventId, scopeId, sourceTruthTime, canonicalTruthTime,
-                            systemId, containerId, uniqueId, messageType,
-                            commandId, requestId, targetId, commandType, payload
-                        FROM commandEvents
-                        WHERE {timeField} >= ? AND {timeField} <= ?
-                        {scopeFilter}
-                    """
-                    params = [startTime, stopTime] + scopeParams
-                    query += buildEntityFilter(params)
-                    
-                    if commandId:
-                        query += " AND commandId = ?"
-                        params.append(commandId)
-                    
-                    if commandType:
-                        query += " AND commandType = ?"
-                        params.append(commandType)
-                    
-                    if requestId:
-                        query += " AND requestId = ?"
-                        params.append(requestId)
-                
-                    query += f" {orderByClause}"
-                    
-                    if limit:
-                        query += f" LIMIT ?"
-                        params.append(limit)
-                    
-                    cursor.execute(query, params)
-                    for row in cursor.fetchall():
-                        result = dict(row)
-                        result['payload'] = json.loads(result['payload'])
-                        results.append(result)
-                
-                if Lane.METADATA in lanes:
-                    orderByClause = getOrderByClause(Lane.METADATA)
-                    query = f"""
-                        SELECT
-                            'metadata' as lane,
-                            eventId, scopeId, sourceTruthTime, canonicalTruthTime,
-                            systemId, containerId, uniqueId, messageType,
-                            effectiveTime, manifestId, payload
-                        FROM metadataEvents
-                        WHERE {timeField} >= ? AND {timeField} <= ?
-                        {scopeFilter}
-                    """
-                    params = [startTime, stopTime] + scopeParams
-                    query += buildEntityFilter(params)
-                    
-                    if manifestId:
-                        query += " AND manifestId = ?"
-                        params.append(manifestId)
-                    
-                    if messageType:
-                        query += " AND messageType = ?"
-                        params.append(messageType)
-                    
-                    query += f" {orderByClause}"
-                    
-                    if limit:
-                        query += f" LIMIT ?"
-                        params.append(limit)
+                    # Merge sources back into lane order, then keep the first `limit` rows
+                    if contributing > 1:
+                        if ingestOrder:
+                            laneRows.sort(key=lambda e: e['ingestSeq'])
+                        elif limit and len(laneRows) > limit:
+                            laneRows.sort(key=lambda e: (e[timeField], e['eventId']))
+                        if limit:
+                            del laneRows[limit:]
+                    if ingestOrder:
+                        for result in laneRows:
+                            del result['ingestSeq']
                     
-                    cursor.execute(query, params)
-                    for row in cursor.fetchall():
-                        result = dict(row)
-                        result['payload'] = json.loads(result['payload'])
-                        results.append(result)
+                    if jsonField:
+                        decode = self._payloadCodec.decode
+                        for result in laneRows:
+                            text = decode(result[jsonField])
+                            resultBytes += len(text)
+                            result[jsonField] = json.loads(text)
+                    elif cacheKey is not None:
+                        resultBytes += sum(len(result['bytes']) for result in laneRows)
+                    results.extend(laneRows)
                 
                 # Cross-lane ordering
-                # When ingestOrder=True: skip cross-lane sort, preserve per-lane rowid order
+                # When ingestOrder=True: skip cross-lane sort, preserve per-lane ingestSeq order
                 #   (used for file/export parity where we need to match real-time FileWriter order)
                 # When ingestOrder=False: sort by (timebase, lane_priority, eventId)
                 #   (Global Truth Contract for queries, streaming, UI)
@@ -781,17 +2050,22 @@ class Database:
                     ))
                 
                 # Performance logging
-                queryMs = (time.perf_counter() - queryStart) * 1000
+                querySeconds = time.perf_counter() - queryStart
+                QUERY_SECONDS.observe(querySeconds)
+                QUERY_ROWS_TOTAL.inc(len(results))
+                queryMs = querySeconds * 1000
                 if len(results) > 0 or queryMs > 50:  # Log if results or slow query
                     self.log.debug(f"[Database] queryEvents: {len(results)} events in {queryMs:.1f}ms "
-                                   f"[{startTime[:19]}→{stopTime[:19]}] lanes={[l.value for l in lanes]}")
-                
-                return results
+                                   f"[{startTime[:19]}→{stopTime[:19]}] lanes={[l.value for l in lanes]} "
+                                   f"segments={len(segments)}")
                 
             except sqlite3.Error as e:
                 raise DatabaseError(f"Query failed: {e}")
-            finally:
-                cursor.close()
+        
+        if cacheKey is not None:
+            cache.put(cacheKey, cacheKey[0], startTime, stopTime, results,
+                      cache.estimateBytes(len(results), resultBytes), cacheToken)
+        return results
 
     def insertCommandEvent(self, commandEvent: Dict[str, Any]) -> bool:
         """
@@ -872,25 +2146,39 @@ class Database:
                 cursor = self.conn.execute(f"PRAGMA wal_checkpoint({mode})")
                 result = cursor.fetchone()
                 cursor.close()
-                return tuple(result) if result else (1, -1, -1)
+                if not result:
+                    return (1, -1, -1)
+                blocked, logPages, checkpointed = result
+                
+                # Open segment writers: fold their WAL pages into the totals
+                for segmentConn in self._segmentWriters.values():
+                    segBlocked, segLog, segCheckpointed = segmentConn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+                    blocked = max(blocked, segBlocked)
+                    logPages += max(segLog, 0)
+                    checkpointed += max(segCheckpointed, 0)
+                return (blocked, logPages, checkpointed)
             except sqlite3.Error as e:
                 self.log.warning(f'[Database] Checkpoint failed: {e}')
                 return (1, -1, -1)
     
     def close(self):
         """Close database connections with final checkpoint"""
-        # Close read connection first
-        if self._readConn:
-            with self._readLock:
+        # Close read connections first
+        with self._readLock:
+            if self._readConn:
                 try:
                     self._readConn.close()
                 except sqlite3.Error:
                     pass
                 self._readConn = None
+            while self._segmentReaders:
+                self._closeConnection(self._segmentReaders.popitem()[1])
         
-        # Close write connection with checkpoint
+        # Close write connections with checkpoint
         if self.conn:
             with self._writeLock:
+                while self._segmentWriters:
+                    self._closeConnection(self._segmentWriters.popitem()[1], checkpoint=True)
                 # Do a TRUNCATE checkpoint on close to clean up WAL file
                 try:
                     self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
@@ -0,0 +1,120 @@
+"""
+NOVA Dedupe Filter
+
+In-memory Bloom filter over recently ingested eventIds, used by Database.insertEvent
+to avoid failed writes for duplicates (replays, mirrored scopes).
+
+- "Definitely new": insert directly (eventIndex PK still enforces uniqueness)
+- "Maybe seen": confirm with an indexed eventIndex read instead of a failed insert
+
+Two generations of `capacity` ids each are kept; when the current generation fills,
+the older one is discarded. Forgotten ids only lose the fast path (the insert falls
+back to the IntegrityError dedupe), so the filter never affects correctness.
+
+eventIds are SHA256 hex digests, so bit positions are taken directly from the id;
+other strings are hashed first.
+"""
+
+import hashlib
+import math
+from typing import Iterable, List
+
+try:
+    import numpy as _np
+except ImportError:  # numpy is optional for Core (bulk rebuild falls back to per-id adds)
+    _np = None
+
+
+_BIT = tuple(1 << i for i in range(8))
+
+
+class DedupeFilter:
+    """Generational Bloom filter of recent eventIds."""
+
+    def __init__(self, capacity: int = 1000000, falsePositiveRate: float = 0.01):
+        """
+        Args:
+            capacity: eventIds per generation (memory ~ capacity * 1.2 bytes per generation at 1%)
+            falsePositiveRate: Target false positive rate per generation
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        bits = -capacity * math.log(falsePositiveRate) / (math.log(2) ** 2)
+        self._bitsLog2 = max(10, math.ceil(math.log2(bits)))  # Power of two: index by shift/mask
+        self.numBits = 1 << self._bitsLog2
+        self.numHashes = max(1, min(8, round(self.numBits / capacity * math.log(2))))
+        self._mask = self.numBits - 1
+        self._shifts = tuple(32 * i for i in range(self.numHashes))  # k 32-bit slices of the digest
+        self._current = bytearray(self.numBits >> 3)
+        self._previous = bytearray(self.numBits >> 3)
+        self._currentCount = 0
+
+    @staticmethod
+    def _digest(eventId: str) -> int:
+        """256-bit integer for an eventId (the id itself when it is a SHA256 hex digest)"""
+        if len(eventId) == 64:
+            try:
+                return int(eventId, 16)
+            except ValueError:
+                pass
+        return int.from_bytes(hashlib.sha256(eventId.encode('utf-8')).digest(), 'big')
+
+    def add(self, eventId: str):
+        """Record an eventId; rotates generations when the current one is full"""
+        if self._currentCount >= self.capacity:
+            self._previous = self._current
+            self._current = bytearray(self.numBits >> 3)
+            self._currentCount = 0
+        bits, mask, value = self._current, self._mask, self._digest(eventId)
+        for shift in self._shifts:
+            position = (value >> shift) & mask
+            bits[position >> 3] |= _BIT[position & 7]
+        self._currentCount += 1
+
+    def mightContain(self, eventId: str) -> bool:
+        """False: eventId was definitely not added recently. True: it probably was."""
+        mask, value = self._mask, self._digest(eventId)
+        positions = [(value >> shift) & mask for shift in self._shifts]
+        for bits in (self._current, self._previous):
+            for position in positions:
+                if not bits[position >> 3] & _BIT[position & 7]:
+                    break
+            else:
+                return True
+        return False
+
+    def update(self, eventIds: Iterable[str]):
+        """Add many eventIds (oldest first); vectorized when numpy is available"""
+        eventIds = list(eventIds)
+        offset = 0
+        while offset < len(eventIds):
+            if self._currentCount >= self.capacity:
+                self._previous = self._current
+                self._current = bytearray(self.numBits >> 3)
+                self._currentCount = 0
+            chunk = eventIds[offset:offset + self.capacity - self._currentCount]
+            offset += len(chunk)
+            if _np is None or not self._addBulk(chunk):
+                for eventId in chunk:
+                    self.add(eventId)
+
+    def _addBulk(self, eventIds: List[str]) -> bool:
+        """Set bits for SHA256 hex eventIds with numpy. Returns False if any id is not a hex digest."""
+        try:
+            if any(len(eventId) != 64 for eventId in eventIds):
+                return False
+            words = _np.frombuffer(bytes.fromhex(''.join(eventIds)), dtype='>u4').reshape(-1, 8)
+        except ValueError:
+            return False
+        marks = _np.zeros(self.numBits, dtype=bool)
+        for i in range(self.numHashes):
+            marks[words[:, 7 - i].astype(_np.int64) & self._mask] = True  # Word 7-i holds bits 32i..32i+31
+        packed = _np.packbits(marks, bitorder='little')
+        current = _np.frombuffer(self._current, dtype=_np.uint8)
+        self._current = bytearray(_np.bitwise_or(current, packed).tobytes())
+        self._currentCount += len(eventIds)
+        return True
+
+    def __contains__(self, eventId: str) -> bool:
+        return self.mightContain(eventId)
@@ -21,7 +21,9 @@ File Parity Ordering (Phase 6 Sub-Contract):
   ⚠️ This is a NARROW sub-contract for file/export parity ONLY.
   It does NOT replace the Global Truth Ordering contract (Phase 4).
   
-  - Files and exports use INGEST ORDER (rowid), NOT timestamp order.
+  - Files and exports use INGEST ORDER (ingestSeq), NOT timestamp order.
+  - ingestSeq is global to the truth DB, so the main file and all segment
+    files merge back into one ingest order (also for late/replicated days).
   - FileWriter writes as events arrive (implicitly ingest order).
   - Export uses ingestOrder=True to match real-time writes.
   - This is the ONLY ordering that can match real-time file content.
@@ -108,7 +110,7 @@ class Export:
             containerId: Filter by container
             uniqueId: Filter by entity
             exportId: Custom export ID (generated if not provided)
-            ingestOrder: If True, use ingest order (rowid) for parity with real-time.
+            ingestOrder: If True, use ingest order (ingestSeq) for parity with real-time.
                          If False, use timebase order (for UI display exports).
             
         Returns:
@@ -134,7 +136,7 @@ class Export:
         
         try:
             # Query events from DB (bounded read)
-            # For parity: use ingest order (rowid) to match real-time file writes
+            # For parity: use ingest order (ingestSeq) to match real-time file writes
             events = self.database.queryEvents(
                 startTime=startTime,
                 stopTime=stopTime,
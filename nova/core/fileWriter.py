@@ -14,9 +14,11 @@ from pathlib import Path
 from typing import Dict, Any, Optional, Callable
 from queue import Queue, Empty
 import threading
+import time
 
 from nova.core.events import Lane
 from nova.core.drivers.registry import DriverRegistry
+from nova.core.metrics import getRegistry
 from sdk.logging import getLogger
 
 
@@ -56,6 +58,11 @@ class FileWriter:
         
         self._eventsWritten = 0
         self._writeErrors = 0
+        
+        metrics = getRegistry()
+        metrics.gauge('nova_filewriter_queue_depth', 'Events waiting in the FileWriter queue').setFunction(self._writeQueue.qsize)
+        self._writeSeconds = metrics.histogram('nova_filewriter_write_seconds', 'FileWriter per-event driver write latency')
+        self._writtenTotal = metrics.counter('nova_filewriter_events_total', 'Events written to files by FileWriter')
     
     def start(self):
         """Start the file writer background thread."""
@@ -95,7 +102,9 @@ class FileWriter:
                 if item is None:
                     break
                 event, canonicalTruthTime = item
+                writeStart = time.perf_counter()
                 self._processWrite(event, canonicalTruthTime)
+                self._writeSeconds.observe(time.perf_counter() - writeStart)
             except Empty:
                 continue
     
@@ -129,6 +138,7 @@ class FileWriter:
         filePath = driver.write(event, canonicalTruthTime)
         if filePath:
             self._eventsWritten += 1
+            self._writtenTotal.inc()
     
     def _emitDriverBinding(self, event: Dict[str, Any], driver, canonicalTruthTime: str):
         """Emit DriverBinding metadata event."""
@@ -33,12 +33,23 @@ Ingest Flow:
   6. On success: return True
 """
 
+import time
+from collections import Counter
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional
+
+from sdk.logging import getLogger
 
 from .database import Database, DatabaseError
 from .events import Event, Lane, computeEventId, buildEntityIdentityKey
 from .canonical_json import canonicalJson
+from .metrics import getRegistry
+
+
+_metrics = getRegistry()
+INGEST_SECONDS = _metrics.histogram('nova_ingest_seconds', 'Ingest.ingest latency (validate, eventId, insert, fan-out)', ('lane',))
+INGEST_EVENTS_TOTAL = _metrics.counter('nova_ingest_events_total', 'Events through Ingest.ingest/ingestBatch by outcome', ('lane', 'result'))
+INGEST_BATCH_SECONDS = _metrics.histogram('nova_ingest_batch_seconds', 'Ingest.ingestBatch latency (validate, eventId, batch insert, fan-out)')
 
 
 class IngestError(Exception):
@@ -55,12 +66,13 @@ class Ingest:
     Notifies StreamingManager of new events for push-based LIVE streaming.
     Triggers FileWriter for real-time file output (Phase 6).
     Processes UiUpdate events through UiStateManager for checkpoint generation (Phase 7).
+    Feeds inserted events to the OverviewPyramid for timeline overview buckets.
     
     CRITICAL: FileWriter is ONLY triggered on ingest (producer truth).
     FileWriter must NEVER be called from query/stream/replay paths.
     """
     
-    def __init__(self, database: Database, verifyEventId: bool = True, streamingManager=None, fileWriter=None, uiStateManager=None):
+    def __init__(self, database: Database, verifyEventId: bool = True, streamingManager=None, fileWriter=None, uiStateManager=None, overview=None):
         """
         Initialize ingest pipeline.
         
@@ -70,12 +82,15 @@ class Ingest:
             streamingManager: StreamingManager instance for LIVE stream notifications (optional)
             fileWriter: FileWriter instance for real-time file output (optional)
             uiStateManager: UiStateManager instance for UiCheckpoint generation (optional)
+            overview: OverviewPyramid instance for overview bucket updates (optional)
         """
         self.database = database
         self.verifyEventId = verifyEventId
         self.streamingManager = streamingManager
         self.fileWriter = fileWriter
         self.uiStateManager = uiStateManager
+        self.overview = overview
+        self.log = getLogger()
     
     def ingest(self, event: Event) -> bool:
         """
@@ -91,47 +106,108 @@ class Ingest:
         Raises:
             IngestError: On validation failure or database error (not dedupe)
         """
-        # Step 1: Validate required fields (eventId computed if missing)
-        self._validate(event)
+        ingestStart = time.perf_counter()
+        result = 'rejected'
+        try:
+            # Step 1: Validate required fields (eventId computed if missing)
+            self._validate(event)
         
-        # Step 2: Compute or verify eventId
-        self._ensureEventId(event)
+            # Step 2: Compute or verify eventId
+            self._ensureEventId(event)
         
-        # Step 3: Assign canonicalTruthTime (wall-clock now, UTC ISO8601)
-        canonicalTruthTime = datetime.now(timezone.utc).isoformat()
+            # Step 3: Assign canonicalTruthTime (wall-clock now, UTC ISO8601)
+            canonicalTruthTime = datetime.now(timezone.utc).isoformat()
         
-        # Step 4: Atomic insert (dedupe + append)
-        try:
-            inserted = self.database.insertEvent(event, canonicalTruthTime)
+            # Step 4: Atomic insert (dedupe + append)
+            try:
+                inserted = self.database.insertEvent(event, canonicalTruthTime)
             
-            if inserted:
-                # Success: new event ingested
-                # Notify StreamingManager for LIVE stream push
-                if self.streamingManager:
-                    self.streamingManager.notifyNewEvent(event, canonicalTruthTime)
-                
-                # Trigger FileWriter for real-time file output (Phase 6)
-                # CRITICAL: Only on ingest, NEVER on query/stream/replay
-                if self.fileWriter:
-                    eventDict = event.toDict()
-                    eventDict['canonicalTruthTime'] = canonicalTruthTime
-                    self.fileWriter.write(eventDict, canonicalTruthTime)
-                
-                # Process UiUpdate through UiStateManager for checkpoint generation (Phase 7)
-                if self.uiStateManager and event.lane == Lane.UI:
-                    if hasattr(event, 'messageType') and event.messageType == "UiUpdate":
-                        checkpoint = self.uiStateManager.processUiUpdate(event)
-                        if checkpoint:
-                            # Ingest the generated checkpoint
-                            self._ingestCheckpoint(checkpoint, canonicalTruthTime)
-                
-                return True
-            else:
-                # Dedupe: eventId already exists
-                return False
+                if inserted:
+                    # Success: new event ingested
+                    self._fanOut(event, canonicalTruthTime)
+                    result = 'inserted'
+                    return True
+                else:
+                    # Dedupe: eventId already exists
+                    result = 'deduped'
+                    return False
         
+            except DatabaseError as e:
+                raise IngestError(f"Database insert failed: {e}")
+        finally:
+            lane = event.lane.value if isinstance(event.lane, Lane) else 'unknown'
+            INGEST_SECONDS.observe(time.perf_counter() - ingestStart, lane=lane)
+            INGEST_EVENTS_TOTAL.inc(lane=lane, result=result)
+    
+    def ingestBatch(self, events: List[Event], canonicalTruthTime: Optional[str] = None) -> int:
+        """
+        Ingest many events with one batched insert (replication, bulk import).
+        
+        Events are validated and their eventId computed or verified as in ingest;
+        invalid events are logged, counted as rejected and skipped so the rest of the
+        batch still lands. Events that already carry canonicalTruthTime keep it, the
+        rest get canonicalTruthTime (default: wall-clock now). New events get the
+        same fan-out as ingest.
+        
+        Returns:
+            Number of new events (duplicates and rejected events excluded)
+            
+        Raises:
+            IngestError: On database error
+        """
+        batchStart = time.perf_counter()
+        canonicalTruthTime = canonicalTruthTime or datetime.now(timezone.utc).isoformat()
+        accepted = []
+        for event in events:
+            try:
+                self._validate(event)
+                self._ensureEventId(event)
+                accepted.append(event)
+            except IngestError as e:
+                self.log.warning(f"[Ingest] Batch event rejected: {e}", eventId=event.eventId)
+                INGEST_EVENTS_TOTAL.inc(lane=event.lane.value if isinstance(event.lane, Lane) else 'unknown',
+                                        result='rejected')
+        
+        try:
+            inserted = self.database.insertNewEvents(accepted, canonicalTruthTime) if accepted else []
         except DatabaseError as e:
-            raise IngestError(f"Database insert failed: {e}")
+            raise IngestError(f"Database batch insert failed: {e}")
+        
+        for event, eventCanonical in inserted:
+            self._fanOut(event, eventCanonical)
+        
+        insertedByLane = Counter(event.lane.value for event, _ in inserted)
+        for lane, total in Counter(event.lane.value for event in accepted).items():
+            if insertedByLane[lane]:
+                INGEST_EVENTS_TOTAL.inc(insertedByLane[lane], lane=lane, result='inserted')
+            if total > insertedByLane[lane]:
+                INGEST_EVENTS_TOTAL.inc(total - insertedByLane[lane], lane=lane, result='deduped')
+        INGEST_BATCH_SECONDS.observe(time.perf_counter() - batchStart)
+        return len(inserted)
+    
+    def _fanOut(self, event: Event, canonicalTruthTime: str):
+        """Push a newly inserted event to LIVE streams, FileWriter, overview and UiStateManager"""
+        # Notify StreamingManager for LIVE stream push
+        if self.streamingManager:
+            self.streamingManager.notifyNewEvent(event, canonicalTruthTime)
+        
+        # Trigger FileWriter for real-time file output (Phase 6)
+        # CRITICAL: Only on ingest, NEVER on query/stream/replay
+        if self.fileWriter:
+            eventDict = event.toDict()
+            eventDict['canonicalTruthTime'] = canonicalTruthTime
+            self.fileWriter.write(eventDict, canonicalTruthTime)
+        
+        if self.overview:
+            self.overview.observe(event, canonicalTruthTime)
+        
+        # Process UiUpdate through UiStateManager for checkpoint generation (Phase 7)
+        if self.uiStateManager and event.lane == Lane.UI:
+            if hasattr(event, 'messageType') and event.messageType == "UiUpdate":
+                checkpoint = self.uiStateManager.processUiUpdate(event)
+                if checkpoint:
+                    # Ingest the generated checkpoint
+                    self._ingestCheckpoint(checkpoint, canonicalTruthTime)
     
     def _ingestCheckpoint(self, checkpoint, parentCanonicalTime: str):
         """
@@ -33,9 +33,17 @@ from nova.core.contracts import (
     ExportRequest, ExportResponse, ListExportsRequest, ExportsListResponse
 )
 from nova.core.export import Export
+from nova.core.overview import OverviewPyramid
+from nova.core.metrics import getRegistry
+from nova.core.profiler import Profiler, ProfilerBusy
+from nova.core.watchdog import LoopWatchdog
 from sdk.logging import getLogger
 
 
+# Stream items forwarded per queue per forwarding pass
+STREAM_FORWARD_BATCH = 32
+
+
 class CoreIPCHandler:
     """
     Core-side IPC handler.
@@ -61,9 +69,29 @@ class CoreIPCHandler:
         exportDir = Path(self.config.get('exportDir', './nova/exports'))
         self.exportHandler = Export(database, exportDir)
         
+        # Overview pyramid (fed by Ingest; None when disabled)
+        self.overview = OverviewPyramid.fromConfig(database, self.config.get('overview', {}))
+        
         # Per-connection response queues for streaming
         self.streamQueues: Dict[str, asyncio.Queue] = {}
         
+        # Metrics (queue depths are sampled at collection time)
+        self.metrics = getRegistry()
+        self._requestSeconds = self.metrics.histogram('nova_ipc_request_seconds', 'Core IPC request handling latency', ('type',))
+        self._requestsTotal = self.metrics.counter('nova_ipc_requests_total', 'Core IPC requests by type', ('type',))
+        self._streamItemsTotal = self.metrics.counter('nova_ipc_stream_items_forwarded_total', 'Stream chunks/completions forwarded to Server')
+        queueDepth = self.metrics.gauge('nova_ipc_queue_depth', 'Items waiting in IPC and per-stream queues', ('queue',))
+        queueDepth.setFunction(requestQueue.qsize, queue='request')
+        queueDepth.setFunction(responseQueue.qsize, queue='response')
+        queueDepth.setFunction(lambda: sum(q.qsize() for q in list(self.streamQueues.values())), queue='stream')
+        
+        # Admin profiling sessions run as background tasks (they last seconds)
+        self.profiler = Profiler.fromConfig('core', self.config.get('diagnostics', {}))
+        self._profileTasks: set = set()
+        
+        # Event loop stall detector (diagnostics.watchdog; None when disabled)
+        self.watchdog = LoopWatchdog.fromConfig('core', self.config.get('diagnostics', {}).get('watchdog', {}))
+        
         self.running = False
     
     def setTransportManager(self, transportManager):
@@ -76,6 +104,9 @@ class CoreIPCHandler:
         self.running = True
         self.log.info("[CoreIPC] Started")
         
+        if self.watchdog:
+            self.watchdog.start()
+        
         # Start request processor
         requestTask = asyncio.create_task(self._processRequests())
         
@@ -87,6 +118,8 @@ class CoreIPCHandler:
     async def stop(self):
         """Stop IPC handler"""
         self.running = False
+        if self.watchdog:
+            await self.watchdog.stop()
         await self.streamingManager.shutdown()
         self.log.info("[CoreIPC] Stopped")
     
@@ -101,6 +134,7 @@ class CoreIPCHandler:
                 
                 # Parse request
                 requestType = request.get('type')
+                requestStart = time.perf_counter()
                 
                 if requestType == RequestType.QUERY.value:
                     await self._handleQuery(request)
@@ -120,9 +154,21 @@ class CoreIPCHandler:
                     await self._handleCancelStreamRaw(request)
                 elif requestType == RequestType.INGEST_METADATA.value:
                     await self._handleIngestMetadata(request)
+                elif requestType == RequestType.GET_METRICS.value:
+                    await self._handleGetMetrics(request)
+                elif requestType == RequestType.PROFILE.value:
+                    await self._handleProfile(request)
+                elif requestType == RequestType.GET_STALLS.value:
+                    await self._handleGetStalls(request)
+                elif requestType == RequestType.QUERY_OVERVIEW.value:
+                    await self._handleQueryOverview(request)
                 else:
                     self.log.warning(f"[CoreIPC] Unknown request type: {requestType}")
                     await self._sendError(request.get('requestId'), f"Unknown request type: {requestType}")
+                    continue
+                
+                self._requestsTotal.inc(type=requestType)
+                self._requestSeconds.observe(time.perf_counter() - requestStart, type=requestType)
             
             except Exception as e:
                 self.log.error(f"[CoreIPC] Error processing request: {e}")
@@ -211,14 +257,16 @@ class CoreIPCHandler:
                 rate=request['rate'],
                 timelineMode=TimelineMode(request['timelineMode']),
                 timebase=request.get('timebase', 'canonical'),
-                filters=request.get('filters')
+                filters=request.get('filters'),
+                unpaced=request.get('unpaced', False)
             )
             
             self.log.info(f"[CoreIPC] StartStream: playbackId={req.playbackRequestId}, "
-                         f"start={req.startTime}, stop={req.stopTime}, rate={req.rate}")
+                         f"start={req.startTime}, stop={req.stopTime}, rate={req.rate}, unpaced={req.unpaced}")
             
-            # Create response queue for this connection
-            chunkQueue = asyncio.Queue()
+            # Create response queue for this connection (bounded for unpaced replay: backpressure on the cursor)
+            maxQueued = self.config.get('streaming', {}).get('unpacedMaxQueuedChunks', 8) if req.unpaced else 0
+            chunkQueue = asyncio.Queue(maxsize=maxQueued)
             self.streamQueues[req.clientConnId] = chunkQueue
             
             # Start streaming
@@ -301,9 +349,13 @@ class CoreIPCHandler:
                     if not queue:
                         continue
                     
-                    try:
-                        # Non-blocking get
-                        item = queue.get_nowait()
+                    # Drain what is queued (bounded per pass so one stream cannot starve the others)
+                    for _ in range(STREAM_FORWARD_BATCH):
+                        try:
+                            # Non-blocking get
+                            item = queue.get_nowait()
+                        except asyncio.QueueEmpty:
+                            break
                         
                         # Send to Server
                         itemDict = item.toDict()
@@ -316,9 +368,7 @@ class CoreIPCHandler:
                             itemDict['type'] = 'streamChunk'
                         
                         await self._sendResponse(itemDict)
-                        
-                    except asyncio.QueueEmpty:
-                        pass
+                        self._streamItemsTotal.inc()
                 
                 # Small delay to prevent busy-wait
                 await asyncio.sleep(0.01)
@@ -335,6 +385,69 @@ class CoreIPCHandler:
         errorResp = ErrorResponse(requestId=requestId, error=error)
         await self._sendResponse(errorResp.toDict())
 
+    async def _handleGetMetrics(self, request: Dict[str, Any]):
+        """Handle GET_METRICS: snapshot of this process's metrics registry"""
+        await self._sendResponse({
+            'type': 'metrics',
+            'requestId': request.get('requestId'),
+            'metrics': self.metrics.snapshot()
+        })
+
+    async def _handleGetStalls(self, request: Dict[str, Any]):
+        """Handle GET_STALLS: event loop stalls recorded by the watchdog"""
+        await self._sendResponse({
+            'type': 'stalls',
+            'requestId': request.get('requestId'),
+            'enabled': self.watchdog is not None,
+            'stalls': self.watchdog.stalls() if self.watchdog else []
+        })
+
+    async def _handleQueryOverview(self, request: Dict[str, Any]):
+        """Handle QUERY_OVERVIEW: bucket summaries for a window (microsecond times)"""
+        if self.overview is None:
+            await self._sendError(request.get('requestId'), 'Overview pyramid is disabled')
+            return
+        try:
+            result = await asyncio.to_thread(
+                self.overview.query,
+                startTime=request['startTime'],
+                stopTime=request['stopTime'],
+                timebase=request.get('timebase', 'canonical'),
+                filters=request.get('filters'),
+                maxBuckets=request.get('maxBuckets'),
+                tier=request.get('tier')
+            )
+            result.update(type='overview', requestId=request.get('requestId'))
+            await self._sendResponse(result)
+        except Exception as e:
+            self.log.error(f"[CoreIPC] QueryOverview error: {e}")
+            await self._sendError(request.get('requestId'), str(e))
+
+    async def _handleProfile(self, request: Dict[str, Any]):
+        """Handle PROFILE: start a time-boxed profiling session; responds when it completes"""
+        if self.profiler.active:
+            await self._sendError(request.get('requestId'), 'Profiling session already running in core')
+            return
+        task = asyncio.create_task(self._runProfile(request))
+        self._profileTasks.add(task)
+        task.add_done_callback(self._profileTasks.discard)
+
+    async def _runProfile(self, request: Dict[str, Any]):
+        requestId = request.get('requestId')
+        try:
+            summary = await self.profiler.profile(
+                durationSeconds=request.get('durationSeconds', 10.0),
+                sampleIntervalMs=request.get('sampleIntervalMs', 5.0),
+                slowCallbackMs=request.get('slowCallbackMs', 100.0),
+                sessionId=request.get('sessionId')
+            )
+            await self._sendResponse({'type': 'profile', 'requestId': requestId, 'profile': summary})
+        except ProfilerBusy as e:
+            await self._sendError(requestId, str(e))
+        except Exception as e:
+            self.log.error(f"[CoreIPC] Profile error: {e}", exc_info=True)
+            await self._sendError(requestId, str(e))
+
     async def _handleExport(self, request: Dict[str, Any]):
         """Handle ExportRequest"""
         try:
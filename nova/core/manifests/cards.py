@@ -14,6 +14,7 @@ Architecture (nova architecture.md):
 
 Phase 8 Contract:
 - Manifests discovered from *.manifest.py files in sorted filename order
+  (compiled cache invalidated by file mtime/size or a change to this module, see fileCache.py)
 - Each file exports MANIFEST (a CardManifest)
 - Collision on entityType = fail fast at startup
 - Default manifest used when no match
@@ -28,10 +29,10 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 from enum import Enum
 from pathlib import Path
-import importlib
-import importlib.util
 import logging
 
+from .fileCache import loadManifestFiles, MISSING
+
 logger = logging.getLogger(__name__)
 
 
@@ -117,33 +118,18 @@ class CardRegistry:
         if manifestDir is None:
             manifestDir = Path(__file__).parent
         
-        # Get manifest files in sorted order (determinism)
-        manifestFiles = sorted(manifestDir.glob("*.manifest.py"))
-        
-        for manifestPath in manifestFiles:
-            moduleName = manifestPath.stem  # e.g., "gnssReceiver.manifest"
+        # Manifest files in sorted order (determinism); unchanged files come from the compiled cache
+        for manifestPath, manifest in loadManifestFiles(manifestDir, "*.manifest.py", "MANIFEST", "cards.cache.pickle",
+                                                        schemaSources=(__file__,)):
+            if manifest is MISSING:
+                logger.warning(f"[CardRegistry] {manifestPath.name} missing MANIFEST export, skipping")
+                continue
+            
+            if not isinstance(manifest, CardManifest):
+                logger.warning(f"[CardRegistry] {manifestPath.name} MANIFEST is not CardManifest, skipping")
+                continue
             
-            try:
-                # Import the manifest module
-                spec = importlib.util.spec_from_file_location(moduleName, manifestPath)
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                
-                # Get MANIFEST export
-                if not hasattr(module, 'MANIFEST'):
-                    logger.warning(f"[CardRegistry] {manifestPath.name} missing MANIFEST export, skipping")
-                    continue
-                
-                manifest = module.MANIFEST
-                if not isinstance(manifest, CardManifest):
-                    logger.warning(f"[CardRegistry] {manifestPath.name} MANIFEST is not CardManifest, skipping")
-                    continue
-                
-                self._registerManifest(manifest, manifestPath.name)
-                
-            except Exception as e:
-                logger.error(f"[CardRegistry] Failed to load {manifestPath.name}: {e}")
-                raise
+            self._registerManifest(manifest, manifestPath.name)
         
         logger.info(f"[CardRegistry] Discovered {len(self._manifests)} card manifests")
         return len(self._manifests)
@@ -0,0 +1,118 @@
+"""
+Compiled cache for file-discovered manifests.
+
+CardRegistry (*.manifest.py) and RunManifestRegistry (*.runManifest.py) execute
+every manifest file on discovery. loadManifestFiles keeps the exported objects
+in a pickle next to the bytecode cache (<manifestDir>/__pycache__/<cacheName>)
+keyed by file name and invalidated by each file's mtime and size, so unchanged
+manifests are loaded without executing their modules. The whole cache is also
+keyed by a hash of the schema sources (the modules defining the exported
+classes), so changing CardManifest or RunManifest discards pickled objects.
+
+Only the manifest file itself is tracked: a change in a module it imports does
+not invalidate its entry (touch the manifest file, or delete the cache).
+"""
+
+import hashlib
+import importlib.util
+import logging
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Any, Iterable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+MISSING = object()   # File has no export of the requested name
+
+
+def _execExport(manifestPath: Path, exportName: str) -> Any:
+    """Execute a manifest file and return its export (MISSING if absent)"""
+    spec = importlib.util.spec_from_file_location(manifestPath.stem, manifestPath)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, exportName, MISSING)
+
+
+def _schemaHash(schemaSources: Iterable[str]) -> str:
+    """Hash of the source files defining the cached export classes"""
+    digest = hashlib.sha256()
+    for sourcePath in schemaSources:
+        digest.update(Path(sourcePath).read_bytes())
+    return digest.hexdigest()
+
+
+def _readCache(cachePath: Path, schema: str) -> dict:
+    try:
+        with open(cachePath, 'rb') as f:
+            cache = pickle.load(f)
+        if (cache.get('version') == CACHE_VERSION and cache.get('python') == tuple(sys.version_info[:2])
+                and cache.get('schema') == schema):
+            return cache['entries']
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"[ManifestCache] Ignoring unreadable cache {cachePath}: {e}")
+    return {}
+
+
+def _writeCache(cachePath: Path, schema: str, entries: dict) -> None:
+    tmpPath = cachePath.with_name(f"{cachePath.name}.{os.getpid()}.tmp")
+    try:
+        cachePath.parent.mkdir(exist_ok=True)
+        with open(tmpPath, 'wb') as f:
+            pickle.dump({'version': CACHE_VERSION, 'python': tuple(sys.version_info[:2]), 'schema': schema,
+                         'entries': entries}, f)
+        os.replace(tmpPath, cachePath)
+    except Exception as e:       # Read-only install or unpicklable export: discovery still works uncached
+        logger.debug(f"[ManifestCache] Not caching {cachePath}: {e}")
+        tmpPath.unlink(missing_ok=True)
+
+
+def loadManifestFiles(manifestDir: Path, pattern: str, exportName: str, cacheName: str,
+                      schemaSources: Iterable[str] = ()) -> List[Tuple[Path, Any]]:
+    """
+    Exports of manifest files matching pattern, in sorted filename order.
+
+    Args:
+        manifestDir: Directory to scan
+        pattern: Glob pattern (e.g. "*.manifest.py")
+        exportName: Module attribute to load (e.g. "MANIFEST")
+        cacheName: Cache file name under manifestDir/__pycache__
+        schemaSources: Source files defining the export's classes (cache discarded when they change)
+
+    Returns:
+        [(manifestPath, export or MISSING), ...]
+
+    Raises:
+        Whatever executing a changed manifest file raises
+    """
+    cachePath = manifestDir / '__pycache__' / cacheName
+    schema = _schemaHash(schemaSources)
+    cached = _readCache(cachePath, schema)
+    entries = {}
+    results = []
+    executed = 0
+
+    for manifestPath in sorted(manifestDir.glob(pattern)):
+        stat = manifestPath.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        entry = cached.get(manifestPath.name)
+        if entry is not None and entry[0] == key:
+            export = MISSING if entry[1] is None else entry[1]
+        else:
+            try:
+                export = _execExport(manifestPath, exportName)
+            except Exception as e:
+                logger.error(f"[ManifestCache] Failed to load {manifestPath.name}: {e}")
+                raise
+            executed += 1
+        entries[manifestPath.name] = (key, None if export is MISSING else export)
+        results.append((manifestPath, export))
+
+    if executed or entries.keys() != cached.keys():
+        _writeCache(cachePath, schema, entries)
+    logger.debug(f"[ManifestCache] {pattern}: {len(results) - executed} cached, {executed} executed")
+    return results
@@ -4,12 +4,17 @@ Manifest Registry - Loads, registers, and publishes manifests.
 ManifestRegistry is the single source of truth for all manifest definitions.
 Manifests are published to the Metadata lane as ManifestPublished events,
 creating a time-versioned record of UI schema definitions.
+
+Publication is content-addressed: each payload carries a contentHash, and a
+manifest whose latest published payload has the same hash is not re-emitted,
+so restarts with unchanged manifests add no ManifestPublished events.
 """
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Dict, Optional, List, TYPE_CHECKING
+from typing import Any, Dict, Optional, List, TYPE_CHECKING
 from datetime import datetime
+import hashlib
 import logging
 
 from .base import Manifest, GenericManifest
@@ -26,7 +31,8 @@ class ManifestRecord:
     manifestId: str
     versions: Dict[int, Manifest] = field(default_factory=dict)
     currentVersion: int = 0
-    publishedAt: Optional[datetime] = None
+    publishedAt: Optional[datetime] = None   # Set when this process emitted ManifestPublished
+    contentHash: Optional[str] = None        # Hash of the current version's published payload
     
     def getVersion(self, version: Optional[int] = None) -> Optional[Manifest]:
         """Get manifest by version, or current if not specified."""
@@ -56,6 +62,7 @@ class ManifestRegistry:
         self._byViewId: Dict[str, str] = {}  # viewId -> manifestId
         self._database = database
         self._scopeId = scopeId
+        self._publishedHashes: Optional[Dict[str, str]] = None  # manifestId -> latest contentHash in database
         
     def register(self, manifest: Manifest, publish: bool = True) -> Manifest:
         """
@@ -63,7 +70,8 @@ class ManifestRegistry:
         
         Args:
             manifest: The manifest to register
-            publish: Whether to emit ManifestPublished event
+            publish: Whether to emit ManifestPublished event (skipped when the
+                     database already holds an identical latest payload)
             
         Returns:
             The registered manifest
@@ -79,8 +87,9 @@ class ManifestRegistry:
         # Track viewId -> manifestId mapping
         self._byViewId[manifest.viewId] = manifestId
         
-        if publish and self._database:
-            self._publishManifest(manifest)
+        payload = self._publishPayload(manifest)
+        record.contentHash = payload['contentHash']
+        if publish and self._database and self._publishManifest(manifest, payload):
             from datetime import timezone
             record.publishedAt = datetime.now(timezone.utc)
         
@@ -122,10 +131,40 @@ class ManifestRegistry:
         """Get all registered manifest IDs."""
         return list(self._records.keys())
     
-    def _publishManifest(self, manifest: Manifest) -> None:
-        """Emit ManifestPublished event to Metadata lane."""
+    @staticmethod
+    def _publishPayload(manifest: Manifest) -> Dict[str, Any]:
+        """ManifestPublished payload, including its contentHash."""
+        from nova.core.canonical_json import canonicalJsonBytes
+        
+        payload = {
+            "manifestId": manifest.manifestId,
+            "manifestVersion": manifest.manifestVersion,
+            "viewId": manifest.viewId,
+            "allowedKeys": list(manifest.getAllowedKeys().keys()),  # Just key names
+            "fields": [f.toDict() for f in manifest.fields],
+            "displayName": manifest.displayName,
+            "description": manifest.description,
+            "categories": manifest.categories
+        }
+        payload["contentHash"] = hashlib.sha256(canonicalJsonBytes(payload)).hexdigest()[:32]
+        return payload
+    
+    def _publishManifest(self, manifest: Manifest, payload: Dict[str, Any]) -> bool:
+        """
+        Emit ManifestPublished event to Metadata lane.
+        
+        Returns:
+            False if the latest published payload has the same contentHash (nothing emitted)
+        """
         if not self._database:
-            return
+            return False
+        
+        if self._publishedHashes is None:
+            published = self._database.latestMetadataPayloads("ManifestPublished", self._scopeId)
+            self._publishedHashes = {mid: p.get("contentHash") for mid, p in published.items()}
+        if self._publishedHashes.get(manifest.manifestId) == payload["contentHash"]:
+            logger.debug(f"ManifestPublished unchanged: {manifest.manifestId} v{manifest.manifestVersion}")
+            return False
         
         from nova.core.events import MetadataEvent
         from datetime import timezone
@@ -140,21 +179,14 @@ class ManifestRegistry:
             messageType="ManifestPublished",
             effectiveTime=now,
             manifestId=manifest.manifestId,
-            payload={
-                "manifestId": manifest.manifestId,
-                "manifestVersion": manifest.manifestVersion,
-                "viewId": manifest.viewId,
-                "allowedKeys": list(manifest.getAllowedKeys().keys()),  # Just key names
-                "fields": [f.toDict() for f in manifest.fields],
-                "displayName": manifest.displayName,
-                "description": manifest.description,
-                "categories": manifest.categories
-            }
+            payload=payload
         )
         
         # Insert with current time as canonicalTruthTime
         self._database.insertEvent(event, now)
+        self._publishedHashes[manifest.manifestId] = payload["contentHash"]
         logger.debug(f"Published ManifestPublished: {manifest.manifestId} v{manifest.manifestVersion}")
+        return True
     
     def loadBuiltinManifests(self) -> int:
         """
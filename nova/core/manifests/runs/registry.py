@@ -18,9 +18,10 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Callable
 from enum import Enum
 from pathlib import Path
-import importlib.util
 import logging
 
+from ..fileCache import loadManifestFiles, MISSING
+
 logger = logging.getLogger(__name__)
 
 
@@ -116,33 +117,18 @@ class RunManifestRegistry:
         if manifestDir is None:
             manifestDir = Path(__file__).parent
         
-        # Get manifest files in sorted order (determinism)
-        manifestFiles = sorted(manifestDir.glob("*.runManifest.py"))
-        
-        for manifestPath in manifestFiles:
-            moduleName = manifestPath.stem  # e.g., "generic.runManifest"
+        # Manifest files in sorted order (determinism); unchanged files come from the compiled cache
+        for manifestPath, manifest in loadManifestFiles(manifestDir, "*.runManifest.py", "RUN_MANIFEST", "runs.cache.pickle",
+                                                        schemaSources=(__file__,)):
+            if manifest is MISSING:
+                logger.warning(f"[RunManifestRegistry] {manifestPath.name} missing RUN_MANIFEST export, skipping")
+                continue
+            
+            if not isinstance(manifest, RunManifest):
+                logger.warning(f"[RunManifestRegistry] {manifestPath.name} RUN_MANIFEST is not RunManifest, skipping")
+                continue
             
-            try:
-                # Import the manifest module
-                spec = importlib.util.spec_from_file_location(moduleName, manifestPath)
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                
-                # Get RUN_MANIFEST export
-                if not hasattr(module, 'RUN_MANIFEST'):
-                    logger.warning(f"[RunManifestRegistry] {manifestPath.name} missing RUN_MANIFEST export, skipping")
-                    continue
-                
-                manifest = module.RUN_MANIFEST
-                if not isinstance(manifest, RunManifest):
-                    logger.warning(f"[RunManifestRegistry] {manifestPath.name} RUN_MANIFEST is not RunManifest, skipping")
-                    continue
-                
-                self._registerManifest(manifest, manifestPath.name)
-                
-            except Exception as e:
-                logger.error(f"[RunManifestRegistry] Failed to load {manifestPath.name}: {e}")
-                raise
+            self._registerManifest(manifest, manifestPath.name)
         
         logger.info(f"[RunManifestRegistry] Discovered {len(self._manifests)} run manifests")
         return len(self._manifests)
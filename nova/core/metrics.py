@@ -0,0 +1,276 @@
+"""
+NOVA Metrics Registry
+
+Lightweight in-process counters, gauges and histograms for finding bottlenecks
+under real load (ingest rate, commit/query latency, queue depths, stream lag,
+dropped chunks).
+
+- One default registry per process (getRegistry()); Core and Server each have their own
+- Metrics are created once (module/instance init) and updated on hot paths with a
+  lock-protected add; queue depths are callback gauges sampled only at collection time
+- snapshot() returns plain dicts so Core metrics can cross the IPC queue
+- renderPrometheus() produces Prometheus text exposition format (0.0.4); the Server
+  serves Core + Server snapshots on its /metrics route
+
+Names follow Prometheus conventions: nova_<area>_<what>_<unit>, counters end in _total.
+
+Property of Uncompromising Sensors LLC.
+"""
+
+import bisect
+import math
+import threading
+import time
+from typing import Dict, Any, List, Optional, Tuple, Callable, Iterable
+
+
+# Default latency buckets (seconds): 100 µs .. 10 s
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Metric:
+    """Common name/help/label handling. Samples are keyed by label value tuples."""
+    kind = ''
+
+    def __init__(self, name: str, help: str, labelNames: Tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labelNames = tuple(labelNames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[str, ...]:
+        try:
+            if len(labels) == len(self.labelNames):
+                return tuple(str(labels[name]) for name in self.labelNames)
+        except KeyError:
+            pass
+        raise ValueError(f"{self.name} expects labels {self.labelNames}, got {tuple(labels)}")
+
+
+class Counter(_Metric):
+    """Monotonic count (events ingested, chunks dropped, ...)"""
+    kind = 'counter'
+
+    def __init__(self, name: str, help: str, labelNames: Tuple[str, ...] = ()):
+        super().__init__(name, help, labelNames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> List[Tuple[Tuple[str, ...], float]]:
+        with self._lock:
+            return list(self._values.items())
+
+
+class Gauge(_Metric):
+    """
+    Point-in-time value. Either set/inc/dec explicitly, or give a callback
+    (setFunction) that is sampled at collection time, e.g. a queue's qsize.
+    """
+    kind = 'gauge'
+
+    def __init__(self, name: str, help: str, labelNames: Tuple[str, ...] = ()):
+        super().__init__(name, help, labelNames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._functions: Dict[Tuple[str, ...], Callable[[], float]] = {}
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    def setFunction(self, function: Callable[[], float], **labels):
+        """Sample function() at collection time (replaces any earlier value for these labels)"""
+        key = self._key(labels)
+        with self._lock:
+            self._values.pop(key, None)
+            self._functions[key] = function
+
+    def remove(self, **labels):
+        """Drop a labelled series (e.g. a closed stream)"""
+        key = self._key(labels)
+        with self._lock:
+            self._values.pop(key, None)
+            self._functions.pop(key, None)
+
+    def value(self, **labels) -> float:
+        key = self._key(labels)
+        function = self._functions.get(key)
+        return _sample(function) if function else self._values.get(key, 0)
+
+    def samples(self) -> List[Tuple[Tuple[str, ...], float]]:
+        with self._lock:
+            values = list(self._values.items())
+            functions = list(self._functions.items())
+        return values + [(key, _sample(function)) for key, function in functions]
+
+
+def _sample(function: Callable[[], float]) -> float:
+    """Callback gauge value; NaN if the source is gone or unsupported (e.g. Queue.qsize on macOS)"""
+    try:
+        return float(function())
+    except Exception:
+        return math.nan
+
+
+class Histogram(_Metric):
+    """Distribution of observations (latencies, sizes) in fixed cumulative buckets"""
+    kind = 'histogram'
+
+    def __init__(self, name: str, help: str, labelNames: Tuple[str, ...] = (), buckets: Iterable[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labelNames)
+        self.buckets = tuple(sorted(buckets))
+        # key -> [per-bucket counts (+Inf last), sum, count]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def time(self, **labels) -> '_Timer':
+        """Context manager observing elapsed seconds"""
+        return _Timer(self, labels)
+
+    def samples(self) -> List[Tuple[Tuple[str, ...], Dict[str, Any]]]:
+        with self._lock:
+            return [(key, {'counts': list(counts), 'sum': total, 'count': count})
+                    for key, (counts, total, count) in self._series.items()]
+
+
+class _Timer:
+    __slots__ = ('histogram', 'labels', 'start')
+
+    def __init__(self, histogram: Histogram, labels: Dict[str, Any]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+        return False
+
+
+class MetricsRegistry:
+    """Named metrics of one process. counter()/gauge()/histogram() are get-or-create."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _getOrCreate(self, cls, name: str, help: str, labelNames: Tuple[str, ...], **kwargs) -> _Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help, tuple(labelNames), **kwargs)
+            elif not isinstance(metric, cls) or metric.labelNames != tuple(labelNames):
+                raise ValueError(f"Metric {name} already registered as {metric.kind} {metric.labelNames}")
+            return metric
+
+    def counter(self, name: str, help: str, labelNames: Tuple[str, ...] = ()) -> Counter:
+        return self._getOrCreate(Counter, name, help, labelNames)
+
+    def gauge(self, name: str, help: str, labelNames: Tuple[str, ...] = ()) -> Gauge:
+        return self._getOrCreate(Gauge, name, help, labelNames)
+
+    def histogram(self, name: str, help: str, labelNames: Tuple[str, ...] = (),
+                  buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._getOrCreate(Histogram, name, help, labelNames, buckets=buckets)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Plain-data view of every metric (picklable, safe to ship over IPC)"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        result = []
+        for metric in metrics:
+            entry = {'name': metric.name, 'help': metric.help, 'kind': metric.kind,
+                     'labelNames': list(metric.labelNames), 'samples': [[list(key), value] for key, value in metric.samples()]}
+            if isinstance(metric, Histogram):
+                entry['buckets'] = list(metric.buckets)
+            result.append(entry)
+        return result
+
+
+_defaultRegistry = MetricsRegistry()
+
+
+def getRegistry() -> MetricsRegistry:
+    """This process's registry"""
+    return _defaultRegistry
+
+
+def _formatValue(value: float) -> str:
+    if math.isnan(value):
+        return 'NaN'
+    if math.isinf(value):
+        return '+Inf' if value > 0 else '-Inf'
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labelText(names: List[str], values: List[str], extra: Dict[str, str]) -> str:
+    pairs = list(extra.items()) + list(zip(names, values))
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(str(value))}"' for name, value in pairs) + '}'
+
+
+def renderPrometheus(snapshots: List[Tuple[Dict[str, str], List[Dict[str, Any]]]]) -> str:
+    """
+    Render snapshots as Prometheus text format.
+
+    Args:
+        snapshots: (constant labels, registry snapshot) pairs, e.g. ({'process': 'core'}, coreSnapshot)
+    """
+    byName: Dict[str, Dict[str, Any]] = {}
+    lines: Dict[str, List[str]] = {}
+    for extra, snapshot in snapshots:
+        for metric in snapshot:
+            name = metric['name']
+            if name not in byName:
+                byName[name] = metric
+                lines[name] = [f"# HELP {name} {metric['help']}", f"# TYPE {name} {metric['kind']}"]
+            out = lines[name]
+            for labelValues, value in metric['samples']:
+                if metric['kind'] != 'histogram':
+                    out.append(f"{name}{_labelText(metric['labelNames'], labelValues, extra)} {_formatValue(value)}")
+                    continue
+                cumulative = 0
+                bucketBounds = list(metric['buckets']) + [math.inf]
+                for bound, count in zip(bucketBounds, value['counts']):
+                    cumulative += count
+                    labels = _labelText(metric['labelNames'] + ['le'], labelValues + [_formatValue(bound)], extra)
+                    out.append(f"{name}_bucket{labels} {cumulative}")
+                labels = _labelText(metric['labelNames'], labelValues, extra)
+                out.append(f"{name}_sum{labels} {_formatValue(value['sum'])}")
+                out.append(f"{name}_count{labels} {value['count']}")
+    return '\n'.join(line for name in byName for line in lines[name]) + '\n'
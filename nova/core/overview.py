@@ -0,0 +1,375 @@
+"""
+NOVA Overview Pyramid
+
+Multi-resolution summaries of the truth database for timeline scrubbing.
+Zoomed-out views over hours or days read a bounded number of precomputed
+buckets instead of every event, so their cost and response size depend on the
+window and tier, not on how many events are stored.
+
+Per tier (default 1 s, 1 min, 1 h), entity (scopeId, lane, systemId,
+containerId, uniqueId) and messageType, each bucket holds:
+- count: events in the bucket
+- min / max / last of top-level numeric fields: Parsed payload, UI data (the
+  viewId stands in for the messageType, which is always UiUpdate) and the
+  frame length ('bytes') for Raw. The first maxFields numeric fields seen per
+  messageType are tracked
+
+Only the high-volume lanes (Raw, Parsed, UI) are summarized; UiCheckpoints are
+derived snapshots and are skipped. Buckets are keyed by canonicalTruthTime (epoch
+seconds) and stored in the main database file (overviewBuckets, one row per bucket
+and field; field '' holds the count).
+
+- Incremental: Ingest calls observe() for each inserted event; partial aggregates
+  are buffered and merged (SQL upsert) every flushEvents events, every flushSeconds,
+  and before each query
+- Rebuild: rebuild() recomputes a window from stored truth (backfill of an existing
+  database, after retention thinning or replication imports, which bypass Ingest)
+
+Config "overview": {"enabled": true, "tiers": [1, 60, 3600], "maxFields": 16,
+                    "maxBuckets": 1000, "flushEvents": 2000, "flushSeconds": 1.0}
+
+Rebuild CLI:
+    python -m nova.core.overview --db nova/data/nova.db [--start ISO8601] [--stop ISO8601]
+"""
+
+import argparse
+import math
+import threading
+import time
+from datetime import datetime, timezone, timedelta
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from sdk.logging import getLogger
+
+from .events import Lane, Timebase
+from .metrics import getRegistry
+
+if TYPE_CHECKING:
+    from nova.core.database import Database
+
+
+OVERVIEW_TIERS = (1, 60, 3600)
+
+# Lanes summarized by the pyramid (Command/Metadata are sparse and queried directly)
+OVERVIEW_LANES = (Lane.RAW, Lane.PARSED, Lane.UI)
+
+_metrics = getRegistry()
+OVERVIEW_FLUSH_SECONDS = _metrics.histogram('nova_overview_flush_seconds', 'OverviewPyramid buffer merge latency')
+OVERVIEW_QUERY_SECONDS = _metrics.histogram('nova_overview_query_seconds', 'OverviewPyramid.query latency')
+
+
+class OverviewError(Exception):
+    """Invalid overview request or configuration"""
+    pass
+
+
+def _epochSeconds(isoTime: str) -> float:
+    """ISO8601 (Z or offset; naive treated as UTC) -> epoch seconds"""
+    parsed = datetime.fromisoformat(isoTime.replace('Z', '+00:00'))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class OverviewPyramid:
+    """
+    Per-tier bucket aggregates maintained at ingest and read for zoomed-out views.
+
+    observe() runs on the ingest path; query() and rebuild() are synchronous
+    (sqlite work) and run in a thread. The buffer is guarded by one lock.
+    """
+
+    def __init__(self, database: 'Database', tiers=OVERVIEW_TIERS, maxFields: int = 16, maxBuckets: int = 1000,
+                 flushEvents: int = 2000, flushSeconds: float = 1.0):
+        """
+        Args:
+            database: Truth database (buckets live in its main file)
+            tiers: Bucket widths in seconds, each a multiple of the previous
+            maxFields: Numeric fields tracked per (lane, messageType)
+            maxBuckets: Default bucket budget per series for query()
+            flushEvents: Observed events buffered before a merge
+            flushSeconds: Maximum age of buffered aggregates before a merge
+        """
+        tiers = tuple(sorted(int(tier) for tier in tiers))
+        if not tiers or tiers[0] < 1 or any(b % a for a, b in zip(tiers, tiers[1:])):
+            raise OverviewError(f"Overview tiers must be positive multiples of each other, got {list(tiers)}")
+        self.database = database
+        self.tiers = tiers
+        self.maxFields = maxFields
+        self.maxBuckets = maxBuckets
+        self.flushEvents = flushEvents
+        self.flushSeconds = flushSeconds
+        self.log = getLogger()
+        self._lock = threading.Lock()
+        self._buffer: Dict[tuple, list] = {}  # (tier, bucketStart, series..., field) -> [count, min, max, last, lastTime]
+        self._fields: Dict[Tuple[str, str], Dict[str, None]] = {}  # (lane, messageType) -> tracked fields (ordered)
+        self._pending = 0
+        self._lastFlush = time.monotonic()
+
+    @classmethod
+    def fromConfig(cls, database: 'Database', config: Dict[str, Any]) -> Optional['OverviewPyramid']:
+        """Pyramid from config "overview" (None when disabled)"""
+        if not config.get('enabled', True):
+            return None
+        return cls(database,
+                   tiers=config.get('tiers', OVERVIEW_TIERS),
+                   maxFields=config.get('maxFields', 16),
+                   maxBuckets=config.get('maxBuckets', 1000),
+                   flushEvents=config.get('flushEvents', 2000),
+                   flushSeconds=config.get('flushSeconds', 1.0))
+
+    # ------------------------------------------------------------------
+    # Aggregation
+    # ------------------------------------------------------------------
+
+    def _numericFields(self, lane: str, messageType: str, values: Any) -> List[Tuple[str, float]]:
+        """(field, value) for tracked finite numeric top-level fields"""
+        if not isinstance(values, dict):
+            return []
+        tracked = self._fields.setdefault((lane, messageType), {})
+        result = []
+        for name, value in values.items():
+            if type(value) not in (int, float) or not math.isfinite(value):
+                continue  # bool, str, nested, NaN/inf
+            if name not in tracked:
+                if len(tracked) >= self.maxFields:
+                    continue
+                tracked[name] = None
+            result.append((name, float(value)))
+        return result
+
+    def _accumulate(self, series: tuple, seconds: float, canonicalTruthTime: str, fields: List[Tuple[str, float]]):
+        """Add one event to the buffered buckets of every tier. Caller holds _lock."""
+        buffer = self._buffer
+        for tier in self.tiers:
+            bucketStart = int(seconds // tier) * tier
+            for field, value in [('', None)] + fields:
+                key = (tier, bucketStart) + series + (field,)
+                entry = buffer.get(key)
+                if entry is None:
+                    buffer[key] = [1, value, value, value, canonicalTruthTime]
+                    continue
+                entry[0] += 1
+                if value is not None:
+                    entry[1] = min(entry[1], value)
+                    entry[2] = max(entry[2], value)
+                    if canonicalTruthTime >= entry[4]:
+                        entry[3] = value
+                if canonicalTruthTime > entry[4]:
+                    entry[4] = canonicalTruthTime
+
+    @staticmethod
+    def _describe(lane: Lane, event: Any) -> Optional[Tuple[str, Any]]:
+        """(messageType, numeric source) for an event, None when not summarized"""
+        if lane == Lane.RAW:
+            return '', {'bytes': len(event.bytesData)}
+        if lane == Lane.PARSED:
+            return event.messageType, event.payload
+        if event.messageType != 'UiUpdate':
+            return None
+        return event.viewId, event.data
+
+    def observe(self, event: Any, canonicalTruthTime: str):
+        """Buffer an inserted event (merged on the next flush)"""
+        lane = event.lane
+        if lane not in OVERVIEW_LANES:
+            return
+        described = self._describe(lane, event)
+        if described is None:
+            return
+        messageType, values = described
+        seconds = _epochSeconds(canonicalTruthTime)
+        series = (event.scopeId, lane.value, event.systemId, event.containerId, event.uniqueId, messageType)
+        with self._lock:
+            self._accumulate(series, seconds, canonicalTruthTime, self._numericFields(lane.value, messageType, values))
+            self._pending += 1
+            due = self._pending >= self.flushEvents or time.monotonic() - self._lastFlush >= self.flushSeconds
+        if due:
+            self.flush()
+
+    def flush(self) -> int:
+        """Merge buffered aggregates into the database; returns rows merged"""
+        with self._lock:
+            buffer, self._buffer = self._buffer, {}
+            self._pending = 0
+            self._lastFlush = time.monotonic()
+        if not buffer:
+            return 0
+        start = time.perf_counter()
+        self.database.mergeOverviewBuckets([key + tuple(entry) for key, entry in buffer.items()])
+        OVERVIEW_FLUSH_SECONDS.observe(time.perf_counter() - start)
+        return len(buffer)
+
+    # ------------------------------------------------------------------
+    # Rebuild
+    # ------------------------------------------------------------------
+
+    def rebuild(self, startTime: Optional[str] = None, stopTime: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Recompute buckets from stored truth.
+
+        The window (canonicalTruthTime, default: everything stored) is widened to
+        whole coarsest-tier buckets and processed one such bucket at a time, so
+        memory stays bounded on long recordings. Rebuild closed windows: events
+        ingested into the window while it runs would be counted twice.
+
+        Returns:
+            Dict with startTime, stopTime (aligned window), events and rows
+        """
+        if startTime is None:
+            earliest = [self.database.earliestCanonicalTime(lane) for lane in OVERVIEW_LANES]
+            earliest = [value for value in earliest if value]
+            if not earliest:
+                return {'startTime': None, 'stopTime': None, 'events': 0, 'rows': 0}
+            startTime = min(earliest)
+        stopSeconds = _epochSeconds(stopTime) if stopTime else time.time()
+        coarsest = self.tiers[-1]
+        windowStart = int(_epochSeconds(startTime) // coarsest) * coarsest
+        windowStop = (int(stopSeconds // coarsest) + 1) * coarsest
+
+        self.flush()
+        self.database.deleteOverviewBuckets(windowStart, windowStop)
+        events = rows = 0
+        for chunkStart in range(windowStart, windowStop, coarsest):
+            chunkStop = chunkStart + coarsest
+            rowsInChunk = self.database.queryEvents(
+                self._isoTime(chunkStart), self._isoTime(chunkStop), Timebase.CANONICAL,
+                lanes=list(OVERVIEW_LANES), ingestOrder=True
+            )
+            with self._lock:
+                for row in rowsInChunk:
+                    seconds = _epochSeconds(row['canonicalTruthTime'])
+                    if seconds >= chunkStop:
+                        continue  # queryEvents stopTime is inclusive; belongs to the next chunk
+                    lane = Lane(row['lane'])
+                    described = self._describeRow(lane, row)
+                    if described is None:
+                        continue
+                    messageType, values = described
+                    series = (row['scopeId'], lane.value, row['systemId'], row['containerId'], row['uniqueId'], messageType)
+                    self._accumulate(series, seconds, row['canonicalTruthTime'],
+                                     self._numericFields(lane.value, messageType, values))
+                    events += 1
+            rows += self.flush()
+        self.log.info(f"[Overview] Rebuilt {self._isoTime(windowStart)} -> {self._isoTime(windowStop)}: "
+                      f"{events} events, {rows} bucket rows")
+        return {'startTime': self._isoTime(windowStart), 'stopTime': self._isoTime(windowStop),
+                'events': events, 'rows': rows}
+
+    @staticmethod
+    def _describeRow(lane: Lane, row: Dict[str, Any]) -> Optional[Tuple[str, Any]]:
+        """_describe for a queryEvents row"""
+        if lane == Lane.RAW:
+            return '', {'bytes': len(row['bytes'])}
+        if lane == Lane.PARSED:
+            return row['messageType'], row['payload']
+        if row['messageType'] != 'UiUpdate':
+            return None
+        return row['viewId'], row['data']
+
+    @staticmethod
+    def _isoTime(seconds: float) -> str:
+        return (datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=seconds)).isoformat()
+
+    # ------------------------------------------------------------------
+    # Query
+    # ------------------------------------------------------------------
+
+    def selectTier(self, startSeconds: float, stopSeconds: float, maxBuckets: int) -> int:
+        """Finest tier with at most maxBuckets buckets across the window (else the coarsest)"""
+        span = max(stopSeconds - startSeconds, 0)
+        for tier in self.tiers:
+            if span / tier <= maxBuckets:
+                return tier
+        return self.tiers[-1]
+
+    def query(self, startTime: int, stopTime: int, timebase: str = 'canonical',
+              filters: Optional[Dict[str, Any]] = None, maxBuckets: Optional[int] = None,
+              tier: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Overview of a window.
+
+        Args:
+            startTime: Window start (microseconds since epoch)
+            stopTime: Window stop (microseconds since epoch, inclusive)
+            timebase: Must be 'canonical' (buckets are keyed by canonicalTruthTime)
+            filters: scopeIds, lanes, systemId, containerId, uniqueId, messageType
+            maxBuckets: Bucket budget per series (default: configured maxBuckets)
+            tier: Explicit tier in seconds (default: chosen from the window and budget)
+
+        Returns:
+            Dict with tier, timebase and series: one entry per entity and messageType with
+            buckets [[bucketStartUs, count], ...] and fields {name: [[bucketStartUs, min, max, last], ...]}
+
+        Raises:
+            OverviewError: On an invalid window, timebase or tier
+        """
+        if timebase != Timebase.CANONICAL.value:
+            raise OverviewError("Overview buckets are keyed by canonicalTruthTime; timebase must be 'canonical'")
+        if stopTime < startTime:
+            raise OverviewError("stopTime must not be before startTime")
+        if tier is not None and tier not in self.tiers:
+            raise OverviewError(f"Unknown overview tier {tier}, expected one of {list(self.tiers)}")
+
+        queryStart = time.perf_counter()
+        self.flush()
+        startSeconds, stopSeconds = startTime / 1_000_000, stopTime / 1_000_000
+        tier = tier or self.selectTier(startSeconds, stopSeconds, maxBuckets or self.maxBuckets)
+        filters = filters or {}
+        lanes = filters.get('lanes')
+        rows = self.database.queryOverviewBuckets(
+            tier, int(startSeconds // tier) * tier, int(stopSeconds),
+            scopeIds=filters.get('scopeIds'),
+            lanes=[lane.value if isinstance(lane, Lane) else lane for lane in lanes] if lanes else None,
+            systemId=filters.get('systemId'),
+            containerId=filters.get('containerId'),
+            uniqueId=filters.get('uniqueId'),
+            messageType=filters.get('messageType')
+        )
+
+        series: List[Dict[str, Any]] = []
+        current = None
+        currentKey = None
+        for row in rows:
+            key = (row['scopeId'], row['lane'], row['systemId'], row['containerId'], row['uniqueId'], row['messageType'])
+            if key != currentKey:
+                currentKey = key
+                current = {'scopeId': key[0], 'lane': key[1], 'systemId': key[2], 'containerId': key[3],
+                           'uniqueId': key[4], 'messageType': key[5], 'buckets': [], 'fields': {}}
+                series.append(current)
+            bucketStartUs = row['bucketStart'] * 1_000_000
+            if row['field'] == '':
+                current['buckets'].append([bucketStartUs, row['count']])
+            else:
+                current['fields'].setdefault(row['field'], []).append(
+                    [bucketStartUs, row['minValue'], row['maxValue'], row['lastValue']])
+
+        OVERVIEW_QUERY_SECONDS.observe(time.perf_counter() - queryStart)
+        return {'tier': tier, 'timebase': timebase, 'series': series}
+
+
+# ============================================================================
+# Rebuild CLI
+# ============================================================================
+
+def main():
+    from nova.core.database import Database
+
+    parser = argparse.ArgumentParser(description='Rebuild overview pyramid buckets from stored truth')
+    parser.add_argument('--db', required=True, help='Main database file')
+    parser.add_argument('--start', help='canonicalTruthTime window start (default: earliest stored event)')
+    parser.add_argument('--stop', help='canonicalTruthTime window stop (default: now)')
+    parser.add_argument('--tiers', default=','.join(str(tier) for tier in OVERVIEW_TIERS), help='Bucket widths in seconds')
+    args = parser.parse_args()
+
+    database = Database(args.db)
+    try:
+        pyramid = OverviewPyramid(database, tiers=[int(tier) for tier in args.tiers.split(',')])
+        result = pyramid.rebuild(args.start, args.stop)
+        print(f"Rebuilt {result['startTime']} -> {result['stopTime']}: {result['events']} events, {result['rows']} bucket rows")
+    finally:
+        database.close()
+
+
+if __name__ == '__main__':
+    main()
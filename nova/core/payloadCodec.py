@@ -0,0 +1,248 @@
+"""
+NOVA Payload Codec
+
+Optional dictionary compression of Parsed lane payloads and UI lane data.
+
+Consecutive payloads of one messageType (nav_sat, MeasEpoch, telemetry.gnss
+updates) share almost all of their keys and much of their values, which
+per-row compression cannot exploit. The codec trains one dictionary per
+(lane, messageType) - for the UI lane the manifestId stands in for the
+messageType, which is always UiUpdate - and compresses each row against it.
+
+- Codecs: 'zstd' (trained dictionaries, needs the zstandard package) and
+  'zlib' (stdlib preset dictionary built from recent payloads)
+- Dictionaries are stored in the main database file (payloadDictionaries) and
+  never deleted: rows reference them by dictId
+- Stored value: str for plain JSON (codec off, or no dictionary yet for the
+  messageType), bytes for HEADER (magic, codec id, dictId) + compressed JSON.
+  Plain and compressed rows mix freely; Database decodes both transparently
+- Until a messageType has a dictionary its rows are stored plain and sampled;
+  after trainSamples rows Database trains and persists the dictionary
+
+Migration of existing rows (both directions) and manual training:
+    python -m nova.core.payloadCodec --db nova/data/nova.db --codec zstd [--vacuum]
+    python -m nova.core.payloadCodec --db nova/data/nova.db --codec none   # back to plain JSON
+"""
+
+import argparse
+import struct
+import threading
+import zlib
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    import zstandard as _zstd
+except ImportError:  # zstandard is optional (zlib codec and plain rows work without it)
+    _zstd = None
+
+
+MAGIC = b'NPC'
+HEADER = struct.Struct('>3sBI')  # magic, codec id, dictId
+CODEC_IDS = {'zstd': 1, 'zlib': 2}
+CODEC_NAMES = {codecId: name for name, codecId in CODEC_IDS.items()}
+ZLIB_MAX_DICTIONARY = 32768  # zlib window size
+
+
+class PayloadCodecError(Exception):
+    """Unknown codec, missing dependency or undecodable stored payload"""
+    pass
+
+
+class PayloadCodec:
+    """
+    Per-(lane, messageType) dictionary compression of JSON payload text.
+
+    Thread-safe: zstd compressor/decompressor objects are per thread (never shared),
+    and the lock only guards the dictionary, active and sample maps.
+    """
+
+    def __init__(self, codec: Optional[str] = None, level: int = 3, dictionarySize: int = 16384,
+                 trainSamples: int = 500):
+        """
+        Args:
+            codec: 'zstd', 'zlib' or None (store plain JSON; stored compressed rows still decode)
+            level: Compression level
+            dictionarySize: Target dictionary bytes (zlib caps at 32 KiB)
+            trainSamples: Plain rows sampled per messageType before training its dictionary
+        """
+        if codec is not None and codec not in CODEC_IDS:
+            raise PayloadCodecError(f"Unknown payload codec '{codec}', expected one of {list(CODEC_IDS)} or None")
+        if codec == 'zstd' and _zstd is None:
+            raise PayloadCodecError("Payload codec 'zstd' requires the zstandard package")
+        self.codec = codec
+        self.level = level
+        self.dictionarySize = dictionarySize if codec != 'zlib' else min(dictionarySize, ZLIB_MAX_DICTIONARY)
+        self.trainSamples = trainSamples
+        self.loadDictionary: Optional[Callable[[int], Optional[Tuple[str, bytes]]]] = None  # dictId -> (codec, bytes)
+        self._lock = threading.Lock()
+        self._dictionaries: Dict[int, Tuple[str, bytes]] = {}
+        self._active: Dict[Tuple[str, str], int] = {}  # (lane, messageType) -> dictId for new rows
+        self._samples: Dict[Tuple[str, str], List[bytes]] = {}
+        self._local = threading.local()  # Per-thread compressors / decompressors by dictId
+
+    @property
+    def enabled(self) -> bool:
+        return self.codec is not None
+
+    def addDictionary(self, dictId: int, codec: str, lane: str, messageType: str, dictionary: bytes):
+        """Register a stored dictionary; the newest of the configured codec becomes active for new rows"""
+        with self._lock:
+            self._dictionaries[dictId] = (codec, dictionary)
+            key = (lane, messageType)
+            if codec == self.codec and dictId >= self._active.get(key, -1):
+                self._active[key] = dictId
+                self._samples.pop(key, None)
+
+    def hasDictionary(self, lane: str, messageType: str) -> bool:
+        return (lane, messageType) in self._active
+
+    # ------------------------------------------------------------------
+    # Encode / decode
+    # ------------------------------------------------------------------
+
+    def encode(self, lane: str, messageType: str, text: str) -> Union[str, bytes]:
+        """Stored value for a JSON text: compressed bytes, or the text itself"""
+        if self.codec is None:
+            return text
+        raw = text.encode('utf-8')
+        key = (lane, messageType)
+        dictId = self._active.get(key)
+        if dictId is None:
+            with self._lock:
+                samples = self._samples.setdefault(key, [])
+                if len(samples) < self.trainSamples:
+                    samples.append(raw)
+            return text
+        compressed = self._compress(dictId, raw)
+        if len(compressed) + HEADER.size >= len(raw):
+            return text
+        return HEADER.pack(MAGIC, CODEC_IDS[self.codec], dictId) + compressed
+
+    def decode(self, value: Union[str, bytes, None]) -> Optional[str]:
+        """JSON text of a stored value"""
+        if value is None or isinstance(value, str):
+            return value
+        try:
+            magic, codecId, dictId = HEADER.unpack_from(value)
+        except struct.error:
+            magic = None
+        if magic != MAGIC:
+            return bytes(value).decode('utf-8')  # JSON stored as a blob by other writers
+        stored = self._dictionaries.get(dictId)
+        if stored is None:
+            with self._lock:
+                stored = self._dictionaries.get(dictId)
+                if stored is None:
+                    stored = self.loadDictionary(dictId) if self.loadDictionary else None
+                    if stored is None:
+                        raise PayloadCodecError(f"Payload dictionary {dictId} not found")
+                    self._dictionaries[dictId] = stored
+        if CODEC_NAMES.get(codecId) != stored[0]:
+            raise PayloadCodecError(f"Payload codec id {codecId} does not match dictionary {dictId}")
+        return self._decompress(dictId, stored, memoryview(value)[HEADER.size:]).decode('utf-8')
+
+    def _threadCodecs(self, name: str) -> Dict[int, object]:
+        """This thread's zstd compressors or decompressors by dictId"""
+        codecs = getattr(self._local, name, None)
+        if codecs is None:
+            codecs = {}
+            setattr(self._local, name, codecs)
+        return codecs
+
+    def _compress(self, dictId: int, raw: bytes) -> bytes:
+        codec, dictionary = self._dictionaries[dictId]
+        if codec == 'zstd':
+            compressors = self._threadCodecs('compressors')
+            compressor = compressors.get(dictId)
+            if compressor is None:
+                compressor = compressors[dictId] = _zstd.ZstdCompressor(
+                    level=self.level, dict_data=_zstd.ZstdCompressionDict(dictionary))
+            return compressor.compress(raw)
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, -15, zdict=dictionary)
+        return compressor.compress(raw) + compressor.flush()
+
+    def _decompress(self, dictId: int, stored: Tuple[str, bytes], data) -> bytes:
+        codec, dictionary = stored
+        if codec == 'zstd':
+            if _zstd is None:
+                raise PayloadCodecError("Reading zstd-compressed payloads requires the zstandard package")
+            decompressors = self._threadCodecs('decompressors')
+            decompressor = decompressors.get(dictId)
+            if decompressor is None:
+                decompressor = decompressors[dictId] = _zstd.ZstdDecompressor(
+                    dict_data=_zstd.ZstdCompressionDict(dictionary))
+            return decompressor.decompress(data)
+        decompressor = zlib.decompressobj(-15, zdict=dictionary)
+        return decompressor.decompress(data) + decompressor.flush()
+
+    # ------------------------------------------------------------------
+    # Training
+    # ------------------------------------------------------------------
+
+    def dueForTraining(self) -> List[Tuple[str, str]]:
+        """(lane, messageType) keys with enough plain-row samples to train"""
+        with self._lock:
+            return [key for key, samples in self._samples.items() if len(samples) >= self.trainSamples]
+
+    def takeSamples(self, lane: str, messageType: str) -> List[bytes]:
+        with self._lock:
+            return self._samples.pop((lane, messageType), [])
+
+    def train(self, samples: List[bytes]) -> Optional[bytes]:
+        """Dictionary trained from sample payloads (None if the samples are unusable)"""
+        if not samples:
+            return None
+        if self.codec == 'zstd':
+            try:
+                return _zstd.train_dictionary(self.dictionarySize, samples, level=self.level).as_bytes()
+            except _zstd.ZstdError:
+                return None
+        # zlib: preset dictionary of recent distinct payloads, most recent (most typical) last
+        dictionary = b''
+        seen = set()
+        for sample in reversed(samples):
+            if sample in seen:
+                continue
+            seen.add(sample)
+            dictionary = sample + dictionary
+            if len(dictionary) >= self.dictionarySize:
+                break
+        return dictionary[-self.dictionarySize:]
+
+
+# ============================================================================
+# Migration CLI
+# ============================================================================
+
+def main():
+    from nova.core.database import Database
+
+    parser = argparse.ArgumentParser(description='Train payload dictionaries and re-encode stored Parsed/UI payloads')
+    parser.add_argument('--db', required=True, help='Main database file')
+    parser.add_argument('--codec', required=True, choices=list(CODEC_IDS) + ['none'],
+                        help="Target codec ('none' rewrites compressed rows as plain JSON)")
+    parser.add_argument('--level', type=int, default=3)
+    parser.add_argument('--dictionary-size', type=int, default=16384)
+    parser.add_argument('--train-samples', type=int, default=500, help='Rows sampled per messageType for training')
+    parser.add_argument('--batch', type=int, default=2000, help='Rows rewritten per transaction')
+    parser.add_argument('--vacuum', action='store_true', help='VACUUM files afterwards to return freed pages')
+    args = parser.parse_args()
+
+    codecConfig = None if args.codec == 'none' else {
+        'codec': args.codec, 'level': args.level,
+        'dictionarySize': args.dictionary_size, 'trainSamples': args.train_samples
+    }
+    database = Database(args.db, payloadCodec=codecConfig)
+    try:
+        if codecConfig:
+            trained = database.trainPayloadDictionaries()
+            print(f"Trained {len(trained)} dictionaries: {', '.join(f'{lane}/{mt}' for lane, mt in trained)}")
+        result = database.migratePayloads(batchSize=args.batch, vacuum=args.vacuum)
+        print(f"Rewrote {result['rewritten']} of {result['examined']} rows: "
+              f"{result['bytesBefore'] / 1e6:.1f} MB -> {result['bytesAfter'] / 1e6:.1f} MB payload")
+    finally:
+        database.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,238 @@
+"""
+NOVA Sampling Profiler
+
+Time-boxed, opt-in profiling for a running Core or Server process, started
+from the Server's admin API (POST /api/admin/profile). Nothing runs until a
+session is requested; sessions end on their own.
+
+A session combines:
+- StackSampler: a daemon thread that samples every thread's Python stack
+  (sys._current_frames) at a fixed interval and aggregates them as collapsed
+  stacks ("thread;file:function:line;... count"), ready for flamegraph.pl /
+  speedscope
+- LoopLagMonitor: a coroutine measuring event loop scheduling lag (how late a
+  sleep wakes up); lag means something ran on the loop without yielding
+- Slow callbacks: the loop runs in asyncio debug mode for the session with
+  slow_callback_duration set, and asyncio's "Executing <Handle ...> took N
+  seconds" reports are captured
+
+Output per session in the diagnostics directory:
+    <sessionId>-<process>.collapsed   collapsed stacks
+    <sessionId>-<process>.json        summary (lag stats, slow callbacks, top stacks)
+
+Property of Uncompromising Sensors LLC.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import orjson
+
+from sdk.logging import getLogger
+
+
+DEFAULT_DIAGNOSTICS_DIR = './nova/data/diagnostics'
+MAX_STACK_DEPTH = 64
+
+
+class ProfilerBusy(Exception):
+    """A profiling session is already running in this process"""
+    pass
+
+
+class StackSampler:
+    """Samples all thread stacks from a background thread; aggregates collapsed stacks"""
+
+    def __init__(self, intervalSeconds: float = 0.005):
+        self.intervalSeconds = intervalSeconds
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='NovaStackSampler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+    def _run(self):
+        selfId = threading.get_ident()
+        while not self._stop.wait(self.intervalSeconds):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for threadId, frame in sys._current_frames().items():
+                if threadId != selfId:
+                    self.stacks[collapseStack(frame, names.get(threadId, str(threadId)))] += 1
+            self.samples += 1
+
+    def collapsed(self) -> str:
+        """Collapsed stack text, one 'stack count' line per distinct stack"""
+        return ''.join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+def stackFrames(frame, maxDepth: int = MAX_STACK_DEPTH) -> List[str]:
+    """file:function:line labels from frame outwards (innermost first), at most maxDepth"""
+    frames = []
+    while frame is not None and len(frames) < maxDepth:
+        code = frame.f_code
+        frames.append(f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}")
+        frame = frame.f_back
+    return frames
+
+
+def collapseStack(frame, threadName: str) -> str:
+    """'thread;outer;...;inner' with file:function:line frames, root first"""
+    frames = stackFrames(frame)
+    frames.append(threadName.replace(';', '_').replace(' ', '_'))
+    return ';'.join(reversed(frames))
+
+
+class LoopLagMonitor:
+    """Measures how late the event loop wakes a periodic sleep"""
+
+    def __init__(self, intervalSeconds: float = 0.05):
+        self.intervalSeconds = intervalSeconds
+        self.lags: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self):
+        while True:
+            expected = time.perf_counter() + self.intervalSeconds
+            await asyncio.sleep(self.intervalSeconds)
+            self.lags.append(max(0.0, time.perf_counter() - expected))
+
+    def summary(self) -> Dict[str, Any]:
+        lags = sorted(self.lags)
+        pick = lambda fraction: round(lags[min(len(lags) - 1, int(fraction * len(lags)))] * 1000, 3) if lags else None
+        return {'samples': len(lags), 'p50Ms': pick(0.50), 'p99Ms': pick(0.99),
+                'maxMs': round(lags[-1] * 1000, 3) if lags else None}
+
+
+class _SlowCallbackHandler(logging.Handler):
+    """Collects asyncio debug-mode 'Executing ... took N seconds' warnings"""
+
+    def __init__(self, limit: int = 200):
+        super().__init__(logging.WARNING)
+        self.limit = limit
+        self.records: List[Dict[str, Any]] = []
+
+    def emit(self, record: logging.LogRecord):
+        message = record.getMessage()
+        if message.startswith('Executing') and len(self.records) < self.limit:
+            self.records.append({'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+                                 'message': message})
+
+
+class Profiler:
+    """
+    Per-process profiling sessions (one at a time).
+
+    Args:
+        processName: 'core' or 'server' (used in file names)
+        diagnosticsDir: where session files are written
+        maxDurationSeconds: upper bound for a requested session
+    """
+
+    def __init__(self, processName: str, diagnosticsDir: str = DEFAULT_DIAGNOSTICS_DIR, maxDurationSeconds: float = 120.0):
+        self.processName = processName
+        self.diagnosticsDir = Path(diagnosticsDir)
+        self.maxDurationSeconds = maxDurationSeconds
+        self.log = getLogger()
+        self._active = False
+
+    @classmethod
+    def fromConfig(cls, processName: str, config: dict) -> 'Profiler':
+        """From a "diagnostics" config section ({dir, maxProfileSeconds})"""
+        return cls(processName, config.get('dir', DEFAULT_DIAGNOSTICS_DIR), config.get('maxProfileSeconds', 120.0))
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    async def profile(self, durationSeconds: float = 10.0, sampleIntervalMs: float = 5.0,
+                      slowCallbackMs: float = 100.0, sessionId: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Run one session on the current loop and write its files.
+
+        Returns: session summary (also written as <sessionId>-<process>.json)
+        Raises: ProfilerBusy if a session is already running
+        """
+        if self._active:
+            raise ProfilerBusy(f"Profiling session already running in {self.processName}")
+        self._active = True
+        durationSeconds = min(max(float(durationSeconds), 0.1), self.maxDurationSeconds)
+        sessionId = sessionId or datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+        loop = asyncio.get_running_loop()
+        previousDebug, previousSlow = loop.get_debug(), loop.slow_callback_duration
+        slowHandler = _SlowCallbackHandler()
+        asyncioLogger = logging.getLogger('asyncio')
+        sampler = StackSampler(sampleIntervalMs / 1000.0)
+        lagMonitor = LoopLagMonitor()
+
+        self.log.info(f"[Profiler] {self.processName} session {sessionId} started ({durationSeconds}s)")
+        startedAt = datetime.now(timezone.utc).isoformat()
+        wallStart, cpuStart = time.perf_counter(), time.process_time()
+        asyncioLogger.addHandler(slowHandler)
+        loop.slow_callback_duration = slowCallbackMs / 1000.0
+        loop.set_debug(True)
+        sampler.start()
+        lagMonitor.start()
+        try:
+            await asyncio.sleep(durationSeconds)
+        finally:
+            await lagMonitor.stop()
+            sampler.stop()
+            loop.set_debug(previousDebug)
+            loop.slow_callback_duration = previousSlow
+            asyncioLogger.removeHandler(slowHandler)
+            self._active = False
+
+        summary = {
+            'sessionId': sessionId,
+            'process': self.processName,
+            'pid': os.getpid(),
+            'startedAt': startedAt,
+            'durationSeconds': round(time.perf_counter() - wallStart, 3),
+            'cpuSeconds': round(time.process_time() - cpuStart, 3),
+            'sampleIntervalMs': sampleIntervalMs,
+            'stackSamples': sampler.samples,
+            'loopLag': lagMonitor.summary(),
+            'slowCallbacks': slowHandler.records,
+            'topStacks': [{'stack': stack, 'count': count} for stack, count in sampler.stacks.most_common(20)],
+        }
+        summary['files'] = await asyncio.to_thread(self._write, sessionId, sampler.collapsed(), summary)
+        self.log.info(f"[Profiler] {self.processName} session {sessionId} done: {sampler.samples} samples, "
+                      f"loop lag max {summary['loopLag']['maxMs']} ms, {len(slowHandler.records)} slow callbacks")
+        return summary
+
+    def _write(self, sessionId: str, collapsed: str, summary: Dict[str, Any]) -> List[str]:
+        self.diagnosticsDir.mkdir(parents=True, exist_ok=True)
+        stem = self.diagnosticsDir / f"{sessionId}-{self.processName}"
+        collapsedPath, summaryPath = stem.with_suffix('.collapsed'), stem.with_suffix('.json')
+        collapsedPath.write_text(collapsed)
+        summaryPath.write_bytes(orjson.dumps(dict(summary, files=[str(collapsedPath), str(summaryPath)]),
+                                             option=orjson.OPT_INDENT_2))
+        return [str(collapsedPath), str(summaryPath)]
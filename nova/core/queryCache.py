@@ -0,0 +1,171 @@
+"""
+NOVA Query Cache
+
+Memory-bounded cache of decoded Database.queryEvents results for historical
+windows. Replay viewers re-request the same windows (seek back, looped playback,
+several users reviewing one run); hits skip SQLite reads and JSON decoding.
+
+- Key: timebase, window and the full filter tuple (exact match)
+- Only windows whose stopTime is older than now - liveMarginSeconds are cached;
+  live-edge windows bypass the cache
+- Truth can still change inside a past window (late source times, replication
+  with preserved canonical times, retention): Database reports inserted event
+  times and removals, and overlapping entries are dropped. A result read while
+  an overlapping insert landed is not stored (generation check)
+- LRU eviction by estimated decoded size (maxBytes); results larger than
+  maxEntryBytes are never cached
+- Hits return fresh row dicts; nested payload/data objects are shared between
+  hits and must be treated as read-only
+
+Config "queryCache": {"maxBytes": 268435456, "maxEntryBytes": 33554432, "liveMarginSeconds": 10}
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from .metrics import getRegistry
+
+
+# Decoded size estimate per row: dict and identity strings plus decoded JSON (~4x its text)
+ROW_OVERHEAD_BYTES = 1024
+DECODED_JSON_FACTOR = 4
+
+_metrics = getRegistry()
+QUERY_CACHE_REQUESTS_TOTAL = _metrics.counter('nova_query_cache_requests_total', 'Database.queryEvents cache lookups by result', ('result',))
+QUERY_CACHE_EVICTIONS_TOTAL = _metrics.counter('nova_query_cache_evictions_total', 'Query cache entries dropped by reason', ('reason',))
+
+
+class QueryCache:
+    """
+    LRU cache of decoded query results with a byte budget.
+
+    Thread-safe; entries, window horizons and the generation are guarded by one lock.
+    """
+
+    def __init__(self, maxBytes: int = 256 * 1024 * 1024, maxEntryBytes: Optional[int] = None,
+                 liveMarginSeconds: float = 10.0):
+        """
+        Args:
+            maxBytes: Estimated decoded bytes kept across all entries
+            maxEntryBytes: Largest single result cached (default maxBytes / 8)
+            liveMarginSeconds: Windows ending within this many seconds of now are not cached
+        """
+        self.maxBytes = maxBytes
+        self.maxEntryBytes = maxEntryBytes if maxEntryBytes is not None else maxBytes // 8
+        self.liveMarginSeconds = liveMarginSeconds
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()  # key -> (timebase, startTime, stopTime, rows, size)
+        self._bytes = 0
+        self._generation = 0
+        # Latest stopTime of any cached or in-flight window per timebase: inserts after it skip the scan
+        self._horizon: Dict[str, str] = {}
+        _metrics.gauge('nova_query_cache_bytes', 'Estimated decoded bytes held by the query cache').setFunction(lambda: self._bytes)
+        _metrics.gauge('nova_query_cache_entries', 'Query results held by the query cache').setFunction(lambda: len(self._entries))
+
+    @classmethod
+    def fromConfig(cls, config: Optional[Dict[str, Any]]) -> Optional['QueryCache']:
+        """Cache from config "queryCache" (None when absent or maxBytes is 0)"""
+        if not config or not config.get('maxBytes', 0):
+            return None
+        return cls(maxBytes=config['maxBytes'], maxEntryBytes=config.get('maxEntryBytes'),
+                   liveMarginSeconds=config.get('liveMarginSeconds', 10.0))
+
+    def cacheable(self, stopTime: str) -> bool:
+        """True if the window ends before the live margin"""
+        try:
+            stop = datetime.fromisoformat(stopTime.replace('Z', '+00:00'))
+        except ValueError:
+            return False
+        if stop.tzinfo is None:
+            stop = stop.replace(tzinfo=timezone.utc)
+        return stop.timestamp() < time.time() - self.liveMarginSeconds
+
+    @staticmethod
+    def estimateBytes(rowCount: int, jsonBytes: int) -> int:
+        """Estimated decoded size of a result from its row count and stored JSON/bytes length"""
+        return rowCount * ROW_OVERHEAD_BYTES + jsonBytes * DECODED_JSON_FACTOR
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+
+    def get(self, key: tuple, timebase: str, stopTime: str) -> Tuple[Optional[List[Dict[str, Any]]], int]:
+        """
+        Cached rows (fresh dicts) or None, plus the generation token for put().
+
+        A miss registers the window as in flight so overlapping inserts invalidate it.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if stopTime > self._horizon.get(timebase, ''):
+                    self._horizon[timebase] = stopTime
+                QUERY_CACHE_REQUESTS_TOTAL.inc(result='miss')
+                return None, self._generation
+            self._entries.move_to_end(key)
+            rows = entry[3]
+        QUERY_CACHE_REQUESTS_TOTAL.inc(result='hit')
+        return [dict(row) for row in rows], self._generation
+
+    def put(self, key: tuple, timebase: str, startTime: str, stopTime: str, rows: List[Dict[str, Any]],
+            size: int, generation: int) -> bool:
+        """Store a result read under generation; False if it was invalidated meanwhile or too large"""
+        if size > self.maxEntryBytes:
+            QUERY_CACHE_EVICTIONS_TOTAL.inc(reason='oversize')
+            return False
+        stored = [dict(row) for row in rows]
+        with self._lock:
+            if generation != self._generation:
+                return False
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[4]
+            self._entries[key] = (timebase, startTime, stopTime, stored, size)
+            self._bytes += size
+            while self._bytes > self.maxBytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted[4]
+                QUERY_CACHE_EVICTIONS_TOTAL.inc(reason='lru')
+        return True
+
+    def bypass(self):
+        QUERY_CACHE_REQUESTS_TOTAL.inc(result='bypass')
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+
+    def invalidateTimes(self, times: List[Tuple[str, str]]):
+        """Drop entries whose window contains an inserted event's (sourceTruthTime, canonicalTruthTime)"""
+        with self._lock:
+            sourceHorizon = self._horizon.get('source', '')
+            canonicalHorizon = self._horizon.get('canonical', '')
+            late = [(source, canonical) for source, canonical in times
+                    if source <= sourceHorizon or canonical <= canonicalHorizon]
+            if not late:
+                return
+            self._generation += 1
+            stale = [key for key, (timebase, startTime, stopTime, _, _) in self._entries.items()
+                     if any(startTime <= (source if timebase == 'source' else canonical) <= stopTime
+                            for source, canonical in late)]
+            self._drop(stale, 'invalidated')
+
+    def invalidateAll(self):
+        """Drop every entry (retention, archival)"""
+        with self._lock:
+            self._generation += 1
+            self._drop(list(self._entries), 'invalidated')
+
+    def _drop(self, keys: List[tuple], reason: str):
+        """Caller holds _lock"""
+        for key in keys:
+            self._bytes -= self._entries.pop(key)[4]
+        if keys:
+            QUERY_CACHE_EVICTIONS_TOTAL.inc(len(keys), reason=reason)
+        self._horizon = {}
+        for timebase, _, stopTime, _, _ in self._entries.values():
+            if stopTime > self._horizon.get(timebase, ''):
+                self._horizon[timebase] = stopTime
@@ -0,0 +1,189 @@
+"""
+NOVA Replication
+
+Ships stored truth between NOVA instances (e.g. field Core -> ground mirror) as
+contiguous ingest-sequence ranges instead of per-event requests, so a peer that was
+offline for hours catches up in seconds.
+
+- Exporter (source side): reads events after a cursor in ingestSeq order from the
+  main file and live segments, packs them into one compressed batch. ingestSeq is a
+  stored column, so VACUUM on the source never makes a lagging peer skip or repeat rows
+- Importer (target side): decodes a batch and hands it to Ingest.ingestBatch, which
+  batch-dedupes it against eventIndex, inserts the rest and notifies LIVE streams,
+  the overview pyramid and ingest metrics; then persists the peer's cursor (high-water mark)
+
+Batches are opaque bytes so any transport can carry them (NATS request/reply,
+HTTP, files on removable media). Applying a batch twice is harmless: dedupe is by
+eventId, and the cursor only moves forward after the batch is committed.
+
+Per architecture, canonicalTruthTime is assigned by the receiving NOVA: imported
+events get the target's receive time unless preserveCanonicalTime is set (e.g. to
+rebuild an exact copy of a database).
+
+Batch format: MAGIC + version byte + zlib(JSON {"cursor": {...}, "events": [...]})
+with events in toDict form (raw bytes base64).
+"""
+
+import base64
+import zlib
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
+
+import orjson
+
+from sdk.logging import getLogger
+
+from .events import Lane, eventFromDict
+from .ingest import Ingest
+
+if TYPE_CHECKING:
+    from nova.core.database import Database
+
+
+BATCH_MAGIC = b'NRB'
+BATCH_VERSION = 1
+
+
+class ReplicationError(Exception):
+    """Malformed or incompatible replication batch"""
+    pass
+
+
+def _rowToDict(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Lane-table row (Database.readRowsSince) -> event dict for eventFromDict"""
+    lane = Lane(row['lane'])
+    event = {key: value for key, value in row.items() if value is not None}
+    if lane == Lane.RAW:
+        event['bytes'] = base64.b64encode(row['bytes']).decode('ascii')
+    else:
+        jsonField = 'data' if lane == Lane.UI else 'payload'
+        event[jsonField] = orjson.loads(row[jsonField])
+    return event
+
+
+class ReplicationExporter:
+    """Source side: packs stored events after a cursor into compressed batches."""
+
+    def __init__(self, database: 'Database', scopeIds: Optional[List[str]] = None, compressionLevel: int = 6):
+        """
+        Args:
+            database: Source truth database
+            scopeIds: Only ship these scopes (None = all)
+            compressionLevel: zlib level (1 fastest .. 9 smallest)
+        """
+        self.database = database
+        self.scopeIds = scopeIds
+        self.compressionLevel = compressionLevel
+
+    def exportBatch(self, cursor: Dict[str, int], maxEvents: int = 5000) -> Tuple[bytes, Dict[str, int], int]:
+        """
+        Read up to maxEvents after cursor.
+
+        Returns:
+            (batch bytes, cursor after the batch, event count) - count 0 means caught up
+        """
+        rows, nextCursor = self.database.readRowsSince(cursor, maxEvents, self.scopeIds)
+        body = orjson.dumps({'cursor': nextCursor, 'events': [_rowToDict(row) for row in rows]})
+        batch = BATCH_MAGIC + bytes([BATCH_VERSION]) + zlib.compress(body, self.compressionLevel)
+        return batch, nextCursor, len(rows)
+
+
+def decodeBatch(batch: bytes) -> Tuple[Dict[str, int], List[Dict[str, Any]]]:
+    """
+    Decode a replication batch.
+
+    Returns:
+        (cursor after the batch, event dicts)
+
+    Raises:
+        ReplicationError: On bad magic/version or corrupt body
+    """
+    if batch[:len(BATCH_MAGIC)] != BATCH_MAGIC:
+        raise ReplicationError("Not a replication batch")
+    version = batch[len(BATCH_MAGIC)]
+    if version != BATCH_VERSION:
+        raise ReplicationError(f"Unsupported replication batch version {version}")
+    try:
+        body = orjson.loads(zlib.decompress(batch[len(BATCH_MAGIC) + 1:]))
+    except (zlib.error, orjson.JSONDecodeError) as e:
+        raise ReplicationError(f"Corrupt replication batch: {e}")
+    return body['cursor'], body['events']
+
+
+class ReplicationImporter:
+    """Target side: applies batches from a peer and tracks its high-water mark."""
+
+    def __init__(self, database: 'Database', preserveCanonicalTime: bool = False, ingest: Optional[Ingest] = None):
+        """
+        Args:
+            database: Target truth database
+            preserveCanonicalTime: Keep the source's canonicalTruthTime instead of stamping receive time
+            ingest: Target's ingest pipeline (LIVE streams, overview); None = plain Ingest on database
+        """
+        self.database = database
+        self.preserveCanonicalTime = preserveCanonicalTime
+        self.ingest = ingest or Ingest(database)
+
+    def cursorFor(self, peerId: str) -> Dict[str, int]:
+        """Where the next batch from peerId should start"""
+        return self.database.getReplicationCursor(peerId)
+
+    def applyBatch(self, peerId: str, batch: bytes) -> int:
+        """
+        Insert a batch from peerId and advance its cursor.
+
+        Returns:
+            Number of new events (duplicates excluded)
+        """
+        cursor, eventDicts = decodeBatch(batch)
+        receiveTime = datetime.now(timezone.utc).isoformat()
+        events = []
+        for eventDict in eventDicts:
+            if not self.preserveCanonicalTime:
+                eventDict.pop('canonicalTruthTime', None)
+            events.append(eventFromDict(eventDict))
+        inserted = self.ingest.ingestBatch(events, receiveTime) if events else 0
+        self.database.setReplicationCursor(peerId, cursor, inserted)
+        return inserted
+
+
+class ReplicationService:
+    """
+    Pulls from a source database into a target until caught up.
+
+    Both databases are local here (tests, offline media, co-located mirror); across
+    the network the same exportBatch/applyBatch pair runs on each side of a transport.
+    """
+
+    def __init__(self, source: 'Database', target: 'Database', peerId: str,
+                 scopeIds: Optional[List[str]] = None, batchSize: int = 5000,
+                 preserveCanonicalTime: bool = False, ingest: Optional[Ingest] = None):
+        self.exporter = ReplicationExporter(source, scopeIds)
+        self.importer = ReplicationImporter(target, preserveCanonicalTime, ingest)
+        self.peerId = peerId
+        self.batchSize = batchSize
+        self.log = getLogger()
+
+    def catchUp(self, maxBatches: Optional[int] = None) -> Dict[str, int]:
+        """
+        Ship batches until the source has nothing past the peer's cursor.
+
+        Returns:
+            {'batches', 'events', 'inserted', 'bytes'}
+        """
+        stats = {'batches': 0, 'events': 0, 'inserted': 0, 'bytes': 0}
+        cursor = self.importer.cursorFor(self.peerId)
+        while maxBatches is None or stats['batches'] < maxBatches:
+            batch, nextCursor, count = self.exporter.exportBatch(cursor, self.batchSize)
+            if nextCursor == cursor:
+                break
+            stats['inserted'] += self.importer.applyBatch(self.peerId, batch)
+            stats['batches'] += 1
+            stats['events'] += count
+            stats['bytes'] += len(batch)
+            cursor = nextCursor
+
+        if stats['batches']:
+            self.log.info(f"[Replication] {self.peerId}: {stats['inserted']} new events in {stats['batches']} batches",
+                          bytes=stats['bytes'])
+        return stats
@@ -0,0 +1,223 @@
+"""
+NOVA Retention Engine
+
+Ages high-volume truth data into downsampled tiers so disk use and wide-window
+scan cost stay bounded on long-running systems.
+
+Rules (config "retention.rules"), applied per lane and optional messageType once
+data is older than the rule's age (by canonicalTruthTime):
+- drop:           remove every event (e.g. raw frames after a horizon)
+- keepEveryN:     keep the 1st, (N+1)th, ... event per entity and messageType
+- keepPerSeconds: keep the first event per entity and messageType per N-second bucket
+
+Several rules on the same lane/messageType form tiers (e.g. every 10th after a day,
+1 per minute after a week, drop after a month); younger tiers run first.
+
+Auditability:
+- Every slice that removes data is recorded as a RetentionApplied metadata event
+  (rule, window, examined/removed counts)
+- Removed eventIds stay in eventIndex, so re-ingest of dropped data is still deduped
+- Command and metadata lanes are never thinned; UI updates are partial upserts and
+  only support drop
+
+Progress per rule is a watermark in the database (retentionState), so each window is
+processed exactly once and restarts resume where they left off.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timezone, timedelta
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
+
+from sdk.logging import getLogger
+
+from .events import Lane, MetadataEvent
+
+if TYPE_CHECKING:
+    from nova.core.database import Database
+
+
+RETENTION_ACTIONS = ('drop', 'keepEveryN', 'keepPerSeconds')
+
+# Lanes retention may touch (command/metadata are the audit trail)
+RETENTION_LANES = (Lane.RAW, Lane.PARSED, Lane.UI)
+
+# Config age keys -> seconds
+AGE_UNITS = {'afterSeconds': 1, 'afterMinutes': 60, 'afterHours': 3600, 'afterDays': 86400}
+
+
+@dataclass
+class RetentionRule:
+    """One retention tier: lane (+ optional messageType), minimum age and action."""
+    ruleId: str
+    lane: Lane
+    afterSeconds: float
+    action: str
+    messageType: Optional[str] = None
+    value: Optional[int] = None  # N for keepEveryN, bucket seconds for keepPerSeconds
+
+    @staticmethod
+    def fromConfig(ruleConfig: Dict[str, Any]) -> 'RetentionRule':
+        """
+        Build a rule from config, e.g.
+        {"id": "navsat-decimate", "lane": "parsed", "messageType": "ubx.nav_sat",
+         "afterHours": 24, "action": "keepEveryN", "n": 10}
+
+        Raises:
+            ValueError: On invalid lane, action, age or action parameter
+        """
+        lane = Lane(ruleConfig.get('lane'))
+        if lane not in RETENTION_LANES:
+            raise ValueError(f"Retention not allowed on lane '{lane.value}'")
+
+        action = ruleConfig.get('action')
+        if action not in RETENTION_ACTIONS:
+            raise ValueError(f"Invalid retention action '{action}', expected one of {RETENTION_ACTIONS}")
+        if lane == Lane.UI and action != 'drop':
+            raise ValueError("UI lane only supports 'drop' (UiUpdates are partial upserts)")
+
+        afterSeconds = sum(ruleConfig.get(key, 0) * scale for key, scale in AGE_UNITS.items())
+        if afterSeconds <= 0:
+            raise ValueError(f"Retention rule needs a positive age ({', '.join(AGE_UNITS)})")
+
+        value = None
+        if action == 'keepEveryN':
+            value = int(ruleConfig.get('n', 0))
+        elif action == 'keepPerSeconds':
+            value = int(ruleConfig.get('seconds', 0))
+        if action != 'drop' and (value is None or value < 1):
+            raise ValueError(f"Retention action '{action}' needs a positive {'n' if action == 'keepEveryN' else 'seconds'}")
+
+        messageType = ruleConfig.get('messageType')
+        if messageType and lane == Lane.RAW:
+            raise ValueError("Raw lane has no messageType")
+
+        ruleId = ruleConfig.get('id') or f"{lane.value}-{messageType or '*'}-{action}-{int(afterSeconds)}"
+        return RetentionRule(ruleId, lane, afterSeconds, action, messageType, value)
+
+    def describe(self) -> Dict[str, Any]:
+        """Rule fields for audit payloads"""
+        return {
+            'ruleId': self.ruleId,
+            'lane': self.lane.value,
+            'messageType': self.messageType,
+            'afterSeconds': self.afterSeconds,
+            'action': self.action,
+            'value': self.value
+        }
+
+
+def _parseTime(value: str) -> datetime:
+    """Parse ISO8601 (Z or offset; naive treated as UTC) as a UTC datetime"""
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return parsed.astimezone(timezone.utc) if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+class RetentionEngine:
+    """
+    Applies retention rules to the truth database.
+
+    runOnce() is synchronous (sqlite work); the Core runs it periodically in a thread.
+    """
+
+    def __init__(self, database: 'Database', rules: List[RetentionRule], scopeId: str,
+                 sliceSeconds: int = 3600, compact: bool = False):
+        """
+        Args:
+            database: Truth database
+            rules: Retention tiers
+            scopeId: Scope for RetentionApplied metadata events
+            sliceSeconds: Window size per thinning step (bounds memory and write-lock hold time)
+            compact: VACUUM older segments after removing data from them (opt-in: each VACUUM
+                     rewrites the segment file; ingest continues, see Database.compactSegment)
+        """
+        ruleIds = [rule.ruleId for rule in rules]
+        if len(ruleIds) != len(set(ruleIds)):
+            raise ValueError(f"Duplicate retention rule ids: {ruleIds}")
+        self.database = database
+        self.rules = sorted(rules, key=lambda rule: rule.afterSeconds)  # Younger tiers first
+        self.scopeId = scopeId
+        self.sliceSeconds = sliceSeconds
+        self.compact = compact
+        self.log = getLogger()
+
+    @staticmethod
+    def fromConfig(database: 'Database', config: Dict[str, Any]) -> Optional['RetentionEngine']:
+        """Build from Core config ("retention" section). Returns None if disabled or no rules."""
+        retentionConfig = config.get('retention', {})
+        if not retentionConfig.get('enabled', False) or not retentionConfig.get('rules'):
+            return None
+        rules = [RetentionRule.fromConfig(ruleConfig) for ruleConfig in retentionConfig['rules']]
+        return RetentionEngine(
+            database,
+            rules,
+            scopeId=config.get('scopeId', 'local'),
+            sliceSeconds=retentionConfig.get('sliceSeconds', 3600),
+            compact=retentionConfig.get('compact', False)
+        )
+
+    def runOnce(self, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Apply every rule up to its cutoff (now - age).
+
+        Returns:
+            Audit payloads of the slices that removed data
+        """
+        now = (now or datetime.now(timezone.utc)).astimezone(timezone.utc)  # Windows in the stored UTC form
+        actions = []
+        touchedSegments = set()
+
+        for rule in self.rules:
+            cutoff = now - timedelta(seconds=rule.afterSeconds)
+            start = self.database.getRetentionWatermark(rule.ruleId)
+            if start is None:
+                start = self.database.earliestCanonicalTime(rule.lane, rule.messageType)
+                if start is None:
+                    continue
+
+            sliceStart = _parseTime(start)
+            ruleRemoved = 0
+            while sliceStart < cutoff:
+                sliceStop = min(sliceStart + timedelta(seconds=self.sliceSeconds), cutoff)
+                windowStart, windowStop = sliceStart.isoformat(), sliceStop.isoformat()
+
+                result = self.database.thinEvents(
+                    rule.lane, windowStart, windowStop,
+                    messageType=rule.messageType,
+                    keepEveryN=rule.value if rule.action == 'keepEveryN' else None,
+                    keepPerSeconds=rule.value if rule.action == 'keepPerSeconds' else None
+                )
+                if result['removed']:
+                    payload = dict(rule.describe(), windowStart=windowStart, windowStop=windowStop,
+                                   examined=result['examined'], removed=result['removed'])
+                    self._recordAction(payload)
+                    actions.append(payload)
+                    ruleRemoved += result['removed']
+                    touchedSegments.update(result['segmentIds'])
+
+                self.database.setRetentionWatermark(rule.ruleId, windowStop)
+                sliceStart = sliceStop
+
+            if ruleRemoved:
+                self.log.info(f"[Retention] {rule.ruleId}: removed {ruleRemoved} {rule.lane.value} events",
+                              cutoff=cutoff.isoformat())
+
+        if self.compact:
+            for segmentId in sorted(touchedSegments):
+                self.database.compactSegment(segmentId)
+
+        return actions
+
+    def _recordAction(self, payload: Dict[str, Any]):
+        """Insert RetentionApplied metadata event (audit trail)"""
+        now = datetime.now(timezone.utc).isoformat()
+        event = MetadataEvent.create(
+            scopeId=self.scopeId,
+            sourceTruthTime=now,
+            messageType="RetentionApplied",
+            effectiveTime=payload['windowStop'],
+            payload=payload,
+            systemId="nova",
+            containerId="core",
+            uniqueId=f"retention-{payload['ruleId']}"
+        )
+        self.database.insertEvent(event, now)
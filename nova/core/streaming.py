@@ -6,6 +6,8 @@ No persistent per-client state - cursors exist only during active stream.
 
 Architecture invariants (nova architecture.md):
 - Server-paced: Core controls emission timing based on requested rate
+- Unpaced (bounded replay, request.unpaced): windows emitted back-to-back, window
+  size adapted toward a target chunk byte size; consumer backpressure only
 - Ephemeral: cursor state discarded when stream stops/canceled
 - Fencing: playbackRequestId prevents interleaving after seek/rate change
 - Deterministic: uses ordering.py for event sequencing
@@ -18,6 +20,7 @@ Property of Uncompromising Sensors LLC.
 """
 
 import asyncio
+import json
 import time
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any, List
@@ -26,9 +29,130 @@ from pathlib import Path
 from nova.core.database import Database
 from nova.core.contracts import StreamRequest, StreamChunk, StreamComplete, TimelineMode
 from nova.core.contract import Lane
+from nova.core.metrics import getRegistry
 from sdk.logging import getLogger
 
 
+_metrics = getRegistry()
+STREAM_CHUNKS_TOTAL = _metrics.counter('nova_stream_chunks_total', 'StreamChunks emitted by timeline cursors (incl. empty time-advance chunks)')
+STREAM_EVENTS_TOTAL = _metrics.counter('nova_stream_events_total', 'Events emitted by timeline cursors')
+STREAM_READ_SECONDS = _metrics.histogram('nova_stream_read_seconds', 'StreamCursor database read latency per chunk')
+STREAM_LAG_SECONDS = _metrics.histogram('nova_stream_lag_seconds', 'LIVE cursor lag behind wall clock per emitted chunk (all cursors)',
+                                         buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0))
+STREAM_WAKEUPS_TOTAL = _metrics.counter('nova_stream_wakeups_total', 'LIVE cursor wakeups signalled by notifyNewEvent (after coalescing)')
+
+# Unpaced replay defaults (config "streaming")
+UNPACED_CHUNK_BYTES = 1024 * 1024
+UNPACED_MIN_WINDOW_US = 1_000
+UNPACED_MAX_WINDOW_US = 3600 * 1_000_000
+UNPACED_SIZE_SAMPLES = 16
+
+# Per-lane filters applied by Database.queryEvents beyond scope and entity identity
+LANE_FILTER_FIELDS = {
+    Lane.RAW.value: (),
+    Lane.PARSED.value: ('messageType',),
+    Lane.UI.value: ('viewId', 'manifestId'),
+    Lane.COMMAND.value: ('commandType',),
+    Lane.METADATA.value: ('messageType', 'manifestId'),
+}
+
+
+class Subscription:
+    """A LIVE cursor's filter predicate: which ingested events can appear in its next read"""
+    
+    __slots__ = ('cursor', 'scopeIds', 'lanes', 'systemId', 'containerId', 'uniqueId', 'fields')
+    
+    def __init__(self, cursor, filters: Dict[str, Any]):
+        """
+        Args:
+            cursor: StreamCursor / OutputStreamCursor woken through its newDataEvent
+            filters: The filters the cursor's queryEvents call applies
+        """
+        self.cursor = cursor
+        self.scopeIds = tuple(filters['scopeIds']) if filters.get('scopeIds') else None
+        lanes = filters.get('lanes')
+        self.lanes = tuple(Lane(lane).value for lane in lanes) if lanes else None
+        self.systemId = filters.get('systemId')
+        self.containerId = filters.get('containerId')
+        self.uniqueId = filters.get('uniqueId')
+        self.fields = {name: filters[name] for name in ('messageType', 'viewId', 'manifestId', 'commandType')
+                       if filters.get(name)}
+    
+    def keys(self):
+        """(scopeId, lane, uniqueId) index keys, None = any"""
+        for scopeId in self.scopeIds or (None,):
+            for lane in self.lanes or (None,):
+                yield scopeId, lane, self.uniqueId
+    
+    def accepts(self, event, lane: str) -> bool:
+        """Residual predicate after the index lookup (systemId, containerId, per-lane filters)"""
+        if self.systemId and event.systemId != self.systemId:
+            return False
+        if self.containerId and event.containerId != self.containerId:
+            return False
+        for name in LANE_FILTER_FIELDS.get(lane, ()):
+            wanted = self.fields.get(name)
+            if wanted and getattr(event, name, None) != wanted:
+                return False
+        return True
+
+
+class SubscriptionIndex:
+    """
+    LIVE cursor subscriptions indexed by scopeId -> lane -> uniqueId (None = wildcard).
+    
+    match() probes at most 8 buckets per event, so its cost follows the number of
+    subscriptions that can match, not the number of open streams.
+    """
+    
+    def __init__(self):
+        self._index: Dict[Optional[str], Dict[Optional[str], Dict[Optional[str], Dict[int, Subscription]]]] = {}
+        self._byCursor: Dict[int, Subscription] = {}
+    
+    def __len__(self):
+        return len(self._byCursor)
+    
+    def add(self, subscription: Subscription):
+        self.remove(subscription.cursor)
+        self._byCursor[id(subscription.cursor)] = subscription
+        for scopeId, lane, uniqueId in subscription.keys():
+            self._index.setdefault(scopeId, {}).setdefault(lane, {}).setdefault(uniqueId, {})[id(subscription.cursor)] = subscription
+    
+    def remove(self, cursor):
+        subscription = self._byCursor.pop(id(cursor), None)
+        if subscription is None:
+            return
+        for scopeId, lane, uniqueId in subscription.keys():
+            byLane = self._index[scopeId]
+            byUnique = byLane[lane]
+            bucket = byUnique[uniqueId]
+            bucket.pop(id(cursor), None)
+            if not bucket:
+                del byUnique[uniqueId]
+                if not byUnique:
+                    del byLane[lane]
+                    if not byLane:
+                        del self._index[scopeId]
+    
+    def match(self, event) -> List[Subscription]:
+        """Subscriptions whose filters accept the event"""
+        lane = event.lane.value if isinstance(event.lane, Lane) else event.lane
+        matched = []
+        for scopeId in (event.scopeId, None):
+            byLane = self._index.get(scopeId)
+            if not byLane:
+                continue
+            for laneKey in (lane, None):
+                byUnique = byLane.get(laneKey)
+                if not byUnique:
+                    continue
+                for uniqueId in (event.uniqueId, None):
+                    bucket = byUnique.get(uniqueId)
+                    if bucket:
+                        matched.extend(sub for sub in bucket.values() if sub.accepts(event, lane))
+        return matched
+
+
 class StreamCursor:
     """Ephemeral cursor for one active stream"""
     
@@ -76,6 +200,16 @@ class StreamCursor:
         
         self.running = True
         
+        # Query window: fixed 1 second, adapted per chunk in unpaced mode
+        streamingConfig = (config or {}).get('streaming', {})
+        self.queryWindowUs = 1_000_000
+        self.unpaced = bool(request.unpaced) and self.startTime is not None and self.stopTime is not None
+        self.unpacedChunkBytes = streamingConfig.get('unpacedChunkBytes', UNPACED_CHUNK_BYTES)
+        self.unpacedMaxWindowUs = int(streamingConfig.get('unpacedMaxWindowSeconds', UNPACED_MAX_WINDOW_US / 1_000_000) * 1_000_000)
+        self._windowsRead = 0
+        if request.unpaced and not self.unpaced:
+            self.log.warning(f"[Stream] Unpaced replay needs startTime and stopTime - pacing at rate={request.rate}")
+        
         # For LIVE streaming (stopTime=None): notification event for push-based updates
         if self.stopTime is None:
             self.newDataEvent = asyncio.Event()
@@ -92,6 +226,7 @@ class StreamCursor:
         - LIVE (rate > 0, stopTime=null): Notification-driven, emit new data immediately
         - REWIND (rate < 0, stopTime=null): Query historical data, pace at requested rate
         - Bounded REWIND (stopTime set): Query until boundary, pace at requested rate
+        - Unpaced bounded replay: Query until boundary, no delay between chunks
         """
         self.log.info(f"[Stream] Start: requestId={self.playbackRequestId}, "
                      f"window=[{self.startTime}, {self.stopTime}], cursor={self.currentTime}, rate={self.rate}")
@@ -138,6 +273,7 @@ class StreamCursor:
                             complete=False
                         )
                         await chunkQueue.put(chunk)
+                        STREAM_CHUNKS_TOTAL.inc()
                         self.cursorAdvancedEvent.set()
                         
                         # Apply paced delay for smooth timeline advancement
@@ -161,13 +297,18 @@ class StreamCursor:
                     complete=False
                 )
                 await chunkQueue.put(chunk)
+                STREAM_CHUNKS_TOTAL.inc()
+                STREAM_EVENTS_TOTAL.inc(len(events))
+                if isLive:
+                    nowUs = datetime.now(timezone.utc).timestamp() * 1_000_000
+                    STREAM_LAG_SECONDS.observe((nowUs - self.lastEmittedCursor) / 1_000_000)
                 
                 # Signal followers that cursor has advanced (they read lastWindow)
                 self.cursorAdvancedEvent.set()
                 
                 # Server-paced delay: ONLY for REWIND mode
-                # LIVE mode has natural pacing from data arrival rate
-                if not isLive:
+                # LIVE mode has natural pacing from data arrival rate; unpaced replay is bounded by the consumer
+                if not isLive and not self.unpaced:
                     queryWindowUs = getattr(self, 'lastQueryWindowUs', 1_000_000)
                     await self._pacedDelay(queryWindowUs)
                 
@@ -185,10 +326,13 @@ class StreamCursor:
         - LIVE initial: Read last 1 minute to catch up (includes metadata)
         - LIVE ongoing: Read from cursor to now
         - REWIND: Read 1-second windows for smooth flow at typical data rates
+        - Unpaced: Adaptive windows; consecutive windows do not share their boundary
+          microsecond (stopTime is inclusive), so each event is emitted once
         """
         # Query window size: 1 second of timeline data for smooth continuous flow
         # At 10Hz: ~10 events, at 100Hz: ~100 events - reasonable batch sizes
-        queryWindowUs = 1_000_000  # 1 second in microseconds
+        queryWindowUs = self.queryWindowUs
+        boundaryUs = 1 if self.unpaced and self._windowsRead else 0
         
         # Calculate query boundaries
         # LIVE only if no startTime was provided
@@ -204,7 +348,7 @@ class StreamCursor:
             self.log.info(f"[Stream] LIVE start from now")
         elif self.rate >= 0:
             # Forward: read window from cursor
-            readStart = self.currentTime
+            readStart = self.currentTime + boundaryUs
             if self.stopTime:
                 # Bounded forward: don't exceed stop boundary
                 readEnd = min(self.currentTime + queryWindowUs, self.stopTime)
@@ -222,7 +366,7 @@ class StreamCursor:
             actualWindowUs = readEnd - readStart
         else:
             # Backward: read window before cursor
-            readEnd = self.currentTime
+            readEnd = self.currentTime - boundaryUs
             if self.stopTime:
                 # Bounded backward: don't go past start boundary
                 readStart = max(self.currentTime - queryWindowUs, self.startTime)
@@ -243,6 +387,7 @@ class StreamCursor:
         
         # Query database - NO LIMIT, read what exists
         # Filters use new identity model: systemId, containerId, uniqueId
+        readStartTime = time.perf_counter()
         events = await asyncio.to_thread(
             self.database.queryEvents,
             startTime=startTimeIso,
@@ -258,6 +403,10 @@ class StreamCursor:
             manifestId=self.filters.get('manifestId'),
             commandType=self.filters.get('commandType')
         )
+        STREAM_READ_SECONDS.observe(time.perf_counter() - readStartTime)
+        if self.unpaced:
+            self._windowsRead += 1
+            self._adaptWindow(events, actualWindowUs)
         
         if not events:
             # No events in current window
@@ -289,6 +438,19 @@ class StreamCursor:
         
         return events
     
+    def _adaptWindow(self, events: List[Dict[str, Any]], windowUs: int):
+        """Unpaced: scale the next query window toward unpacedChunkBytes (at most 4x per step)"""
+        if not events:
+            scale = 4.0  # Sparse data: widen quickly
+        else:
+            step = max(1, len(events) // UNPACED_SIZE_SAMPLES)
+            sample = events[::step][:UNPACED_SIZE_SAMPLES]
+            sampleBytes = sum(len(json.dumps(event, default=str)) for event in sample)
+            estimatedBytes = sampleBytes * len(events) / len(sample)
+            scale = min(4.0, max(0.25, self.unpacedChunkBytes / max(estimatedBytes, 1)))
+        windowUs = max(windowUs, UNPACED_MIN_WINDOW_US)
+        self.queryWindowUs = int(min(self.unpacedMaxWindowUs, max(UNPACED_MIN_WINDOW_US, windowUs * scale)))
+    
     async def _pacedDelay(self, queryWindowUs: int):
         """
         Server-paced delay based on query window size (fixed ~1 second).
@@ -412,7 +574,8 @@ class OutputStreamCursor:
                 followerCursor = leaderCursor
                 continue
             
-            events = await self._queryEvents(readStart, readEnd)
+            # Unpaced leaders advance by large windows: read the whole gap
+            events = await self._queryEvents(readStart, readEnd, limit=None if leader.unpaced else 1000)
             followerCursor = leaderCursor
             
             if events:
@@ -462,7 +625,7 @@ class OutputStreamCursor:
                 except asyncio.TimeoutError:
                     pass
     
-    async def _queryEvents(self, startUs: int, endUs: int) -> List[Dict[str, Any]]:
+    async def _queryEvents(self, startUs: int, endUs: int, limit: Optional[int] = 1000) -> List[Dict[str, Any]]:
         """Query events with own filters in given time window"""
         startTime = datetime.fromtimestamp(startUs / 1_000_000, tz=timezone.utc)
         endTime = datetime.fromtimestamp(endUs / 1_000_000, tz=timezone.utc)
@@ -479,7 +642,7 @@ class OutputStreamCursor:
             containerId=self.filters.get('containerId'),
             uniqueId=self.filters.get('uniqueId'),
             messageType=self.filters.get('messageType'),
-            limit=1000
+            limit=limit
         )
     
     def cancel(self):
@@ -513,6 +676,15 @@ class StreamingManager:
         # Output stream cursors: connId → OutputStreamCursor
         self.outputStreams: Dict[str, OutputStreamCursor] = {}
         self.outputTasks: Dict[str, asyncio.Task] = {}
+        
+        # LIVE cursors woken by ingest, by filter; wakeups within one loop iteration are coalesced
+        self.subscriptions = SubscriptionIndex()
+        self._pendingWakeups: Dict[int, Subscription] = {}
+        self._wakeupScheduled = False
+        
+        _metrics.gauge('nova_stream_active', 'Active streams by kind', ('kind',)).setFunction(lambda: len(self.activeStreams), kind='timeline')
+        _metrics.gauge('nova_stream_active', 'Active streams by kind', ('kind',)).setFunction(lambda: len(self.outputStreams), kind='output')
+        _metrics.gauge('nova_stream_subscriptions', 'LIVE cursors registered for ingest wakeups').setFunction(lambda: len(self.subscriptions))
     
     def getLeaderCursor(self, leaderConnId: str) -> Optional[StreamCursor]:
         """Get a leader cursor's current state for followers to read"""
@@ -520,26 +692,37 @@ class StreamingManager:
     
     def notifyNewEvent(self, event, canonicalTruthTime: str):
         """
-        Notify active LIVE streams of new ingested event.
+        Notify LIVE streams whose filters match a new ingested event.
         Called synchronously from Ingest after DB write.
-        Wakes up LIVE cursors (stopTime=None) to push new data immediately.
+        
+        Matching LIVE cursors (stopTime=None) and unbound output streams are collected
+        and woken once per event loop iteration, so a burst of ingested events costs
+        each cursor a single wakeup (and a single read).
         """
-        # Wake up all LIVE streams (non-blocking, just set event flags)
-        liveCount = 0
-        for clientConnId, cursor in self.activeStreams.items():
-            if cursor.stopTime is None:  # LIVE mode only
-                if hasattr(cursor, 'newDataEvent'):
-                    cursor.newDataEvent.set()  # Wake up cursor to read new data
-                    liveCount += 1
-        
-        if liveCount > 0:
-            self.log.debug(f"[StreamMgr] Notified {liveCount} LIVE cursor(s) at {canonicalTruthTime}")
-        
-        # Wake up unbound output streams (live-follow mode)
-        for connId, cursor in self.outputStreams.items():
-            if cursor.leaderConnId is None:  # Unbound = LIVE mode
-                if hasattr(cursor, 'newDataEvent'):
-                    cursor.newDataEvent.set()
+        matched = self.subscriptions.match(event)
+        if not matched:
+            return
+        for subscription in matched:
+            self._pendingWakeups[id(subscription.cursor)] = subscription
+        if self._wakeupScheduled:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._flushWakeups()  # No loop (synchronous ingest): wake immediately
+            return
+        self._wakeupScheduled = True
+        loop.call_soon(self._flushWakeups)
+    
+    def _flushWakeups(self):
+        """Set newDataEvent of every cursor matched since the last flush"""
+        self._wakeupScheduled = False
+        pending, self._pendingWakeups = self._pendingWakeups, {}
+        for subscription in pending.values():
+            subscription.cursor.newDataEvent.set()
+        STREAM_WAKEUPS_TOTAL.inc(len(pending))
+        self.log.debug(f"[StreamMgr] Woke {len(pending)} LIVE cursor(s)")
+    
     async def startStream(self, request: StreamRequest, chunkQueue: asyncio.Queue):
         """
         Start new stream for client connection.
@@ -552,6 +735,8 @@ class StreamingManager:
         
         cursor = StreamCursor(request, self.database, self.config)
         self.activeStreams[clientConnId] = cursor
+        if cursor.stopTime is None:  # LIVE mode only
+            self.subscriptions.add(Subscription(cursor, cursor.filters))
         
         # Start streaming task
         task = asyncio.create_task(cursor.streamChunks(chunkQueue))
@@ -568,6 +753,7 @@ class StreamingManager:
         if cursor:
             cursor.cancel()
             self.activeStreams.pop(clientConnId, None)
+            self.subscriptions.remove(cursor)
         
         task = self.streamTasks.get(clientConnId)
         if task and not task.done():
@@ -600,6 +786,9 @@ class StreamingManager:
             streamingManager=self
         )
         self.outputStreams[connId] = cursor
+        if cursor.leaderConnId is None:  # Unbound = LIVE mode
+            queryFilters = {key: filters.get(key) for key in ('lanes', 'systemId', 'containerId', 'uniqueId', 'messageType')}
+            self.subscriptions.add(Subscription(cursor, queryFilters))
         
         # Start streaming task
         task = asyncio.create_task(cursor.streamChunks(chunkQueue))
@@ -616,6 +805,7 @@ class StreamingManager:
         if cursor:
             cursor.cancel()
             self.outputStreams.pop(connId, None)
+            self.subscriptions.remove(cursor)
         
         task = self.outputTasks.get(connId)
         if task and not task.done():
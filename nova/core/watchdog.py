@@ -0,0 +1,160 @@
+"""
+NOVA Event Loop Watchdog
+
+Always-on detector for synchronous work that blocks an asyncio loop (file I/O
+in handlers, direct Database calls, logging) in Core and Server.
+
+- A heartbeat coroutine on the loop records when it last ran
+- A watchdog thread checks the heartbeat; once it is older than thresholdMs the
+  loop is stalled, and the thread captures what the loop thread is executing
+  right now: the current asyncio task and the loop thread's Python stack
+- When the loop recovers, the heartbeat completes the record with the stall duration
+- Records go into a bounded ring (newest last) served by the admin API
+  (GET /api/admin/stalls); lag and stall counts are exported as metrics
+
+Cost when healthy: one short sleep/wakeup per heartbeat and one timestamp
+comparison per check in the thread.
+
+Property of Uncompromising Sensors LLC.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional
+
+from nova.core.metrics import getRegistry
+from nova.core.profiler import stackFrames
+from sdk.logging import getLogger
+
+
+LOOP_LAG_SECONDS = getRegistry().histogram('nova_loop_lag_seconds', 'Event loop heartbeat lag', ('process',),
+                                           buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0))
+LOOP_STALLS_TOTAL = getRegistry().counter('nova_loop_stalls_total', 'Event loop stalls over the watchdog threshold', ('process',))
+
+MAX_STACK_FRAMES = 40
+
+
+class LoopWatchdog:
+    """
+    Detects event loop stalls and records what was running.
+
+    Args:
+        processName: 'core' or 'server'
+        thresholdMs: heartbeat age that counts as a stall
+        heartbeatMs: heartbeat period (also the watchdog thread's check period)
+        ringSize: stall records kept
+    """
+
+    def __init__(self, processName: str, thresholdMs: float = 250.0, heartbeatMs: float = 50.0, ringSize: int = 100):
+        self.processName = processName
+        self.thresholdSeconds = thresholdMs / 1000.0
+        self.heartbeatSeconds = heartbeatMs / 1000.0
+        self.log = getLogger()
+        self._stalls: deque = deque(maxlen=ringSize)
+        self._lock = threading.Lock()
+        self._lastBeat = time.monotonic()
+        self._openStall: Optional[Dict[str, Any]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loopThreadId: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @classmethod
+    def fromConfig(cls, processName: str, config: dict) -> Optional['LoopWatchdog']:
+        """From a "diagnostics.watchdog" config section; None when disabled"""
+        if not config.get('enabled', True):
+            return None
+        return cls(processName, config.get('thresholdMs', 250.0), config.get('heartbeatMs', 50.0), config.get('ringSize', 100))
+
+    def start(self):
+        """Start heartbeat (on the running loop) and watchdog thread"""
+        self._loop = asyncio.get_running_loop()
+        self._loopThreadId = threading.get_ident()
+        self._lastBeat = time.monotonic()
+        self._stop.clear()
+        self._task = self._loop.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._watch, name=f'NovaLoopWatchdog-{self.processName}', daemon=True)
+        self._thread.start()
+        self.log.info(f"[Watchdog] {self.processName} loop watchdog started (threshold {self.thresholdSeconds * 1000:.0f} ms)")
+
+    async def stop(self):
+        self._stop.set()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._thread:
+            await asyncio.to_thread(self._thread.join)
+
+    def stalls(self) -> List[Dict[str, Any]]:
+        """Recorded stalls, oldest first (copies)"""
+        with self._lock:
+            return [dict(stall) for stall in self._stalls]
+
+    async def _heartbeat(self):
+        while True:
+            expected = time.monotonic() + self.heartbeatSeconds
+            await asyncio.sleep(self.heartbeatSeconds)
+            now = time.monotonic()
+            lag = max(0.0, now - expected)
+            LOOP_LAG_SECONDS.observe(lag, process=self.processName)
+            with self._lock:
+                self._lastBeat = now
+                stall, self._openStall = self._openStall, None
+                if stall is not None:
+                    stall['durationMs'] = round(lag * 1000, 1)
+                    stall['ongoing'] = False
+            if stall is not None:
+                self._logStall(stall)
+
+    def _watch(self):
+        while not self._stop.wait(self.heartbeatSeconds):
+            with self._lock:
+                lastBeat = self._lastBeat
+                age = time.monotonic() - lastBeat
+                if age < self.thresholdSeconds or self._openStall is not None:
+                    continue
+            stall = self._capture(age)
+            with self._lock:
+                if self._lastBeat == lastBeat:
+                    self._openStall = stall
+                else:
+                    # The loop recovered during the capture: that heartbeat ended the stall
+                    stall['durationMs'] = round(max(age, self._lastBeat - lastBeat - self.heartbeatSeconds) * 1000, 1)
+                    stall['ongoing'] = False
+                self._stalls.append(stall)
+            LOOP_STALLS_TOTAL.inc(process=self.processName)
+            if not stall['ongoing']:
+                self._logStall(stall)
+
+    def _logStall(self, stall: Dict[str, Any]):
+        self.log.warning(f"[Watchdog] {self.processName} loop blocked ~{stall['durationMs']:.0f} ms in "
+                         f"{stall['task'] or 'callback'} at {stall['stack'][-1] if stall['stack'] else '?'}")
+
+    def _capture(self, age: float) -> Dict[str, Any]:
+        """Snapshot the loop thread: current task and Python stack (innermost last)"""
+        task = None
+        try:
+            current = asyncio.current_task(self._loop)
+            if current is not None:
+                coro = current.get_coro()
+                task = f"{current.get_name()} ({getattr(coro, '__qualname__', repr(coro))})"
+        except RuntimeError:
+            pass
+        frames = stackFrames(sys._current_frames().get(self._loopThreadId), MAX_STACK_FRAMES)
+        frames.reverse()
+        return {
+            'process': self.processName,
+            'detectedAt': datetime.now(timezone.utc).isoformat(),
+            'durationMs': round(age * 1000, 1),
+            'ongoing': True,
+            'task': task,
+            'stack': frames,
+        }
@@ -25,16 +25,9 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from nova.core.database import Database
-from nova.core.ingest import Ingest
-from nova.core.transportManager import TransportManager
-from nova.core.ipc import CoreIPCHandler
-from nova.core.fileWriter import FileWriter
-from nova.core.uiState import UiStateManager
-from nova.core.manifests import ManifestRegistry, setRegistry
-from nova.server.server import NovaServer
-from sdk.logging import getLogger, configureLogging
-from sdk.transport import createTransport
+# Core and Server modules are imported inside their process entry points: each process
+# (and the launcher) only pays for what it runs (Core never loads aiohttp, Server never loads the DB layer)
+from sdk.logging import getLogger, configureLogging, shutdownLogging, StartupTimer
 
 
 def loadConfig(configPath: str) -> dict:
@@ -54,10 +47,22 @@ def runCoreProcess(configPath: str, requestQueue: Queue, responseQueue: Queue):
     - IPC handler (query, stream, command)
     """
     # Configure logging
+    timer = StartupTimer('Core')
     configureLogging()
     log = getLogger()
     log.info("[Core] Process starting...")
     
+    with timer.phase('imports'):
+        from datetime import datetime, timezone
+        from nova.core.database import Database
+        from nova.core.events import MetadataEvent
+        from nova.core.ingest import Ingest
+        from nova.core.ipc import CoreIPCHandler
+        from nova.core.fileWriter import FileWriter
+        from nova.core.uiState import UiStateManager
+        from nova.core.retention import RetentionEngine
+        from nova.core.manifests import ManifestRegistry, setRegistry
+    
     # Load config
     config = loadConfig(configPath)
     
@@ -68,7 +73,10 @@ def runCoreProcess(configPath: str, requestQueue: Queue, responseQueue: Queue):
     dbPathObj = Path(dbPath)
     dbPathObj.parent.mkdir(parents=True, exist_ok=True)
     
-    database = Database(dbPath)
+    database = Database(dbPath, segmentPeriod=config.get('segmentPeriod', 'day'),
+                        dedupeFilterCapacity=config.get('dedupeFilterCapacity', 1000000),
+                        payloadCodec=config.get('payloadCodec'), queryCache=config.get('queryCache'))
+    timer.mark('database')
     
     # Get scopeId from config
     scopeId = config.get('scopeId', 'local')
@@ -79,26 +87,7 @@ def runCoreProcess(configPath: str, requestQueue: Queue, responseQueue: Queue):
     manifestRegistry.loadBuiltinManifests()
     log.info("[Core] ManifestRegistry initialized")
     
-    # Emit ManifestPublished events for all loaded manifests (Phase 10)
-    from nova.core.events import MetadataEvent
-    from datetime import datetime, timezone
-    
-    now = datetime.now(timezone.utc).isoformat()
-    allManifests = manifestRegistry.getAllManifests()
-    for manifest in allManifests:
-        manifestVersion = manifest.manifestVersion
-        publishedEvent = MetadataEvent.create(
-            scopeId=scopeId,
-            sourceTruthTime=now,
-            messageType="ManifestPublished",
-            effectiveTime=now,
-            payload={'manifestId': manifest.manifestId, 'manifestVersion': manifestVersion},
-            systemId="nova",
-            containerId="core",
-            uniqueId=f"manifest-{manifest.manifestId}"
-        )
-        database.insertEvent(publishedEvent, now)
-    log.info(f"[Core] Emitted ManifestPublished for {len(allManifests)} manifests")
+    timer.mark('manifests')
     
     # Initialize UiStateManager (Phase 10: config-driven intervals)
     uiConfig = config.get('ui', {})
@@ -115,9 +104,6 @@ def runCoreProcess(configPath: str, requestQueue: Queue, responseQueue: Queue):
     
     # DriverBinding emitter - inserts binding as Metadata event
     def emitDriverBinding(binding: dict):
-        from nova.core.events import MetadataEvent
-        from datetime import datetime, timezone
-        
         now = datetime.now(timezone.utc).isoformat()
         bindingEvent = MetadataEvent.create(
             scopeId=config.get('scopeId', 'local'),
@@ -136,13 +122,21 @@ def runCoreProcess(configPath: str, requestQueue: Queue, responseQueue: Queue):
     fileWriter = FileWriter(dataDir, emitBinding=emitDriverBinding)
     fileWriter.start()
     
-    # Ingest (with StreamingManager + FileWriter + UiStateManager)
-    ingest = Ingest(database, verifyEventId=False, streamingManager=ipcHandler.streamingManager, fileWriter=fileWriter, uiStateManager=uiStateManager)
+    # Ingest (with StreamingManager + FileWriter + UiStateManager + OverviewPyramid)
+    ingest = Ingest(database, verifyEventId=False, streamingManager=ipcHandler.streamingManager, fileWriter=fileWriter,
+                    uiStateManager=uiStateManager, overview=ipcHandler.overview)
+    
+    # Retention engine (optional, config "retention")
+    retentionEngine = RetentionEngine.fromConfig(database, config)
+    if retentionEngine:
+        log.info(f"[Core] Retention enabled with {len(retentionEngine.rules)} rules")
+    timer.mark('components')
     
     # Run Core event loop
     async def runCore():
         transportManager = None
         checkpointTask = None
+        retentionTask = None
         
         # Periodic checkpoint task - runs every 60 seconds
         async def periodicCheckpoint():
@@ -155,13 +149,30 @@ def runCoreProcess(configPath: str, requestQueue: Queue, responseQueue: Queue):
                 except Exception as e:
                     log.warning(f"[Core] Checkpoint error: {e}")
         
+        # Periodic retention pass - sqlite work runs in a thread
+        async def periodicRetention():
+            intervalSeconds = config.get('retention', {}).get('intervalSeconds', 3600)
+            while True:
+                try:
+                    actions = await asyncio.to_thread(retentionEngine.runOnce)
+                    if actions:
+                        log.info(f"[Core] Retention pass: {len(actions)} actions")
+                except Exception as e:
+                    log.warning(f"[Core] Retention error: {e}")
+                await asyncio.sleep(intervalSeconds)
+        
         try:
             # Start periodic checkpoint task
             checkpointTask = asyncio.create_task(periodicCheckpoint())
+            if retentionEngine:
+                retentionTask = asyncio.create_task(periodicRetention())
             
             # Initialize transport (if configured)
             transportConfig = config.get('transport')
             if transportConfig:
+                # Only the configured transport's adapter is loaded
+                from sdk.transport import createTransport
+                from nova.core.transportManager import TransportManager
                 transportUri = transportConfig.get('uri')
                 transport = createTransport(transportUri)
                 await transport.connect(transportUri)
@@ -173,6 +184,9 @@ def runCoreProcess(configPath: str, requestQueue: Queue, responseQueue: Queue):
                 
                 # Start transport
                 await transportManager.start()
+                timer.mark('transport')
+            
+            timer.report(log)
             
             # Start IPC handler
             await ipcHandler.start()
@@ -182,13 +196,14 @@ def runCoreProcess(configPath: str, requestQueue: Queue, responseQueue: Queue):
         except Exception as e:
             log.error(f"[Core] Fatal error: {e}", exc_info=True)
         finally:
-            # Cancel checkpoint task
-            if checkpointTask:
-                checkpointTask.cancel()
-                try:
-                    await checkpointTask
-                except asyncio.CancelledError:
-                    pass
+            # Cancel checkpoint and retention tasks
+            for task in (checkpointTask, retentionTask):
+                if task:
+                    task.cancel()
+                    try:
+                        await task
+                    except asyncio.CancelledError:
+                        pass
             
             # Cleanup
             await ipcHandler.stop()
@@ -198,12 +213,17 @@ def runCoreProcess(configPath: str, requestQueue: Queue, responseQueue: Queue):
             # Stop FileWriter
             fileWriter.stop()
             
-            # Final checkpoint and close database
+            # Merge buffered overview buckets, final checkpoint and close database
+            if ipcHandler.overview:
+                ipcHandler.overview.flush()
             database.close()
             
             log.info("[Core] Process stopped")
     
-    asyncio.run(runCore())
+    try:
+        asyncio.run(runCore())
+    finally:
+        shutdownLogging()   # Child processes exit via os._exit (no atexit): drain the log queue explicitly
 
 
 def runServerProcess(configPath: str, requestQueue: Queue, responseQueue: Queue):
@@ -216,21 +236,29 @@ def runServerProcess(configPath: str, requestQueue: Queue, responseQueue: Queue)
     - IPC client (forwards requests to Core)
     """
     # Configure logging
+    timer = StartupTimer('Server')
     configureLogging()
     log = getLogger()
     log.info("[Server] Process starting...")
     
+    with timer.phase('imports'):
+        from nova.server.server import NovaServer
+    
     # Load config
     config = loadConfig(configPath)
     serverConfig = config.get('server', {})
+    serverConfig.setdefault('diagnostics', config.get('diagnostics', {}))
     
     # Initialize Server
     server = NovaServer(serverConfig, requestQueue, responseQueue)
+    timer.mark('components')
     
     # Run Server event loop
     async def runServer():
         try:
             await server.start()
+            timer.mark('listen')
+            timer.report(log)
             
             # Keep running
             while True:
@@ -244,7 +272,10 @@ def runServerProcess(configPath: str, requestQueue: Queue, responseQueue: Queue)
             await server.stop()
             log.info("[Server] Process stopped")
     
-    asyncio.run(runServer())
+    try:
+        asyncio.run(runServer())
+    finally:
+        shutdownLogging()
 
 
 def main():
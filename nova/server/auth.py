@@ -9,14 +9,17 @@ Phase 9 Auth (Complete):
 - User states: pending, active, disabled
 - Bootstrap admin from config
 - Admin password reset
+- Validated tokens cached for tokenCacheSeconds; a cache hit re-checks the user
+  record (O(1)), so tokenVersion/status/role/scope changes apply immediately
 
 Property of Uncompromising Sensors LLC.
 """
 
 import jwt
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 
 from sdk.logging import getLogger
 from nova.server.userStore import UserStore
@@ -25,6 +28,10 @@ from nova.server.userStore import UserStore
 COOKIE_NAME = 'nova_token'
 COOKIE_MAX_AGE_DAYS = 7  # Persistent login duration
 
+# Validated token cache
+TOKEN_CACHE_SECONDS = 30
+TOKEN_CACHE_MAX_ENTRIES = 10000
+
 
 class AuthManager:
     """
@@ -44,6 +51,10 @@ class AuthManager:
         self.tokenExpiry = config.get('tokenExpirySeconds', 86400)  # 24 hours default
         self.cookieMaxAge = config.get('cookieMaxAgeDays', COOKIE_MAX_AGE_DAYS) * 86400  # Convert to seconds
         self.secure = config.get('secureCookies', False)  # Set True in production with HTTPS
+        self.tokenCacheSeconds = config.get('tokenCacheSeconds', TOKEN_CACHE_SECONDS)  # 0 disables
+        
+        # token -> (monotonic expiry, user record, _userState at validation, result)
+        self._tokenCache: Dict[str, Tuple[float, Dict[str, Any], str, Dict[str, Any]]] = {}
         
         # User store
         usersPath = config.get('usersPath', './nova/data/users.json')
@@ -142,6 +153,15 @@ class AuthManager:
         if not token:
             return None
         
+        cached = self._tokenCache.get(token)
+        if cached is not None:
+            expiresAt, cachedUser, userState, result = cached
+            # Deleted/recreated user, or a status/tokenVersion/role/scope change, invalidates the entry
+            if (time.monotonic() < expiresAt and self.userStore.getById(result['userId']) is cachedUser
+                    and self._userState(cachedUser) == userState):
+                return dict(result)
+            del self._tokenCache[token]
+        
         try:
             payload = jwt.decode(token, self.secret, algorithms=['HS256'])
             
@@ -160,12 +180,14 @@ class AuthManager:
                 return None
             
             # Return payload with current user data (includes allowedScopes)
-            return {
+            result = {
                 'userId': payload['userId'],
                 'username': payload['username'],
                 'role': user['role'],
                 'allowedScopes': user.get('allowedScopes', [])
             }
+            self._cacheToken(token, payload, user, result)
+            return dict(result)
             
         except jwt.ExpiredSignatureError:
             self.log.warning("[Auth] Token expired")
@@ -174,6 +196,27 @@ class AuthManager:
             self.log.warning(f"[Auth] Invalid token: {e}")
             return None
     
+    def _cacheToken(self, token: str, payload: Dict[str, Any], user: Dict[str, Any], result: Dict[str, Any]):
+        """Cache a validated token until tokenCacheSeconds or its exp, whichever is first"""
+        if self.tokenCacheSeconds <= 0:
+            return
+        ttl = self.tokenCacheSeconds
+        if 'exp' in payload:
+            ttl = min(ttl, payload['exp'] - time.time())
+        if ttl <= 0:
+            return
+        if len(self._tokenCache) >= TOKEN_CACHE_MAX_ENTRIES:
+            now = time.monotonic()
+            self._tokenCache = {k: v for k, v in self._tokenCache.items() if v[0] > now}
+            while len(self._tokenCache) >= TOKEN_CACHE_MAX_ENTRIES:
+                del self._tokenCache[next(iter(self._tokenCache))]  # Oldest first
+        self._tokenCache[token] = (time.monotonic() + ttl, user, self._userState(user), result)
+    
+    @staticmethod
+    def _userState(user: Dict[str, Any]) -> tuple:
+        """User fields a validated token depends on"""
+        return (user['status'], user.get('tokenVersion', 1), user['role'], tuple(user.get('allowedScopes', [])))
+    
     def getCookieSettings(self) -> Dict[str, Any]:
         """Get cookie configuration for Set-Cookie header"""
         return {
@@ -0,0 +1,159 @@
+"""
+Binary WebSocket framing for UI stream chunks.
+
+Dense telemetry chunks repeat the same keys, lane names and identity triplets on
+every event. The columnar framing sends each chunk as one binary frame:
+- Identity and time fields are string-table columns (16-bit or 32-bit indices)
+- The remaining fields are JSON rows without keys: each row is
+  [shapeIndex, values...] where a per-chunk shape lists the keys, with one level of
+  nested object keys flattened (["payload", ["lat", "lon", ...]])
+
+Negotiation: the UI opens /ws?framing=columnar; the server confirms with
+authResponse.framing ("columnar" or "json"). Only streamChunk messages use the
+binary framing; every other message stays a JSON text frame.
+
+Frame layout (little-endian):
+    magic    4 bytes  b'NVC1'
+    metaLen  u32      length of meta
+    meta     UTF-8 JSON: chunk fields except events, plus
+                      count   - number of events
+                      strings - string table
+                      columns - column field names, in frame order
+                      shapes  - row shapes: key or [key, [subkeys]] entries
+                      wide    - true if indices are u32 (table >= 65535 entries)
+    pad      to a 4-byte boundary
+    columns  len(columns) x count indices (u16 or u32); ABSENT = field not a string
+             on that event (left in the remainder object, if present at all)
+    pad      to a 4-byte boundary
+    restLen  u32
+    rest     UTF-8 JSON array of count rows [shapeIndex, values...]
+
+Property of Uncompromising Sensors LLC.
+"""
+
+import struct
+import sys
+from array import array
+from typing import Any, Dict, List
+
+import orjson
+
+
+FRAMING_JSON = 'json'
+FRAMING_COLUMNAR = 'columnar'
+FRAMINGS = (FRAMING_JSON, FRAMING_COLUMNAR)
+
+MAGIC = b'NVC1'
+
+# Event fields carried as string-table columns (identity, routing, schema and time fields)
+COLUMN_FIELDS = ('lane', 'scopeId', 'systemId', 'containerId', 'uniqueId', 'messageType',
+                 'viewId', 'manifestId', 'manifestVersion', 'schemaVersion', 'commandType', 'connectionId',
+                 'sourceTruthTime', 'canonicalTruthTime')
+
+ABSENT_U16 = 0xFFFF
+ABSENT_U32 = 0xFFFFFFFF
+
+
+def _pad(length: int) -> bytes:
+    return b'\x00' * (-length % 4)
+
+
+def encodeChunk(message: Dict[str, Any]) -> bytes:
+    """Encode a streamChunk message (with events list) as one columnar binary frame"""
+    events: List[Dict[str, Any]] = message.get('events') or []
+    strings: List[str] = []
+    stringIndex: Dict[str, int] = {}
+    columns = {field: [None] * len(events) for field in COLUMN_FIELDS}
+    shapes: List[list] = []
+    shapeIndex: Dict[tuple, int] = {}
+    rest = []
+    for position, event in enumerate(events):
+        shapeKey, row = [], [0]
+        for key, value in event.items():
+            column = columns.get(key)
+            if column is not None and type(value) is str:
+                index = stringIndex.get(value)
+                if index is None:
+                    index = stringIndex[value] = len(strings)
+                    strings.append(value)
+                column[position] = index
+            elif type(value) is dict:
+                shapeKey.append((key, tuple(value)))
+                row.extend(value.values())
+            else:
+                shapeKey.append(key)
+                row.append(value)
+        shapeKey = tuple(shapeKey)
+        index = shapeIndex.get(shapeKey)
+        if index is None:
+            index = shapeIndex[shapeKey] = len(shapes)
+            shapes.append([entry if type(entry) is str else [entry[0], list(entry[1])] for entry in shapeKey])
+        row[0] = index
+        rest.append(row)
+
+    wide = len(strings) >= ABSENT_U16
+    absent = ABSENT_U32 if wide else ABSENT_U16
+    usedColumns = [field for field in COLUMN_FIELDS if any(index is not None for index in columns[field])]
+
+    meta = {key: value for key, value in message.items() if key != 'events'}
+    meta.update(count=len(events), strings=strings, columns=usedColumns, shapes=shapes, wide=wide)
+    metaBytes = orjson.dumps(meta)
+
+    parts = [MAGIC, struct.pack('<I', len(metaBytes)), metaBytes]
+    offset = 8 + len(metaBytes)
+    parts.append(_pad(offset))
+    offset += len(parts[-1])
+    for field in usedColumns:
+        indices = array('I' if wide else 'H', [absent if index is None else index for index in columns[field]])
+        if sys.byteorder == 'big':
+            indices.byteswap()
+        parts.append(indices.tobytes())
+        offset += len(parts[-1])
+    parts.append(_pad(offset))
+
+    restBytes = orjson.dumps(rest)
+    parts.append(struct.pack('<I', len(restBytes)))
+    parts.append(restBytes)
+    return b''.join(parts)
+
+
+def decodeChunk(frame: bytes) -> Dict[str, Any]:
+    """Decode a columnar frame back to the streamChunk message (tools and tests; the UI decodes in websocket.js)"""
+    if frame[:4] != MAGIC:
+        raise ValueError('Not a columnar chunk frame')
+    metaLength = struct.unpack_from('<I', frame, 4)[0]
+    meta = orjson.loads(frame[8:8 + metaLength])
+    count, strings, usedColumns = meta.pop('count'), meta.pop('strings'), meta.pop('columns')
+    shapes, wide = meta.pop('shapes'), meta.pop('wide')
+    offset = 8 + metaLength
+    offset += -offset % 4
+
+    width, absent = (4, ABSENT_U32) if wide else (2, ABSENT_U16)
+    columnData = []
+    for _ in usedColumns:
+        indices = array('I' if wide else 'H', frame[offset:offset + count * width])
+        if sys.byteorder == 'big':
+            indices.byteswap()
+        columnData.append(indices)
+        offset += count * width
+    offset += -offset % 4
+
+    restLength = struct.unpack_from('<I', frame, offset)[0]
+    events = []
+    for row in orjson.loads(frame[offset + 4:offset + 4 + restLength]):
+        event, position = {}, 1
+        for entry in shapes[row[0]]:
+            if type(entry) is str:
+                event[entry] = row[position]
+                position += 1
+            else:
+                key, subkeys = entry
+                event[key] = dict(zip(subkeys, row[position:position + len(subkeys)]))
+                position += len(subkeys)
+        events.append(event)
+    for field, indices in zip(usedColumns, columnData):
+        for event, index in zip(events, indices):
+            if index != absent:
+                event[field] = strings[index]
+    meta['events'] = events
+    return meta
@@ -113,11 +113,13 @@ class ServerIPCClient:
                          timelineMode: TimelineMode,
                          timebase: str = "canonical",
                          filters: Optional[Dict[str, Any]] = None,
-                         chunkHandler: Optional[Callable] = None):
+                         chunkHandler: Optional[Callable] = None,
+                         unpaced: bool = False):
         """
         Send StreamRequest to Core.
         
         chunkHandler: callback(chunk) for each StreamChunk received
+        unpaced: bounded replay emitted as fast as it is consumed (ignores rate pacing)
         """
         requestId = str(uuid.uuid4())
         
@@ -130,7 +132,8 @@ class ServerIPCClient:
             rate=rate,
             timelineMode=timelineMode,
             timebase=timebase,
-            filters=filters
+            filters=filters,
+            unpaced=unpaced
         )
         
         # Register stream handler
@@ -260,6 +263,105 @@ class ServerIPCClient:
         finally:
             self.responseHandlers.pop(requestId, None)
     
+    async def getMetrics(self, timeout: float = 2.0) -> list:
+        """
+        Fetch Core's metrics registry snapshot.
+        
+        Returns: list of metric dicts (nova.core.metrics snapshot format)
+        """
+        requestId = str(uuid.uuid4())
+        
+        future = asyncio.Future()
+        self.responseHandlers[requestId] = lambda resp: future.set_result(resp)
+        
+        await self._sendRequest({'requestId': requestId, 'type': RequestType.GET_METRICS.value})
+        
+        try:
+            response = await asyncio.wait_for(future, timeout=timeout)
+            return response.get('metrics', [])
+        finally:
+            self.responseHandlers.pop(requestId, None)
+    
+    async def getStalls(self, timeout: float = 2.0) -> Dict[str, Any]:
+        """
+        Fetch Core's event loop stall ring.
+        
+        Returns: {'enabled': bool, 'stalls': [stall records, oldest first]}
+        """
+        requestId = str(uuid.uuid4())
+        
+        future = asyncio.Future()
+        self.responseHandlers[requestId] = lambda resp: future.set_result(resp)
+        
+        await self._sendRequest({'requestId': requestId, 'type': RequestType.GET_STALLS.value})
+        
+        try:
+            response = await asyncio.wait_for(future, timeout=timeout)
+            return {'enabled': response.get('enabled', False), 'stalls': response.get('stalls', [])}
+        finally:
+            self.responseHandlers.pop(requestId, None)
+    
+    async def profile(self, durationSeconds: float, sampleIntervalMs: float = 5.0, slowCallbackMs: float = 100.0,
+                      sessionId: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Run a profiling session in Core and wait for it to finish.
+        
+        Returns: {'type': 'profile', 'profile': summary} or ErrorResponse dict
+        """
+        requestId = str(uuid.uuid4())
+        
+        future = asyncio.Future()
+        self.responseHandlers[requestId] = lambda resp: future.set_result(resp)
+        
+        await self._sendRequest({
+            'requestId': requestId,
+            'type': RequestType.PROFILE.value,
+            'durationSeconds': durationSeconds,
+            'sampleIntervalMs': sampleIntervalMs,
+            'slowCallbackMs': slowCallbackMs,
+            'sessionId': sessionId
+        })
+        
+        try:
+            return await asyncio.wait_for(future, timeout=durationSeconds + 30.0)
+        finally:
+            self.responseHandlers.pop(requestId, None)
+    
+    async def queryOverview(self,
+                            clientConnId: str,
+                            startTime: int,
+                            stopTime: int,
+                            timebase: str = "canonical",
+                            filters: Optional[Dict[str, Any]] = None,
+                            maxBuckets: Optional[int] = None,
+                            tier: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Fetch overview pyramid buckets for a window (microsecond times).
+        
+        Returns: {'type': 'overview', 'tier', 'timebase', 'series', ...} or ErrorResponse dict
+        """
+        requestId = str(uuid.uuid4())
+        
+        future = asyncio.Future()
+        self.responseHandlers[requestId] = lambda resp: future.set_result(resp)
+        
+        await self._sendRequest({
+            'requestId': requestId,
+            'type': RequestType.QUERY_OVERVIEW.value,
+            'clientConnId': clientConnId,
+            'startTime': startTime,
+            'stopTime': stopTime,
+            'timebase': timebase,
+            'filters': filters,
+            'maxBuckets': maxBuckets,
+            'tier': tier
+        })
+        
+        try:
+            return await asyncio.wait_for(future, timeout=30.0)
+        finally:
+            self.responseHandlers.pop(requestId, None)
+    
     async def _processResponses(self):
         """Process incoming responses from Core"""
         while self.running:
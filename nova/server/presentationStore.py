@@ -13,11 +13,20 @@ Phase 10 (phase9-11Updated.md):
 Storage Layout:
 - User overrides: data/users/<username>/presentation.json
 - Admin defaults: data/presentation/defaults/<scopeId>.json
+
+Caching:
+- Parsed files are kept in memory and re-read only when their mtime/size changes
+  (hand edits on disk are still picked up)
+- Saves are write-through and atomic (temp file + rename)
+- Merged presentations are precomputed per (username, scopeId) and dropped when
+  either underlying file is edited, so entity lists resolve without disk reads
 """
 
+import copy
 import json
+import os
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, field, asdict
 
 from sdk.logging import getLogger
@@ -70,6 +79,11 @@ class PresentationStore:
         # Ensure directories exist
         self.usersPath.mkdir(parents=True, exist_ok=True)
         self.defaultsPath.mkdir(parents=True, exist_ok=True)
+        
+        # path -> (stamp, parsed JSON, {scopeId or None: {uniqueId: EntityPresentation}})
+        self._files: Dict[Path, Tuple[tuple, Dict[str, Any], Dict[Optional[str], Dict[str, EntityPresentation]]]] = {}
+        # (username, scopeId) -> (file stamps, {uniqueId: resolved presentation})
+        self._merged: Dict[Tuple[Optional[str], str], Tuple[tuple, Dict[str, Dict[str, Any]]]] = {}
     
     def _scopeToFilename(self, scopeId: str) -> str:
         """Convert scopeId to safe filename (| is invalid on Windows)."""
@@ -79,6 +93,76 @@ class PresentationStore:
         """Convert filename back to scopeId."""
         return filename.replace('_', '|')
     
+    def _userPath(self, username: str) -> Path:
+        return self.usersPath / username / 'presentation.json'
+    
+    def _defaultsFile(self, scopeId: str) -> Path:
+        return self.defaultsPath / f'{self._scopeToFilename(scopeId)}.json'
+    
+    @staticmethod
+    def _stamp(filePath: Path) -> Optional[tuple]:
+        """(mtime_ns, size) of a file, None if it does not exist"""
+        try:
+            stat = filePath.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def _entry(self, filePath: Path, what: str):
+        """Cached (stamp, data, parsed) for a JSON file, re-read when it changed on disk"""
+        stamp = self._stamp(filePath)
+        if stamp is None:
+            self._files.pop(filePath, None)
+            return None, {}, {}
+        entry = self._files.get(filePath)
+        if entry is not None and entry[0] == stamp:
+            return entry
+        try:
+            with open(filePath, 'r') as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError(f"expected an object, got {type(data).__name__}")
+        except (json.JSONDecodeError, ValueError, IOError) as e:
+            self.log.warning(f"[Presentation] Failed to load {what}: {e}")
+            data = {}
+        entry = (stamp, data, {})
+        self._files[filePath] = entry
+        return entry
+    
+    def _parsed(self, filePath: Path, what: str, scopeId: Optional[str]) -> Dict[str, EntityPresentation]:
+        """{uniqueId: EntityPresentation} for a user file scope (or a defaults file, scopeId None)"""
+        _, data, parsed = self._entry(filePath, what)
+        if scopeId not in parsed:
+            scopeData = data if scopeId is None else data.get(scopeId, {})
+            parsed[scopeId] = {
+                uniqueId: EntityPresentation.fromDict(overrides)
+                for uniqueId, overrides in (scopeData.items() if isinstance(scopeData, dict) else ())
+                if isinstance(overrides, dict)
+            }
+        return parsed[scopeId]
+    
+    def _loadForEdit(self, filePath: Path, what: str) -> Dict[str, Any]:
+        """Private copy of a file's JSON for read-modify-write"""
+        return copy.deepcopy(self._entry(filePath, what)[1])
+    
+    def _save(self, filePath: Path, data: Dict[str, Any]) -> None:
+        """Atomic write-through save (raises IOError); refreshes caches"""
+        tmpPath = filePath.with_name(f'{filePath.name}.tmp')
+        try:
+            with open(tmpPath, 'w') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmpPath, filePath)
+        except IOError:
+            tmpPath.unlink(missing_ok=True)
+            raise
+        self._files[filePath] = (self._stamp(filePath), data, {})
+    
+    def _invalidateMerged(self, username: Optional[str] = None, scopeId: Optional[str] = None):
+        """Drop precomputed presentations for a user (all scopes) or a scope (all users)"""
+        for key in [k for k in self._merged if (username is not None and k[0] == username) or
+                    (scopeId is not None and k[1] == scopeId)]:
+            del self._merged[key]
+    
     # =========================================================================
     # User Overrides
     # =========================================================================
@@ -89,23 +173,7 @@ class PresentationStore:
         
         Returns: Dict of uniqueId → EntityPresentation
         """
-        filePath = self.usersPath / username / 'presentation.json'
-        if not filePath.exists():
-            return {}
-        
-        try:
-            with open(filePath, 'r') as f:
-                data = json.load(f)
-            
-            # Get scope-specific overrides
-            scopeData = data.get(scopeId, {})
-            return {
-                uniqueId: EntityPresentation.fromDict(overrides)
-                for uniqueId, overrides in scopeData.items()
-            }
-        except (json.JSONDecodeError, IOError) as e:
-            self.log.warning(f"[Presentation] Failed to load user overrides: {e}")
-            return {}
+        return dict(self._parsed(self._userPath(username), 'user overrides', scopeId))
     
     def getAllUserOverrides(self, username: str) -> Dict[str, Dict[str, EntityPresentation]]:
         """
@@ -115,26 +183,13 @@ class PresentationStore:
         
         Returns: Dict of scopeId → { uniqueId → EntityPresentation }
         """
-        filePath = self.usersPath / username / 'presentation.json'
-        if not filePath.exists():
-            return {}
-        
-        try:
-            with open(filePath, 'r') as f:
-                data = json.load(f)
-            
-            result = {}
-            for scopeId, scopeData in data.items():
-                if isinstance(scopeData, dict):
-                    result[scopeId] = {
-                        uniqueId: EntityPresentation.fromDict(overrides)
-                        for uniqueId, overrides in scopeData.items()
-                        if isinstance(overrides, dict)
-                    }
-            return result
-        except (json.JSONDecodeError, IOError) as e:
-            self.log.warning(f"[Presentation] Failed to load all user overrides: {e}")
-            return {}
+        filePath = self._userPath(username)
+        _, data, _ = self._entry(filePath, 'all user overrides')
+        return {
+            scopeId: dict(self._parsed(filePath, 'all user overrides', scopeId))
+            for scopeId, scopeData in data.items()
+            if isinstance(scopeData, dict)
+        }
     
     def setUserOverride(
         self, 
@@ -174,13 +229,7 @@ class PresentationStore:
         userDir.mkdir(parents=True, exist_ok=True)
         filePath = userDir / 'presentation.json'
         
-        data = {}
-        if filePath.exists():
-            try:
-                with open(filePath, 'r') as f:
-                    data = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                data = {}
+        data = self._loadForEdit(filePath, 'user overrides')
         
         # Update
         if scopeId not in data:
@@ -198,12 +247,13 @@ class PresentationStore:
         
         # Write
         try:
-            with open(filePath, 'w') as f:
-                json.dump(data, f, indent=2)
+            self._save(filePath, data)
             return True
         except IOError as e:
             self.log.error(f"[Presentation] Failed to save user override: {e}")
             return False
+        finally:
+            self._invalidateMerged(username=username)
     
     def deleteUserOverride(
         self, 
@@ -218,15 +268,8 @@ class PresentationStore:
         If key is None, deletes all overrides for the entity.
         If key is provided, deletes only that key.
         """
-        filePath = self.usersPath / username / 'presentation.json'
-        if not filePath.exists():
-            return True
-        
-        try:
-            with open(filePath, 'r') as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return True
+        filePath = self._userPath(username)
+        data = self._loadForEdit(filePath, 'user overrides')
         
         if scopeId not in data:
             return True
@@ -240,12 +283,13 @@ class PresentationStore:
             del data[scopeId][uniqueId]
         
         try:
-            with open(filePath, 'w') as f:
-                json.dump(data, f, indent=2)
+            self._save(filePath, data)
             return True
         except IOError as e:
             self.log.error(f"[Presentation] Failed to delete user override: {e}")
             return False
+        finally:
+            self._invalidateMerged(username=username)
     
     # =========================================================================
     # Admin Defaults
@@ -257,21 +301,7 @@ class PresentationStore:
         
         Returns: Dict of uniqueId → EntityPresentation
         """
-        filePath = self.defaultsPath / f'{self._scopeToFilename(scopeId)}.json'
-        if not filePath.exists():
-            return {}
-        
-        try:
-            with open(filePath, 'r') as f:
-                data = json.load(f)
-            
-            return {
-                uniqueId: EntityPresentation.fromDict(overrides)
-                for uniqueId, overrides in data.items()
-            }
-        except (json.JSONDecodeError, IOError) as e:
-            self.log.warning(f"[Presentation] Failed to load admin defaults: {e}")
-            return {}
+        return dict(self._parsed(self._defaultsFile(scopeId), 'admin defaults', None))
     
     def getAllAdminDefaults(self) -> Dict[str, Dict[str, EntityPresentation]]:
         """
@@ -287,16 +317,7 @@ class PresentationStore:
             # Scan all JSON files in defaults directory
             for filePath in self.defaultsPath.glob('*.json'):
                 scopeId = self._filenameToScope(filePath.stem)  # Convert filename back to scopeId
-                try:
-                    with open(filePath, 'r') as f:
-                        data = json.load(f)
-                    result[scopeId] = {
-                        uniqueId: EntityPresentation.fromDict(overrides)
-                        for uniqueId, overrides in data.items()
-                        if isinstance(overrides, dict)
-                    }
-                except (json.JSONDecodeError, IOError) as e:
-                    self.log.warning(f"[Presentation] Failed to load admin defaults for {scopeId}: {e}")
+                result[scopeId] = dict(self._parsed(filePath, f'admin defaults for {scopeId}', None))
         except Exception as e:
             self.log.warning(f"[Presentation] Failed to scan admin defaults: {e}")
         
@@ -332,15 +353,8 @@ class PresentationStore:
                 del filtered['scale']
         
         # Load existing
-        filePath = self.defaultsPath / f'{self._scopeToFilename(scopeId)}.json'
-        
-        data = {}
-        if filePath.exists():
-            try:
-                with open(filePath, 'r') as f:
-                    data = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                data = {}
+        filePath = self._defaultsFile(scopeId)
+        data = self._loadForEdit(filePath, 'admin defaults')
         
         # Update
         if uniqueId not in data:
@@ -353,12 +367,13 @@ class PresentationStore:
         
         # Write
         try:
-            with open(filePath, 'w') as f:
-                json.dump(data, f, indent=2)
+            self._save(filePath, data)
             return True
         except IOError as e:
             self.log.error(f"[Presentation] Failed to save admin default: {e}")
             return False
+        finally:
+            self._invalidateMerged(scopeId=scopeId)
     
     def deleteAdminDefault(
         self, 
@@ -367,15 +382,8 @@ class PresentationStore:
         key: Optional[str] = None
     ) -> bool:
         """Delete admin default override."""
-        filePath = self.defaultsPath / f'{self._scopeToFilename(scopeId)}.json'
-        if not filePath.exists():
-            return True
-        
-        try:
-            with open(filePath, 'r') as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return True
+        filePath = self._defaultsFile(scopeId)
+        data = self._loadForEdit(filePath, 'admin defaults')
         
         if uniqueId not in data:
             return True
@@ -386,17 +394,48 @@ class PresentationStore:
             del data[uniqueId]
         
         try:
-            with open(filePath, 'w') as f:
-                json.dump(data, f, indent=2)
+            self._save(filePath, data)
             return True
         except IOError as e:
             self.log.error(f"[Presentation] Failed to delete admin default: {e}")
             return False
+        finally:
+            self._invalidateMerged(scopeId=scopeId)
     
     # =========================================================================
     # Resolution (Inheritance)
     # =========================================================================
     
+    def _mergedPresentations(self, username: Optional[str], scopeId: str) -> Dict[str, Dict[str, Any]]:
+        """Precomputed {uniqueId: presentation} for entities with admin defaults or user overrides"""
+        defaultsFile = self._defaultsFile(scopeId)
+        userFile = self._userPath(username) if username else None
+        stamps = (self._stamp(defaultsFile), self._stamp(userFile) if userFile else None)
+        
+        cached = self._merged.get((username, scopeId))
+        if cached is not None and cached[0] == stamps:
+            return cached[1]
+        
+        adminDefaults = self._parsed(defaultsFile, 'admin defaults', None)
+        userOverrides = self._parsed(userFile, 'user overrides', scopeId) if userFile else {}
+        
+        merged = {}
+        for uniqueId in adminDefaults.keys() | userOverrides.keys():
+            pres = dict(FACTORY_DEFAULTS)
+            
+            # Layer 2: Admin defaults
+            if uniqueId in adminDefaults:
+                pres.update(adminDefaults[uniqueId].toDict())
+            
+            # Layer 1: User overrides (highest priority)
+            if uniqueId in userOverrides:
+                pres.update(userOverrides[uniqueId].toDict())
+            
+            merged[uniqueId] = pres
+        
+        self._merged[(username, scopeId)] = (stamps, merged)
+        return merged
+    
     def resolvePresentation(
         self, 
         username: Optional[str], 
@@ -413,22 +452,7 @@ class PresentationStore:
         
         Returns complete presentation dict with all keys.
         """
-        result = dict(FACTORY_DEFAULTS)
-        
-        # Layer 2: Admin defaults
-        adminDefaults = self.getAdminDefaults(scopeId)
-        if uniqueId in adminDefaults:
-            for key, value in adminDefaults[uniqueId].toDict().items():
-                result[key] = value
-        
-        # Layer 1: User overrides (highest priority)
-        if username:
-            userOverrides = self.getUserOverrides(username, scopeId)
-            if uniqueId in userOverrides:
-                for key, value in userOverrides[uniqueId].toDict().items():
-                    result[key] = value
-        
-        return result
+        return dict(self._mergedPresentations(username, scopeId).get(uniqueId, FACTORY_DEFAULTS))
     
     def resolvePresentationBulk(
         self, 
@@ -441,27 +465,8 @@ class PresentationStore:
         
         Returns: Dict of uniqueId → presentation dict
         """
-        # Load all at once
-        adminDefaults = self.getAdminDefaults(scopeId)
-        userOverrides = self.getUserOverrides(username, scopeId) if username else {}
-        
-        result = {}
-        for uniqueId in uniqueIds:
-            pres = dict(FACTORY_DEFAULTS)
-            
-            # Admin defaults
-            if uniqueId in adminDefaults:
-                for key, value in adminDefaults[uniqueId].toDict().items():
-                    pres[key] = value
-            
-            # User overrides
-            if uniqueId in userOverrides:
-                for key, value in userOverrides[uniqueId].toDict().items():
-                    pres[key] = value
-            
-            result[uniqueId] = pres
-        
-        return result
+        merged = self._mergedPresentations(username, scopeId)
+        return {uniqueId: dict(merged.get(uniqueId, FACTORY_DEFAULTS)) for uniqueId in uniqueIds}
     
     # =========================================================================
     # Model Discovery
@@ -29,35 +29,135 @@ from nova.server.streamStore import StreamStore, StreamDefinition
 from nova.server.streams import StreamManager
 from nova.server.presentationStore import PresentationStore
 from nova.server.runStore import RunStore
+from nova.server.framing import FRAMING_JSON, FRAMING_COLUMNAR, FRAMINGS, encodeChunk
 from nova.core.contracts import TimelineMode
+from nova.core.metrics import getRegistry, renderPrometheus
+from nova.core.profiler import Profiler, ProfilerBusy
+from nova.core.watchdog import LoopWatchdog
 from nova.core.manifests.cards import getAllCardManifestsDict
 from nova.core.manifests.runs import getRunManifestRegistry
 from sdk.logging import getLogger
 
 
+WS_CHUNKS_FORWARDED_TOTAL = getRegistry().counter('nova_ws_chunks_forwarded_total', 'Stream chunk frames sent to UI WebSocket clients', ('framing',))
+WS_CHUNKS_COALESCED_TOTAL = getRegistry().counter('nova_ws_chunks_coalesced_total', 'Stream chunks merged into a pending UI WebSocket frame')
+
+
+def applyCompressionLevel(ws: web.WebSocketResponse, level: int) -> bool:
+    """
+    Set the permessage-deflate level on a prepared WebSocket (aiohttp fixes Z_BEST_SPEED).
+
+    aiohttp has no public setting for this, so the writer's private compressor is
+    replaced. Returns False (the connection keeps aiohttp's default level) if deflate
+    was not negotiated or this aiohttp version no longer has that compressor.
+    """
+    writer = getattr(ws, '_writer', None)
+    if not ws.compress or writer is None or getattr(writer, '_compressobj', False) is False:
+        return False
+    try:
+        from aiohttp.compression_utils import ZLibCompressor
+        compressor = ZLibCompressor(level=level, wbits=-ws.compress, max_sync_chunk_size=16384)
+    except (ImportError, TypeError):
+        return False
+    writer._compressobj = compressor
+    return True
+
+
 class ClientConnection:
     """
     Ephemeral client connection state.
     
     Exists only while WebSocket is open.
     Tracks active stream playbackRequestId for fencing.
+    Stream chunks use the framing negotiated at connect (json or columnar binary).
+    
+    Chunk coalescing (coalesceSeconds > 0): a chunk arriving after an idle period is
+    sent at once; chunks arriving within coalesceSeconds of the last send, or while a
+    send is in flight (slow link), merge into one pending chunk per playbackRequestId.
+    Past coalesceMaxEvents pending events the caller waits for the send (backpressure).
     """
     
     def __init__(self, connId: str, ws: web.WebSocketResponse, 
-                 userId: Optional[str] = None, username: Optional[str] = None, role: Optional[str] = None):
+                 userId: Optional[str] = None, username: Optional[str] = None, role: Optional[str] = None,
+                 framing: str = FRAMING_JSON, coalesceSeconds: float = 0.0, coalesceMaxEvents: int = 5000):
         self.connId = connId
         self.ws = ws
         self.userId = userId
         self.username = username
         self.role = role
+        self.framing = framing
         self.activePlaybackId: Optional[str] = None
         self.log = getLogger()
+        
+        # Chunk coalescing state
+        self.coalesceSeconds = coalesceSeconds
+        self.coalesceMaxEvents = coalesceMaxEvents
+        self._pendingChunk: Optional[Dict[str, Any]] = None
+        self._flushTask: Optional[asyncio.Task] = None
+        self._lastChunkSent = float('-inf')
     
     async def sendMessage(self, message: Dict[str, Any]):
         """Send JSON message to client"""
         if not self.ws.closed:
             await self.ws.send_json(message)
     
+    async def sendChunk(self, chunk: Dict[str, Any]):
+        """Send streamChunk message in the negotiated framing (coalesced when enabled)"""
+        if self.coalesceSeconds <= 0:
+            await self._writeChunk(chunk)
+            return
+        
+        pending = self._pendingChunk
+        if pending is not None and pending.get('playbackRequestId') == chunk.get('playbackRequestId'):
+            pending['events'].extend(chunk.get('events') or [])
+            pending['timestamp'] = chunk.get('timestamp')
+            pending['complete'] = chunk.get('complete', False)
+            WS_CHUNKS_COALESCED_TOTAL.inc()
+        else:
+            # A different playbackRequestId supersedes (fences) anything still pending
+            self._pendingChunk = dict(chunk, events=list(chunk.get('events') or []))
+        
+        if self._flushTask is None or self._flushTask.done():
+            self._flushTask = asyncio.create_task(self._flushChunks())
+        if self._pendingChunk is not None and len(self._pendingChunk['events']) >= self.coalesceMaxEvents:
+            await asyncio.wait({self._flushTask})
+    
+    async def _flushChunks(self):
+        """Send pending chunks: at once after idle, else at the end of the latency budget"""
+        loop = asyncio.get_running_loop()
+        delay = self._lastChunkSent + self.coalesceSeconds - loop.time()
+        if delay > 0 and len(self._pendingChunk['events']) < self.coalesceMaxEvents:
+            await asyncio.sleep(delay)
+        while self._pendingChunk is not None:
+            chunk, self._pendingChunk = self._pendingChunk, None
+            if self.shouldDiscardChunk(chunk.get('playbackRequestId')):
+                continue
+            try:
+                await self._writeChunk(chunk)  # Chunks arriving meanwhile merge into the next one
+            except Exception as e:
+                # No caller to raise to: close, so the handler's receive loop ends and cleans up
+                self.log.error(f"[Conn {self.connId}] Chunk send failed, closing connection: {e}")
+                self._pendingChunk = None
+                await self.ws.close()
+                return
+            self._lastChunkSent = loop.time()
+    
+    async def _writeChunk(self, chunk: Dict[str, Any]):
+        """Write one chunk frame in the negotiated framing (counted once written)"""
+        if self.ws.closed:
+            return
+        if self.framing == FRAMING_COLUMNAR:
+            await self.ws.send_bytes(encodeChunk(chunk))
+        else:
+            await self.ws.send_json(chunk)
+        WS_CHUNKS_FORWARDED_TOTAL.inc(framing=self.framing)
+    
+    def close(self):
+        """Drop pending chunks (connection closing)"""
+        self._pendingChunk = None
+        if self._flushTask is not None:
+            self._flushTask.cancel()
+    
     async def sendError(self, error: str, requestId: Optional[str] = None):
         """Send error message to client"""
         await self.sendMessage({
@@ -122,6 +222,16 @@ class NovaServer:
         # Run store (Phase 11: per-user runs/replays)
         self.runStore = RunStore()
         
+        # Metrics (Server registry + Core snapshot over IPC on /metrics)
+        self.metricsConfig = config.get('metrics', {})
+        self.metrics = getRegistry()
+        self.metrics.gauge('nova_ws_connections', 'Open UI WebSocket connections').setFunction(lambda: len(self.connections))
+        self._chunksDiscarded = self.metrics.counter('nova_ws_chunks_discarded_total', 'Stale stream chunks dropped by playbackRequestId fencing')
+        
+        # Diagnostics (admin-triggered profiling; files under diagnostics.dir)
+        self.profiler = Profiler.fromConfig('server', config.get('diagnostics', {}))
+        self.watchdog = LoopWatchdog.fromConfig('server', config.get('diagnostics', {}).get('watchdog', {}))
+        
         # aiohttp app
         self.app = web.Application()
         self._setupRoutes()
@@ -134,6 +244,8 @@ class NovaServer:
         self.app.router.add_get('/ws', self.handleWebSocket)
         self.app.router.add_get('/ws/streams/{path}', self.handleWsStream)
         self.app.router.add_get('/health', self.handleHealth)
+        if self.metricsConfig.get('enabled', True):
+            self.app.router.add_get('/metrics', self.handleMetrics)
         self.app.router.add_get('/config', self.handleConfig)
         
         # Auth endpoints (cookie-based)
@@ -150,6 +262,8 @@ class NovaServer:
         self.app.router.add_post('/api/admin/users/{userId}/role', self.handleSetUserRole)
         self.app.router.add_post('/api/admin/users/{userId}/reset-password', self.handleResetPassword)
         self.app.router.add_delete('/api/admin/users/{userId}', self.handleDeleteUser)
+        self.app.router.add_post('/api/admin/profile', self.handleProfile)
+        self.app.router.add_get('/api/admin/stalls', self.handleListStalls)
         
         # Stream API endpoints
         self.app.router.add_get('/api/streams', self.handleListStreams)
@@ -205,6 +319,9 @@ class NovaServer:
         # Start IPC client
         await self.ipcClient.start()
         
+        if self.watchdog:
+            self.watchdog.start()
+        
         # Start enabled streams from persistence
         await self._startPersistedStreams()
         
@@ -248,6 +365,9 @@ class NovaServer:
         # Stop IPC client
         await self.ipcClient.stop()
         
+        if self.watchdog:
+            await self.watchdog.stop()
+        
         # Stop aiohttp
         if self._site:
             await self._site.stop()
@@ -264,6 +384,26 @@ class NovaServer:
         """Health check endpoint"""
         return web.json_response({'status': 'ok'})
     
+    async def handleMetrics(self, request: web.Request) -> web.Response:
+        """
+        Prometheus text exposition of Server and Core metrics.
+        
+        Requires metrics.bearerToken (scrapers) or an admin cookie, unless metrics.public is set.
+        """
+        bearerToken = self.metricsConfig.get('bearerToken')
+        tokenValid = bool(bearerToken) and request.headers.get('Authorization') == f"Bearer {bearerToken}"
+        if not self.metricsConfig.get('public', False) and not tokenValid and not self._checkAdminAuth(request):
+            return web.Response(status=401, text='Unauthorized\n')
+        
+        snapshots = [({'process': 'server'}, self.metrics.snapshot())]
+        try:
+            snapshots.append(({'process': 'core'}, await self.ipcClient.getMetrics()))
+        except asyncio.TimeoutError:
+            self.log.warning("[Server] Core metrics request timed out")
+        
+        return web.Response(text=renderPrometheus(snapshots), content_type='text/plain', charset='utf-8',
+                            headers={'X-Prometheus-Exposition-Format': '0.0.4'})
+    
     async def handleConfig(self, request: web.Request) -> web.Response:
         """UI configuration endpoint"""
         nodeMode = self.config.get('mode', 'payload')
@@ -421,6 +561,72 @@ class NovaServer:
             return None
         return payload
     
+    async def handleProfile(self, request: web.Request) -> web.Response:
+        """
+        Run a time-boxed profiling session (admin only).
+        
+        Body: {durationSeconds, sampleIntervalMs, slowCallbackMs, target: 'server'|'core'|'all'}
+        Responds when the session ends with per-process summaries; collapsed stacks and
+        summaries are written to the diagnostics directory of each process.
+        """
+        if not self._checkAdminAuth(request):
+            return web.json_response({'error': 'Admin access required'}, status=403)
+        
+        try:
+            data = await request.json() if request.can_read_body else {}
+            durationSeconds = min(float(data.get('durationSeconds', 10.0)), self.profiler.maxDurationSeconds)
+            sampleIntervalMs = float(data.get('sampleIntervalMs', 5.0))
+            slowCallbackMs = float(data.get('slowCallbackMs', 100.0))
+        except (ValueError, TypeError) as e:
+            return web.json_response({'error': f'Invalid profile request: {e}'}, status=400)
+        target = data.get('target', 'all')
+        if target not in ('server', 'core', 'all'):
+            return web.json_response({'error': "target must be 'server', 'core' or 'all'"}, status=400)
+        if durationSeconds <= 0 or sampleIntervalMs <= 0:
+            return web.json_response({'error': 'durationSeconds and sampleIntervalMs must be positive'}, status=400)
+        if self.profiler.active:
+            return web.json_response({'error': 'Profiling session already running'}, status=409)
+        
+        sessionId = time.strftime('%Y%m%dT%H%M%SZ', time.gmtime())
+        options = dict(durationSeconds=durationSeconds, sampleIntervalMs=sampleIntervalMs,
+                       slowCallbackMs=slowCallbackMs, sessionId=sessionId)
+        tasks = {}
+        if target in ('server', 'all'):
+            tasks['server'] = asyncio.create_task(self.profiler.profile(**options))
+        if target in ('core', 'all'):
+            tasks['core'] = asyncio.create_task(self.ipcClient.profile(**options))
+        
+        profiles, errors = {}, {}
+        for name, task in tasks.items():
+            try:
+                result = await task
+            except (ProfilerBusy, asyncio.TimeoutError) as e:
+                errors[name] = str(e) or 'Timed out'
+                continue
+            if name == 'core':
+                if result.get('type') != 'profile':
+                    errors[name] = result.get('error', 'Profile failed')
+                    continue
+                result = result['profile']
+            profiles[name] = result
+        
+        self.log.info(f"[Server] Profile session {sessionId} ({target}) complete")
+        return web.json_response({'sessionId': sessionId, 'profiles': profiles, 'errors': errors},
+                                 status=200 if profiles else 500)
+    
+    async def handleListStalls(self, request: web.Request) -> web.Response:
+        """Event loop stalls recorded by the Server and Core watchdogs (admin only)"""
+        if not self._checkAdminAuth(request):
+            return web.json_response({'error': 'Admin access required'}, status=403)
+        
+        result = {'server': {'enabled': self.watchdog is not None,
+                             'stalls': self.watchdog.stalls() if self.watchdog else []}}
+        try:
+            result['core'] = await self.ipcClient.getStalls()
+        except asyncio.TimeoutError:
+            result['core'] = {'error': 'Core did not respond'}
+        return web.json_response(result)
+    
     async def handleListUsers(self, request: web.Request) -> web.Response:
         """List all users (admin only)"""
         if not self._checkAdminAuth(request):
@@ -899,14 +1105,24 @@ class NovaServer:
         
         Auth is via httpOnly cookie (same-origin, set during login).
         Cookie is automatically sent by browser on WebSocket upgrade request.
+        Stream chunk framing: ?framing=columnar requests binary chunks (confirmed in authResponse).
         """
         connId = str(uuid.uuid4())
-        self.log.info(f"[Server] WebSocket connection: {connId} from {request.remote}")
+        framing = request.query.get('framing', FRAMING_JSON)
+        if framing not in FRAMINGS or not self.config.get('binaryFraming', True):
+            framing = FRAMING_JSON
+        self.log.info(f"[Server] WebSocket connection: {connId} from {request.remote}, framing={framing}")
         
-        ws = web.WebSocketResponse()
+        wsConfig = self.config.get('websocket', {})
+        ws = web.WebSocketResponse(compress=wsConfig.get('compress', True))
         await ws.prepare(request)
+        level = wsConfig.get('compressionLevel')
+        if level is not None and ws.compress and not applyCompressionLevel(ws, level):
+            self.log.warning(f"[Server] WebSocket compressionLevel={level} not supported by this aiohttp, using its default level")
         
-        conn = ClientConnection(connId, ws)
+        conn = ClientConnection(connId, ws, framing=framing,
+                                coalesceSeconds=wsConfig.get('coalesceMs', 0) / 1000,
+                                coalesceMaxEvents=wsConfig.get('coalesceMaxEvents', 5000))
         self.connections[connId] = conn
         
         # Authenticate via httpOnly cookie (same-origin)
@@ -932,7 +1148,8 @@ class NovaServer:
             'connId': connId,
             'username': username,
             'userId': userId,
-            'role': role
+            'role': role,
+            'framing': framing
         })
         
         try:
@@ -985,6 +1202,8 @@ class NovaServer:
                 await self._handleExport(conn, message)
             elif msgType == 'listExports':
                 await self._handleListExports(conn, message)
+            elif msgType == 'queryOverview':
+                await self._handleQueryOverview(conn, message)
             else:
                 await conn.sendError(f"Unknown message type: {msgType}")
         
@@ -1017,6 +1236,29 @@ class NovaServer:
             self.log.error(f"[Server] Query error: {e}", exc_info=True)
             await conn.sendError(str(e))
     
+    async def _handleQueryOverview(self, conn: ClientConnection, message: Dict[str, Any]):
+        """Handle queryOverview request (timeline scrub bar summaries)"""
+        try:
+            response = await self.ipcClient.queryOverview(
+                clientConnId=conn.connId,
+                startTime=message['startTime'],
+                stopTime=message['stopTime'],
+                timebase=message.get('timebase', 'canonical'),
+                filters=message.get('filters'),
+                maxBuckets=message.get('maxBuckets'),
+                tier=message.get('tier')
+            )
+            
+            if 'error' in response:
+                await conn.sendError(response['error'])
+                return
+            response['type'] = 'overviewResponse'
+            await conn.sendMessage(response)
+        
+        except Exception as e:
+            self.log.error(f"[Server] Overview query error: {e}", exc_info=True)
+            await conn.sendError(str(e))
+    
     async def _handleStartStream(self, conn: ClientConnection, message: Dict[str, Any]):
         """Handle startStream request"""
         try:
@@ -1027,6 +1269,7 @@ class NovaServer:
             timelineMode = TimelineMode(message.get('timelineMode', 'live'))
             timebase = message.get('timebase', 'canonical')
             filters = message.get('filters')
+            unpaced = bool(message.get('unpaced', False))
             
             conn.setActiveStream(playbackRequestId)
             
@@ -1036,9 +1279,10 @@ class NovaServer:
             async def chunkHandler(chunk: Dict[str, Any]):
                 chunkPlaybackId = chunk.get('playbackRequestId')
                 if conn.shouldDiscardChunk(chunkPlaybackId):
+                    self._chunksDiscarded.inc()
                     return
                 chunk['type'] = 'streamChunk'
-                await conn.sendMessage(chunk)
+                await conn.sendChunk(chunk)
             
             await self.ipcClient.startStream(
                 clientConnId=conn.connId,
@@ -1049,7 +1293,8 @@ class NovaServer:
                 timelineMode=timelineMode,
                 timebase=timebase,
                 filters=filters,
-                chunkHandler=chunkHandler
+                chunkHandler=chunkHandler,
+                unpaced=unpaced
             )
             
             await conn.sendMessage({
@@ -1276,6 +1521,7 @@ class NovaServer:
         conn = self.connections.pop(connId, None)
         if not conn:
             return
+        conn.close()
         
         # Cancel any active stream
         if conn.activePlaybackId:
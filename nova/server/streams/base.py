@@ -17,9 +17,17 @@ from typing import Dict, Any, Optional, Callable, Awaitable, List
 from dataclasses import dataclass
 
 from nova.server.streamStore import StreamDefinition
+from nova.core.metrics import getRegistry
 from sdk.logging import getLogger
 
 
+_metrics = getRegistry()
+OUTPUT_MESSAGES_TOTAL = _metrics.counter('nova_output_stream_messages_total', 'Formatted messages distributed by output streams', ('streamId',))
+OUTPUT_BYTES_TOTAL = _metrics.counter('nova_output_stream_bytes_total', 'Bytes distributed by output streams (before per-client fan-out)', ('streamId',))
+OUTPUT_DROPPED_TOTAL = _metrics.counter('nova_output_stream_dropped_clients_total', 'Output stream clients dropped after a failed write', ('streamId',))
+OUTPUT_CONNECTIONS = _metrics.gauge('nova_output_stream_connections', 'Connected output stream clients', ('streamId',))
+
+
 @dataclass
 class StreamBinding:
     """
@@ -105,6 +113,8 @@ class BaseStreamServer(ABC):
         # Data streaming task
         self._streamTask: Optional[asyncio.Task] = None
         self._running = False
+        
+        OUTPUT_CONNECTIONS.setFunction(lambda: len(self._connections), streamId=definition.streamId)
     
     @abstractmethod
     def _getProtocolName(self) -> str:
@@ -168,6 +178,8 @@ class BaseStreamServer(ABC):
                     self.log.debug(f"{self._logPrefix()} Event #{eventCount}: {len(output)} bytes, conns={len(self._connections)}")
                 
                 await self._distributeToClients(output)
+                OUTPUT_MESSAGES_TOTAL.inc(streamId=self.definition.streamId)
+                OUTPUT_BYTES_TOTAL.inc(len(output), streamId=self.definition.streamId)
                 
                 # Track throughput - log every 30 seconds
                 eventCount += 1
@@ -228,6 +240,7 @@ class BaseStreamServer(ABC):
                 disconnected.append(connId)
         
         for connId in disconnected:
+            OUTPUT_DROPPED_TOTAL.inc(streamId=self.definition.streamId)
             conn = self._connections.pop(connId, None)
             if conn:
                 await conn.close()
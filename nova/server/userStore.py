@@ -8,10 +8,15 @@ Phase 9 Complete:
 - tokenVersion for JWT revocation (increments on password reset/revoke)
 - Password reset functionality
 
+Lookups by userId and username are dict lookups (username index kept alongside
+_users). Saves are atomic (temp file + rename) and incremental: each user's JSON
+fragment is cached and only changed users are re-serialized.
+
 Property of Uncompromising Sensors LLC.
 """
 
 import json
+import os
 import uuid
 import bcrypt
 from pathlib import Path
@@ -43,6 +48,8 @@ class UserStore:
         self.filePath = Path(filePath)
         self.log = getLogger()
         self._users: Dict[str, Dict[str, Any]] = {}
+        self._byUsername: Dict[str, str] = {}    # username -> userId
+        self._fragments: Dict[str, str] = {}     # userId -> serialized record (users.json layout)
         self._load()
     
     def _load(self):
@@ -66,20 +73,53 @@ class UserStore:
         else:
             self.log.info("[UserStore] No users file, starting empty")
             self._users = {}
+        self._byUsername = {u['username']: userId for userId, u in self._users.items()}
+        self._fragments = {}
+    
+    @staticmethod
+    def _serialize(user: Dict[str, Any]) -> str:
+        """One user record as it appears in json.dump({'users': [...]}, indent=2)"""
+        return '\n'.join('    ' + line for line in json.dumps(user, indent=2).split('\n'))
     
-    def _save(self):
-        """Save users to JSON file"""
+    def _save(self, changedUserId: Optional[str] = None):
+        """
+        Atomically save users to JSON file.
+        
+        Only changedUserId is re-serialized (all users when None); the rest reuse
+        their cached fragments.
+        """
+        if changedUserId is None:
+            self._fragments = {}
+        else:
+            self._fragments.pop(changedUserId, None)
+        
+        fragments = []
+        for userId, user in self._users.items():
+            fragment = self._fragments.get(userId)
+            if fragment is None:
+                fragment = self._fragments[userId] = self._serialize(user)
+            fragments.append(fragment)
+        for userId in self._fragments.keys() - self._users.keys():
+            del self._fragments[userId]
+        
+        text = '{\n  "users": [\n' + ',\n'.join(fragments) + '\n  ]\n}' if fragments else '{\n  "users": []\n}'
         self.filePath.parent.mkdir(parents=True, exist_ok=True)
-        data = {'users': list(self._users.values())}
-        with open(self.filePath, 'w') as f:
-            json.dump(data, f, indent=2)
+        tmpPath = self.filePath.with_name(f'{self.filePath.name}.tmp')
+        try:
+            with open(tmpPath, 'w') as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmpPath, self.filePath)
+        except OSError:
+            self._fragments = {}
+            tmpPath.unlink(missing_ok=True)
+            raise
     
     def getByUsername(self, username: str) -> Optional[Dict[str, Any]]:
         """Get user by username"""
-        for user in self._users.values():
-            if user['username'] == username:
-                return user
-        return None
+        userId = self._byUsername.get(username)
+        return self._users.get(userId) if userId else None
     
     def getById(self, userId: str) -> Optional[Dict[str, Any]]:
         """Get user by ID"""
@@ -121,7 +161,8 @@ class UserStore:
         }
         
         self._users[userId] = user
-        self._save()
+        self._byUsername[username] = userId
+        self._save(userId)
         
         self.log.info(f"[UserStore] Created user: {username}, role={role}, status={status}")
         
@@ -150,7 +191,7 @@ class UserStore:
         
         user['status'] = status
         user['updatedAt'] = datetime.now(timezone.utc).isoformat()
-        self._save()
+        self._save(userId)
         
         self.log.info(f"[UserStore] Updated user {user['username']} status to {status}")
         return self._sanitize(user)
@@ -166,7 +207,7 @@ class UserStore:
         if role == 'admin' and 'ALL' not in user.get('allowedScopes', []):
             user['allowedScopes'] = ['ALL']
         user['updatedAt'] = datetime.now(timezone.utc).isoformat()
-        self._save()
+        self._save(userId)
         
         self.log.info(f"[UserStore] Updated user {user['username']} role to {role}")
         return self._sanitize(user)
@@ -179,7 +220,7 @@ class UserStore:
         
         user['allowedScopes'] = scopes
         user['updatedAt'] = datetime.now(timezone.utc).isoformat()
-        self._save()
+        self._save(userId)
         
         self.log.info(f"[UserStore] Updated user {user['username']} scopes to {scopes}")
         return self._sanitize(user)
@@ -202,7 +243,7 @@ class UserStore:
         user['tokenVersion'] = user.get('tokenVersion', 0) + 1
         user['updatedAt'] = datetime.now(timezone.utc).isoformat()
         
-        self._save()
+        self._save(userId)
         
         self.log.info(f"[UserStore] Reset password for {user['username']}, tokenVersion={user['tokenVersion']}")
         return self._sanitize(user)
@@ -219,7 +260,7 @@ class UserStore:
         
         user['tokenVersion'] = user.get('tokenVersion', 0) + 1
         user['updatedAt'] = datetime.now(timezone.utc).isoformat()
-        self._save()
+        self._save(userId)
         
         self.log.info(f"[UserStore] Revoked tokens for {user['username']}, tokenVersion={user['tokenVersion']}")
         return self._sanitize(user)
@@ -229,7 +270,8 @@ class UserStore:
         if userId in self._users:
             username = self._users[userId]['username']
             del self._users[userId]
-            self._save()
+            self._byUsername.pop(username, None)
+            self._save(userId)
             self.log.info(f"[UserStore] Deleted user: {username}")
             return True
         return False
@@ -15,6 +15,11 @@
  * - No token in query params or messages
  * - Cookie is sent automatically on WebSocket upgrade (same-origin)
  * - Server reads cookie and validates JWT
+ *
+ * Stream chunk framing (nova/server/framing.py):
+ * - Connects with ?framing=columnar; server confirms in authResponse.framing
+ * - Binary frames are streamChunk messages: string-table columns + keyless rows
+ * - All other messages remain JSON text frames
  */
 
 const wsState = {
@@ -22,9 +27,67 @@ const wsState = {
     connected: false,
     connId: null,
     reconnecting: false,
-    reconnectTimer: null
+    reconnectTimer: null,
+    framing: 'json'
 };
 
+const COLUMNAR_MAGIC = 0x3143564E;  // 'NVC1' little-endian
+const columnarText = new TextDecoder();
+
+/**
+ * Decode a columnar binary stream chunk frame into the streamChunk message
+ * Layout documented in nova/server/framing.py
+ */
+function decodeColumnarChunk(buffer) {
+    const view = new DataView(buffer);
+    if (view.getUint32(0, true) !== COLUMNAR_MAGIC) {
+        throw new Error('Not a columnar chunk frame');
+    }
+    const metaLength = view.getUint32(4, true);
+    const meta = JSON.parse(columnarText.decode(new Uint8Array(buffer, 8, metaLength)));
+    const { count, strings, columns, shapes, wide } = meta;
+    delete meta.count; delete meta.strings; delete meta.columns; delete meta.shapes; delete meta.wide;
+    
+    let offset = 8 + metaLength;
+    offset += (4 - offset % 4) % 4;
+    const absent = wide ? 0xFFFFFFFF : 0xFFFF;
+    const columnData = columns.map(() => {
+        const indices = wide ? new Uint32Array(buffer, offset, count) : new Uint16Array(buffer, offset, count);
+        offset += count * (wide ? 4 : 2);
+        return indices;
+    });
+    offset += (4 - offset % 4) % 4;
+    
+    const restLength = view.getUint32(offset, true);
+    const rows = JSON.parse(columnarText.decode(new Uint8Array(buffer, offset + 4, restLength)));
+    const events = new Array(rows.length);
+    for (let i = 0; i < rows.length; i++) {
+        const row = rows[i];
+        const event = {};
+        let position = 1;
+        for (const entry of shapes[row[0]]) {
+            if (typeof entry === 'string') {
+                event[entry] = row[position++];
+            } else {
+                const nested = {};
+                for (const subkey of entry[1]) {
+                    nested[subkey] = row[position++];
+                }
+                event[entry[0]] = nested;
+            }
+        }
+        for (let c = 0; c < columns.length; c++) {
+            const index = columnData[c][i];
+            if (index !== absent) {
+                event[columns[c]] = strings[index];
+            }
+        }
+        events[i] = event;
+    }
+    meta.events = events;
+    return meta;
+}
+
 function initWebSocket() {
     // Connect triggered by init.js after auth check
 }
@@ -34,12 +97,13 @@ function connectWebSocket() {
     const host = window.location.host;
     
     // Cookie is sent automatically on same-origin WebSocket connection
-    const wsUrl = `${protocol}//${host}/ws`;
+    const wsUrl = `${protocol}//${host}/ws?framing=columnar`;
     
     console.log('[WS] Connecting to:', wsUrl);
     
     try {
         wsState.ws = new WebSocket(wsUrl);
+        wsState.ws.binaryType = 'arraybuffer';
         
         wsState.ws.onopen = () => {
             updateConnectionStatus(true);
@@ -50,7 +114,9 @@ function connectWebSocket() {
         
         wsState.ws.onmessage = (event) => {
             try {
-                const msg = JSON.parse(event.data);
+                const msg = typeof event.data === 'string'
+                    ? JSON.parse(event.data)
+                    : decodeColumnarChunk(event.data);
                 handleMessage(msg);
             } catch (e) {
                 console.error('[WS] Parse error:', e);
@@ -186,8 +252,9 @@ function handleAuthResponse(msg) {
     if (msg.success) {
         wsState.connected = true;
         wsState.connId = msg.connId;
+        wsState.framing = msg.framing || 'json';
         updateStatus(`Authenticated as ${msg.username}`, 'success');
-        console.log('[WS] Authenticated, connId:', msg.connId);
+        console.log('[WS] Authenticated, connId:', msg.connId, 'framing:', wsState.framing);
     } else {
         updateStatus(`Auth failed: ${msg.error}`, 'error');
         disconnectWebSocket();
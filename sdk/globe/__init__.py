@@ -5,15 +5,17 @@ Public API:
     - Globe: Main geodetic and orbital calculations class
     - KeplerianOrbit: Keplerian orbital elements dataclass
     - EcefOrbit: ECEF orbital state dataclass
+    - GeoidGrid: Gridded geoid model with bilinear interpolation (memory-mapped binary cache)
     - MapVisualization: Real-time 3D map visualization (optional, from visualization submodule)
 """
 
 from .globe import Globe, KeplerianOrbit, EcefOrbit
+from .geoid import GeoidGrid
 
 # Import MapVisualization if visualization module is available (currently commented out)
 try:
     from .visualization.visualization import MapVisualization
-    __all__ = ['Globe', 'KeplerianOrbit', 'EcefOrbit', 'MapVisualization']
+    __all__ = ['Globe', 'KeplerianOrbit', 'EcefOrbit', 'GeoidGrid', 'MapVisualization']
 except (ImportError, AttributeError):
     # MapVisualization not available (implementation is commented out)
-    __all__ = ['Globe', 'KeplerianOrbit', 'EcefOrbit']
+    __all__ = ['Globe', 'KeplerianOrbit', 'EcefOrbit', 'GeoidGrid']
@@ -0,0 +1,202 @@
+# Imports
+import hashlib, json, math, os
+import numpy as np
+
+# Local imports
+from sdk.logging import getLogger
+
+_scalarTypes = (int, float, np.integer, np.floating)
+
+
+class GeoidGrid:
+    """Regular latitude/longitude grid of geoid undulations (meters) with bilinear interpolation.
+    The grid is built once from the geoid CSV (Latitude, Longitude, GeoidHeight columns) and cached
+    in the user cache directory as a compact float32 .npy file that is memory-mapped on subsequent loads."""
+
+    cacheVersion = 2
+    maxAbsHeight = 200.0                                      # Geoid undulation never exceeds ~110 m; larger cached values mean corruption
+    _loaded = {}                                              # Process-wide cache {csvPath: GeoidGrid}
+
+    def __init__(self, heights, lat0, dLat, lon0, dLon):
+        """Class constructor for GeoidGrid. heights is a (nLat, nLon) array indexed by lat0 + i*dLat, lon0 + j*dLon."""
+        self.heights = heights
+        self._item = np.asarray(heights).item                 # Plain ndarray view (still memory-mapped) for fast scalar reads
+        self.lat0 = float(lat0)
+        self.dLat = float(dLat)
+        self.lon0 = float(lon0)
+        self.dLon = float(dLon)
+        self.nLat, self.nLon = heights.shape
+        self.wrapsLon = abs(self.nLon * self.dLon - 360.0) < abs(self.dLon) / 2   # Grid covers the full circle of longitude
+
+
+    @classmethod
+    def load(cls, csvPath, cacheDir=None):
+        """Returns the GeoidGrid for csvPath, shared per process. Uses the binary cache in cacheDir (default: defaultCacheDir())
+        if it matches the CSV and passes validation, otherwise rebuilds it."""
+        csvPath = os.path.realpath(csvPath)
+        grid = cls._loaded.get(csvPath)
+        if grid is None:
+            cacheDir = cacheDir or cls.defaultCacheDir()
+            grid = cls._loadCache(csvPath, cacheDir)
+            if grid is None:
+                grid = cls.fromCsv(csvPath)
+                grid._writeCache(csvPath, cacheDir)
+            cls._loaded[csvPath] = grid
+        return grid
+
+
+    @staticmethod
+    def defaultCacheDir():
+        """Returns the geoid cache directory: $XDG_CACHE_HOME/sdk/globe (~/.cache/sdk/globe), outside the source tree."""
+        cacheHome = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        return os.path.join(cacheHome, 'sdk', 'globe')
+
+
+    @classmethod
+    def fromCsv(cls, csvPath):
+        """Builds a regular grid from a geoid CSV. Missing grid cells are filled with the nearest available sample."""
+        with open(csvPath, 'r') as f:
+            header = [name.strip() for name in f.readline().split(',')]
+        columns = [header.index(name) for name in ('Latitude', 'Longitude', 'GeoidHeight')]
+        lats, lons, heights = np.loadtxt(csvPath, delimiter=',', skiprows=1, usecols=columns, unpack=True)
+        lat0, dLat, latIdx = cls._regularAxis(lats)
+        lon0, dLon, lonIdx = cls._regularAxis(lons)
+        grid = np.full((latIdx.max() + 1, lonIdx.max() + 1), np.nan, dtype=np.float32)
+        grid[latIdx, lonIdx] = heights
+
+        # Fill holes from the nearest sample so interpolation never sees NaN
+        missing = np.argwhere(np.isnan(grid))
+        if len(missing):
+            for i, j in missing:
+                nearest = np.argmin((latIdx - i)**2 + (lonIdx - j)**2)
+                grid[i, j] = heights[nearest]
+        return cls(grid, lat0, dLat, lon0, dLon)
+
+
+    @staticmethod
+    def _regularAxis(values):
+        """Returns (origin, step, index per value) for coordinates sampled on a regular (possibly rounded) spacing."""
+        unique = np.unique(values)
+        step = np.median(np.diff(unique)) if len(unique) > 1 else 1.0
+        origin = unique[0]
+        return origin, step, np.rint((values - origin) / step).astype(np.intp)
+
+
+    @staticmethod
+    def _cachePaths(csvPath, cacheDir):
+        """Returns (gridPath, metaPath) of the binary cache for csvPath (file name keyed by the CSV's real path)."""
+        name = os.path.splitext(os.path.basename(csvPath))[0]
+        key = hashlib.sha1(csvPath.encode('utf-8')).hexdigest()[:12]
+        base = os.path.join(cacheDir, f'{name}-{key}')
+        return base + '.grid.npy', base + '.grid.json'
+
+
+    @classmethod
+    def _loadCache(cls, csvPath, cacheDir):
+        """Returns a memory-mapped GeoidGrid from the binary cache, or None if it is missing, stale or fails validation."""
+        gridPath, metaPath = cls._cachePaths(csvPath, cacheDir)
+        try:
+            with open(metaPath, 'r') as f:
+                meta = json.load(f)
+            stat = os.stat(csvPath)
+            if meta.get('version') != cls.cacheVersion or meta.get('sourceSize') != stat.st_size or meta.get('sourceMtime') != stat.st_mtime:
+                return None
+            heights = np.load(gridPath, mmap_mode='r')
+        except (OSError, ValueError, KeyError):
+            return None
+        problem = cls._validateCache(heights, meta)
+        if problem:
+            getLogger().warning('Ignoring invalid geoid cache, rebuilding', path=gridPath, reason=problem)
+            return None
+        return cls(heights, meta['lat0'], meta['dLat'], meta['lon0'], meta['dLon'])
+
+
+    @classmethod
+    def _validateCache(cls, heights, meta):
+        """Returns why a cached grid is unusable, or None. Checks shape and axes against the metadata and the value range."""
+        try:
+            nLat, nLon = meta['nLat'], meta['nLon']
+            lat0, dLat, lon0, dLon = (float(meta[key]) for key in ('lat0', 'dLat', 'lon0', 'dLon'))
+        except (KeyError, TypeError, ValueError):
+            return 'incomplete metadata'
+        if heights.dtype != np.float32 or heights.shape != (nLat, nLon) or nLat < 1 or nLon < 1:
+            return f'shape {heights.shape} {heights.dtype}, expected ({nLat}, {nLon}) float32'
+        if not (dLat > 0 and dLon > 0 and -90.0 <= lat0 and lat0 + (nLat - 1) * dLat <= 90.0 + dLat / 2
+                and -360.0 <= lon0 and lon0 + (nLon - 1) * dLon <= 360.0 + dLon / 2):
+            return 'grid axes outside latitude/longitude bounds'
+        if not np.isfinite(heights).all() or np.abs(heights).max() > cls.maxAbsHeight:
+            return 'heights non-finite or out of range'
+        return None
+
+
+    def _writeCache(self, csvPath, cacheDir):
+        """Writes the binary cache for csvPath. Failure (e.g. read-only cache dir) only costs a rebuild on next start."""
+        gridPath, metaPath = self._cachePaths(csvPath, cacheDir)
+        suffix = f'.{os.getpid()}.tmp'
+        try:
+            os.makedirs(cacheDir, exist_ok=True)
+            stat = os.stat(csvPath)
+            with open(gridPath + suffix, 'wb') as f:
+                np.save(f, np.ascontiguousarray(self.heights, dtype=np.float32))
+            os.replace(gridPath + suffix, gridPath)
+            meta = dict(version=self.cacheVersion, sourceSize=stat.st_size, sourceMtime=stat.st_mtime, nLat=self.nLat, nLon=self.nLon,
+                        lat0=self.lat0, dLat=self.dLat, lon0=self.lon0, dLon=self.dLon)
+            with open(metaPath + suffix, 'w') as f:
+                json.dump(meta, f)
+            os.replace(metaPath + suffix, metaPath)           # Metadata last, so a partial write is never seen as valid
+        except OSError as e:
+            getLogger().warning('Could not write geoid cache, using in-memory grid', path=gridPath, error=str(e))
+            for path in (gridPath + suffix, metaPath + suffix):
+                if os.path.exists(path):
+                    os.remove(path)
+
+
+    def interpolate(self, lat, lon):
+        """Returns bilinearly interpolated geoid undulation (m) for lat/lon (deg). Accepts scalars or arrays (vectorized)."""
+        if isinstance(lat, _scalarTypes) and isinstance(lon, _scalarTypes):
+            return self._interpolateScalar(float(lat), float(lon))
+        lat = np.asarray(lat, dtype=np.float64)
+        lon = np.asarray(lon, dtype=np.float64)
+
+        # Fractional grid coordinates
+        y = np.clip((lat - self.lat0) / self.dLat, 0, self.nLat - 1)
+        if self.wrapsLon:
+            x = ((lon - self.lon0) % 360.0) / self.dLon
+        else:
+            span = (self.nLon - 1) * self.dLon                # Measure longitude from the grid centre so both edges clamp to the nearest side
+            x = np.clip((((lon - self.lon0 - span / 2 + 180.0) % 360.0) - 180.0 + span / 2) / self.dLon, 0, self.nLon - 1)
+
+        i0 = np.minimum(np.floor(y).astype(np.intp), self.nLat - 1)
+        j0 = np.minimum(np.floor(x).astype(np.intp), self.nLon - 1)
+        i1 = np.minimum(i0 + 1, self.nLat - 1)
+        j1 = (j0 + 1) % self.nLon if self.wrapsLon else np.minimum(j0 + 1, self.nLon - 1)
+        fy = y - i0
+        fx = x - j0
+
+        h = self.heights
+        top = h[i0, j0] * (1 - fx) + h[i0, j1] * fx
+        bottom = h[i1, j0] * (1 - fx) + h[i1, j1] * fx
+        return top * (1 - fy) + bottom * fy
+
+
+    def _interpolateScalar(self, lat, lon):
+        """Scalar bilinear interpolation in plain Python floats (avoids numpy call overhead for single position fixes)."""
+        nLat, nLon = self.nLat, self.nLon
+        y = min(max((lat - self.lat0) / self.dLat, 0.0), nLat - 1)
+        if self.wrapsLon:
+            x = ((lon - self.lon0) % 360.0) / self.dLon
+        else:
+            span = (nLon - 1) * self.dLon
+            x = min(max((((lon - self.lon0 - span / 2 + 180.0) % 360.0) - 180.0 + span / 2) / self.dLon, 0.0), nLon - 1)
+
+        i0 = min(int(math.floor(y)), nLat - 1)
+        j0 = min(int(math.floor(x)), nLon - 1)
+        i1 = min(i0 + 1, nLat - 1)
+        j1 = (j0 + 1) % nLon if self.wrapsLon else min(j0 + 1, nLon - 1)
+        fy = y - i0
+        fx = x - j0
+
+        item = self._item
+        top = item(i0, j0) * (1 - fx) + item(i0, j1) * fx
+        bottom = item(i1, j0) * (1 - fx) + item(i1, j1) * fx
+        return top * (1 - fy) + bottom * fy
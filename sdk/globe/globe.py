@@ -1,9 +1,9 @@
 # Imports
 import json, os, re
 import numpy as np
-import pandas as pd
 from datetime import datetime, timezone, timedelta
 from dataclasses import dataclass
+from .geoid import GeoidGrid
 
 
 @dataclass
@@ -45,9 +45,19 @@ class Globe:
         self.mu = 3.986005e14                                 # Earth's gravitational parameter (m³/s²)
         self.omegaEarth = 7.2921151467e-5                     # Earth's rotation rate (rad/s)
         
-        # Get geoid data
+        # Get geoid data (regular grid shared by all Globe instances, memory-mapped from the binary cache)
         self.cwd = os.path.dirname(os.path.realpath(__file__))
-        self.geoidData = pd.read_csv(os.path.join(self.cwd, 'geoidHeights.csv'))
+        self.geoidPath = os.path.join(self.cwd, 'geoidHeights.csv')
+        self.geoid = GeoidGrid.load(self.geoidPath)
+
+
+    @property
+    def geoidData(self):
+        """Raw geoid table as a pandas DataFrame (loaded on first access; lookups use the interpolated grid)."""
+        if not hasattr(self, '_geoidData'):
+            import pandas as pd
+            self._geoidData = pd.read_csv(self.geoidPath)
+        return self._geoidData
 
 
     def llaToEcef(self, lat, lon, alt):
@@ -96,11 +106,19 @@ class Globe:
     
 
     def getGeoidSeperation(self, lat, lon):
-        """Returns the ellipsoidal geoid seperation (HAE to MSL variable in meters) of a given latitude and longitude (deg)."""     
-        nearestLatIndex = (np.abs(self.geoidData['Latitude'] - lat)).idxmin()
-        nearestLatSlice = self.geoidData[self.geoidData['Latitude'] == self.geoidData['Latitude'][nearestLatIndex]]
-        nearestLonIndex = (np.abs(nearestLatSlice['Longitude'] - lon)).idxmin()
-        return nearestLatSlice['GeoidHeight'][nearestLonIndex]
+        """Returns the ellipsoidal geoid seperation (HAE to MSL variable in meters) of a given latitude and longitude (deg).
+        Bilinearly interpolated; lat/lon may also be arrays, returning an array of seperations."""
+        return self.geoid.interpolate(lat, lon)
+
+
+    def getGeoidSeperations(self, lats, lons):
+        """Vectorized geoid seperation (m) for arrays of latitudes and longitudes (deg). Returns a numpy array."""
+        return np.atleast_1d(self.geoid.interpolate(lats, lons))
+
+
+    def haeToMsl(self, lat, lon, hae):
+        """Converts ellipsoidal height (HAE-m) to orthometric height (MSL-m) at lat/lon (deg). Accepts scalars or arrays."""
+        return np.subtract(hae, self.geoid.interpolate(lat, lon))
     
 
     def getDistanceHeadingPoint(self, lat, lon, distance, azimuth):
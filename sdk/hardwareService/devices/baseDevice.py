@@ -52,6 +52,7 @@ REQUIRED METHODS (all abstract):
 PROVIDED METHODS (concrete):
 ============================
 - async emit(dataType, ts, data) : Publish data to transport
+- async parseAll(protocol, parser, bytesBin) : Parse buffer (on HardwareService's parse pool if configured)
 - async attachPort(port)         : Claim additional port (optional override)
 
 Property of Uncompromising Sensors LLC.
@@ -76,6 +77,7 @@ class BaseDevice(ABC):
         self.ports = []
         self.lastSeen = time.time()
         self._rawSequence = 0  # Track raw frame sequence for NOVA
+        self.parsePool = None  # Set by HardwareService when a parse pool is configured
     
 
     @abstractmethod
@@ -112,6 +114,17 @@ class BaseDevice(ABC):
             await self.transport.publish(subject, data)
     
 
+    async def parseAll(self, protocol: str, parser, bytesBin: bytes):
+        """Return parser.parseAll(bytesBin): (remaining bytes, messages)
+        
+        Runs on HardwareService's parse pool when configured (protocol names the
+        worker-side parser: 'ubx', 'sbf', 'nmea'), inline otherwise.
+        """
+        if self.parsePool:
+            return await self.parsePool.parseAll(protocol, parser, bytesBin)
+        return parser.parseAll(bytesBin)
+    
+
     async def softwareReset(self):
         """Send software reset command to device before restart (optional override)
         
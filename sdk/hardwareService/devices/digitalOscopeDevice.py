@@ -19,6 +19,9 @@ from sdk.logging import getLogger
 from .baseDevice import BaseDevice
 
 
+MAX_CHANNELS = 16  # Digital lines per 16-bit sample
+
+
 # Class
 class DigitalOscopeDevice(BaseDevice):
     
@@ -115,6 +118,9 @@ class DigitalOscopeDevice(BaseDevice):
                 if result and 'lag' in result and result['lag'] is not None:
                     ts = datetime.now(timezone.utc).timestamp()
                     summary = {'lag': result['lag'], 'ts': ts, 'deviceId': self.deviceId}
+                    if 'channels' in result:
+                        summary['channels'] = {channel: {key: stats[key] for key in ('risingCount', 'fallingCount', 'duty', 'frequencyHz')}
+                                               for channel, stats in result['channels'].items()}
                     await self.emit('samples', ts, json.dumps(summary).encode('utf-8'))
             except (OSError, AttributeError, Exception) as e:
                 # Device unplugged or hardware error - propagate to trigger cleanup
@@ -169,16 +175,9 @@ class DigitalOscopeDevice(BaseDevice):
                 dwf.FDwfDigitalInConfigure(hdwf, ctypes.c_bool(False), ctypes.c_bool(True))
                 return {}
                 
-            # Convert to numpy array
-            buffer = np.array(buffer)
-
-            # Process data - find first rising edge for each channel
-            indexes = {}
-            for channel in range(0, 15):
-                channelBuffer = (buffer & (1 << channel)) >> channel
-                risingEdge = np.flatnonzero(channelBuffer > 0.5)
-                if len(risingEdge) > 0:
-                    indexes[channel] = risingEdge[0]
+            # Extract edges and statistics for all channels in one vectorized pass
+            channels = analyzeChannels(np.frombuffer(buffer, dtype=np.uint16), len(self.channels), self.sampleRate)
+            indexes = {channel: stats['firstHigh'] for channel, stats in channels.items() if stats['firstHigh'] is not None}
             
             # Calculate lag relative to trigger channel
             lag = {}
@@ -196,6 +195,72 @@ class DigitalOscopeDevice(BaseDevice):
             
             # Rearm the scope
             dwf.FDwfDigitalInConfigure(hdwf, ctypes.c_bool(False), ctypes.c_bool(True))
-            return {'lag': lag}
+            return {'lag': lag, 'channels': channels}
+
+        return await self.ioLayer.runInExecutor(_doCapture)
+
 
-        return await self.ioLayer.runInExecutor(_doCapture)
\ No newline at end of file
+def analyzeChannels(samples: np.ndarray, numChannels: int, sampleRate: float) -> dict:
+    """Extract per-channel edges and statistics from a 16-bit digital capture in one vectorized pass.
+    
+    Transitions are found by XOR of adjacent samples; only samples where any line changed are
+    bit-unpacked into a (changes, 16) matrix, and a single nonzero() locates every edge on every
+    channel. Edge indexes refer to the first sample after the transition.
+    
+    Returns {channel: {'firstHigh', 'risingEdgesNs', 'fallingEdgesNs', 'risingCount', 'fallingCount', 'duty', 'frequencyHz'}}
+    where firstHigh is the index of the first high sample (None if never high), edge times are ns from
+    buffer start, duty is the fraction of high samples and frequencyHz is from the mean rising-edge period
+    (None with fewer than two rising edges).
+    
+    Raises ValueError if numChannels is outside 1..16 (one bit per line of a 16-bit sample).
+    """
+    if not 1 <= numChannels <= MAX_CHANNELS:
+        raise ValueError(f"analyzeChannels supports 1-{MAX_CHANNELS} channels, got {numChannels}")
+    samples = np.ascontiguousarray(samples, dtype='<u2')
+    numSamples = len(samples)
+    nsPerSample = 1e9 / sampleRate
+    initial = (int(samples[0]) >> np.arange(numChannels)) & 1 if numSamples else np.zeros(numChannels, dtype=int)
+    
+    # XOR adjacent samples, unpack only the changed ones, then one nonzero() over (change, channel)
+    transitions = samples[1:] ^ samples[:-1]
+    changed = np.flatnonzero(transitions)
+    transitionBits = np.unpackbits(transitions[changed].view(np.uint8).reshape(-1, 2), axis=1, bitorder='little')[:, :numChannels]
+    changeRow, edgeChannel = np.nonzero(transitionBits)
+    edgeSample = changed[changeRow] + 1
+    rising = ((samples[edgeSample] >> edgeChannel.astype(np.uint16)) & 1).astype(bool)
+    
+    # Group edges by channel (stable sort keeps time order within a channel)
+    order = np.argsort(edgeChannel, kind='stable')
+    edgeSample, rising = edgeSample[order], rising[order]
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(edgeChannel, minlength=numChannels))))
+    
+    result = {}
+    for channel in range(numChannels):
+        chSamples = edgeSample[bounds[channel]:bounds[channel + 1]]
+        chRising = rising[bounds[channel]:bounds[channel + 1]]
+        risingIdx = chSamples[chRising]
+        fallingIdx = chSamples[~chRising]
+        
+        # Levels are constant between edges: high time is the sum of high segments
+        segmentBounds = np.concatenate(([0], chSamples, [numSamples]))
+        segmentLevels = np.concatenate(([initial[channel]], chRising))
+        highSamples = int(np.dot(np.diff(segmentBounds), segmentLevels))
+        
+        if initial[channel]:
+            firstHigh = 0
+        else:
+            firstHigh = int(risingIdx[0]) if len(risingIdx) else None
+        frequencyHz = None
+        if len(risingIdx) > 1:
+            frequencyHz = float(sampleRate * (len(risingIdx) - 1) / (risingIdx[-1] - risingIdx[0]))
+        
+        result[channel] = {
+            'firstHigh': firstHigh,
+            'risingEdgesNs': risingIdx * nsPerSample,
+            'fallingEdgesNs': fallingIdx * nsPerSample,
+            'risingCount': int(len(risingIdx)),
+            'fallingCount': int(len(fallingIdx)),
+            'duty': highSamples / numSamples if numSamples else 0.0,
+            'frequencyHz': frequencyHz,
+        }
+    return result
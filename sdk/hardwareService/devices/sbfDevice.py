@@ -157,7 +157,7 @@ class SBFDevice(BaseDevice):
                         self.parseBuffer = self.parseBuffer[-maxBufferSize:]
                     
                     # Parse SBF messages from buffer using parseAll (handles ACKs internally)
-                    self.parseBuffer, messages = self.sbf.parseAll(self.parseBuffer)
+                    self.parseBuffer, messages = await self.parseAll('sbf', self.sbf, self.parseBuffer)
                     
                     # Process each parsed message
                     for msgDict in messages:
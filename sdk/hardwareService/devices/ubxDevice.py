@@ -205,7 +205,7 @@ class UBXDevice(BaseDevice):
             
             # 3. Parse all UBX messages
             try:
-                self.parseBuffer, ubxMessages = self.ubxParser.parseAll(self.parseBuffer)
+                self.parseBuffer, ubxMessages = await self.parseAll('ubx', self.ubxParser, self.parseBuffer)
             except Exception as e:
                 self.log.error('UBX parser error', deviceId=self.deviceId, errorClass=type(e).__name__, errorMsg=str(e))
                 self.parseBuffer = b''
@@ -213,7 +213,7 @@ class UBXDevice(BaseDevice):
             
             # 4. Parse all NMEA messages (mixed protocols)
             try:
-                self.parseBuffer, nmeaMessages = self.nmeaParser.parseAll(self.parseBuffer)
+                self.parseBuffer, nmeaMessages = await self.parseAll('nmea', self.nmeaParser, self.parseBuffer)
             except Exception as e:
                 self.log.error('NMEA parser error', deviceId=self.deviceId, errorClass=type(e).__name__, errorMsg=str(e))
                 nmeaMessages = []
@@ -7,6 +7,7 @@ The HardwareService class acts as the central point for hardware orchestration,
 - Discovers devices by scanning available ports
 - Creates and tracks device instances
 - Manages per-device data flows and periodic rescans
+- Optionally offloads device protocol parsing to a worker pool (config "parsePool")
 - Coordinates configuration, logging, and device restarts
 - Provides a command interface for restarts, topology requests, configuration management, and other device operations
 
@@ -18,6 +19,7 @@ import asyncio, base64, importlib, json, os, serial.tools.list_ports, time
 from typing import Dict, List
 from datetime import datetime, timezone
 from .restartManager import restartUsb
+from .parsePool import ParsePool
 from sdk.logging import getLogger
 
 
@@ -50,6 +52,9 @@ class HardwareService:
         self.subjectBuilder = subjectBuilder
         self.novaAdapter = novaAdapter
 
+        # Optional parsing worker pool shared by all device read loops (None = parse on the event loop)
+        self.parsePool = ParsePool.fromConfig(config.get('parsePool'))
+
 
     def loadPlugins(self, hardwareConfig: dict, config: dict) -> None:
         """Register plugins based on hardwareConfig rules."""
@@ -196,6 +201,8 @@ class HardwareService:
         self.devices.clear()
         await self.transport.close()
         self.ioLayer.shutdown()
+        if self.parsePool:
+            self.parsePool.shutdown()
         self.log.info('HardwareService stopped', component='HardwareService', state='CLOSED')
 
 
@@ -355,6 +362,7 @@ class HardwareService:
             if not device:
                 self.log.error(f'ERROR: Failed to create device {deviceId}', component='HardwareService', deviceId=deviceId, kind=kind)
                 return
+            device.parsePool = self.parsePool
             
             # Open and handshake - catch serial errors
             try:
@@ -18,7 +18,7 @@ from sdk.hardware_config_loader import load_hardware_config
 from .hardwareService import HardwareService
 from .ioLayer import IoLayer
 from .novaAdapter import NovaAdapter
-from sdk.logging import getLogger
+from sdk.logging import getLogger, StartupTimer
 from datetime import datetime, timezone
 from .configManager import ConfigManager
 from .subjects import SubjectBuilder
@@ -29,6 +29,7 @@ class HardwareServiceApp:
                  hardwareConfigPath=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'hardware-config.json')):
         
         # Set attributes
+        self.startupTimer = StartupTimer('hardwareService')
         self.configPath = configPath 
         self.hardwareConfigPath = hardwareConfigPath
 
@@ -45,6 +46,7 @@ class HardwareServiceApp:
             # Convert Unix path to Windows
             transport_url = transport_url.replace('/tmp/', 'C:\\tmp\\')
         self.config['transport'] = transport_url
+        self.startupTimer.mark('config')
         
         # Create local transport (NNG IPC for local consumers like svs)
         self.transport = createTransport(self.config['transport'])
@@ -59,6 +61,7 @@ class HardwareServiceApp:
             self.novaTransport.setLogger(self.log)
             # NovaAdapter will get hardwareService reference after service is created
         
+        self.startupTimer.mark('transports')
         self.ioLayer = IoLayer()
         
         # Get container ID from config (defaults to hostname or 'unknown')
@@ -78,6 +81,7 @@ class HardwareServiceApp:
         
         # Load shared hardware config (with fallback + flush)
         self.hardwareConfig, self.hardwareConfigVersion, self.hardwareConfigFallback = self._loadHardwareConfig()
+        self.startupTimer.mark('service')
 
 
     def _loadConfig(self):
@@ -105,9 +109,13 @@ class HardwareServiceApp:
         if self.novaAdapter:
             await self.novaTransport.connect(self.config['novaTransport'])
             await self.novaAdapter.start()
+            self.startupTimer.mark('novaAdapter')
         
         self.service.loadPlugins(self.hardwareConfig, self.config)
+        self.startupTimer.mark('plugins')
         await self.service.start()
+        self.startupTimer.mark('start')
+        self.startupTimer.report(self.log)
         try:
             while True:
                 await asyncio.sleep(1)
@@ -43,7 +43,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from nova.core.subjects import formatNovaSubject, RouteKey
-from nova.core.canonical_json import canonicalJson, canonicalJsonBytes
+from nova.core.canonical_json import canonicalJson, canonicalJsonBytes, canonicalizeJson
 from nova.core.contract import Lane
 from sdk.logging import getLogger
 
@@ -55,6 +55,9 @@ def jsonNormalize(obj):
     Handles mixed-type dict keys (int/str) by converting to JSON and back.
     This ensures all keys are strings and canonicalJson can sort them.
     
+    Reference implementation: publish paths use canonicalizeJson (single pass,
+    byte-identical canonical output, also accepts numpy scalars).
+    
     Args:
         obj: Python object (dict, list, primitives)
         
@@ -92,6 +95,7 @@ class NovaAdapter:
         self._running = False
         self.hardwareService = hardwareService
         self.commandSubscription = None
+        self._publishTemplates = {}  # (lane, uniqueId, staticFields) -> (subject, eventId hash prefix, static envelope JSON)
         
         self.log.info('[NovaAdapter] Initialized', scopeId=self.scopeId, 
                      systemId=self.systemId, containerId=self.containerId)
@@ -133,6 +137,63 @@ class NovaAdapter:
         """Build entity identity key for eventId hash."""
         return f"{self.systemId}|{self.containerId}|{uniqueId}"
     
+    def _getPublishTemplate(self, lane: Lane, uniqueId: str, **staticFields) -> tuple:
+        """
+        Return cached per-entity publish parts for high-rate lanes.
+        
+        Everything except sourceTruthTime, eventId and the payload is constant for a
+        given (lane, uniqueId, messageType/view), so the subject, the SHA256 state after
+        the eventId prefix (eidV1 + scopeId + lane + entityIdentityKey) and the static
+        envelope fields are computed once and reused.
+        
+        Returns:
+            (subject, hashPrefix, staticJsonBytes)
+        """
+        key = (lane, uniqueId, tuple(staticFields.items()))
+        template = self._publishTemplates.get(key)
+        if template is None:
+            routeKey = RouteKey(
+                scopeId=self.scopeId,
+                lane=lane,
+                systemId=self.systemId,
+                containerId=self.containerId,
+                uniqueId=uniqueId,
+                schemaVersion=self.schemaVersion
+            )
+            subject = formatNovaSubject(routeKey)
+            
+            hashPrefix = hashlib.sha256()
+            hashPrefix.update(b"eidV1")
+            hashPrefix.update(self.scopeId.encode('utf-8'))
+            hashPrefix.update(lane.value.encode('utf-8'))
+            hashPrefix.update(self._buildEntityIdentityKey(uniqueId).encode('utf-8'))
+            
+            staticFields = {
+                "schemaVersion": self.schemaVersion,
+                "scopeId": self.scopeId,
+                "lane": lane.value,
+                "systemId": self.systemId,
+                "containerId": self.containerId,
+                "uniqueId": uniqueId,
+                **staticFields
+            }
+            staticJson = json.dumps(staticFields)[1:-1].encode('utf-8')
+            
+            template = (subject, hashPrefix, staticJson)
+            self._publishTemplates[key] = template
+        return template
+    
+    @staticmethod
+    def _encodeEnvelope(eventId: str, sourceTruthTime: str, staticJson: bytes,
+                        bodyKey: bytes, canonicalBody: bytes) -> bytes:
+        """Assemble envelope JSON around already-canonical body bytes (no second encode of the payload)."""
+        return b''.join((
+            b'{"eventId":"', eventId.encode('ascii'),
+            b'","sourceTruthTime":"', sourceTruthTime.encode('ascii'),
+            b'",', staticJson,
+            b',"', bodyKey, b'":', canonicalBody, b'}'
+        ))
+    
     async def publishRaw(self, deviceId: str, sequence: int, rawBytes: bytes):
         """
         Publish Raw lane event.
@@ -223,50 +284,20 @@ class NovaAdapter:
         uniqueId = deviceId
         sourceTruthTime = datetime.now(timezone.utc).isoformat()
         
-        # Normalize payload to JSON-compatible form (converts int keys to strings)
-        normalizedPayload = jsonNormalize(payload)
-        
-        # Canonicalize payload for eventId
-        canonicalPayload = canonicalJson(normalizedPayload)
-        
-        # Build entity identity key for eventId
-        entityIdentityKey = self._buildEntityIdentityKey(uniqueId)
-        
-        # Compute eventId
-        eventId = self._computeEventId(
-            lane=Lane.PARSED,
-            entityIdentityKey=entityIdentityKey,
-            sourceTruthTime=sourceTruthTime,
-            canonicalPayload=canonicalPayload
-        )
+        subject, hashPrefix, staticJson = self._getPublishTemplate(Lane.PARSED, uniqueId, messageType=streamType)
         
-        # Build envelope with new identity model
-        envelope = {
-            "schemaVersion": self.schemaVersion,
-            "eventId": eventId,
-            "scopeId": self.scopeId,
-            "lane": "parsed",
-            "sourceTruthTime": sourceTruthTime,
-            "systemId": self.systemId,
-            "containerId": self.containerId,
-            "uniqueId": uniqueId,
-            "messageType": streamType,  # Required: message type (e.g., ubx.nav.pvt)
-            "payload": normalizedPayload
-        }
+        # Normalize + canonicalize payload in one pass (converts int keys to strings, numpy scalars to numbers)
+        _, canonicalPayload = canonicalizeJson(payload)
         
-        # Format subject using canonical format
-        routeKey = RouteKey(
-            scopeId=self.scopeId,
-            lane=Lane.PARSED,
-            systemId=self.systemId,
-            containerId=self.containerId,
-            uniqueId=uniqueId,
-            schemaVersion=self.schemaVersion
-        )
-        subject = formatNovaSubject(routeKey)
+        # Compute eventId: SHA256(eidV1 + scopeId + lane + entityIdentityKey + sourceTruthTime + canonicalPayload)
+        hasher = hashPrefix.copy()
+        hasher.update(sourceTruthTime.encode('utf-8'))
+        hasher.update(canonicalPayload)
+        eventId = hasher.hexdigest()
         
         # Publish (errors propagate - no swallowing)
-        await self.novaTransport.publish(subject, json.dumps(envelope).encode('utf-8'))
+        await self.novaTransport.publish(
+            subject, self._encodeEnvelope(eventId, sourceTruthTime, staticJson, b'payload', canonicalPayload))
         
         self.log.debug('[NovaAdapter] Published Parsed', 
                       eventId=eventId[:16], uniqueId=uniqueId, streamType=streamType)
@@ -345,11 +376,8 @@ class NovaAdapter:
         # uniqueId = renderable entity (entityId preferred, fall back to manifestId)
         uniqueId = entityId if entityId else manifestId
         
-        # Normalize payload to JSON-compatible form
-        normalizedPayload = jsonNormalize(payload)
-        
-        # Canonicalize payload for eventId
-        canonicalPayload = canonicalJson(normalizedPayload)
+        # Normalize payload to JSON-compatible form and canonicalize for eventId
+        normalizedPayload, canonicalPayload = canonicalizeJson(payload)
         
         # Build entity identity key for eventId
         entityIdentityKey = self._buildEntityIdentityKey(uniqueId)
@@ -428,53 +456,22 @@ class NovaAdapter:
         uniqueId = deviceId
         sourceTruthTime = datetime.now(timezone.utc).isoformat()
         
-        # Normalize data to JSON-compatible form
-        normalizedData = jsonNormalize(data)
+        subject, hashPrefix, staticJson = self._getPublishTemplate(
+            Lane.UI, uniqueId, messageType="UiUpdate",
+            viewId=viewId, manifestId=manifestId, manifestVersion=manifestVersion)
         
-        # Canonicalize data for eventId
-        canonicalPayload = canonicalJson(normalizedData)
-        
-        # Build entity identity key for eventId
-        entityIdentityKey = self._buildEntityIdentityKey(uniqueId)
+        # Normalize + canonicalize data in one pass
+        _, canonicalPayload = canonicalizeJson(data)
         
         # Compute eventId
-        eventId = self._computeEventId(
-            lane=Lane.UI,
-            entityIdentityKey=entityIdentityKey,
-            sourceTruthTime=sourceTruthTime,
-            canonicalPayload=canonicalPayload
-        )
-        
-        # Build envelope with UI lane identity model
-        envelope = {
-            "schemaVersion": self.schemaVersion,
-            "eventId": eventId,
-            "scopeId": self.scopeId,
-            "lane": "ui",
-            "sourceTruthTime": sourceTruthTime,
-            "systemId": self.systemId,
-            "containerId": self.containerId,
-            "uniqueId": uniqueId,
-            "messageType": "UiUpdate",
-            "viewId": viewId,
-            "manifestId": manifestId,
-            "manifestVersion": manifestVersion,
-            "data": normalizedData
-        }
-        
-        # Format subject using canonical format
-        routeKey = RouteKey(
-            scopeId=self.scopeId,
-            lane=Lane.UI,
-            systemId=self.systemId,
-            containerId=self.containerId,
-            uniqueId=uniqueId,
-            schemaVersion=self.schemaVersion
-        )
-        subject = formatNovaSubject(routeKey)
+        hasher = hashPrefix.copy()
+        hasher.update(sourceTruthTime.encode('utf-8'))
+        hasher.update(canonicalPayload)
+        eventId = hasher.hexdigest()
         
         # Publish (errors propagate - no swallowing)
-        await self.novaTransport.publish(subject, json.dumps(envelope).encode('utf-8'))
+        await self.novaTransport.publish(
+            subject, self._encodeEnvelope(eventId, sourceTruthTime, staticJson, b'data', canonicalPayload))
         
         self.log.debug('[NovaAdapter] Published UiUpdate', 
                       eventId=eventId[:16], uniqueId=uniqueId, viewId=viewId)
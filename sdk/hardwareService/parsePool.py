@@ -0,0 +1,112 @@
+"""
+ParsePool: Optional worker pool for device protocol parsing.
+
+Device read loops normally parse on the hardwareService event loop, so one
+process handles every receiver on one core. With a ParsePool, read loops submit
+their parse buffer to worker processes (or sub-interpreters) and await the
+(remaining bytes, messages) result; the event loop only reads, publishes and
+routes.
+
+- Per-device ordering: a device awaits each chunk's result before reading the
+  next (the remaining bytes carry into the next buffer), so it has at most one
+  chunk in flight and messages publish in stream order
+- Bounded in-flight work: at most maxInFlight chunks are submitted across all
+  devices; further read loops wait (serial data queues in the reader meanwhile)
+- Parsers (Ubx, Sbf, Nmea) are built once per worker and reused; parser
+  exceptions propagate to the device exactly as inline parsing would
+- A broken pool (worker crash) logs once and falls back to inline parsing
+
+Config "parsePool": {"workers": 4, "mode": "process", "maxInFlight": 8}
+workers 0 (default) disables the pool; mode "interpreter" needs Python 3.14+.
+
+Property of Uncompromising Sensors LLC.
+"""
+
+# Imports
+import asyncio, concurrent.futures, os
+from typing import Dict, List, Optional, Tuple
+
+# Local imports
+from sdk.logging import getLogger
+from sdk.parsers.ubx import Ubx
+from sdk.parsers.sbf import Sbf
+from sdk.parsers.nmea import Nmea
+
+
+PARSERS = {'ubx': Ubx, 'sbf': Sbf, 'nmea': Nmea}
+
+# Worker-side parser instances, built on first use in each worker
+_workerParsers: Dict[str, object] = {}
+
+
+def parseChunk(protocol: str, bytesBin: bytes) -> Tuple[bytes, List[dict]]:
+    """Worker entry point: protocol parser's parseAll on bytesBin"""
+    parser = _workerParsers.get(protocol)
+    if parser is None:
+        parser = _workerParsers[protocol] = PARSERS[protocol]()
+    return parser.parseAll(bytesBin)
+
+
+class ParsePool:
+    """Process (or sub-interpreter) pool running protocol parseAll off the event loop"""
+
+    def __init__(self, workers: int, mode: str = 'process', maxInFlight: Optional[int] = None):
+        """
+        Args:
+            workers: Worker count
+            mode: 'process' or 'interpreter'
+            maxInFlight: Chunks submitted at once across devices (default 2 per worker)
+        """
+        self.log = getLogger()
+        self.workers = workers
+        self.mode = mode
+        self.maxInFlight = maxInFlight or workers * 2
+        self.executor = self._createExecutor(workers, mode)
+        self.broken = False
+        self.submitted = 0
+        self._slots: Optional[asyncio.Semaphore] = None   # Created on first use (bound to the running loop)
+        self.log.info('Parse pool started', workers=workers, mode=mode, maxInFlight=self.maxInFlight)
+
+    @classmethod
+    def fromConfig(cls, config: Optional[dict]) -> Optional['ParsePool']:
+        """Pool from config "parsePool" (None when absent or workers is 0); workers "auto" uses cpu count - 1"""
+        if not config:
+            return None
+        workers = config.get('workers', 0)
+        if workers == 'auto':
+            workers = max(1, (os.cpu_count() or 2) - 1)
+        if not workers:
+            return None
+        return cls(int(workers), mode=config.get('mode', 'process'), maxInFlight=config.get('maxInFlight'))
+
+    @staticmethod
+    def _createExecutor(workers: int, mode: str):
+        if mode == 'process':
+            return concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        if mode == 'interpreter':
+            if not hasattr(concurrent.futures, 'InterpreterPoolExecutor'):
+                raise ValueError('parsePool mode "interpreter" requires Python 3.14+')
+            return concurrent.futures.InterpreterPoolExecutor(max_workers=workers)
+        raise ValueError(f'Unsupported parsePool mode: {mode}')
+
+    async def parseAll(self, protocol: str, parser, bytesBin: bytes) -> Tuple[bytes, List[dict]]:
+        """
+        parser.parseAll(bytesBin) on a worker; returns (remaining bytes, messages).
+
+        parser is the device's own instance, used inline if the pool is broken.
+        """
+        if self.broken or not bytesBin:
+            return parser.parseAll(bytesBin)
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.maxInFlight)
+        async with self._slots:
+            try:
+                self.submitted += 1
+                return await asyncio.get_running_loop().run_in_executor(self.executor, parseChunk, protocol, bytesBin)
+            except concurrent.futures.BrokenExecutor as e:
+                self.broken = True
+                self.log.error('Parse pool broken - parsing inline', errorClass=type(e).__name__, errorMsg=str(e))
+                return parser.parseAll(bytesBin)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
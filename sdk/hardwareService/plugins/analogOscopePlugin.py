@@ -16,7 +16,6 @@ from sys import platform
 
 # Local imports
 from .basePlugin import BasePlugin
-from ..devices.analogOscopeDevice import AnalogOscopeDevice
 
 # Class
 class AnalogOscopePlugin(BasePlugin):
@@ -98,4 +97,5 @@ class AnalogOscopePlugin(BasePlugin):
     
     async def createDevice(self, deviceId: str, ports: list, meta: dict, ioLayer, transport=None, subjectBuilder=None, novaAdapter=None):
         """Create analog oscope device instance with configured trigger channel"""
+        from ..devices.analogOscopeDevice import AnalogOscopeDevice    # Lazy: numpy and the WaveForms SDK load only once a scope is found
         return AnalogOscopeDevice(deviceId, ioLayer, transport=transport, subjectBuilder=subjectBuilder, novaAdapter=novaAdapter, triggerChannel=self.triggerChannel)
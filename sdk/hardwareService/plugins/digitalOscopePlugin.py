@@ -15,7 +15,6 @@ from sys import platform
 
 # Local imports
 from .basePlugin import BasePlugin
-from ..devices.digitalOscopeDevice import DigitalOscopeDevice
 
 
 # Class
@@ -97,4 +96,5 @@ class DigitalOscopePlugin(BasePlugin):
     
     async def createDevice(self, deviceId: str, ports: list, meta: dict, ioLayer, transport=None, subjectBuilder=None, novaAdapter=None):
         """Create digital oscope device instance with configured trigger channel"""
+        from ..devices.digitalOscopeDevice import DigitalOscopeDevice    # Lazy: numpy and the WaveForms SDK load only once a scope is found
         return DigitalOscopeDevice(deviceId, ioLayer, transport=transport, subjectBuilder=subjectBuilder, novaAdapter=novaAdapter, triggerChannel=self.triggerChannel)
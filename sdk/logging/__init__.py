@@ -22,9 +22,19 @@ API:
     # Global configuration (optional, once at app startup)
     from sdk.logging import configureLogging
     configureLogging(logDir='../logs', maxBytes=10_000_000, maxTotalMb=2048)
+    
+    # Records are written by a background thread; flush before exit (also done via atexit)
+    from sdk.logging import shutdownLogging
+    shutdownLogging()
+    
+    # Startup phase timing, reported at debug level
+    from sdk.logging import StartupTimer
+    timer = StartupTimer('Core'); timer.mark('imports'); timer.report(log)
 """
 
 from .logger import getLogger, configureLogging
+from .writer import flushLogging, shutdownLogging, getLoggingStats
+from .startup import StartupTimer
 from .context import (
     setServiceContext, 
     getServiceContext, 
@@ -35,6 +45,10 @@ from .context import (
 __all__ = [
     'getLogger', 
     'configureLogging',
+    'flushLogging',
+    'shutdownLogging',
+    'getLoggingStats',
+    'StartupTimer',
     'setServiceContext',
     'getServiceContext',
     'clearServiceContext',
@@ -4,6 +4,7 @@ Universal hierarchical logger with automatic detection.
 Features:
 - Auto-detects logger hierarchy from call stack (computed once, cached)
 - Global log directory with rotation and disk management
+- Non-blocking: records are queued to a background writer thread (file I/O off the caller's thread)
 - Cross-platform (stdlib only)
 - Zero overhead after logger assignment
 - Structured field logging
@@ -29,16 +30,23 @@ Property of Uncompromising Sensors LLC.
 """
 
 # Imports
-import  inspect, logging, logging.handlers, os, socket
+import logging, logging.handlers, os, socket, sys
 from pathlib import Path
 from typing import Optional
 from datetime import datetime, timezone as tz
 
+# Local imports
+from .writer import QueueForwardHandler, configureWriter
+
 
 # Global state
 _hostname = socket.gethostname()
 _configured = False
-_fileHandlers = {}  # Singleton cache: logPath -> handler
+_fileHandlers = {}  # Singleton cache: logPath -> handler (forwarding handler when asyncWrite)
+_nameCache = {}     # (moduleName, className) -> resolved logger hierarchy
+
+# Attributes every LogRecord carries (plus ones added by formatters); anything else is a structured field
+_standardRecordAttrs = frozenset(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime', 'hostname'}
 _config = {
     'logDir': None,
     'maxBytes': 100_000_000,        # 100 MB per log file before rotation
@@ -46,13 +54,17 @@ _config = {
     'maxTotalMb': 10240,            # Max total disk usage: 10 GB across all logs
     'console': True,
     'level': logging.INFO,
-    'utc': False
+    'utc': False,
+    'asyncWrite': True,             # Queue records to the background writer thread
+    'queueSize': 10000,             # Max queued records before the overflow policy applies
+    'overflow': 'dropNewest'        # 'dropNewest' | 'dropOldest' | 'block'
 }
 
 
 def configureLogging(logDir: Optional[str] = None, maxBytes: int = 10_000_000,
                      backupCount: int = 5, maxTotalMb: int = 2048,
-                     console: bool = True, level: str = 'INFO', utc: bool = False):
+                     console: bool = True, level: str = 'INFO', utc: bool = False,
+                     asyncWrite: bool = True, queueSize: int = 10000, overflow: str = 'dropNewest'):
     """
     Configure global logging settings (call once at app startup).
     
@@ -64,6 +76,9 @@ def configureLogging(logDir: Optional[str] = None, maxBytes: int = 10_000_000,
         console: Also log to console (default: True)
         level: Minimum log level (default: 'INFO')
         utc: Use UTC timestamps (default: False, uses local time)
+        asyncWrite: Write through a background thread instead of the calling thread (default: True)
+        queueSize: Maximum queued records for the background writer (default: 10000)
+        overflow: Policy when the queue is full: 'dropNewest', 'dropOldest' or 'block' (default: 'dropNewest')
     """
     global _configured, _config
     
@@ -71,59 +86,53 @@ def configureLogging(logDir: Optional[str] = None, maxBytes: int = 10_000_000,
         logDir = os.path.abspath(os.path.join(os.getcwd(), os.pardir, "logs"))
     
     _config.update({'logDir': logDir,'maxBytes': maxBytes,'backupCount': backupCount, 'maxTotalMb': maxTotalMb,
-                    'console': console,'level': getattr(logging, level.upper()), 'utc': utc})
+                    'console': console,'level': getattr(logging, level.upper()), 'utc': utc,
+                    'asyncWrite': asyncWrite, 'queueSize': queueSize, 'overflow': overflow})
+    configureWriter(maxSize=queueSize, overflow=overflow)
     
     Path(logDir).mkdir(parents=True, exist_ok=True)
     _configured = True
 
 
 def _autoDetectName() -> str:
-    """Auto-detect logger name from call stack. Returns hierarchy like: 'hardwareService.devices.ubxDevice.UBXDevice'"""
+    """Auto-detect logger name from call stack. Returns hierarchy like: 'hardwareService.devices.ubxDevice.UBXDevice'
+    
+    Uses the caller frame's module globals (no sys.modules scan) and caches the resulting
+    hierarchy per (module, class), so repeated getLogger() calls from a module are a dict lookup."""
 
-    frame = inspect.currentframe()
+    frame = sys._getframe(1)
     try:
         # Walk up the stack to find the first frame outside of logging module
         current = frame
         while current is not None:
-            current = current.f_back
-            if current is None:
-                break
+            moduleName = current.f_globals.get('__name__')
             
-            # Get module for this frame
-            module = inspect.getmodule(current)
-            if module is None:
+            # Skip frames inside the logging module itself, Python's import machinery and unknown modules
+            if (moduleName is None or moduleName.startswith('sdk.logging') or moduleName.startswith('importlib')
+                    or moduleName.startswith('_frozen_importlib') or moduleName == '__main__'):
+                current = current.f_back
                 continue
             
-            moduleName = module.__name__
-            
-            # Skip frames that are inside the logging module itself
-            if 'logging' in moduleName and 'sdk.logging' in moduleName:
-                continue
-            
-            # Skip Python's import machinery
-            if moduleName.startswith('importlib') or moduleName == '__main__':
-                continue
-            
-            # Found the caller! Build hierarchy
-            parts = moduleName.split('.')
-            
-            # Remove 'sdk' prefix if present (it's just a package wrapper)
-            if parts and parts[0] == 'sdk':
-                parts = parts[1:]
-            
             # Get class name if called from within a class method
             className = None
-            if current.f_locals:
-                if 'self' in current.f_locals:
-                    className = current.f_locals['self'].__class__.__name__
-                elif 'cls' in current.f_locals:
-                    className = current.f_locals['cls'].__name__
+            localsDict = current.f_locals
+            if 'self' in localsDict:
+                className = localsDict['self'].__class__.__name__
+            elif 'cls' in localsDict and isinstance(localsDict['cls'], type):
+                className = localsDict['cls'].__name__
             
-            hierarchy = '.'.join(parts) if parts else 'unknown'
-            if className:
-                hierarchy = f"{hierarchy}.{className}"
-            
-            return hierarchy if hierarchy else 'unknown'
+            key = (moduleName, className)
+            hierarchy = _nameCache.get(key)
+            if hierarchy is None:
+                # Found the caller! Build hierarchy (remove 'sdk' prefix - it's just a package wrapper)
+                parts = moduleName.split('.')
+                if parts and parts[0] == 'sdk':
+                    parts = parts[1:]
+                hierarchy = '.'.join(parts) if parts else 'unknown'
+                if className:
+                    hierarchy = f"{hierarchy}.{className}"
+                hierarchy = _nameCache[key] = hierarchy or 'unknown'
+            return hierarchy
         
         # Couldn't find valid module
         return 'unknown'
@@ -138,60 +147,56 @@ class StructuredFormatter(logging.Formatter):
     def __init__(self, fmt=None, datefmt=None, utc=False):
         super().__init__(fmt, datefmt)
         self.utc = utc
+        self._cachedSecond = None   # (whole second, datefmt) of the last formatted timestamp
+        self._cachedTime = ''
     
     def formatTime(self, record, datefmt=None):
-        """Override to support UTC if configured."""
-        if self.utc:
-            ct = datetime.fromtimestamp(record.created, tz=tz.utc)
-        else:
-            ct = datetime.fromtimestamp(record.created)
+        """Override to support UTC if configured. The seconds part is cached (records arrive in bursts within a second)."""
+        second = int(record.created)
+        if self._cachedSecond != (second, datefmt):
+            if self.utc:
+                ct = datetime.fromtimestamp(second, tz=tz.utc)
+            else:
+                ct = datetime.fromtimestamp(second)
+            self._cachedTime = ct.strftime(datefmt) if datefmt else ct.strftime("%Y-%m-%d %H:%M:%S")
+            self._cachedSecond = (second, datefmt)
         
         if datefmt:
-            s = ct.strftime(datefmt)
-        else:
-            s = ct.strftime("%Y-%m-%d %H:%M:%S")
-            s = f"{s},{int(record.msecs):03d}"
-        return s
+            return self._cachedTime
+        return f"{self._cachedTime},{int(record.msecs):03d}"
     
 
     def format(self, record):
         # Add hostname to record
         record.hostname = _hostname
         
-        # Extract structured fields from record.__dict__
-        structuredFields = []
-        excluded = {
-            'name', 'msg', 'args', 'created', 'filename', 'funcName',
-            'levelname', 'levelno', 'lineno', 'module', 'msecs',
-            'message', 'pathname', 'process', 'processName',
-            'relativeCreated', 'thread', 'threadName', 'exc_info',
-            'exc_text', 'stack_info', 'hostname', 'asctime'
-        }
+        # Structured fields: record attributes that are not standard LogRecord attributes.
+        # Computed once per record and shared by every handler that formats it.
+        suffix = record.__dict__.get('_structuredSuffix')
+        if suffix is None:
+            structuredFields = [f"{key}={value}" for key, value in record.__dict__.items()
+                                if key not in _standardRecordAttrs and key[0] != '_']
+            suffix = record._structuredSuffix = f" [{', '.join(structuredFields)}]" if structuredFields else ''
         
-        for key, value in record.__dict__.items():
-            if key not in excluded and not key.startswith('_'):
-                structuredFields.append(f"{key}={value}")
+        if not suffix:
+            return super().format(record)
         
-        # DON'T modify record.msg - create a copy and append to it
+        # DON'T modify record.msg permanently - restore it to avoid affecting other handlers
         originalMsg = record.msg
-        if structuredFields:
-            record.msg = f"{originalMsg} [{', '.join(structuredFields)}]"
-        
-        # Format the record
-        result = super().format(record)
-        
-        # Restore original message to avoid affecting other handlers
-        record.msg = originalMsg
-        
-        return result
+        record.msg = f"{originalMsg}{suffix}"
+        try:
+            return super().format(record)
+        finally:
+            record.msg = originalMsg
 
 
 def getLogger(name: Optional[str] = None, separateFile: bool = False) -> logging.Logger:
     """
     Get or create a logger with automatic hierarchy detection.
     
-    PERFORMANCE: Stack inspection happens ONCE during getLogger() call (~5-10μs).
-    The returned logger object is cached and reused with zero overhead (~0.1-0.5μs per log call).
+    PERFORMANCE: Name detection reads the caller frame's module globals and is cached per
+    (module, class), so repeated getLogger() calls cost a dict lookup. Log calls below the
+    configured level return after a single level check.
     
     Args:
         name: Logger name (auto-detected from call stack if None)
@@ -248,7 +253,7 @@ def getLogger(name: Optional[str] = None, separateFile: bool = False) -> logging
         global _fileHandlers
         if logPath not in _fileHandlers:
             # Rotating file handler
-            fileHandler = logging.handlers.RotatingFileHandler(
+            fileHandler = _RotatingFileHandler(
                 logPath,
                 maxBytes=_config['maxBytes'],
                 backupCount=_config['backupCount'],
@@ -263,8 +268,8 @@ def getLogger(name: Optional[str] = None, separateFile: bool = False) -> logging
             )
             fileHandler.setFormatter(formatter)
             
-            # Cache singleton handler
-            _fileHandlers[logPath] = fileHandler
+            # Cache singleton handler (wrapped so the caller only enqueues)
+            _fileHandlers[logPath] = QueueForwardHandler(fileHandler) if _config['asyncWrite'] else fileHandler
         
         logger.addHandler(_fileHandlers[logPath])
         
@@ -277,7 +282,7 @@ def getLogger(name: Optional[str] = None, separateFile: bool = False) -> logging
                 utc=_config['utc']
             )
             consoleHandler.setFormatter(consoleFormatter)
-            logger.addHandler(consoleHandler)
+            logger.addHandler(QueueForwardHandler(consoleHandler) if _config['asyncWrite'] else consoleHandler)
         
         # Mark as configured
         logger._configured_by_sdk = True
@@ -297,55 +302,39 @@ def _wrapLogger(logger: logging.Logger) -> logging.Logger:
     if hasattr(logger, '_is_wrapped'):
         return logger
     
-    # Store original methods
-    originalDebug = logger.debug
-    originalInfo = logger.info
-    originalWarning = logger.warning
-    originalError = logger.error
-    originalCritical = logger.critical
+    # Level is checked first so filtered records cost one comparison (no extra dict, no record)
+    isEnabledFor = logger.isEnabledFor
+    log = logger._log
     
     # Create wrapped methods
     def debug(msg, *args, **kwargs):
         """Log debug message with structured fields."""
-        if kwargs:
-            originalDebug(msg, *args, extra=kwargs)
-        else:
-            originalDebug(msg, *args)
+        if isEnabledFor(logging.DEBUG):
+            log(logging.DEBUG, msg, args, extra=kwargs or None)
     
     def info(msg, *args, **kwargs):
         """Log info message with structured fields."""
-        if kwargs:
-            originalInfo(msg, *args, extra=kwargs)
-        else:
-            originalInfo(msg, *args)
+        if isEnabledFor(logging.INFO):
+            log(logging.INFO, msg, args, extra=kwargs or None)
     
     def warning(msg, *args, **kwargs):
         """Log warning message with structured fields."""
-        # Extract exc_info if present (it's a reserved logging param)
-        exc_info = kwargs.pop('exc_info', False)
-        if kwargs:
-            originalWarning(msg, *args, extra=kwargs, exc_info=exc_info)
-        else:
-            originalWarning(msg, *args, exc_info=exc_info)
+        if isEnabledFor(logging.WARNING):
+            # Extract exc_info if present (it's a reserved logging param)
+            exc_info = kwargs.pop('exc_info', False)
+            log(logging.WARNING, msg, args, exc_info=exc_info, extra=kwargs or None)
     
     def error(msg, *args, **kwargs):
         """Log error message with structured fields."""
-        # Extract exc_info if present (it's a reserved logging param)
-        exc_info = kwargs.pop('exc_info', False)
-        if kwargs:
-            originalError(msg, *args, extra=kwargs, exc_info=exc_info)
-        else:
-            originalError(msg, *args, exc_info=exc_info)
+        if isEnabledFor(logging.ERROR):
+            exc_info = kwargs.pop('exc_info', False)
+            log(logging.ERROR, msg, args, exc_info=exc_info, extra=kwargs or None)
     
     def critical(msg, *args, **kwargs):
         """Log critical message with structured fields."""
-        # Extract exc_info if present (it's a reserved logging param)
-        exc_info = kwargs.pop('exc_info', False)
-        if kwargs:
-            originalCritical(msg, *args, extra=kwargs, exc_info=exc_info)
-        else:
-            originalCritical(msg, *args, exc_info=exc_info)
-            originalCritical(msg, *args)
+        if isEnabledFor(logging.CRITICAL):
+            exc_info = kwargs.pop('exc_info', False)
+            log(logging.CRITICAL, msg, args, exc_info=exc_info, extra=kwargs or None)
     
     # Replace methods on logger instance
     logger.debug = debug
@@ -358,6 +347,14 @@ def _wrapLogger(logger: logging.Logger) -> logging.Logger:
     return logger
 
 
+class _RotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """RotatingFileHandler that enforces the global disk limit after each rollover."""
+    
+    def doRollover(self):
+        super().doRollover()
+        _enforceDiskLimit()
+
+
 def _enforceDiskLimit():
     """
     Enforce global disk usage limit by removing oldest log files.
@@ -0,0 +1,62 @@
+"""
+Startup timing report.
+
+Records how long each startup phase of a process takes (imports, database
+open, manifest load, transport connect, ...) and logs one summary line at
+debug level, so cold-start regressions show up in the logs of restart-on-fault
+cycles without extra tooling.
+
+Usage:
+    from sdk.logging import StartupTimer
+
+    timer = StartupTimer('Core')
+    with timer.phase('imports'):
+        from nova.core.database import Database
+    timer.mark('database')          # time since the previous phase/mark
+    timer.report(log)               # [Core] Startup 412.3 ms: imports=180.1 ms, database=35.0 ms, ...
+
+Property of Uncompromising Sensors LLC.
+"""
+
+# Imports
+import time
+from contextlib import contextmanager
+from typing import List, Tuple
+
+
+class StartupTimer:
+    """Named startup phases with wall-clock durations"""
+
+    def __init__(self, processName: str):
+        self.processName = processName
+        self.start = time.perf_counter()
+        self._last = self.start
+        self.phases: List[Tuple[str, float]] = []
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the enclosed block as one phase"""
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._last = time.perf_counter()
+            self.phases.append((name, self._last - begin))
+
+    def mark(self, name: str):
+        """Record the time since the previous phase/mark as phase name"""
+        now = time.perf_counter()
+        self.phases.append((name, now - self._last))
+        self._last = now
+
+    def totalSeconds(self) -> float:
+        return self._last - self.start
+
+    def summary(self) -> str:
+        phases = ', '.join(f"{name}={seconds * 1000:.1f} ms" for name, seconds in self.phases)
+        return f"[{self.processName}] Startup {self.totalSeconds() * 1000:.1f} ms: {phases}"
+
+    def report(self, log):
+        """Log the summary at debug level"""
+        log.debug(self.summary(), startupMs=round(self.totalSeconds() * 1000, 1),
+                  phases={name: round(seconds * 1000, 1) for name, seconds in self.phases})
@@ -0,0 +1,272 @@
+"""
+Background log writer: bounded in-memory queue drained by a dedicated thread.
+
+Loggers get lightweight QueueForwardHandler instances that only enqueue the
+record; the real handlers (rotating file, console) run on the writer thread,
+so file I/O, rotation and disk-limit checks never run on the caller's thread
+(e.g. the asyncio event loop).
+
+Overflow policies (when the queue is full):
+- 'dropNewest': discard the incoming record (caller never blocks)
+- 'dropOldest': discard the oldest queued record to make room
+- 'block':      wait for space (previous synchronous back-pressure)
+
+Dropped records are counted and reported by the writer thread as a single
+warning line once space is available again.
+
+Property of Uncompromising Sensors LLC.
+"""
+
+# Imports
+import atexit, logging, os, queue, threading
+from typing import Optional
+
+
+OVERFLOW_POLICIES = ('dropNewest', 'dropOldest', 'block')
+
+_STOP = object()                # Sentinel: writer thread exits after draining
+
+
+class LogWriter:
+    """Bounded record queue plus the thread that writes records to their target handlers."""
+
+    def __init__(self, maxSize: int = 10000, overflow: str = 'dropNewest'):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Invalid overflow policy '{overflow}', expected one of {OVERFLOW_POLICIES}")
+        self.maxSize = maxSize
+        self.overflow = overflow
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self._reportedDrops = 0
+        self._targets = set()   # Handlers seen by this writer (flushed on shutdown, receive drop reports)
+        self._queue = queue.Queue(maxsize=maxSize)
+        self._thread = None
+        self._stopped = False
+        self._lock = threading.Lock()
+
+
+    def start(self):
+        """Start the writer thread (idempotent)."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='sdkLogWriter', daemon=True)
+                self._thread.start()
+
+
+    def enqueue(self, target: logging.Handler, record: logging.LogRecord):
+        """Queue a record for target, applying the overflow policy. Never performs I/O while the writer runs."""
+        if self._thread is None:
+            if self._stopped:
+                self._process((target, record))               # After shutdown: write synchronously so nothing is lost
+                return
+            self.start()
+        item = (target, record)
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            if self.overflow == 'block':
+                self._queue.put(item)
+            elif self.overflow == 'dropOldest':
+                try:
+                    oldest = self._queue.get_nowait()
+                    self._queue.task_done()
+                    if isinstance(oldest, tuple):
+                        self.dropped += 1
+                    elif oldest is _STOP:
+                        self._queue.put_nowait(oldest)        # Never drop control items; drop the new record instead
+                        self.dropped += 1
+                        return
+                    else:
+                        oldest.set()                          # Flush marker: everything before it has been handled or dropped
+                except queue.Empty:
+                    pass
+                try:
+                    self._queue.put_nowait(item)
+                except queue.Full:
+                    self.dropped += 1
+                    return
+            else:
+                self.dropped += 1
+                return
+        self.enqueued += 1
+
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until every record queued before this call has been written. Returns False on timeout."""
+        if self._thread is None or not self._thread.is_alive():
+            self._drainInline()
+            return True
+        marker = threading.Event()
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.wait(timeout)
+
+
+    def stop(self, timeout: Optional[float] = 5.0):
+        """Drain remaining records, stop the writer thread and flush target handlers."""
+        self._stopped = True
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            try:
+                self._queue.put(_STOP, timeout=timeout)
+                thread.join(timeout)
+            except queue.Full:
+                pass
+        self._thread = None
+        self._drainInline()
+        for target in list(self._targets):
+            try:
+                target.flush()
+            except Exception:
+                pass
+
+
+    def stats(self) -> dict:
+        """Counters for monitoring (queue depth, enqueued, written, dropped)."""
+        return {
+            'queueDepth': self._queue.qsize(),
+            'queueSize': self.maxSize,
+            'overflow': self.overflow,
+            'enqueued': self.enqueued,
+            'written': self.written,
+            'dropped': self.dropped,
+        }
+
+
+    def _run(self):
+        """Writer thread: hand each record to its target handler until the stop sentinel."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                self._process(item)
+            finally:
+                self._queue.task_done()
+
+
+    def _drainInline(self):
+        """Write whatever is still queued on the calling thread (shutdown / no writer thread)."""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if item is not _STOP:
+                self._process(item)
+            self._queue.task_done()
+
+
+    def _process(self, item):
+        """Write one queued item (record or flush marker)."""
+        if isinstance(item, threading.Event):
+            item.set()
+            return
+        target, record = item
+        self._targets.add(target)
+        if self.dropped != self._reportedDrops:
+            self._reportDrops(record)
+        try:
+            target.handle(record)
+        except Exception:
+            target.handleError(record)
+        self.written += 1
+
+
+    def _reportDrops(self, nextRecord: logging.LogRecord):
+        """Emit one warning per target summarising records dropped since the last report."""
+        dropped = self.dropped - self._reportedDrops
+        self._reportedDrops = self.dropped
+        report = logging.LogRecord(nextRecord.name, logging.WARNING, __file__, 0,
+                                   f"Log queue full: dropped {dropped} record(s) (policy={self.overflow}, total={self.dropped})",
+                                   None, None)
+        for target in list(self._targets):
+            try:
+                target.handle(report)
+            except Exception:
+                pass
+
+
+class QueueForwardHandler(logging.Handler):
+    """Handler attached to loggers: forwards records to the background writer for a target handler."""
+
+    def __init__(self, target: logging.Handler):
+        super().__init__(target.level)
+        self.target = target
+
+
+    def emit(self, record: logging.LogRecord):
+        # Merge %-style args now so later mutation of arguments cannot change the message
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        getWriter().enqueue(self.target, record)
+
+
+    def handle(self, record):
+        # Skip the per-handler lock: enqueue is thread-safe and does no I/O
+        if self.filter(record):
+            self.emit(record)
+            return True
+        return False
+
+
+    def flush(self):
+        getWriter().flush()
+
+
+# Process-wide writer
+_writer: Optional[LogWriter] = None
+_writerConfig = {'maxSize': 10000, 'overflow': 'dropNewest'}
+
+
+def configureWriter(maxSize: int = 10000, overflow: str = 'dropNewest'):
+    """Set queue size / overflow policy. Applies to the current writer if it has not been used yet."""
+    global _writer
+    if overflow not in OVERFLOW_POLICIES:
+        raise ValueError(f"Invalid overflow policy '{overflow}', expected one of {OVERFLOW_POLICIES}")
+    _writerConfig.update({'maxSize': maxSize, 'overflow': overflow})
+    if _writer is not None:
+        if _writer.enqueued == 0:
+            _writer = LogWriter(**_writerConfig)
+        else:
+            _writer.overflow = overflow
+
+
+def getWriter() -> LogWriter:
+    """Return the process-wide writer, creating it on first use."""
+    global _writer
+    if _writer is None:
+        _writer = LogWriter(**_writerConfig)
+    return _writer
+
+
+def flushLogging(timeout: Optional[float] = 5.0) -> bool:
+    """Block until all queued log records are written. Returns False on timeout."""
+    return _writer.flush(timeout) if _writer is not None else True
+
+
+def shutdownLogging(timeout: Optional[float] = 5.0):
+    """Drain the queue and stop the writer thread. Safe to call more than once; logging keeps working afterwards."""
+    if _writer is not None:
+        _writer.stop(timeout)
+
+
+def getLoggingStats() -> dict:
+    """Writer queue statistics (depth, enqueued, written, dropped)."""
+    return getWriter().stats()
+
+
+def _resetAfterFork():
+    """Child processes get a fresh writer: the parent's thread does not exist after fork and its queue lock may be held."""
+    global _writer
+    if _writer is not None:
+        _writer = LogWriter(**_writerConfig)
+
+
+atexit.register(shutdownLogging)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_resetAfterFork)
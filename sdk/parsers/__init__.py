@@ -15,11 +15,18 @@ from .nmea import Nmea
 from .sbf import Sbf
 from .ubx import Ubx
 
-# Re-export Globe from sdk.globe for backward compatibility
-from sdk.globe import Globe
-
 __all__ = ['Nmea', 'Sbf', 'Ubx', 'Globe']
 
+
+def __getattr__(name):
+    """Globe is re-exported from sdk.globe for backward compatibility, loaded on first
+    access so parser-only users (hardwareService devices) don't import numpy."""
+    if name == 'Globe':
+        from sdk.globe import Globe
+        return Globe
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Define the version
 __version__ = "USS GNSS Parsing Scripts (GPS) Version 1.1"
 print(f'Loaded sdk.parsers version {__version__}')
@@ -9,7 +9,6 @@ Created by and property of Uncompromising Sensor Support LLC
 
 # Import
 import struct, os, re, time
-import numpy as np
 from collections import namedtuple, defaultdict, OrderedDict
 
 # Import configuration information
@@ -0,0 +1,40 @@
+"""
+Shared test fixtures.
+
+Every test starts with sdk logging pointed at one session log directory, so
+loggers created by a test never write into a log directory removed by an
+earlier test (tests that check log output configure their own tempDir).
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sdk.logging import configureLogging
+
+
+@pytest.fixture(scope='session')
+def sessionLogDir():
+    """Log directory kept for the whole test session"""
+    dirPath = Path(tempfile.mkdtemp())
+    yield dirPath
+    shutil.rmtree(dirPath, ignore_errors=True)
+
+
+@pytest.fixture(autouse=True)
+def isolatedLogging(sessionLogDir):
+    """Point sdk logging at the session log directory before each test"""
+    configureLogging(logDir=str(sessionLogDir), console=False)
+
+
+@pytest.fixture
+def tempDir():
+    """Create and cleanup temp directory"""
+    dirPath = Path(tempfile.mkdtemp())
+    yield dirPath
+    shutil.rmtree(dirPath, ignore_errors=True)
@@ -0,0 +1,93 @@
+"""
+Auth Cache Tests
+
+Verifies nova.server.userStore / nova.server.auth:
+- users.json stays in the json.dump layout through incremental, atomic saves
+- Username index follows create/delete
+- Validated tokens are served from cache and invalidated by revocation,
+  status and scope changes
+"""
+
+import json
+from pathlib import Path
+
+import jwt
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nova.server.userStore import UserStore
+from nova.server.auth import AuthManager
+
+
+SECRET = 'test-secret-of-at-least-32-bytes-long'
+
+
+class TestUserStore:
+
+    def test_incremental_save_and_index(self, tempDir):
+        filePath = tempDir / 'users.json'
+        store = UserStore(str(filePath))
+        alice = store.create('alice', 'secret1')
+        bob = store.create('bob', 'secret2', status='active')
+        store.updateScopes(alice['userId'], ['scopeA'])
+
+        text = filePath.read_text()
+        assert text == json.dumps({'users': list(store._users.values())}, indent=2)
+        assert not (tempDir / 'users.json.tmp').exists()
+
+        assert store.getByUsername('bob')['userId'] == bob['userId']
+        assert store.delete(bob['userId'])
+        assert store.getByUsername('bob') is None
+        with pytest.raises(ValueError):
+            store.create('alice', 'again')
+
+        reloaded = UserStore(str(filePath))
+        assert reloaded.getByUsername('alice')['allowedScopes'] == ['scopeA']
+        assert [u['username'] for u in reloaded.list()] == ['alice']
+
+        store.delete(alice['userId'])
+        assert json.loads(filePath.read_text()) == {'users': []}
+
+
+class TestTokenCache:
+
+    def test_cached_validation_and_invalidation(self, tempDir, monkeypatch):
+        auth = AuthManager({'enabled': True, 'secret': SECRET, 'usersPath': str(tempDir / 'users.json')})
+        user = auth.userStore.create('alice', 'secret1', status='active')
+        token = auth.login('alice', 'secret1')['token']
+
+        decodes = []
+        realDecode = jwt.decode
+        monkeypatch.setattr(jwt, 'decode', lambda *args, **kwargs: decodes.append(1) or realDecode(*args, **kwargs))
+
+        for _ in range(5):
+            assert auth.validateToken(token)['username'] == 'alice'
+        assert len(decodes) == 1
+
+        auth.userStore.updateScopes(user['userId'], ['scopeA'])
+        assert auth.validateToken(token)['allowedScopes'] == ['scopeA']
+        assert len(decodes) == 2
+
+        auth.disableUser(user['userId'])
+        assert auth.validateToken(token) is None
+        auth.enableUser(user['userId'])
+        assert auth.validateToken(token) is not None
+
+        auth.revokeUserTokens(user['userId'])
+        assert auth.validateToken(token) is None
+
+    def test_cache_disabled_and_expired_tokens(self, tempDir):
+        auth = AuthManager({'enabled': True, 'secret': SECRET, 'tokenCacheSeconds': 0,
+                            'usersPath': str(tempDir / 'users.json')})
+        auth.userStore.create('alice', 'secret1', status='active')
+        token = auth.login('alice', 'secret1')['token']
+        assert auth.validateToken(token) is not None
+        assert auth._tokenCache == {}
+
+        auth.tokenCacheSeconds = 30
+        auth.tokenExpiry = -1
+        expired = auth.login('alice', 'secret1')['token']
+        assert auth.validateToken(expired) is None
+        assert expired not in auth._tokenCache
@@ -0,0 +1,145 @@
+"""
+Canonical JSON Fast Path Tests
+
+normalizeJson / canonicalizeJson replace the json.loads(json.dumps(obj)) round trip
+used by producers before canonicalization. EventIds depend on the canonical bytes,
+so the fast path MUST be byte-for-byte identical to the reference path.
+
+Test Coverage:
+1. Fixed corpus of GNSS-like payloads (int svId keys, tuples, mixed key types)
+2. Seeded random nested structures
+3. numpy scalars/arrays normalize to plain Python numbers
+4. NovaAdapter envelopes pass Core eventId verification
+"""
+
+import asyncio
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nova.core.canonical_json import canonicalJsonBytes, canonicalizeJson, normalizeJson
+from nova.core.events import Lane, buildEntityIdentityKey, computeEventId
+
+
+def referenceCanonical(obj) -> bytes:
+    """Existing producer path: JSON round trip, then canonical encode"""
+    return canonicalJsonBytes(json.loads(json.dumps(obj)))
+
+
+CORPUS = [
+    {},
+    {'lat': 37.7749, 'lon': -122.4194, 'alt': 12.5, 'fixType': '3D', 'numSv': 14, 'gnssTime': None},
+    {'svInfo': {'GPS': {1: {'cno': 42, 'elev': 45.5, 'azim': 120}, 10: {'cno': 38}, 2: {'cno': 0}}}, 'avgCn0': 40.0},
+    {'sigInfo': {'GAL': {5: {'E1C': {'cno': 41, 'quality': 7}}}}, 'cn04th': 35},
+    {1: 'a', '1': 'b', 2.5: 'c', True: 'd', None: 'e', 'z': (1, 2, (3, 4))},
+    {'nested': [{'b': 1, 'a': [1.0, 2.25, -0.0, 1e-07, 1e+22]}, (True, False, None)]},
+    {'unicode': 'héllo ✓   "quoted" \\ back', 'ctrl': '\x01\t\n'},
+    {'big': 2**70, 'neg': -123456789012345678901234567890},
+    [1, 'two', 3.0, {'k': 'v'}],
+    'plain string',
+    42,
+]
+
+
+class TestCanonicalFastPath:
+
+    @pytest.mark.parametrize('obj', CORPUS)
+    def test_corpus_byte_identical(self, obj):
+        normalized, canonical = canonicalizeJson(obj)
+        assert canonical == referenceCanonical(obj)
+        assert normalized == json.loads(json.dumps(obj))
+
+    def test_random_structures_byte_identical(self):
+        rng = random.Random(1234)
+
+        def randomValue(depth):
+            choice = rng.randrange(9 if depth < 4 else 5)
+            if choice == 0:
+                return rng.randint(-10**6, 10**6)
+            if choice == 1:
+                return rng.uniform(-1e6, 1e6)
+            if choice == 2:
+                return rng.choice(['', 'a', 'nav_sat', 'ü', 'x' * 20])
+            if choice == 3:
+                return rng.choice([True, False, None])
+            if choice == 4:
+                return rng.random() * 10 ** rng.randint(-12, 12)
+            if choice in (5, 6):
+                keys = [rng.choice([rng.randint(0, 40), f'k{rng.randint(0, 40)}', rng.random()]) for _ in range(rng.randint(0, 6))]
+                return {key: randomValue(depth + 1) for key in keys}
+            if choice == 7:
+                return tuple(randomValue(depth + 1) for _ in range(rng.randint(0, 4)))
+            return [randomValue(depth + 1) for _ in range(rng.randint(0, 4))]
+
+        for _ in range(500):
+            obj = {'payload': randomValue(0)}
+            assert canonicalizeJson(obj)[1] == referenceCanonical(obj)
+
+    def test_numpy_scalars_normalized(self):
+        np = pytest.importorskip('numpy')
+        payload = {'a': np.int64(3), 'b': np.float64(1.5), 'c': np.bool_(True), np.int32(7): np.array([1, 2]), 'd': np.float32(0.5)}
+        normalized, canonical = canonicalizeJson(payload)
+        assert normalized == {'a': 3, 'b': 1.5, 'c': True, '7': [1, 2], 'd': 0.5}
+        assert type(normalized['a']) is int and type(normalized['b']) is float
+        assert canonical == canonicalJsonBytes({'a': 3, 'b': 1.5, 'c': True, '7': [1, 2], 'd': 0.5})
+
+    def test_unsupported_types_rejected(self):
+        with pytest.raises(TypeError):
+            normalizeJson({'a': {1, 2}})
+        with pytest.raises(TypeError):
+            normalizeJson({(1, 2): 'tuple key'})
+
+
+class FakeTransport:
+    def __init__(self):
+        self.published = []
+
+    async def publish(self, subject, data):
+        self.published.append((subject, data))
+
+
+class TestNovaAdapterEnvelope:
+
+    @pytest.fixture
+    def adapter(self):
+        pytest.importorskip('serial')
+        from sdk.hardwareService.novaAdapter import NovaAdapter
+        adapter = NovaAdapter({'scopeId': 'test-scope', 'containerId': 'node1'}, FakeTransport())
+        adapter._running = True
+        return adapter
+
+    def assertCoreAcceptsEventId(self, envelope, lane, bodyKey):
+        expected = computeEventId(
+            scopeId=envelope['scopeId'],
+            lane=lane,
+            entityIdentityKey=buildEntityIdentityKey(envelope['systemId'], envelope['containerId'], envelope['uniqueId']),
+            sourceTruthTime=envelope['sourceTruthTime'],
+            canonicalPayload=canonicalJsonBytes(envelope[bodyKey])
+        )
+        assert envelope['eventId'] == expected
+
+    def test_parsed_envelope(self, adapter):
+        payload = {'svInfo': {'GPS': {3: {'cno': 40}, 12: {'cno': 33}}}, 'tow': (1, 2)}
+        asyncio.run(adapter.publishParsed('gps1', 'streamgps1', 'ubx.nav_sat', payload))
+        asyncio.run(adapter.publishParsed('gps1', 'streamgps1', 'ubx.nav_sat', payload))
+        subject, data = adapter.novaTransport.published[-1]
+        envelope = json.loads(data)
+        assert subject == 'nova.test-scope.parsed.hardwareService.node1.gps1.v1'
+        assert envelope['lane'] == 'parsed' and envelope['messageType'] == 'ubx.nav_sat'
+        assert envelope['payload'] == json.loads(json.dumps(payload))
+        self.assertCoreAcceptsEventId(envelope, Lane.PARSED, 'payload')
+
+    def test_ui_update_envelope(self, adapter):
+        data = {'lat': 1.25, 'lon': 2.5, 'numSv': 9}
+        asyncio.run(adapter.publishUiUpdate('gps1', 'telemetry.gnss', 'telemetry.gnss', '1.0.0', data))
+        subject, raw = adapter.novaTransport.published[-1]
+        envelope = json.loads(raw)
+        assert subject == 'nova.test-scope.ui.hardwareService.node1.gps1.v1'
+        assert envelope['viewId'] == 'telemetry.gnss' and envelope['messageType'] == 'UiUpdate'
+        assert envelope['data'] == data
+        self.assertCoreAcceptsEventId(envelope, Lane.UI, 'data')
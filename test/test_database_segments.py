@@ -0,0 +1,167 @@
+"""
+Time-Partitioned Database Segment Tests
+
+Verifies Database segment routing for raw/parsed/ui lanes:
+- Inserts land in per-day segment files listed in the catalog
+- Queries return the same rows as an unsegmented database (ordering, limit, ingestOrder)
+- ingestOrder follows insertion order across segments and the main file
+- Only segments overlapping the window are opened
+- Dedupe stays global across segments, including after a crash between commits
+- Archived segments leave queries but keep dedupe
+"""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nova.core.database import Database, DatabaseError
+from nova.core.events import Lane, Timebase, RawFrame, ParsedMessage, MetadataEvent
+
+
+DAYS = ['2026-01-01', '2026-01-02', '2026-01-03']
+
+
+def makeEvents():
+    """Raw + parsed events over three days; source time lags canonical time by a few seconds"""
+    events = []
+    for dayIndex, day in enumerate(DAYS):
+        for i in range(6):
+            sourceTime = f"{day}T12:00:{i:02d}.000000+00:00"
+            canonicalTime = f"{day}T12:00:{i + 3:02d}.000000+00:00"
+            events.append((RawFrame.create('scope', sourceTime, 'sys', 'node', 'gps1', bytes([dayIndex, i])), canonicalTime))
+            events.append((ParsedMessage.create('scope', sourceTime, 'sys', 'node', 'gps1', 'ubx.nav_pvt', 'v1',
+                                                {'day': dayIndex, 'i': i}), canonicalTime))
+    meta = MetadataEvent.create('scope', f"{DAYS[1]}T00:00:00+00:00", 'ManifestPublished', f"{DAYS[1]}T00:00:00+00:00",
+                                {'manifestId': 'm'}, systemId='nova', containerId='core', uniqueId='manifest-m')
+    events.append((meta, f"{DAYS[1]}T00:00:00+00:00"))
+    return events
+
+
+def fillDatabase(db):
+    for event, canonicalTime in makeEvents():
+        assert db.insertEvent(event, canonicalTime)
+
+
+def queryIds(db, **kwargs):
+    return [(e['lane'], e['eventId']) for e in db.queryEvents(**kwargs)]
+
+
+class TestSegmentRouting:
+
+    def test_segments_created_per_day(self, tempDir):
+        db = Database(str(tempDir / 'truth.db'))
+        fillDatabase(db)
+        segments = db.listSegments()
+        assert [s['segmentId'] for s in segments] == DAYS
+        assert all(Path(s['path']).exists() for s in segments)
+        assert segments[0]['minSourceKey'] == segments[0]['maxSourceKey'] == DAYS[0]
+
+        # Metadata stays in the main file; segmented lanes are not in it
+        main = sqlite3.connect(str(tempDir / 'truth.db'))
+        assert main.execute("SELECT COUNT(*) FROM rawEvents").fetchone()[0] == 0
+        assert main.execute("SELECT COUNT(*) FROM metadataEvents").fetchone()[0] == 1
+        assert main.execute("SELECT COUNT(*) FROM eventIndex").fetchone()[0] == len(makeEvents())
+        main.close()
+        db.close()
+
+    @pytest.mark.parametrize('timebase', [Timebase.SOURCE, Timebase.CANONICAL])
+    @pytest.mark.parametrize('limit', [None, 4])
+    @pytest.mark.parametrize('ingestOrder', [False, True])
+    def test_queries_match_unsegmented(self, tempDir, timebase, limit, ingestOrder):
+        segmented = Database(str(tempDir / 'segmented.db'))
+        flat = Database(str(tempDir / 'flat.db'), segmentPeriod=None)
+        fillDatabase(segmented)
+        fillDatabase(flat)
+        for start, stop in [(f"{DAYS[0]}T00:00:00", f"{DAYS[2]}T23:59:59"),
+                            (f"{DAYS[1]}T12:00:02", f"{DAYS[2]}T12:00:04"),
+                            (f"{DAYS[1]}T00:00:00", f"{DAYS[1]}T23:59:59")]:
+            kwargs = dict(startTime=start, stopTime=stop, timebase=timebase, limit=limit, ingestOrder=ingestOrder)
+            assert queryIds(segmented, **kwargs) == queryIds(flat, **kwargs)
+        segmented.close()
+        flat.close()
+
+    @pytest.mark.parametrize('limit', [None, 5])
+    def test_ingest_order_across_out_of_order_days(self, tempDir, limit):
+        db = Database(str(tempDir / 'truth.db'))
+        inserted = []
+        for day in (DAYS[2], DAYS[0], DAYS[1]):
+            for i in range(2):
+                raw = RawFrame.create('scope', f"{day}T12:00:0{i}+00:00", 'sys', 'node', 'gps1', f"{day}-{i}".encode())
+                assert db.insertEvent(raw, f"{day}T12:00:0{i}+00:00")
+                inserted.append(raw.eventId)
+
+        # Late event for a segment being compacted is stored in the main file
+        db._compacting.add(DAYS[0])
+        late = RawFrame.create('scope', f"{DAYS[0]}T13:00:00+00:00", 'sys', 'node', 'gps1', b'late')
+        assert db.insertEvent(late, f"{DAYS[0]}T13:00:00+00:00")
+        db._compacting.discard(DAYS[0])
+        inserted.append(late.eventId)
+
+        events = db.queryEvents(f"{DAYS[0]}T00:00:00", f"{DAYS[2]}T23:59:59", Timebase.CANONICAL,
+                                lanes=[Lane.RAW], limit=limit, ingestOrder=True)
+        assert [e['eventId'] for e in events] == inserted[:limit]
+        assert all('ingestSeq' not in e for e in events)
+        db.close()
+
+    def test_only_overlapping_segments_opened(self, tempDir):
+        db = Database(str(tempDir / 'truth.db'))
+        fillDatabase(db)
+        db.close()
+
+        db = Database(str(tempDir / 'truth.db'))
+        events = db.queryEvents(f"{DAYS[2]}T00:00:00", f"{DAYS[2]}T23:59:59", Timebase.CANONICAL, lanes=[Lane.PARSED])
+        assert len(events) == 6
+        assert list(db._segmentReaders) == [DAYS[2]]
+        db.close()
+
+    def test_dedupe_is_global_across_segments(self, tempDir):
+        db = Database(str(tempDir / 'truth.db'))
+        raw = RawFrame.create('scope', f"{DAYS[0]}T12:00:00+00:00", 'sys', 'node', 'gps1', b'\x01')
+        assert db.insertEvent(raw, f"{DAYS[0]}T12:00:01+00:00")
+        assert not db.insertEvent(raw, f"{DAYS[2]}T12:00:01+00:00")
+        assert db.queryEvents(f"{DAYS[2]}T00:00:00", f"{DAYS[2]}T23:59:59", Timebase.CANONICAL) == []
+        db.close()
+
+    def test_unindexed_segment_rows_reindexed_on_open(self, tempDir):
+        db = Database(str(tempDir / 'truth.db'))
+        fillDatabase(db)
+        lastRaw = makeEvents()[-3][0]
+        db.close()
+
+        # Simulate a crash after the segment commit but before the eventIndex commit
+        main = sqlite3.connect(str(tempDir / 'truth.db'))
+        main.execute("DELETE FROM eventIndex WHERE eventId = ?", (lastRaw.eventId,))
+        main.execute("UPDATE segmentCatalog SET minSourceKey = NULL, maxSourceKey = NULL WHERE segmentId = ?", (DAYS[2],))
+        main.commit()
+        main.close()
+
+        db = Database(str(tempDir / 'truth.db'))
+        assert not db.insertEvent(lastRaw, f"{DAYS[2]}T12:00:30+00:00")
+        assert db.listSegments()[-1]['maxSourceKey'] == DAYS[2]
+        db.close()
+
+    def test_archive_segment(self, tempDir):
+        db = Database(str(tempDir / 'truth.db'))
+        fillDatabase(db)
+        archivePath = db.archiveSegment(DAYS[0], str(tempDir / 'archive'))
+        assert Path(archivePath).exists()
+        assert not list((tempDir / 'truth_segments').glob(f"*{DAYS[0]}*"))
+
+        window = dict(startTime=f"{DAYS[0]}T00:00:00", stopTime=f"{DAYS[2]}T23:59:59", timebase=Timebase.CANONICAL,
+                      lanes=[Lane.RAW])
+        assert len(db.queryEvents(**window)) == 12
+        firstRaw = makeEvents()[0][0]
+        assert not db.insertEvent(firstRaw, f"{DAYS[2]}T13:00:00+00:00")
+
+        with pytest.raises(DatabaseError):
+            db.archiveSegment(DAYS[2], str(tempDir / 'archive'))
+        db.close()
+
+        db = Database(str(tempDir / 'truth.db'))
+        assert [s['state'] for s in db.listSegments()] == ['archived', 'active', 'active']
+        assert len(db.queryEvents(**window)) == 12
+        db.close()
@@ -0,0 +1,96 @@
+"""
+Dedupe Filter Tests
+
+Verifies the recent-eventId Bloom filter and its use in Database.insertEvent:
+- No false negatives for recent ids; false positive rate near target
+- Generation rotation forgets old ids without affecting dedupe correctness
+- Duplicates are rejected via indexed read (no failed write), filter rebuilt at open
+"""
+
+import random
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nova.core.database import Database
+from nova.core.dedupeFilter import DedupeFilter
+from nova.core.events import RawFrame
+
+
+def randomIds(count, seed):
+    rng = random.Random(seed)
+    return ['%064x' % rng.getrandbits(256) for _ in range(count)]
+
+
+def makeFrames(count, day='2026-02-01'):
+    return [RawFrame.create('scope', f"{day}T00:00:00.{i:06d}+00:00", 'sys', 'node', 'gps1', i.to_bytes(4, 'big'))
+            for i in range(count)]
+
+
+class TestDedupeFilter:
+
+    def test_no_false_negatives_and_bounded_false_positives(self):
+        dedupeFilter = DedupeFilter(capacity=10000, falsePositiveRate=0.01)
+        added = randomIds(10000, seed=1)
+        dedupeFilter.update(added)
+        assert all(dedupeFilter.mightContain(eventId) for eventId in added)
+        falsePositives = sum(dedupeFilter.mightContain(eventId) for eventId in randomIds(20000, seed=2))
+        assert falsePositives / 20000 < 0.03
+
+    def test_bulk_update_matches_single_adds(self):
+        pytest.importorskip('numpy')
+        ids = randomIds(500, seed=6) + ['mixed-non-hex-id']
+        bulk, single = DedupeFilter(capacity=300), DedupeFilter(capacity=300)
+        bulk.update(ids)
+        for eventId in ids:
+            single.add(eventId)
+        assert (bulk._current, bulk._previous) == (single._current, single._previous)
+
+    def test_non_hex_ids_supported(self):
+        dedupeFilter = DedupeFilter(capacity=100)
+        dedupeFilter.add('not-a-sha256-id')
+        assert 'not-a-sha256-id' in dedupeFilter
+
+    def test_rotation_keeps_two_generations(self):
+        dedupeFilter = DedupeFilter(capacity=100)
+        first, second, third = randomIds(100, 3), randomIds(100, 4), randomIds(100, 5)
+        for batch in (first, second, third):
+            dedupeFilter.update(batch)
+        assert all(eventId in dedupeFilter for eventId in second + third)
+        assert sum(eventId in dedupeFilter for eventId in first) < 20
+
+
+class TestDatabaseDedupe:
+
+    def test_duplicates_confirmed_by_read(self, tempDir):
+        db = Database(str(tempDir / 'truth.db'))
+        frames = makeFrames(50)
+        assert all(db.insertEvent(frame, '2026-02-01T00:00:01+00:00') for frame in frames)
+        assert not any(db.insertEvent(frame, '2026-02-01T00:00:02+00:00') for frame in frames)
+        assert db.dedupeStats['duplicates'] == 50
+        assert db.dedupeStats['missed'] == 0
+        db.close()
+
+    def test_filter_rebuilt_at_open(self, tempDir):
+        db = Database(str(tempDir / 'truth.db'))
+        frames = makeFrames(20)
+        for frame in frames:
+            db.insertEvent(frame, '2026-02-01T00:00:01+00:00')
+        db.close()
+
+        db = Database(str(tempDir / 'truth.db'))
+        assert not db.insertEvent(frames[0], '2026-02-01T00:00:02+00:00')
+        assert db.dedupeStats['duplicates'] == 1
+        db.close()
+
+    def test_forgotten_ids_still_deduped(self, tempDir):
+        db = Database(str(tempDir / 'truth.db'), dedupeFilterCapacity=10)
+        frames = makeFrames(60)
+        for frame in frames:
+            db.insertEvent(frame, '2026-02-01T00:00:01+00:00')
+        assert not any(db.insertEvent(frame, '2026-02-01T00:00:02+00:00') for frame in frames)
+        assert db.dedupeStats['duplicates'] + db.dedupeStats['missed'] == 60
+        db.close()
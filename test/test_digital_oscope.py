@@ -0,0 +1,98 @@
+"""
+Digital Oscope Analysis Tests
+
+Verifies sdk.hardwareService.devices.digitalOscopeDevice.analyzeChannels against a
+naive per-channel, per-sample implementation:
+- Edge times and counts, duty cycle, frequency and first-high index per channel,
+  including channels that start high, never change or never go high
+- Channel count validation (1-16 lines of a 16-bit sample)
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sdk.hardwareService.devices.digitalOscopeDevice import analyzeChannels
+
+
+SAMPLE_RATE = 100e6
+
+
+def naiveAnalyze(samples, numChannels, sampleRate):
+    """Reference: walk every sample of every channel"""
+    nsPerSample = 1e9 / sampleRate
+    result = {}
+    for channel in range(numChannels):
+        levels = [(int(sample) >> channel) & 1 for sample in samples]
+        rising = [i for i in range(1, len(levels)) if levels[i] and not levels[i - 1]]
+        falling = [i for i in range(1, len(levels)) if levels[i - 1] and not levels[i]]
+        firstHigh = next((i for i, level in enumerate(levels) if level), None)
+        frequencyHz = sampleRate * (len(rising) - 1) / (rising[-1] - rising[0]) if len(rising) > 1 else None
+        result[channel] = {
+            'firstHigh': firstHigh,
+            'risingEdgesNs': [i * nsPerSample for i in rising],
+            'fallingEdgesNs': [i * nsPerSample for i in falling],
+            'risingCount': len(rising),
+            'fallingCount': len(falling),
+            'duty': sum(levels) / len(levels) if levels else 0.0,
+            'frequencyHz': frequencyHz,
+        }
+    return result
+
+
+def assertMatches(actual, expected):
+    assert actual.keys() == expected.keys()
+    for channel, stats in expected.items():
+        for key in ('firstHigh', 'risingCount', 'fallingCount'):
+            assert actual[channel][key] == stats[key], (channel, key)
+        assert actual[channel]['duty'] == pytest.approx(stats['duty']), channel
+        np.testing.assert_allclose(actual[channel]['risingEdgesNs'], stats['risingEdgesNs'])
+        np.testing.assert_allclose(actual[channel]['fallingEdgesNs'], stats['fallingEdgesNs'])
+        if stats['frequencyHz'] is None:
+            assert actual[channel]['frequencyHz'] is None, channel
+        else:
+            assert actual[channel]['frequencyHz'] == pytest.approx(stats['frequencyHz']), channel
+
+
+class TestAnalyzeChannels:
+
+    def test_matches_naive_on_square_waves(self):
+        index = np.arange(4000)
+        samples = np.zeros(len(index), dtype=np.uint16)
+        for channel in range(15):
+            period = 10 + 7 * channel
+            phase = (index + 3 * channel) % period < period // (2 + channel % 3)  # Varied duty and phase
+            samples |= (phase.astype(np.uint16) << channel)
+        samples |= (index >= 1234).astype(np.uint16) << 15  # Channel 15: single rising edge
+        samples &= ~np.uint16(1 << 14)  # Channel 14: never high
+
+        result = analyzeChannels(samples, 16, SAMPLE_RATE)
+        assertMatches(result, naiveAnalyze(samples, 16, SAMPLE_RATE))
+        assert result[0]['firstHigh'] == 0 and result[0]['fallingEdgesNs'][0] == 5 * 10.0  # Starts high
+        assert result[14]['firstHigh'] is None and result[14]['duty'] == 0.0
+        assert result[15]['risingCount'] == 1 and result[15]['frequencyHz'] is None
+        assert result[1]['frequencyHz'] == pytest.approx(SAMPLE_RATE / 17)
+
+    def test_matches_naive_on_random_captures(self):
+        rng = np.random.default_rng(7)
+        for numChannels in (1, 8, 15, 16):
+            # Sparse toggles per line, so runs of constant level alternate with bursts of edges
+            toggles = rng.random((2000, 16)) < 0.03
+            levels = np.cumsum(toggles, axis=0) % 2
+            levels[:, 3] ^= 1  # Channel 3 starts high
+            samples = (levels.astype(np.uint16) << np.arange(16, dtype=np.uint16)).sum(axis=1).astype(np.uint16)
+            assertMatches(analyzeChannels(samples, numChannels, SAMPLE_RATE),
+                          naiveAnalyze(samples, numChannels, SAMPLE_RATE))
+
+        for samples in (np.array([], dtype=np.uint16), np.array([0xFFFF], dtype=np.uint16)):
+            assertMatches(analyzeChannels(samples, 4, SAMPLE_RATE), naiveAnalyze(samples, 4, SAMPLE_RATE))
+
+    def test_channel_count_validated(self):
+        samples = np.zeros(16, dtype=np.uint16)
+        for numChannels in (0, 17, 32):
+            with pytest.raises(ValueError, match='1-16 channels'):
+                analyzeChannels(samples, numChannels, SAMPLE_RATE)
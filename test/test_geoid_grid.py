@@ -0,0 +1,116 @@
+"""
+Geoid Grid Tests
+
+Verifies the gridded geoid model used by Globe.getGeoidSeperation:
+- Grid nodes reproduce the CSV samples exactly (within float32 precision)
+- Scalar and vectorized lookups agree
+- Binary cache is memory-mapped on reload and rebuilt when the CSV changes,
+  or when it is truncated or its shape or values fail validation
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sdk.globe import Globe
+from sdk.globe.geoid import GeoidGrid
+
+
+CSV_PATH = Path(__file__).parent.parent / 'sdk' / 'globe' / 'geoidHeights.csv'
+
+
+@pytest.fixture
+def tempCsv():
+    """Copy of the geoid CSV in a temp directory (tests keep the binary cache there too)"""
+    dirPath = Path(tempfile.mkdtemp())
+    csvPath = dirPath / 'geoidHeights.csv'
+    shutil.copy(CSV_PATH, csvPath)
+    yield csvPath
+    GeoidGrid._loaded.pop(os.path.realpath(csvPath), None)
+    shutil.rmtree(dirPath, ignore_errors=True)
+
+
+def loadSamples(csvPath, count=200):
+    """Return (lats, lons, heights) for an evenly spaced subset of CSV rows"""
+    lats, lons, heights = np.loadtxt(csvPath, delimiter=',', skiprows=1, usecols=(1, 2, 3), unpack=True)
+    idx = np.linspace(0, len(lats) - 1, count).astype(int)
+    return lats[idx], lons[idx], heights[idx]
+
+
+class TestGeoidGrid:
+
+    def test_nodes_match_csv(self, tempCsv):
+        grid = GeoidGrid.fromCsv(tempCsv)
+        lats, lons, heights = loadSamples(tempCsv)
+        np.testing.assert_allclose(grid.interpolate(lats, lons), heights, atol=1e-3)
+
+    def test_scalar_matches_vectorized(self, tempCsv):
+        grid = GeoidGrid.fromCsv(tempCsv)
+        rng = np.random.default_rng(0)
+        lats = rng.uniform(85.0, 90.0, 100)
+        lons = rng.uniform(-20.0, 20.0, 100)
+        batch = grid.interpolate(lats, lons)
+        for lat, lon, expected in zip(lats, lons, batch):
+            assert grid.interpolate(float(lat), float(lon)) == pytest.approx(expected, abs=1e-9)
+
+    def test_interpolates_between_nodes(self, tempCsv):
+        grid = GeoidGrid.fromCsv(tempCsv)
+        lat, lon0, lon1 = 88.0, 5.0, 5.0 + grid.dLon
+        midpoint = grid.interpolate(lat, (lon0 + lon1) / 2)
+        assert midpoint == pytest.approx((grid.interpolate(lat, lon0) + grid.interpolate(lat, lon1)) / 2, abs=1e-6)
+
+    def test_cache_reload_is_memory_mapped(self, tempCsv):
+        built = GeoidGrid.load(tempCsv, cacheDir=str(tempCsv.parent / 'cache'))
+        GeoidGrid._loaded.clear()
+        reloaded = GeoidGrid.load(tempCsv, cacheDir=str(tempCsv.parent / 'cache'))
+        assert isinstance(reloaded.heights, np.memmap)
+        assert reloaded.interpolate(87.3, 4.2) == pytest.approx(built.interpolate(87.3, 4.2))
+        assert not list(tempCsv.parent.glob('*.grid.*'))  # Nothing written next to the CSV
+
+    def test_cache_invalidated_when_csv_changes(self, tempCsv):
+        cacheDir = str(tempCsv.parent / 'cache')
+        GeoidGrid.load(tempCsv, cacheDir=cacheDir)
+        GeoidGrid._loaded.clear()
+        stat = os.stat(tempCsv)
+        os.utime(tempCsv, (stat.st_atime, stat.st_mtime + 10))
+        assert GeoidGrid._loadCache(os.path.realpath(tempCsv), cacheDir) is None
+
+    def test_corrupt_cache_rejected(self, tempCsv):
+        cacheDir = str(tempCsv.parent / 'cache')
+        csvPath = os.path.realpath(tempCsv)
+        built = GeoidGrid.load(tempCsv, cacheDir=cacheDir)
+        gridPath, _ = GeoidGrid._cachePaths(csvPath, cacheDir)
+        valid = np.array(built.heights)
+
+        corruptions = [
+            lambda: np.save(gridPath, np.zeros((valid.shape[0] * 2, valid.shape[1]), dtype=np.float32)),  # Wrong shape
+            lambda: np.save(gridPath, np.full_like(valid, 1e6)),                                            # Out of range
+            lambda: np.save(gridPath, np.where(valid > 20, np.nan, valid).astype(np.float32)),             # NaN cells
+            lambda: os.truncate(gridPath, os.path.getsize(gridPath) // 2),                                  # Interrupted write
+        ]
+        for corrupt in corruptions:
+            corrupt()
+            assert GeoidGrid._loadCache(csvPath, cacheDir) is None
+            GeoidGrid._loaded.clear()
+            rebuilt = GeoidGrid.load(tempCsv, cacheDir=cacheDir)        # Rebuilds from the CSV and rewrites the cache
+            np.testing.assert_array_equal(rebuilt.heights, valid)
+            assert GeoidGrid._loadCache(csvPath, cacheDir) is not None
+        assert not [name for name in os.listdir(cacheDir) if name.endswith('.tmp')]
+
+
+class TestGlobeGeoid:
+
+    def test_orthometric_height(self, tempDir, monkeypatch):
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tempDir))
+        globe = Globe()
+        separation = globe.getGeoidSeperation(88.0, 5.0)
+        assert globe.haeToMsl(88.0, 5.0, 100.0) == pytest.approx(100.0 - separation)
+        heights = globe.haeToMsl([88.0, 88.0], [5.0, 5.0], [100.0, 200.0])
+        np.testing.assert_allclose(heights, [100.0 - separation, 200.0 - separation])
@@ -0,0 +1,110 @@
+"""
+Manifest Publication and Discovery Cache Tests
+
+Verifies:
+- ManifestPublished is content-addressed: a restart on the same database with
+  unchanged manifests emits nothing, a changed manifest is re-emitted
+- Card manifest discovery reuses the compiled cache and re-executes only files
+  whose mtime/size changed
+"""
+
+import os
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nova.core.database import Database
+from nova.core.events import Lane, Timebase
+from nova.core.manifests import ManifestRegistry
+from nova.core.manifests import fileCache
+from nova.core.manifests.cards import CardRegistry
+
+
+CARD_MANIFEST = '''
+from nova.core.manifests.cards import CardManifest
+
+MANIFEST = CardManifest(cardType="{cardType}", title="{title}", icon="x", color="#000000",
+                        onlineIndicator=False, entityTypes=["{cardType}"], widgets=[], actions=[])
+'''
+
+
+def publishedEvents(database):
+    events = database.queryEvents(startTime='0000', stopTime='9999', timebase=Timebase.CANONICAL, lanes=[Lane.METADATA], messageType='ManifestPublished')
+    return [e for e in events if e['messageType'] == 'ManifestPublished']
+
+
+def writeCard(manifestDir, name, cardType, title):
+    path = manifestDir / f"{name}.manifest.py"
+    path.write_text(CARD_MANIFEST.format(cardType=cardType, title=title))
+    return path
+
+
+class TestManifestPublish:
+
+    def test_restart_unchanged_emits_nothing(self, tempDir):
+        database = Database(str(tempDir / 'truth.db'))
+        try:
+            first = ManifestRegistry(database=database)
+            count = first.loadBuiltinManifests()
+            assert len(publishedEvents(database)) == count
+            assert all(r.publishedAt is not None for r in first._records.values())
+
+            restarted = ManifestRegistry(database=database)
+            restarted.loadBuiltinManifests()
+            assert len(publishedEvents(database)) == count
+            assert all(r.publishedAt is None and r.contentHash for r in restarted._records.values())
+
+            # A changed definition is published again, only for that manifest
+            manifest = restarted.getAllManifests()[0]
+            manifest.description = (manifest.description or '') + ' (revised)'
+            ManifestRegistry(database=database).register(manifest)
+            events = publishedEvents(database)
+            assert len(events) == count + 1
+            assert events[-1]['manifestId'] == manifest.manifestId
+        finally:
+            database.close()
+
+
+class TestManifestFileCache:
+
+    def test_discovery_reuses_cache(self, tempDir, monkeypatch):
+        writeCard(tempDir, 'alpha', 'alpha-card', 'Alpha')
+        betaPath = writeCard(tempDir, 'beta', 'beta-card', 'Beta')
+        (tempDir / 'empty.manifest.py').write_text('VALUE = 1\n')
+
+        executed = []
+        realExec = fileCache._execExport
+        monkeypatch.setattr(fileCache, '_execExport', lambda path, name: executed.append(path.name) or realExec(path, name))
+
+        assert CardRegistry().discover(tempDir) == 2
+        assert len(executed) == 3
+        assert (tempDir / '__pycache__' / 'cards.cache.pickle').exists()
+
+        executed.clear()
+        registry = CardRegistry()
+        assert registry.discover(tempDir) == 2
+        assert executed == []
+        assert registry.getManifest('beta-card').title == 'Beta'
+
+        # Rewrite beta with a newer mtime: only beta executes again
+        writeCard(tempDir, 'beta', 'beta-card', 'Beta 2')
+        stat = betaPath.stat()
+        os.utime(betaPath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        registry = CardRegistry()
+        registry.discover(tempDir)
+        assert executed == ['beta.manifest.py']
+        assert registry.getManifest('beta-card').title == 'Beta 2'
+
+        # A changed schema source (manifest class module) discards every cached object
+        schemaPath = tempDir / 'schema.py'
+        schemaPath.write_text('class CardManifest: pass\n')
+        executed.clear()
+        fileCache.loadManifestFiles(tempDir, '*.manifest.py', 'MANIFEST', 'cards.cache.pickle', (str(schemaPath),))
+        assert len(executed) == 3
+        executed.clear()
+        fileCache.loadManifestFiles(tempDir, '*.manifest.py', 'MANIFEST', 'cards.cache.pickle', (str(schemaPath),))
+        assert executed == []
+        schemaPath.write_text('class CardManifest:\n    version = 2\n')
+        fileCache.loadManifestFiles(tempDir, '*.manifest.py', 'MANIFEST', 'cards.cache.pickle', (str(schemaPath),))
+        assert len(executed) == 3
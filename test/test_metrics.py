@@ -0,0 +1,168 @@
+"""
+Metrics Registry Tests
+
+Verifies nova.core.metrics and its instrumentation:
+- Counters, gauges (incl. callback gauges) and histograms with labels
+- Prometheus text rendering (cumulative buckets, constant process label)
+- Ingest / Database record ingest outcomes and latencies
+- Core metrics snapshot round trip over IPC (CoreIPCHandler -> ServerIPCClient)
+- /metrics requires the bearer token or an admin session unless configured public
+"""
+
+import asyncio
+import math
+import pickle
+import queue
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from aiohttp.test_utils import make_mocked_request
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nova.core.metrics import MetricsRegistry, getRegistry, renderPrometheus
+from nova.core.database import Database
+from nova.core.ingest import Ingest, IngestError
+from nova.core.events import RawFrame
+
+
+class TestRegistry:
+
+    def test_counter_gauge_histogram(self):
+        registry = MetricsRegistry()
+        counter = registry.counter('x_total', 'x', ('lane',))
+        counter.inc(lane='raw')
+        counter.inc(2, lane='raw')
+        assert counter.value(lane='raw') == 3
+        assert registry.counter('x_total', 'x', ('lane',)) is counter
+        with pytest.raises(ValueError):
+            registry.gauge('x_total', 'x')
+        with pytest.raises(ValueError):
+            counter.inc(stream='a')
+
+        gauge = registry.gauge('depth', 'queue depth', ('queue',))
+        items = [1, 2]
+        gauge.setFunction(lambda: len(items), queue='a')
+        gauge.set(5, queue='b')
+        items.append(3)
+        assert gauge.value(queue='a') == 3 and gauge.value(queue='b') == 5
+        gauge.setFunction(lambda: 1 / 0, queue='broken')
+        assert math.isnan(gauge.value(queue='broken'))
+        gauge.remove(queue='b')
+        assert len(gauge.samples()) == 2
+
+        histogram = registry.histogram('latency_seconds', 'latency', buckets=(0.01, 0.1))
+        for value in (0.005, 0.05, 0.05, 5):
+            histogram.observe(value)
+        with histogram.time():
+            pass
+        (_, series), = histogram.samples()
+        assert series['counts'] == [2, 2, 1] and series['count'] == 5
+
+    def test_prometheus_text(self):
+        registry = MetricsRegistry()
+        registry.counter('nova_a_total', 'A count', ('lane',)).inc(3, lane='raw')
+        registry.gauge('nova_b', 'B value').set(1.5)
+        histogram = registry.histogram('nova_c_seconds', 'C latency', buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+
+        snapshot = pickle.loads(pickle.dumps(registry.snapshot()))
+        text = renderPrometheus([({'process': 'core'}, snapshot)])
+        lines = text.splitlines()
+        assert '# TYPE nova_a_total counter' in lines
+        assert 'nova_a_total{process="core",lane="raw"} 3' in lines
+        assert 'nova_b{process="core"} 1.5' in lines
+        assert 'nova_c_seconds_bucket{process="core",le="0.1"} 1' in lines
+        assert 'nova_c_seconds_bucket{process="core",le="1"} 2' in lines
+        assert 'nova_c_seconds_bucket{process="core",le="+Inf"} 2' in lines
+        assert 'nova_c_seconds_count{process="core"} 2' in lines
+        assert text.endswith('\n')
+
+
+class TestInstrumentation:
+
+    def test_ingest_and_database_metrics(self, tempDir):
+        registry = getRegistry()
+        ingested = registry.get('nova_ingest_events_total')
+        inserts = registry.get('nova_db_inserts_total')
+        before = {result: ingested.value(lane='raw', result=result) for result in ('inserted', 'deduped', 'rejected')}
+        insertsBefore = inserts.value(lane='raw', result='duplicate')
+
+        database = Database(str(tempDir / 'truth.db'))
+        ingest = Ingest(database)
+        frame = RawFrame.create('scope', datetime.now(timezone.utc).isoformat(), 'sys', 'node', 'gps1', b'\x01')
+        assert ingest.ingest(frame)
+        assert not ingest.ingest(frame)
+        bad = RawFrame.create('scope', 'not-a-time', 'sys', 'node', 'gps1', b'\x02')
+        with pytest.raises(IngestError):
+            ingest.ingest(bad)
+
+        assert ingested.value(lane='raw', result='inserted') == before['inserted'] + 1
+        assert ingested.value(lane='raw', result='deduped') == before['deduped'] + 1
+        assert ingested.value(lane='raw', result='rejected') == before['rejected'] + 1
+        assert inserts.value(lane='raw', result='duplicate') == insertsBefore + 1
+
+        database.queryEvents('1970-01-01', '2100-01-01', 'canonical')
+        assert registry.get('nova_db_query_seconds').samples()[0][1]['count'] >= 1
+        database.close()
+
+    def test_core_metrics_over_ipc(self, tempDir):
+        from nova.core.ipc import CoreIPCHandler
+        from nova.server.ipc import ServerIPCClient
+
+        async def run():
+            requestQueue, responseQueue = queue.Queue(), queue.Queue()
+            database = Database(str(tempDir / 'truth.db'))
+            handler = CoreIPCHandler(database, requestQueue, responseQueue, {'exportDir': str(tempDir / 'exports')})
+            client = ServerIPCClient(requestQueue, responseQueue)
+            handler.running = True
+            await client.start()
+            coreTask = asyncio.create_task(handler._processRequests())
+            try:
+                snapshot = await client.getMetrics(timeout=5.0)
+            finally:
+                handler.running = False
+                await client.stop()
+                await coreTask
+                database.close()
+            return snapshot
+
+        snapshot = asyncio.run(run())
+        names = {metric['name'] for metric in snapshot}
+        assert {'nova_ipc_queue_depth', 'nova_db_insert_seconds', 'nova_stream_active'} <= names
+        text = renderPrometheus([({'process': 'core'}, snapshot)])
+        assert 'nova_ipc_queue_depth{process="core",queue="request"}' in text
+
+    def test_metrics_route_auth(self):
+        from nova.server.server import NovaServer
+
+        class Server:
+            metrics = MetricsRegistry()
+            log = None
+
+            def __init__(self, metricsConfig, admin=False):
+                self.metricsConfig = metricsConfig
+                self.admin = admin
+
+            def _checkAdminAuth(self, request):
+                return {'role': 'admin'} if self.admin else None
+
+            class ipcClient:
+                @staticmethod
+                async def getMetrics():
+                    return []
+
+        def status(metricsConfig, admin=False, token=None):
+            headers = {'Authorization': f'Bearer {token}'} if token else {}
+            request = make_mocked_request('GET', '/metrics', headers=headers)
+            return asyncio.run(NovaServer.handleMetrics(Server(metricsConfig, admin), request)).status
+
+        assert status({}) == 401  # Default: no anonymous scrapes
+        assert status({'bearerToken': None}, token='None') == 401
+        assert status({}, admin=True) == 200
+        assert status({'bearerToken': 's3cret'}, token='s3cret') == 200
+        assert status({'bearerToken': 's3cret'}, token='wrong') == 401
+        assert status({'public': True}) == 200
@@ -0,0 +1,104 @@
+"""
+Overview Pyramid Tests
+
+Verifies nova.core.overview with Database:
+- Buckets maintained at ingest (observe) match a rebuild from stored truth
+- Tier selection keeps wide windows to a bounded number of buckets
+- Invalid tiers, timebases and windows are rejected
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bench import synthetic
+from nova.core.database import Database
+from nova.core.ingest import Ingest
+from nova.core.overview import OverviewPyramid, OverviewError
+
+
+def microseconds(when: datetime) -> int:
+    return int(when.timestamp() * 1_000_000)
+
+
+def loadRecording(database, pyramid, seconds, rateHz):
+    """synthetic.truthEvents stored with canonicalTruthTime = sourceTruthTime and observed"""
+    events = synthetic.truthEvents(seconds, rateHz, 2)
+    for event in events:
+        if database.insertEvent(event, event.sourceTruthTime):
+            pyramid.observe(event, event.sourceTruthTime)
+    pyramid.flush()
+    return events
+
+
+def snapshot(result):
+    return {(s['lane'], s['uniqueId'], s['messageType']): (s['buckets'], s['fields']) for s in result['series']}
+
+
+class TestOverviewPyramid:
+
+    def test_incremental_matches_rebuild(self, tempDir):
+        database = Database(str(tempDir / 'truth.db'))
+        pyramid = OverviewPyramid(database, tiers=(1, 60), flushEvents=37)
+        events = loadRecording(database, pyramid, 90, 5)
+        start, stop = microseconds(synthetic.BASE_TIME), microseconds(synthetic.BASE_TIME) + 90_000_000
+
+        fine = pyramid.query(start, stop, tier=1)
+        series = snapshot(fine)
+        parsed = [e for e in events if e.lane.value == 'parsed' and e.uniqueId == 'gps1']
+        buckets, fields = series[('parsed', 'gps1', 'ubx.nav_pvt')]
+        assert sum(count for _, count in buckets) == len(parsed) and len(buckets) == 90
+        assert buckets[0] == [start, 5]
+        lats = [e.payload['lat'] for e in parsed[:5]]
+        assert fields['lat'][0] == [start, min(lats), max(lats), lats[-1]]
+        assert ('raw', 'gps1', '') in series and ('ui', 'gps1', 'telemetry.gnss') in series
+
+        coarse = pyramid.query(start, stop, tier=60)
+        assert [count for _, count in snapshot(coarse)[('parsed', 'gps1', 'ubx.nav_pvt')][0]] == [300, 150]
+
+        result = pyramid.rebuild(synthetic.BASE_TIME.isoformat(), events[-1].sourceTruthTime)
+        assert result['events'] == len(events)
+        assert snapshot(pyramid.query(start, stop, tier=1)) == series
+        assert snapshot(pyramid.query(start, stop, tier=60)) == snapshot(coarse)
+        database.close()
+
+    def test_ingest_feeds_pyramid_and_tier_selection(self, tempDir):
+        database = Database(str(tempDir / 'truth.db'))
+        pyramid = OverviewPyramid(database)
+        ingest = Ingest(database, verifyEventId=False, overview=pyramid)
+        before = datetime.now(timezone.utc)
+        events = synthetic.truthEvents(2, 5, 1)
+        assert all(ingest.ingest(event) for event in events)
+        assert not ingest.ingest(events[0])  # Deduped events are not counted again
+
+        now = microseconds(datetime.now(timezone.utc))
+        result = pyramid.query(microseconds(before) - 1_000_000, now, filters={'lanes': ['parsed']})
+        assert result['tier'] == 1
+        assert [s['messageType'] for s in result['series']] == ['ubx.nav_pvt']
+        assert sum(count for _, count in result['series'][0]['buckets']) == 10
+
+        # Days-wide windows fall back to coarser tiers: bucket count bounded by the budget
+        assert pyramid.query(now - 3 * 86400_000_000, now, maxBuckets=500)['tier'] == 3600
+        assert pyramid.selectTier(0, 600, 1000) == 1
+        assert pyramid.selectTier(0, 12 * 3600, 1000) == 60
+        assert pyramid.selectTier(0, 30 * 86400, 1000) == 3600
+        database.close()
+
+    def test_validation(self, tempDir):
+        database = Database(str(tempDir / 'truth.db'))
+        with pytest.raises(OverviewError):
+            OverviewPyramid(database, tiers=(1, 60, 90))
+        assert OverviewPyramid.fromConfig(database, {'enabled': False}) is None
+        pyramid = OverviewPyramid.fromConfig(database, {})
+        with pytest.raises(OverviewError):
+            pyramid.query(0, 1_000_000, timebase='source')
+        with pytest.raises(OverviewError):
+            pyramid.query(2_000_000, 1_000_000)
+        with pytest.raises(OverviewError):
+            pyramid.query(0, 1_000_000, tier=5)
+        assert pyramid.rebuild()['events'] == 0
+        database.close()
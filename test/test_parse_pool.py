@@ -0,0 +1,150 @@
+"""
+Parse Pool Tests
+
+Verifies sdk.hardwareService.parsePool with the device read loops:
+- UBX and SBF devices publish the same parsed messages, in the same order,
+  with the pool as with inline parsing (chunk boundaries split messages)
+- In-flight chunks are bounded across concurrently reading devices
+- Config handling and inline fallback when the pool is broken
+"""
+
+import asyncio
+import concurrent.futures
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bench import synthetic
+from sdk.hardwareService.parsePool import ParsePool
+from sdk.hardwareService.devices.ubxDevice import UBXDevice
+from sdk.hardwareService.devices.sbfDevice import SBFDevice
+from sdk.parsers.ubx import Ubx
+
+
+class EndOfStream(Exception):
+    pass
+
+
+class Reader:
+    """Serial reader stand-in: fixed-size chunks, then EndOfStream (ends readLoop)"""
+
+    def __init__(self, data, chunkBytes=1000):
+        self.chunks = [data[i:i + chunkBytes] for i in range(0, len(data), chunkBytes)]
+
+    async def read(self, size):
+        if not self.chunks:
+            raise EndOfStream()
+        return self.chunks.pop(0)
+
+
+class Adapter:
+    """NovaAdapter stand-in recording parsed publishes"""
+
+    def __init__(self):
+        self.parsed = []
+
+    async def publishEntityDescriptor(self, **kwargs):
+        pass
+
+    async def publishRaw(self, deviceId, sequence, data):
+        pass
+
+    async def publishParsed(self, deviceId, streamId, streamType, payload):
+        self.parsed.append((streamType, payload))
+
+    async def publishUiUpdate(self, **kwargs):
+        pass
+
+
+def runDevices(devices):
+    async def run():
+        results = await asyncio.gather(*(device.readLoop() for device in devices), return_exceptions=True)
+        assert all(isinstance(result, EndOfStream) for result in results)
+    asyncio.run(run())
+
+
+def ubxDevice(deviceId, data, parsePool):
+    device = UBXDevice(deviceId, 'ttyTEST', 115200, None, novaAdapter=Adapter(), rxType='ubx')
+    device.reader, device.parsePool = Reader(data), parsePool
+    return device
+
+
+def sbfDevice(deviceId, data, parsePool):
+    device = SBFDevice(deviceId, 'ttyTEST', 115200, None, novaAdapter=Adapter(), rxType='x5')
+    device.reader, device.parsePool = Reader(data), parsePool
+    return device
+
+
+@pytest.fixture
+def parsePool():
+    pool = ParsePool(2, maxInFlight=2)
+    yield pool
+    pool.shutdown()
+
+
+class TestParsePool:
+
+    def test_pool_matches_inline_per_device(self, parsePool):
+        ubxData, ubxFrames = synthetic.ubxStream(3, 5)
+        sbfData, sbfBlocks = synthetic.sbfStream(3, 5)
+        inline = [ubxDevice('gps1', ubxData, None), sbfDevice('gps2', sbfData, None)]
+        pooled = [ubxDevice('gps1', ubxData, parsePool), sbfDevice('gps2', sbfData, parsePool),
+                  ubxDevice('gps3', ubxData[7:], parsePool)]
+        runDevices(inline)
+        runDevices(pooled)
+
+        assert parsePool.submitted > 0 and not parsePool.broken
+        for expected, actual in zip(inline, pooled):
+            assert actual.novaAdapter.parsed == expected.novaAdapter.parsed
+        navPvt = [payload for streamType, payload in pooled[0].novaAdapter.parsed if streamType == 'ubx.nav_pvt']
+        assert len(navPvt) == ubxFrames // 2
+        assert [p['iTOW (ms)'] for p in navPvt] == sorted(p['iTOW (ms)'] for p in navPvt)
+        assert len(pooled[1].novaAdapter.parsed) == sbfBlocks
+        # gps3 starts mid-frame: the partial first frame is dropped, the rest parse in order
+        offset = pooled[2].novaAdapter.parsed
+        assert 0 < len(offset) < len(pooled[0].novaAdapter.parsed) and offset == pooled[0].novaAdapter.parsed[-len(offset):]
+
+    def test_in_flight_bounded(self, parsePool, monkeypatch):
+        inFlight, peak = 0, []
+        realRunInExecutor = asyncio.BaseEventLoop.run_in_executor
+
+        async def counting(future):
+            nonlocal inFlight
+            inFlight += 1
+            peak.append(inFlight)
+            try:
+                return await future
+            finally:
+                inFlight -= 1
+
+        def runInExecutor(loop, executor, func, *args):
+            return counting(realRunInExecutor(loop, executor, func, *args))
+
+        monkeypatch.setattr(asyncio.BaseEventLoop, 'run_in_executor', runInExecutor)
+        ubxData, _ = synthetic.ubxStream(2, 5)
+        runDevices([ubxDevice(f'gps{i}', ubxData, parsePool) for i in range(6)])
+        assert max(peak) == parsePool.maxInFlight == 2
+
+    def test_config_and_broken_fallback(self):
+        assert ParsePool.fromConfig(None) is None
+        assert ParsePool.fromConfig({'workers': 0}) is None
+        with pytest.raises(ValueError):
+            ParsePool.fromConfig({'workers': 1, 'mode': 'threads'})
+
+        pool = ParsePool.fromConfig({'workers': 1})
+        assert pool.maxInFlight == 2
+        pool.executor.shutdown()
+        pool.executor = brokenExecutor()
+        ubxData, ubxFrames = synthetic.ubxStream(1, 5)
+        remaining, messages = asyncio.run(pool.parseAll('ubx', Ubx(), ubxData))
+        assert pool.broken and remaining == b'' and len(messages) == ubxFrames
+
+
+def brokenExecutor():
+    class Broken(concurrent.futures.Executor):
+        def submit(self, fn, *args, **kwargs):
+            raise concurrent.futures.process.BrokenProcessPool('worker died')
+    return Broken()
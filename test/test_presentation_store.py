@@ -0,0 +1,73 @@
+"""
+Presentation Store Tests
+
+Verifies nova.server.presentationStore caching:
+- Reads and resolution are served from memory (no file opens) once loaded
+- Edits through the store are written atomically and reflected immediately
+- Edits made on disk are picked up through mtime/size invalidation
+"""
+
+import builtins
+import json
+import os
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nova.server.presentationStore import PresentationStore, FACTORY_DEFAULTS
+
+
+class TestPresentationStore:
+
+    def test_resolution_served_from_memory(self, tempDir, monkeypatch):
+        store = PresentationStore(str(tempDir))
+        assert store.setAdminDefault('scope', 'rx1', {'displayName': 'Admin', 'scale': 2.0})
+        assert store.setUserOverride('alice', 'scope', 'rx1', {'displayName': 'Mine'})
+
+        opened = []
+        realOpen = builtins.open
+        monkeypatch.setattr(builtins, 'open', lambda *args, **kwargs: opened.append(args[0]) or realOpen(*args, **kwargs))
+
+        for _ in range(3):
+            result = store.resolvePresentationBulk('alice', 'scope', ['rx1', 'rx2'])
+            assert result['rx1']['displayName'] == 'Mine' and result['rx1']['scale'] == 2.0
+            assert result['rx2'] == FACTORY_DEFAULTS
+            assert store.resolvePresentation(None, 'scope', 'rx1')['displayName'] == 'Admin'
+            assert store.getUserOverrides('alice', 'scope')['rx1'].displayName == 'Mine'
+        assert opened == []
+
+        # Returned dicts are copies
+        result['rx1']['displayName'] = 'mutated'
+        assert store.resolvePresentation('alice', 'scope', 'rx1')['displayName'] == 'Mine'
+
+    def test_edits_write_through(self, tempDir):
+        store = PresentationStore(str(tempDir))
+        store.setUserOverride('alice', 'scope', 'rx1', {'displayName': 'One', 'color': [1, 2, 3]})
+        assert store.resolvePresentation('alice', 'scope', 'rx1')['color'] == [1, 2, 3]
+
+        store.deleteUserOverride('alice', 'scope', 'rx1', key='color')
+        assert store.resolvePresentation('alice', 'scope', 'rx1')['color'] == FACTORY_DEFAULTS['color']
+
+        filePath = tempDir / 'users' / 'alice' / 'presentation.json'
+        assert json.loads(filePath.read_text()) == {'scope': {'rx1': {'displayName': 'One'}}}
+        assert list(filePath.parent.iterdir()) == [filePath]  # No temp file left behind
+
+        # A fresh store (restart) sees the same state
+        assert PresentationStore(str(tempDir)).resolvePresentation('alice', 'scope', 'rx1')['displayName'] == 'One'
+
+    def test_external_file_edit_invalidates(self, tempDir):
+        store = PresentationStore(str(tempDir))
+        store.setAdminDefault('a|b', 'rx1', {'displayName': 'Before'})
+        assert store.resolvePresentation(None, 'a|b', 'rx1')['displayName'] == 'Before'
+
+        filePath = tempDir / 'presentation' / 'defaults' / 'a_b.json'
+        filePath.write_text(json.dumps({'rx1': {'displayName': 'After'}}))
+        stat = filePath.stat()
+        os.utime(filePath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert store.resolvePresentation(None, 'a|b', 'rx1')['displayName'] == 'After'
+        assert store.getAllAdminDefaults()['a|b']['rx1'].displayName == 'After'
+
+        filePath.write_text('{not json')
+        assert store.getAdminDefaults('a|b') == {}
@@ -0,0 +1,95 @@
+"""
+Profiler Tests
+
+Verifies nova.core.profiler:
+- A session captures collapsed stacks, loop lag and slow callbacks caused by
+  blocking work on the event loop, and writes them to the diagnostics dir
+- Only one session per process; loop debug settings are restored afterwards
+- Core profiling over IPC (CoreIPCHandler -> ServerIPCClient.profile)
+"""
+
+import asyncio
+import json
+import queue
+import time
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nova.core.profiler import Profiler, ProfilerBusy
+from nova.core.database import Database
+
+
+def blockingWork():
+    time.sleep(0.25)
+
+
+class TestProfiler:
+
+    def test_session_captures_blocking_callback(self, tempDir):
+        profiler = Profiler('core', str(tempDir / 'diag'))
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.1, blockingWork)
+            summary = await profiler.profile(durationSeconds=0.6, sampleIntervalMs=2, slowCallbackMs=50, sessionId='s1')
+            return summary, loop.get_debug()
+
+        summary, debugAfter = asyncio.run(run())
+        assert not debugAfter
+        assert summary['stackSamples'] > 0
+        assert summary['loopLag']['maxMs'] >= 150
+        assert any('blockingWork' in record['message'] for record in summary['slowCallbacks'])
+
+        collapsed = (tempDir / 'diag' / 's1-core.collapsed').read_text()
+        assert 'blockingWork' in collapsed
+        assert all(line.rsplit(' ', 1)[1].isdigit() for line in collapsed.splitlines())
+        written = json.loads((tempDir / 'diag' / 's1-core.json').read_text())
+        assert written['sessionId'] == 's1' and written['files'] == summary['files']
+
+    def test_one_session_at_a_time(self, tempDir):
+        profiler = Profiler('server', str(tempDir), maxDurationSeconds=0.2)
+
+        async def run():
+            first = asyncio.create_task(profiler.profile(durationSeconds=5))
+            await asyncio.sleep(0.05)
+            with pytest.raises(ProfilerBusy):
+                await profiler.profile(durationSeconds=0.1)
+            return await first
+
+        summary = asyncio.run(run())
+        assert summary['durationSeconds'] < 1  # capped by maxDurationSeconds
+        assert not profiler.active
+
+    def test_core_profile_over_ipc(self, tempDir):
+        from nova.core.ipc import CoreIPCHandler
+        from nova.server.ipc import ServerIPCClient
+
+        async def run():
+            requestQueue, responseQueue = queue.Queue(), queue.Queue()
+            database = Database(str(tempDir / 'truth.db'))
+            handler = CoreIPCHandler(database, requestQueue, responseQueue,
+                                     {'exportDir': str(tempDir / 'exports'), 'diagnostics': {'dir': str(tempDir / 'diag')}})
+            client = ServerIPCClient(requestQueue, responseQueue)
+            handler.running = True
+            await client.start()
+            coreTask = asyncio.create_task(handler._processRequests())
+            try:
+                response = await client.profile(0.3, sessionId='ipc')
+                # Core keeps serving requests while a session runs
+                metrics, profiled = await asyncio.gather(client.getMetrics(timeout=5.0), client.profile(0.5, sessionId='again'))
+            finally:
+                handler.running = False
+                await client.stop()
+                await coreTask
+                database.close()
+            return response, metrics, profiled
+
+        response, metrics, profiled = asyncio.run(run())
+        assert response['type'] == 'profile'
+        assert response['profile']['process'] == 'core'
+        assert (tempDir / 'diag' / 'ipc-core.collapsed').exists()
+        assert metrics and profiled['type'] == 'profile'
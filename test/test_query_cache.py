@@ -0,0 +1,116 @@
+"""
+Query Cache Tests
+
+Verifies nova.core.queryCache with Database:
+- Repeated historical windows are served from memory as independent copies;
+  live-edge windows bypass the cache
+- Inserts into a cached window (late data) and retention deletes invalidate it
+- Entries are evicted least-recently-used within the byte budget
+"""
+
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bench import synthetic
+from nova.core.database import Database
+from nova.core.events import Lane, Timebase, ParsedMessage
+
+
+def openRecording(tempDir, cacheConfig, seconds=20):
+    database = Database(str(tempDir / 'truth.db'), queryCache=cacheConfig)
+    events = synthetic.truthEvents(seconds, 5, 2)
+    for event in events:
+        event.canonicalTruthTime = event.sourceTruthTime
+    database.insertEventsBatch(events, synthetic.BASE_TIME.isoformat())
+    return database, events
+
+
+def window(startSeconds, stopSeconds):
+    return ((synthetic.BASE_TIME + timedelta(seconds=startSeconds)).isoformat(),
+            (synthetic.BASE_TIME + timedelta(seconds=stopSeconds)).isoformat())
+
+
+def countReads(monkeypatch, database):
+    """Count SQL statements run on the main read connection"""
+    reads = []
+    realConn = database._getReadConnection()
+
+    class Counting:
+        def execute(self, *args):
+            reads.append(args[0])
+            return realConn.execute(*args)
+
+    monkeypatch.setattr(database, '_getReadConnection', lambda: Counting())
+    return reads
+
+
+class TestQueryCache:
+
+    def test_hits_copies_and_live_bypass(self, tempDir, monkeypatch):
+        database, _ = openRecording(tempDir, {'maxBytes': 64 * 1024 * 1024})
+        reads = countReads(monkeypatch, database)
+        start, stop = window(0, 10)
+        first = database.queryEvents(start, stop, Timebase.CANONICAL, lanes=[Lane.PARSED, Lane.UI])
+        readsAfterMiss = len(reads)
+        second = database.queryEvents(start, stop, Timebase.CANONICAL, lanes=[Lane.PARSED, Lane.UI])
+        assert second == first and len(first) == 204  # stopTime inclusive
+        assert len(reads) == readsAfterMiss  # Served from memory
+
+        second[0]['eventId'] = 'mutated'
+        assert database.queryEvents(start, stop, Timebase.CANONICAL, lanes=[Lane.PARSED, Lane.UI])[0] == first[0]
+
+        # Different filters are a different key
+        assert len(database.queryEvents(start, stop, Timebase.CANONICAL, lanes=[Lane.PARSED], uniqueId='gps1')) == 51
+        assert len(database._queryCache._entries) == 2
+
+        # Live-edge window: never cached
+        now = datetime.now(timezone.utc)
+        database.queryEvents((now - timedelta(seconds=60)).isoformat(), now.isoformat(), Timebase.CANONICAL)
+        assert len(database._queryCache._entries) == 2
+        database.close()
+
+    def test_late_insert_and_retention_invalidate(self, tempDir):
+        database, events = openRecording(tempDir, {'maxBytes': 64 * 1024 * 1024})
+        early, late = window(0, 5), window(10, 15)
+        for start, stop in (early, late):
+            database.queryEvents(start, stop, Timebase.SOURCE, lanes=[Lane.PARSED])
+        assert len(database._queryCache._entries) == 2
+
+        # Late-arriving event with an old sourceTruthTime, received now
+        when = (synthetic.BASE_TIME + timedelta(seconds=2, milliseconds=50)).isoformat()
+        straggler = ParsedMessage.create('bench', when, 'hardwareService', 'node1', 'gps3', 'ubx.nav_pvt', 'v1', {'lat': 1.0})
+        assert database.insertEvent(straggler, datetime.now(timezone.utc).isoformat())
+        assert len(database._queryCache._entries) == 1
+        rows = database.queryEvents(*early, Timebase.SOURCE, lanes=[Lane.PARSED])
+        assert straggler.eventId in {row['eventId'] for row in rows}
+
+        before = len(database.queryEvents(*late, Timebase.SOURCE, lanes=[Lane.PARSED]))
+        thinStart, thinStop = window(0, 30)
+        assert database.thinEvents(Lane.PARSED, thinStart, thinStop, keepEveryN=2)['removed'] > 0
+        assert database._queryCache._entries == {}
+        assert len(database.queryEvents(*late, Timebase.SOURCE, lanes=[Lane.PARSED])) == before // 2
+        database.close()
+
+    def test_lru_byte_budget(self, tempDir):
+        database, _ = openRecording(tempDir, {'maxBytes': 64 * 1024 * 1024})
+        cache = database._queryCache
+        windows = [window(i, i + 1) for i in range(5)]
+        database.queryEvents(*windows[0], Timebase.CANONICAL, lanes=[Lane.PARSED])
+        entryBytes = next(iter(cache._entries.values()))[4]
+        cache.maxBytes = cache.maxEntryBytes = int(entryBytes * 3.5)  # Room for three windows
+        for start, stop in windows[1:3]:
+            database.queryEvents(start, stop, Timebase.CANONICAL, lanes=[Lane.PARSED])
+        database.queryEvents(*windows[0], Timebase.CANONICAL, lanes=[Lane.PARSED])  # Refresh oldest
+        database.queryEvents(*windows[3], Timebase.CANONICAL, lanes=[Lane.PARSED])
+        cachedWindows = [key[1] for key in cache._entries]
+        assert windows[1][0] not in cachedWindows and windows[0][0] in cachedWindows
+        assert cache._bytes <= cache.maxBytes
+
+        cache.maxEntryBytes = entryBytes // 2
+        database.queryEvents(*windows[4], Timebase.CANONICAL, lanes=[Lane.PARSED])
+        assert windows[4][0] not in [key[1] for key in cache._entries]
+        assert Database(str(tempDir / 'other.db'))._queryCache is None
+        database.close()
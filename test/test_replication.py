@@ -0,0 +1,242 @@
+"""
+Replication Tests
+
+Verifies nova.core.replication between two local truth databases:
+- catchUp copies every lane (main file + segments) with matching eventIds
+- The per-peer high-water mark persists; later runs ship only new rows
+- Re-applying a batch is idempotent (batch dedupe against eventIndex)
+- Receiver assigns canonicalTruthTime unless preserveCanonicalTime
+- Scope filtering and corrupt batch rejection
+- Cursors follow ingestSeq, so VACUUM on the source never skips or repeats rows
+- Imported events go through Ingest (LIVE notify, overview, ingest metrics)
+"""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nova.core.database import Database
+from nova.core.events import Lane, Timebase, RawFrame, ParsedMessage, UiUpdate, MetadataEvent, CommandRequest
+from nova.core.ingest import Ingest, INGEST_EVENTS_TOTAL
+from nova.core.replication import (
+    ReplicationService, ReplicationExporter, ReplicationImporter, ReplicationError, decodeBatch
+)
+
+
+DAYS = ['2026-01-01', '2026-01-02']
+WINDOW = dict(startTime='1970-01-01', stopTime='2100-01-01', timebase=Timebase.SOURCE)
+
+
+def fillSource(db, scopeId='field', count=20, offset=0):
+    """Events on every lane across two day segments"""
+    for dayIndex, day in enumerate(DAYS):
+        for i in range(offset, offset + count):
+            sourceTime = f"{day}T12:{i // 60:02d}:{i % 60:02d}.000000+00:00"
+            canonicalTime = f"{day}T13:{i // 60:02d}:{i % 60:02d}.000000+00:00"
+            db.insertEvent(RawFrame.create(scopeId, sourceTime, 'sys', 'node', 'gps1', bytes([dayIndex, i, 0xff])), canonicalTime)
+            db.insertEvent(ParsedMessage.create(scopeId, sourceTime, 'sys', 'node', 'gps1', 'ubx.nav_pvt', 'v1',
+                                                {'day': dayIndex, 'i': i}), canonicalTime)
+            db.insertEvent(UiUpdate.create(scopeId, sourceTime, 'sys', 'node', 'gps1', 'telemetry.gnss', 'm', '1.0.0',
+                                           {'i': i}), canonicalTime)
+    db.insertEvent(MetadataEvent.create(scopeId, f"{DAYS[0]}T00:00:00+00:00", 'ManifestPublished',
+                                        f"{DAYS[0]}T00:00:00+00:00", {'manifestId': 'm'}, systemId='nova',
+                                        containerId='core', uniqueId='manifest-m'), f"{DAYS[0]}T00:00:00+00:00")
+    db.insertEvent(CommandRequest.create(scopeId, f"{DAYS[0]}T01:00:00+00:00", 'sys', 'node', 'gps1', 'cmd-1', 'req-1',
+                                         'gps1', 'coldReset', {}), f"{DAYS[0]}T01:00:00+00:00")
+
+
+class FanOutRecorder:
+    """Stands in for StreamingManager and OverviewPyramid"""
+
+    def __init__(self):
+        self.notified = []
+        self.observed = []
+
+    def notifyNewEvent(self, event, canonicalTruthTime):
+        self.notified.append(event.eventId)
+
+    def observe(self, event, canonicalTruthTime):
+        self.observed.append(event.eventId)
+
+
+def eventIds(db, **kwargs):
+    return sorted((e['lane'], e['eventId']) for e in db.queryEvents(**dict(WINDOW, **kwargs)))
+
+
+class TestReplication:
+
+    def test_catch_up_copies_all_lanes(self, tempDir):
+        source = Database(str(tempDir / 'field.db'))
+        target = Database(str(tempDir / 'ground.db'))
+        fillSource(source)
+
+        stats = ReplicationService(source, target, 'field', batchSize=25).catchUp()
+        assert stats['inserted'] == stats['events'] == 2 * 20 * 3 + 2
+        assert stats['batches'] > 1
+        assert eventIds(target) == eventIds(source)
+        assert {lane for lane, _ in eventIds(target)} == {lane.value for lane in Lane}
+        assert [s['segmentId'] for s in target.listSegments()] != []
+
+        sourceRaw = source.queryEvents(**WINDOW, lanes=[Lane.RAW])
+        targetRaw = target.queryEvents(**WINDOW, lanes=[Lane.RAW])
+        assert [e['bytes'] for e in targetRaw] == [e['bytes'] for e in sourceRaw]
+        source.close()
+        target.close()
+
+    def test_high_water_mark_persists(self, tempDir):
+        source = Database(str(tempDir / 'field.db'))
+        fillSource(source)
+        target = Database(str(tempDir / 'ground.db'))
+        ReplicationService(source, target, 'field').catchUp()
+        target.close()
+
+        fillSource(source, offset=20, count=5)
+        target = Database(str(tempDir / 'ground.db'))
+        stats = ReplicationService(source, target, 'field').catchUp()
+        assert stats['events'] == stats['inserted'] == 2 * 5 * 3
+        assert ReplicationService(source, target, 'field').catchUp()['batches'] == 0
+        assert eventIds(target) == eventIds(source)
+        source.close()
+        target.close()
+
+    def test_reapplied_batch_is_deduped(self, tempDir):
+        source = Database(str(tempDir / 'field.db'))
+        target = Database(str(tempDir / 'ground.db'))
+        fillSource(source)
+        batch, _, count = ReplicationExporter(source).exportBatch({}, maxEvents=1000)
+        importer = ReplicationImporter(target)
+        assert importer.applyBatch('field', batch) == count
+        assert importer.applyBatch('field', batch) == 0
+        assert len(target.queryEvents(**WINDOW)) == count
+
+        # Events arriving live and by replication are stored once
+        raw = RawFrame.create('field', f"{DAYS[1]}T23:00:00+00:00", 'sys', 'node', 'gps1', b'late')
+        assert target.insertEvent(raw, f"{DAYS[1]}T23:00:01+00:00")
+        source.insertEvent(raw, f"{DAYS[1]}T23:00:01+00:00")
+        assert ReplicationService(source, target, 'field').catchUp()['inserted'] == 0
+        source.close()
+        target.close()
+
+    def test_receiver_assigns_canonical_time(self, tempDir):
+        source = Database(str(tempDir / 'field.db'))
+        fillSource(source, count=2)
+        sourceCanonical = {e['eventId']: e['canonicalTruthTime'] for e in source.queryEvents(**WINDOW)}
+
+        stamped = Database(str(tempDir / 'ground.db'), segmentPeriod=None)
+        ReplicationService(source, stamped, 'field').catchUp()
+        assert all(e['canonicalTruthTime'] != sourceCanonical[e['eventId']] for e in stamped.queryEvents(**WINDOW))
+
+        copy = Database(str(tempDir / 'copy.db'))
+        ReplicationService(source, copy, 'field', preserveCanonicalTime=True).catchUp()
+        assert {e['eventId']: e['canonicalTruthTime'] for e in copy.queryEvents(**WINDOW)} == sourceCanonical
+        assert [s['segmentId'] for s in copy.listSegments()] == DAYS
+        for db in (source, stamped, copy):
+            db.close()
+
+    def test_scope_filter(self, tempDir):
+        source = Database(str(tempDir / 'field.db'))
+        target = Database(str(tempDir / 'ground.db'))
+        fillSource(source, 'field', count=3)
+        fillSource(source, 'lab', count=3)
+        ReplicationService(source, target, 'field', scopeIds=['lab']).catchUp()
+        assert eventIds(target) == eventIds(source, scopeIds=['lab'])
+        source.close()
+        target.close()
+
+    def test_corrupt_batch_rejected(self, tempDir):
+        source = Database(str(tempDir / 'field.db'))
+        fillSource(source, count=2)
+        batch, cursor, _ = ReplicationExporter(source).exportBatch({})
+        assert decodeBatch(batch)[0] == cursor
+        with pytest.raises(ReplicationError):
+            decodeBatch(b'XXX' + batch[3:])
+        with pytest.raises(ReplicationError):
+            decodeBatch(batch[:-10])
+        source.close()
+
+    def test_cursor_survives_vacuum(self, tempDir):
+        source = Database(str(tempDir / 'field.db'))
+        target = Database(str(tempDir / 'ground.db'))
+        fillSource(source)
+        first = ReplicationService(source, target, 'field', batchSize=12).catchUp(maxBatches=1)
+
+        # Retention thins the start of the first day, then compaction VACUUMs the segment
+        for lane in (Lane.RAW, Lane.PARSED, Lane.UI):
+            source.thinEvents(lane, f"{DAYS[0]}T13:00:00+00:00", f"{DAYS[0]}T13:00:05+00:00")
+        assert source.compactSegment(DAYS[0])
+
+        rest = ReplicationService(source, target, 'field').catchUp()
+        assert set(eventIds(source)) <= set(eventIds(target))
+        assert first['events'] + rest['events'] == first['inserted'] + rest['inserted']
+        source.close()
+        target.close()
+
+    def test_sequence_not_reused_after_removal(self, tempDir):
+        source = Database(str(tempDir / 'field.db'), segmentPeriod=None)
+        target = Database(str(tempDir / 'ground.db'))
+        fillSource(source, count=2)
+        ReplicationService(source, target, 'field').catchUp()
+
+        # Remove the newest rows, reopen, ingest more: the peer's cursor must not hide them
+        source.thinEvents(Lane.RAW, f"{DAYS[1]}T13:00:00+00:00", f"{DAYS[1]}T14:00:00+00:00")
+        source.close()
+        source = Database(str(tempDir / 'field.db'), segmentPeriod=None)
+        late = RawFrame.create('field', f"{DAYS[1]}T23:00:00+00:00", 'sys', 'node', 'gps1', b'late')
+        source.insertEvent(late, f"{DAYS[1]}T23:00:01+00:00")
+        assert ReplicationService(source, target, 'field').catchUp()['inserted'] == 1
+        source.close()
+        target.close()
+
+    def test_tables_without_ingest_seq_are_migrated(self, tempDir):
+        source = Database(str(tempDir / 'field.db'))
+        fillSource(source, count=3)
+        expected = eventIds(source)
+        paths = [source.dbPath] + [source._segmentPath(s) for s in source.listSegments()]
+        source.close()
+
+        # Strip ingestSeq to recreate a database written before it existed
+        for path in paths:
+            conn = sqlite3.connect(str(path))
+            tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE '%Events'")]
+            for table in tables:
+                conn.execute(f"DROP INDEX idx_{table}_ingestSeq")
+                conn.execute(f"ALTER TABLE {table} DROP COLUMN ingestSeq")
+            conn.execute("DROP TABLE IF EXISTS sequenceState")
+            conn.commit()
+            conn.close()
+
+        source = Database(str(tempDir / 'field.db'))
+        target = Database(str(tempDir / 'ground.db'))
+        ReplicationService(source, target, 'field').catchUp()
+        late = RawFrame.create('field', f"{DAYS[1]}T23:00:00+00:00", 'sys', 'node', 'gps1', b'late')
+        source.insertEvent(late, f"{DAYS[1]}T23:00:01+00:00")
+        assert ReplicationService(source, target, 'field').catchUp()['inserted'] == 1
+        assert eventIds(target) == eventIds(source) == sorted(expected + [('raw', late.eventId)])
+        source.close()
+        target.close()
+
+    def test_import_goes_through_ingest(self, tempDir):
+        source = Database(str(tempDir / 'field.db'))
+        target = Database(str(tempDir / 'ground.db'))
+        fillSource(source, count=3)
+        recorder = FanOutRecorder()
+        ingest = Ingest(target, streamingManager=recorder, overview=recorder)
+        insertedBefore = INGEST_EVENTS_TOTAL.value(lane='raw', result='inserted')
+        dedupedBefore = INGEST_EVENTS_TOTAL.value(lane='raw', result='deduped')
+
+        stats = ReplicationService(source, target, 'field', ingest=ingest).catchUp()
+        assert sorted(recorder.notified) == sorted(recorder.observed) == sorted(e for _, e in eventIds(target))
+        assert len(recorder.notified) == stats['inserted']
+        assert INGEST_EVENTS_TOTAL.value(lane='raw', result='inserted') - insertedBefore == 2 * 3
+
+        # Replaying the same range dedupes without notifying again
+        batch, _, _ = ReplicationExporter(source).exportBatch({})
+        assert ReplicationImporter(target, ingest=ingest).applyBatch('field', batch) == 0
+        assert len(recorder.notified) == stats['inserted']
+        assert INGEST_EVENTS_TOTAL.value(lane='raw', result='deduped') - dedupedBefore == 2 * 3
+        source.close()
+        target.close()
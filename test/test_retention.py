@@ -0,0 +1,184 @@
+"""
+Retention Engine Tests
+
+Verifies nova.core.retention tiers against a segmented truth database:
+- drop removes a lane after its horizon, younger data untouched
+- keepEveryN / keepPerSeconds thin per entity and messageType
+- Each removing slice is recorded as a RetentionApplied metadata event
+- Watermarks make passes idempotent; eventIndex keeps removed events deduped
+- Windows and keepPerSeconds buckets honour UTC offsets (non-UTC inputs select the same rows)
+- Segment compaction runs without the global write lock; late events meanwhile go to the main file
+- Invalid rules are rejected
+"""
+
+import shutil
+import tempfile
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nova.core.database import Database
+from nova.core.events import Lane, Timebase, RawFrame, ParsedMessage
+from nova.core.retention import RetentionEngine, RetentionRule
+
+
+BASE = datetime(2026, 3, 1, 0, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def database():
+    """Segmented database with two days of 4 Hz raw + parsed data (10 s per hour)"""
+    dirPath = Path(tempfile.mkdtemp())
+    db = Database(str(dirPath / 'truth.db'))
+    for hour in range(48):
+        for tick in range(40):
+            t = BASE + timedelta(hours=hour, seconds=tick * 0.25)
+            sourceTime = t.isoformat()
+            canonicalTime = (t + timedelta(milliseconds=50)).isoformat()
+            db.insertEvent(RawFrame.create('scope', sourceTime, 'sys', 'node', 'gps1', bytes([hour, tick])), canonicalTime)
+            for messageType in ('ubx.nav_pvt', 'ubx.nav_sat'):
+                db.insertEvent(ParsedMessage.create('scope', sourceTime, 'sys', 'node', 'gps1', messageType, 'v1',
+                                                    {'type': messageType, 'hour': hour, 'tick': tick}), canonicalTime)
+    yield db
+    db.close()
+    shutil.rmtree(dirPath, ignore_errors=True)
+
+
+def count(db, lane, messageType=None, start=BASE, stop=BASE + timedelta(days=3)):
+    return len(db.queryEvents(start.isoformat(), stop.isoformat(), Timebase.CANONICAL, lanes=[lane], messageType=messageType))
+
+
+def auditEvents(db):
+    return [e for e in db.queryEvents('1970-01-01', '2100-01-01', Timebase.CANONICAL, lanes=[Lane.METADATA])
+            if e['messageType'] == 'RetentionApplied']
+
+
+class TestRetentionEngine:
+
+    def test_drop_after_horizon(self, database):
+        rule = RetentionRule.fromConfig({'id': 'raw-horizon', 'lane': 'raw', 'afterHours': 24, 'action': 'drop'})
+        engine = RetentionEngine(database, [rule], 'scope', compact=True)
+        now = BASE + timedelta(hours=48)
+        actions = engine.runOnce(now=now)
+
+        assert sum(a['removed'] for a in actions) == 24 * 40
+        assert count(database, Lane.RAW, stop=now - timedelta(hours=24)) == 0
+        assert count(database, Lane.RAW) == 24 * 40
+        assert count(database, Lane.PARSED) == 48 * 80
+
+        audit = auditEvents(database)
+        assert len(audit) == len(actions)
+        assert audit[0]['payload']['ruleId'] == 'raw-horizon' and audit[0]['payload']['removed'] > 0
+
+    def test_keep_every_n_per_message_type(self, database):
+        rule = RetentionRule.fromConfig({'lane': 'parsed', 'messageType': 'ubx.nav_sat', 'afterHours': 47,
+                                         'action': 'keepEveryN', 'n': 10})
+        RetentionEngine(database, [rule], 'scope').runOnce(now=BASE + timedelta(hours=48))
+        assert count(database, Lane.PARSED, 'ubx.nav_sat', stop=BASE + timedelta(hours=1)) == 4
+        assert count(database, Lane.PARSED, 'ubx.nav_sat', start=BASE + timedelta(hours=47)) == 40
+        assert count(database, Lane.PARSED, 'ubx.nav_pvt') == 48 * 40
+
+    def test_keep_per_seconds(self, database):
+        rule = RetentionRule.fromConfig({'lane': 'parsed', 'afterHours': 47, 'action': 'keepPerSeconds', 'seconds': 1})
+        RetentionEngine(database, [rule], 'scope').runOnce(now=BASE + timedelta(hours=48))
+        kept = database.queryEvents(BASE.isoformat(), (BASE + timedelta(hours=1)).isoformat(), Timebase.CANONICAL,
+                                    lanes=[Lane.PARSED])
+        assert len(kept) == 2 * 10
+        assert {e['sourceTruthTime'][:19] for e in kept} == {(BASE + timedelta(seconds=s)).isoformat()[:19] for s in range(10)}
+
+    def test_passes_are_idempotent_and_deduped(self, database):
+        rule = RetentionRule.fromConfig({'id': 'raw-horizon', 'lane': 'raw', 'afterHours': 24, 'action': 'drop'})
+        engine = RetentionEngine(database, [rule], 'scope')
+        now = BASE + timedelta(hours=48)
+        engine.runOnce(now=now)
+        assert engine.runOnce(now=now) == []
+        assert database.getRetentionWatermark('raw-horizon') == (now - timedelta(hours=24)).isoformat()
+
+        t = BASE.isoformat()
+        assert not database.insertEvent(RawFrame.create('scope', t, 'sys', 'node', 'gps1', bytes([0, 0])), t)
+
+    def test_tiers_run_youngest_first(self, database):
+        rules = [RetentionRule.fromConfig(r) for r in (
+            {'id': 'drop', 'lane': 'parsed', 'afterHours': 40, 'action': 'drop'},
+            {'id': 'thin', 'lane': 'parsed', 'afterHours': 24, 'action': 'keepEveryN', 'n': 4},
+        )]
+        engine = RetentionEngine(database, rules, 'scope')
+        assert [rule.ruleId for rule in engine.rules] == ['thin', 'drop']
+        engine.runOnce(now=BASE + timedelta(hours=48))
+        assert count(database, Lane.PARSED, stop=BASE + timedelta(hours=8)) == 0
+        assert count(database, Lane.PARSED, start=BASE + timedelta(hours=8), stop=BASE + timedelta(hours=24)) == 16 * 20
+
+    @pytest.mark.parametrize('ruleConfig', [
+        {'lane': 'metadata', 'afterDays': 1, 'action': 'drop'},
+        {'lane': 'ui', 'afterDays': 1, 'action': 'keepEveryN', 'n': 2},
+        {'lane': 'parsed', 'afterDays': 1, 'action': 'keepEveryN'},
+        {'lane': 'parsed', 'action': 'drop'},
+        {'lane': 'raw', 'messageType': 'x', 'afterDays': 1, 'action': 'drop'},
+    ])
+    def test_invalid_rules_rejected(self, ruleConfig):
+        with pytest.raises(ValueError):
+            RetentionRule.fromConfig(ruleConfig)
+
+    def test_disabled_by_default(self, database):
+        assert RetentionEngine.fromConfig(database, {'retention': {'rules': [{'lane': 'raw', 'afterDays': 1, 'action': 'drop'}]}}) is None
+
+    def test_non_utc_offsets(self, database):
+        plus2 = timezone(timedelta(hours=2))
+        # 01:00-03:00+02:00 is 23:00-01:00 UTC: only hour 0 of the recording
+        start, stop = (BASE - timedelta(hours=1)).astimezone(plus2), (BASE + timedelta(hours=1)).astimezone(plus2)
+        assert start.isoformat() == '2026-03-01T01:00:00+02:00'
+        result = database.thinEvents(Lane.RAW, start.isoformat(), stop.isoformat())
+        assert result['removed'] == 40
+        assert count(database, Lane.RAW, stop=BASE + timedelta(hours=1)) == 0
+        assert count(database, Lane.RAW, start=BASE + timedelta(hours=1), stop=BASE + timedelta(hours=2)) == 40
+
+        rule = RetentionRule.fromConfig({'id': 'raw-horizon', 'lane': 'raw', 'afterHours': 24, 'action': 'drop'})
+        minus5 = timezone(timedelta(hours=-5))
+        RetentionEngine(database, [rule], 'scope').runOnce(now=(BASE + timedelta(hours=48)).astimezone(minus5))
+        assert count(database, Lane.RAW) == 24 * 40
+        assert database.getRetentionWatermark('raw-horizon') == (BASE + timedelta(hours=24)).isoformat()
+
+        # keepPerSeconds buckets by the instant, whatever offset the source wrote
+        t = BASE + timedelta(hours=50, milliseconds=100)
+        for offset, sourceTime in ((0, t), (1, t + timedelta(milliseconds=500))):
+            written = sourceTime.astimezone(timezone(timedelta(hours=offset))).isoformat()
+            database.insertEvent(ParsedMessage.create('scope', written, 'sys', 'node', 'gps9', 'ubx.nav_pvt', 'v1',
+                                                      {'offset': offset}), t.isoformat())
+        database.thinEvents(Lane.PARSED, (t - timedelta(seconds=1)).isoformat(), (t + timedelta(seconds=1)).isoformat(),
+                            keepPerSeconds=1)
+        assert count(database, Lane.PARSED, start=t - timedelta(seconds=1), stop=t + timedelta(seconds=1)) == 1
+
+    def test_compaction_does_not_block_ingest(self, database, monkeypatch):
+        rule = RetentionRule.fromConfig({'id': 'raw-horizon', 'lane': 'raw', 'afterHours': 24, 'action': 'drop'})
+        assert not RetentionEngine(database, [rule], 'scope').compact  # Opt-in
+        engine = RetentionEngine(database, [rule], 'scope', compact=True)
+        late = BASE + timedelta(hours=2, minutes=30)
+        vacuums = []
+        openWriteConnection = Database._openWriteConnection
+
+        class Connection:
+            def __init__(self, conn):
+                self.conn = conn
+
+            def execute(self, sql, *args):
+                if sql == 'VACUUM':
+                    assert database._writeLock.acquire(timeout=1)  # Global write lock is free
+                    database._writeLock.release()
+                    if not vacuums:  # Late event for the compacting period
+                        assert database.insertEvent(RawFrame.create('scope', late.isoformat(), 'sys', 'node', 'gps2', b'late'),
+                                                    late.isoformat())
+                    vacuums.append(sql)
+                return self.conn.execute(sql, *args)
+
+            def __getattr__(self, name):
+                return getattr(self.conn, name)
+
+        monkeypatch.setattr(Database, '_openWriteConnection', staticmethod(lambda path: Connection(openWriteConnection(path))))
+        engine.runOnce(now=BASE + timedelta(hours=48))
+        assert vacuums and not database._compacting
+        assert count(database, Lane.RAW, start=late, stop=late) == 1  # Stored in the main file, still queried
+
@@ -0,0 +1,146 @@
+"""
+SDK Logging Tests
+
+Verifies the non-blocking log path in sdk.logging:
+- Records are written by the background writer and visible after flush
+- Overflow policies (dropNewest, dropOldest, block) and drop counters
+- Drop reports are written once the queue drains
+- Shutdown drains the queue and later records are still written
+- Cached logger name resolution, level check before record creation, structured formatting
+"""
+
+import logging
+import threading
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sdk.logging import configureLogging, getLogger, flushLogging
+from sdk.logging.logger import StructuredFormatter, _autoDetectName, _nameCache
+from sdk.logging.writer import LogWriter
+
+
+class ListHandler(logging.Handler):
+    """Collects formatted messages; optionally blocks until released"""
+
+    def __init__(self, gate: threading.Event = None):
+        super().__init__()
+        self.messages = []
+        self.gate = gate
+
+    def emit(self, record):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.messages.append(record.getMessage())
+
+
+def makeRecord(msg):
+    return logging.LogRecord('test', logging.INFO, __file__, 0, msg, None, None)
+
+
+class TestLogWriter:
+
+    def test_records_written_in_order(self):
+        writer = LogWriter(maxSize=100)
+        target = ListHandler()
+        for i in range(50):
+            writer.enqueue(target, makeRecord(f"m{i}"))
+        assert writer.flush(5)
+        assert target.messages == [f"m{i}" for i in range(50)]
+        writer.stop()
+
+    def test_drop_newest_counts_and_reports(self):
+        gate = threading.Event()
+        writer = LogWriter(maxSize=2, overflow='dropNewest')
+        target = ListHandler(gate)
+        for i in range(10):
+            writer.enqueue(target, makeRecord(f"m{i}"))
+        assert writer.dropped > 0
+        gate.set()
+        assert writer.flush(5)
+        writer.enqueue(target, makeRecord("after"))
+        assert writer.flush(5)
+        written = [m for m in target.messages if "dropped" not in m]
+        assert written[-1] == "after"
+        assert len(written) - 1 + writer.dropped == 10
+        assert any("dropped" in m for m in target.messages)
+        writer.stop()
+
+    def test_drop_oldest_keeps_latest(self):
+        gate = threading.Event()
+        writer = LogWriter(maxSize=3, overflow='dropOldest')
+        target = ListHandler(gate)
+        for i in range(10):
+            writer.enqueue(target, makeRecord(f"m{i}"))
+        gate.set()
+        assert writer.flush(5)
+        written = [m for m in target.messages if "dropped" not in m]
+        assert written[-3:] == ["m7", "m8", "m9"]
+        assert len(written) + writer.dropped == 10
+        writer.stop()
+
+    def test_block_policy_never_drops(self):
+        writer = LogWriter(maxSize=2, overflow='block')
+        target = ListHandler()
+        for i in range(200):
+            writer.enqueue(target, makeRecord(f"m{i}"))
+        assert writer.flush(5)
+        assert len(target.messages) == 200
+        assert writer.dropped == 0
+        writer.stop()
+
+    def test_stop_drains_and_writes_synchronously_after(self):
+        writer = LogWriter(maxSize=100)
+        target = ListHandler()
+        for i in range(20):
+            writer.enqueue(target, makeRecord(f"m{i}"))
+        writer.stop()
+        assert len(target.messages) == 20
+        writer.enqueue(target, makeRecord("late"))
+        assert target.messages[-1] == "late"
+
+    def test_invalid_policy_rejected(self):
+        with pytest.raises(ValueError):
+            LogWriter(overflow='sometimes')
+
+
+class TestLoggerIntegration:
+
+    def test_file_written_after_flush(self, tempDir):
+        configureLogging(logDir=str(tempDir), console=False)
+        log = getLogger('asyncLogTest.component')
+        log.info("Queued message", deviceId='GPS_001')
+        assert flushLogging(5)
+        content = (tempDir / 'asyncLogTest.log').read_text()
+        assert "Queued message [deviceId=GPS_001]" in content
+
+
+class TestLoggerOverhead:
+
+    def test_name_resolved_per_module_and_class(self):
+        class Widget:
+            def name(self):
+                return _autoDetectName()
+        assert _autoDetectName() == 'test_sdk_logging.TestLoggerOverhead'
+        assert Widget().name() == 'test_sdk_logging.Widget'
+        assert _nameCache[('test_sdk_logging', 'Widget')] == 'test_sdk_logging.Widget'
+
+    def test_filtered_records_are_not_created(self, tempDir, monkeypatch):
+        configureLogging(logDir=str(tempDir), console=False, level='INFO')
+        log = getLogger('filteredLogTest')
+        created = []
+        monkeypatch.setattr(log, 'makeRecord', lambda *a, **k: created.append(a))
+        log.debug("Not emitted", field=1)
+        assert created == []
+
+    def test_structured_fields_formatted_once(self):
+        formatter = StructuredFormatter('%(name)s - %(levelname)s - %(message)s')
+        record = logging.LogRecord('fmt', logging.INFO, __file__, 0, "Opened %s", ('port',), None)
+        record.deviceId = 'GPS_001'
+        record.baud = 115200
+        assert formatter.format(record) == "fmt - INFO - Opened port [deviceId=GPS_001, baud=115200]"
+        assert record.msg == "Opened %s"
+        assert formatter.format(record) == "fmt - INFO - Opened port [deviceId=GPS_001, baud=115200]"
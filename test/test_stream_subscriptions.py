@@ -0,0 +1,117 @@
+"""
+Stream Subscription Tests
+
+Verifies subscription-indexed wakeups in nova.core.streaming:
+- Only LIVE cursors whose scope, lane, entity and per-lane filters match an
+  ingested event are woken
+- Bursts of ingested events coalesce into one wakeup per cursor per loop iteration
+- startStream / startOutputStream register LIVE cursors; cancel unregisters them
+"""
+
+import asyncio
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nova.core.database import Database
+from nova.core.contracts import StreamRequest, TimelineMode
+from nova.core.events import ParsedMessage, UiUpdate, RawFrame
+from nova.core.streaming import StreamingManager, Subscription, SubscriptionIndex
+
+
+class Cursor:
+    """Stand-in for a LIVE cursor: counts newDataEvent.set() calls"""
+
+    def __init__(self):
+        self.sets = 0
+        cursor = self
+
+        class CountingEvent(asyncio.Event):
+            def set(self):
+                cursor.sets += 1
+                super().set()
+
+        self.newDataEvent = CountingEvent()
+
+
+WHEN = '2026-01-01T00:00:00+00:00'
+
+
+def parsed(uniqueId='gps1', messageType='ubx.nav_pvt', scopeId='scopeA'):
+    return ParsedMessage.create(scopeId, WHEN, 'hardwareService', 'node1', uniqueId, messageType, 'v1', {'lat': 1.0})
+
+
+def uiUpdate(uniqueId='gps1', viewId='telemetry.gnss'):
+    return UiUpdate.create('scopeA', WHEN, 'hardwareService', 'node1', uniqueId, viewId, 'telemetry.gnss', '1.0.0', {'lat': 1.0})
+
+
+class TestSubscriptionIndex:
+
+    def test_match_by_scope_lane_entity_and_lane_filters(self):
+        index = SubscriptionIndex()
+        everything, gps1, navPvt, otherScope, uiView = (Cursor() for _ in range(5))
+        index.add(Subscription(everything, {}))
+        index.add(Subscription(gps1, {'scopeIds': ['scopeA'], 'uniqueId': 'gps1', 'containerId': 'node1'}))
+        index.add(Subscription(navPvt, {'lanes': ['parsed', 'raw'], 'messageType': 'ubx.nav_pvt'}))
+        index.add(Subscription(otherScope, {'scopeIds': ['scopeB']}))
+        index.add(Subscription(uiView, {'lanes': ['ui'], 'viewId': 'telemetry.gnss', 'messageType': 'ignored-on-ui'}))
+
+        def matched(event):
+            return {id(sub.cursor) for sub in index.match(event)}
+
+        assert matched(parsed()) == {id(everything), id(gps1), id(navPvt)}
+        assert matched(parsed(uniqueId='gps2', messageType='ubx.nav_sat')) == {id(everything)}
+        assert matched(parsed(scopeId='scopeB', uniqueId='gps2')) == {id(everything), id(otherScope), id(navPvt)}
+        # messageType does not filter raw frames (no messageType column) or UI updates
+        raw = RawFrame.create('scopeA', WHEN, 'hardwareService', 'node1', 'gps2', b'\x01')
+        assert matched(raw) == {id(everything), id(navPvt)}
+        assert matched(uiUpdate(uniqueId='gps2')) == {id(everything), id(uiView)}
+        assert matched(uiUpdate(uniqueId='gps2', viewId='other')) == {id(everything)}
+
+        for cursor in (everything, gps1, navPvt, otherScope, uiView):
+            index.remove(cursor)
+        assert len(index) == 0 and index._index == {}
+
+
+class TestStreamingManagerWakeups:
+
+    def test_burst_coalesces_to_one_wakeup_per_matching_cursor(self, tempDir):
+        manager = StreamingManager(Database(str(tempDir / 'truth.db')))
+        gps1, gps2 = Cursor(), Cursor()
+        manager.subscriptions.add(Subscription(gps1, {'uniqueId': 'gps1'}))
+        manager.subscriptions.add(Subscription(gps2, {'uniqueId': 'gps2'}))
+
+        async def burst():
+            for _ in range(100):
+                manager.notifyNewEvent(parsed(), WHEN)
+            assert gps1.sets == 0  # Deferred to the next loop iteration
+            await asyncio.sleep(0)
+            manager.notifyNewEvent(parsed(), WHEN)
+            await asyncio.sleep(0)
+
+        asyncio.run(burst())
+        assert gps1.sets == 2 and gps2.sets == 0
+
+        # Without a running loop (synchronous ingest) the wakeup is immediate
+        manager.notifyNewEvent(parsed(uniqueId='gps2'), WHEN)
+        assert gps2.sets == 1
+
+    def test_live_streams_register_and_unregister(self, tempDir):
+        manager = StreamingManager(Database(str(tempDir / 'truth.db')))
+
+        async def run():
+            live = StreamRequest('r1', 'conn1', 'p1', None, None, 1.0, TimelineMode.LIVE, filters={'uniqueId': 'gps1'})
+            bounded = StreamRequest('r2', 'conn2', 'p2', 1_000_000, 2_000_000, 1.0, TimelineMode.REPLAY)
+            await manager.startStream(live, asyncio.Queue())
+            await manager.startStream(bounded, asyncio.Queue())
+            await manager.startOutputStream('out1', {'lanes': ['parsed'], 'scopeIds': ['scopeB']}, asyncio.Queue())
+            assert len(manager.subscriptions) == 2
+
+            matched = {id(sub.cursor) for sub in manager.subscriptions.match(parsed())}
+            assert matched == {id(manager.activeStreams['conn1']), id(manager.outputStreams['out1'])}
+
+            await manager.shutdown()
+            assert len(manager.subscriptions) == 0
+
+        asyncio.run(run())
@@ -0,0 +1,116 @@
+"""
+Unpaced Replay Tests
+
+Verifies unpaced bounded replay in nova.core.streaming.StreamCursor:
+- Every event in the window is emitted exactly once, in query order (forward and
+  reverse), with no paced delays and chunks fenced by playbackRequestId
+- The query window adapts toward the configured chunk byte size
+- A bounded chunk queue applies backpressure; open-ended requests stay paced
+"""
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bench import synthetic
+from nova.core.database import Database
+from nova.core.contracts import StreamRequest, StreamChunk, StreamComplete, TimelineMode
+from nova.core.events import Timebase
+from nova.core.streaming import StreamCursor
+
+
+START_US = int(synthetic.BASE_TIME.timestamp() * 1_000_000)
+
+
+def openRecording(tempDir, seconds=60):
+    database = Database(str(tempDir / 'truth.db'))
+    events = synthetic.truthEvents(seconds, 5, 2)
+    for event in events:
+        event.canonicalTruthTime = event.sourceTruthTime
+    database.insertEventsBatch(events, synthetic.BASE_TIME.isoformat())
+    return database
+
+
+def request(stopSeconds, rate=1.0, unpaced=True, stopTime=True):
+    return StreamRequest('r1', 'conn1', 'play1', START_US, START_US + stopSeconds * 1_000_000 if stopTime else None,
+                         rate, TimelineMode.REPLAY, unpaced=unpaced)
+
+
+def replay(cursor, queue=None):
+    queue = queue or asyncio.Queue()
+
+    async def run():
+        await cursor.streamChunks(queue)
+        items = []
+        while not queue.empty():
+            items.append(queue.get_nowait())
+        return items
+
+    return asyncio.run(run())
+
+
+def noDelay(monkeypatch):
+    async def paced(self, queryWindowUs):
+        raise AssertionError('unpaced replay must not sleep')
+    monkeypatch.setattr(StreamCursor, '_pacedDelay', paced)
+
+
+class TestUnpacedReplay:
+
+    def test_every_event_once_in_order(self, tempDir, monkeypatch):
+        database = openRecording(tempDir)
+        noDelay(monkeypatch)
+        expected = database.queryEvents(synthetic.BASE_TIME.isoformat(),
+                                         synthetic.BASE_TIME.replace(minute=1).isoformat(), Timebase.CANONICAL)
+
+        items = replay(StreamCursor(request(60), database))
+        chunks = [item for item in items if isinstance(item, StreamChunk)]
+        assert isinstance(items[-1], StreamComplete) and items[-1].playbackRequestId == 'play1'
+        assert all(chunk.playbackRequestId == 'play1' for chunk in chunks)
+        emitted = [event['eventId'] for chunk in chunks for event in chunk.events]
+        assert emitted == [event['eventId'] for event in expected]
+        assert [chunk.timestamp for chunk in chunks] == sorted(chunk.timestamp for chunk in chunks)
+
+        reverse = replay(StreamCursor(request(60, rate=-1.0), database))
+        emitted = [event['eventId'] for item in reverse if isinstance(item, StreamChunk) for event in item.events]
+        assert sorted(emitted) == sorted(event['eventId'] for event in expected) and len(set(emitted)) == len(emitted)
+        assert emitted[0] == expected[-1]['eventId'] and emitted[-1] == expected[0]['eventId']
+        database.close()
+
+    def test_window_adapts_to_chunk_bytes(self, tempDir, monkeypatch):
+        database = openRecording(tempDir)
+        noDelay(monkeypatch)
+        config = {'streaming': {'unpacedChunkBytes': 200_000}}
+        cursor = StreamCursor(request(60), database, config)
+        chunks = [item for item in replay(cursor) if isinstance(item, StreamChunk)]
+        windows = [len(chunk.events) for chunk in chunks]
+        assert windows[1] > windows[0] and len(chunks) < 60 / 4  # Grew past the 1 s start
+        assert cursor.queryWindowUs > 1_000_000
+
+        small = StreamCursor(request(60), database, {'streaming': {'unpacedChunkBytes': 2_000}})
+        replay(small)
+        assert small.queryWindowUs < 1_000_000
+        database.close()
+
+    def test_backpressure_and_paced_fallback(self, tempDir):
+        database = openRecording(tempDir, seconds=20)
+
+        async def run():
+            queue = asyncio.Queue(maxsize=2)
+            cursor = StreamCursor(request(20), database, {'streaming': {'unpacedChunkBytes': 1_000}})
+            task = asyncio.create_task(cursor.streamChunks(queue))
+            for _ in range(20):
+                await asyncio.sleep(0.01)
+            assert queue.full() and not task.done()  # Blocked on the consumer, not racing ahead
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        assert not StreamCursor(request(20, stopTime=False), database).unpaced
+        assert not StreamCursor(request(20, unpaced=False), database).unpaced
+        database.close()
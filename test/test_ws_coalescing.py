@@ -0,0 +1,158 @@
+"""
+WebSocket Coalescing Tests
+
+Verifies ClientConnection chunk coalescing and WebSocket compression settings:
+- A chunk arriving on an idle connection is sent without added latency
+- Chunks within the latency budget, or queued behind a slow send, merge into one
+  frame in order; stale playbackRequestIds are dropped (fencing)
+- Frames are counted once written; a failed background send closes the connection
+- The configured deflate level replaces aiohttp's fixed Z_BEST_SPEED compressor,
+  falling back to the default when the writer has no compressor to replace
+"""
+
+import asyncio
+import zlib
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nova.server.framing import FRAMING_COLUMNAR, decodeChunk
+from nova.server.server import ClientConnection, applyCompressionLevel, WS_CHUNKS_FORWARDED_TOTAL
+
+
+def chunkMessage(playbackId, eventIds, complete=False):
+    return {'playbackRequestId': playbackId, 'events': [{'eventId': eventId} for eventId in eventIds],
+            'timestamp': eventIds[-1] if eventIds else 0, 'complete': complete, 'type': 'streamChunk'}
+
+
+class SlowSocket:
+    """WebSocket stand-in taking sendSeconds per frame (slow link)"""
+    closed = False
+
+    def __init__(self, sendSeconds=0.0):
+        self.sendSeconds = sendSeconds
+        self.frames = []
+
+    async def send_json(self, message):
+        await asyncio.sleep(self.sendSeconds)
+        self.frames.append(message)
+
+    async def send_bytes(self, data):
+        await asyncio.sleep(self.sendSeconds)
+        self.frames.append(decodeChunk(data))
+
+    async def close(self):
+        self.closed = True
+
+
+class BrokenSocket(SlowSocket):
+    """WebSocket stand-in whose transport fails on send"""
+
+    async def send_json(self, message):
+        raise ConnectionResetError('peer gone')
+
+
+def eventIds(frame):
+    return [event['eventId'] for event in frame['events']]
+
+
+class TestChunkCoalescing:
+
+    def test_idle_chunk_sent_immediately(self, tempDir):
+        async def run():
+            socket = SlowSocket()
+            conn = ClientConnection('conn1', socket, coalesceSeconds=0.5)
+            conn.activePlaybackId = 'play1'
+            await conn.sendChunk(chunkMessage('play1', [1, 2]))
+            await asyncio.sleep(0.01)
+            assert [eventIds(frame) for frame in socket.frames] == [[1, 2]]  # Well inside the 0.5 s budget
+
+            direct = SlowSocket()
+            await ClientConnection('conn2', direct).sendChunk(chunkMessage('play1', [3]))
+            assert len(direct.frames) == 1  # Coalescing disabled by default
+
+        asyncio.run(run())
+
+    def test_burst_merges_in_order_and_fences(self, tempDir):
+        async def run():
+            socket = SlowSocket(sendSeconds=0.05)
+            conn = ClientConnection('conn1', socket, framing=FRAMING_COLUMNAR, coalesceSeconds=0.02)
+            conn.activePlaybackId = 'play1'
+            for start in range(0, 50, 5):
+                await conn.sendChunk(chunkMessage('play1', list(range(start, start + 5)), complete=start == 45))
+            await conn._flushTask
+            assert len(socket.frames) < 5
+            assert [eventId for frame in socket.frames for eventId in eventIds(frame)] == list(range(50))
+            assert socket.frames[-1]['complete'] and socket.frames[-1]['timestamp'] == 49
+
+            # New playback fences out anything pending for the old one
+            socket.frames.clear()
+            await conn.sendChunk(chunkMessage('play1', [100]))
+            await conn.sendChunk(chunkMessage('play1', [101]))
+            conn.activePlaybackId = 'play2'
+            await conn.sendChunk(chunkMessage('play2', [200]))
+            await conn._flushTask
+            assert all(frame['playbackRequestId'] == 'play2' for frame in socket.frames[1:])
+            assert eventIds(socket.frames[-1]) == [200]
+
+            # Past coalesceMaxEvents the sender waits for the frame to go out
+            socket.frames.clear()
+            conn.coalesceMaxEvents = 3
+            await conn.sendChunk(chunkMessage('play2', [201, 202, 203]))
+            assert len(socket.frames) == 1
+
+        asyncio.run(run())
+
+    def test_written_frames_counted_and_send_failure_closes(self, tempDir):
+        def forwarded():
+            return WS_CHUNKS_FORWARDED_TOTAL.value(framing='json')
+
+        async def run():
+            before = forwarded()
+            socket = SlowSocket(sendSeconds=0.05)
+            conn = ClientConnection('conn1', socket, coalesceSeconds=0.02)
+            conn.activePlaybackId = 'play1'
+            for i in range(5):
+                await conn.sendChunk(chunkMessage('play1', [i]))
+            assert forwarded() == before  # First frame still on the wire
+            await conn._flushTask
+            assert forwarded() - before == len(socket.frames) < 5
+
+            broken = BrokenSocket()
+            conn = ClientConnection('conn2', broken, coalesceSeconds=0.02)
+            conn.activePlaybackId = 'play1'
+            await conn.sendChunk(chunkMessage('play1', [1]))
+            await conn._flushTask  # Error handled inside the task, not raised
+            assert broken.closed and conn._pendingChunk is None
+            assert forwarded() - before == len(socket.frames)
+
+        asyncio.run(run())
+
+    def test_compression_level_applied(self):
+        class Writer:
+            _compressobj = None
+
+        class Socket:
+            compress = 15
+            _writer = Writer()
+
+        socket = Socket()
+        assert applyCompressionLevel(socket, 9)
+        compressor = socket._writer._compressobj
+        data = b'{"lane":"parsed","uniqueId":"gps1"}' * 200
+        compressed = asyncio.run(compressor.compress(data)) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        assert zlib.decompressobj(-15).decompress(compressed) == data
+
+        socket.compress = 0
+        assert not applyCompressionLevel(socket, 9)  # Deflate not negotiated
+
+        class NewerWriter:
+            pass
+
+        socket.compress, socket._writer = 15, NewerWriter()
+        assert not applyCompressionLevel(socket, 9)  # Private compressor gone: keep aiohttp's default
+        assert not hasattr(socket._writer, '_compressobj')
+
+        from aiohttp import web
+        assert web.WebSocketResponse().compress  # Offered by default (permessage-deflate)
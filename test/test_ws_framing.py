@@ -0,0 +1,99 @@
+"""
+WebSocket Framing Tests
+
+Verifies nova.server.framing and ClientConnection.sendChunk:
+- Columnar frames decode to the original streamChunk message and are much
+  smaller than JSON for dense telemetry
+- Edge cases: non-string column values, empty/nested objects, wide string tables
+- Connections send binary chunks only when columnar framing was negotiated
+"""
+
+import asyncio
+from pathlib import Path
+
+import orjson
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bench import synthetic
+from nova.core.database import Database
+from nova.core.events import Lane, Timebase
+from nova.server.framing import FRAMING_COLUMNAR, MAGIC, encodeChunk, decodeChunk
+from nova.server.server import ClientConnection
+
+
+def chunkMessage(events):
+    return {'playbackRequestId': 'play1', 'events': events, 'timestamp': 1_767_225_600_000_000,
+            'complete': False, 'type': 'streamChunk'}
+
+
+def telemetryRows(tempDir):
+    database = Database(str(tempDir / 'truth.db'))
+    events = synthetic.truthEvents(5, 10, 4)
+    for event in events:
+        event.canonicalTruthTime = event.sourceTruthTime
+    database.insertEventsBatch(events, synthetic.BASE_TIME.isoformat())
+    rows = database.queryEvents(synthetic.BASE_TIME.isoformat(), synthetic.BASE_TIME.replace(second=2).isoformat(),
+                                Timebase.CANONICAL, lanes=[Lane.PARSED, Lane.UI])
+    database.close()
+    return rows
+
+
+class FakeSocket:
+    closed = False
+
+    def __init__(self):
+        self.text, self.binary = [], []
+
+    async def send_json(self, message):
+        self.text.append(message)
+
+    async def send_bytes(self, data):
+        self.binary.append(data)
+
+
+class TestColumnarFraming:
+
+    def test_round_trip_and_size(self, tempDir):
+        message = chunkMessage(telemetryRows(tempDir))
+        frame = encodeChunk(message)
+        assert frame[:4] == MAGIC
+        assert decodeChunk(frame) == message
+        assert len(frame) < len(orjson.dumps(message)) * 0.5
+
+        empty = chunkMessage([])
+        assert decodeChunk(encodeChunk(empty)) == empty
+
+    def test_edge_values_and_wide_tables(self):
+        events = [
+            {'lane': 'parsed', 'uniqueId': None, 'messageType': 7, 'payload': {}},
+            {'lane': 'ui', 'uniqueId': 'gps1', 'data': {'svInfo': {'GPS': {'5': {'cno': 41}}}, 'list': [1, None]}},
+            {'eventId': 'x', 'payload': {'lat': 1.5}, 'extra': [{'a': 'b'}]},
+        ]
+        message = chunkMessage(events)
+        assert decodeChunk(encodeChunk(message)) == message
+
+        wide = chunkMessage([{'lane': 'parsed', 'uniqueId': f'dev{i}'} for i in range(70_000)])
+        frame = encodeChunk(wide)
+        metaLength = int.from_bytes(frame[4:8], 'little')
+        assert orjson.loads(frame[8:8 + metaLength])['wide'] is True  # 70001 strings: u32 indices
+        assert decodeChunk(frame) == wide
+        with pytest.raises(ValueError):
+            decodeChunk(orjson.dumps(message))
+
+    def test_connection_sends_negotiated_framing(self, tempDir):
+        chunk = chunkMessage([{'lane': 'parsed', 'uniqueId': 'gps1', 'payload': {'lat': 1.0}}])
+
+        async def send(framing):
+            socket = FakeSocket()
+            kwargs = {'framing': framing} if framing else {}
+            await ClientConnection('conn1', socket, **kwargs).sendChunk(chunk)
+            await ClientConnection('conn1', socket, **kwargs).sendMessage({'type': 'ack'})
+            return socket
+
+        default = asyncio.run(send(None))
+        assert default.text == [chunk, {'type': 'ack'}] and default.binary == []
+        columnar = asyncio.run(send(FRAMING_COLUMNAR))
+        assert columnar.text == [{'type': 'ack'}] and decodeChunk(columnar.binary[0]) == chunk